@@ -23,6 +23,9 @@ from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "tools" / "isa"))
+from linxisa.cache import load_compiled  # noqa: E402
+
 
 _HEX_BYTE_RE = re.compile(r"^[0-9a-fA-F]{2}$")
 _OBJDUMP_INSN_RE = re.compile(r"^\s*[0-9a-fA-F]+:\s+")
@@ -85,18 +88,17 @@ def extract_mnemonics_from_objdump(path: Path) -> Set[str]:
 
 
 def load_isa_spec(spec_path: Path) -> Dict:
-    raw = json.loads(spec_path.read_text())
-    instructions = raw.get("instructions", [])
+    instructions = load_compiled(spec_path)["instructions"]
 
     spec_mnemonics: Set[str] = set()
     mnemonics_by_group: Dict[str, Set[str]] = defaultdict(set)
 
     for inst in instructions:
-        mnem = canonicalize_mnemonic(inst.get("mnemonic", ""))
+        mnem = canonicalize_mnemonic(inst["mnemonic"])
         if not mnem:
             continue
         spec_mnemonics.add(mnem)
-        group = inst.get("group") or "Other"
+        group = inst["group"] or "Other"
         mnemonics_by_group[group].add(mnem)
 
     return {
@@ -9,15 +9,22 @@ This is meant for regression:
   recognizes the full spec (or at least doesn't regress).
 
 The emitted bytes are derived from each form's `match` value with all variable
-fields set to zero.
+fields set to zero. `--random N` adds N more vectors per form with every field
+set to a random in-range value (via `linxisa.encoder`).
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import random
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "tools" / "isa"))
+from linxisa.catalog import Catalog  # noqa: E402
+from linxisa.encoder import EncodeError, Encoder  # noqa: E402
+
 
 def _parse_int(s: str) -> int:
     # JSON currently stores `mask`/`match` as hex strings (e.g. "0x50160002").
@@ -29,14 +36,57 @@ def _canon_mnemonic(mnem: str) -> str:
     return str(mnem).strip().replace(" ", ".")
 
 
+def _emit_word(out: list[str], val: int, length_bits: int) -> None:
+    # Packed word: first part (first in the stream) in the low bits.
+    if length_bits == 16:
+        out.append(f"    .2byte 0x{val & 0xFFFF:04x}")
+    elif length_bits == 32:
+        out.append(f"    .4byte 0x{val & 0xFFFFFFFF:08x}")
+    elif length_bits == 48:
+        out.append(f"    .4byte 0x{val & 0xFFFFFFFF:08x}")
+        out.append(f"    .2byte 0x{(val >> 32) & 0xFFFF:04x}")
+    elif length_bits == 64:
+        out.append(f"    .4byte 0x{val & 0xFFFFFFFF:08x}")
+        out.append(f"    .4byte 0x{(val >> 32) & 0xFFFFFFFF:08x}")
+
+
+def _random_vectors(encoder: Encoder, inst_id: str, count: int, rng: random.Random) -> list[int]:
+    form = encoder.form(inst_id)
+    words: list[int] = []
+    attempts = 0
+    while len(words) < count and attempts < count * 8:
+        attempts += 1
+        values: dict[str, int] = {}
+        for name, field in form.fields.items():
+            lo, hi = encoder.field_range(inst_id, name)
+            # Keep only bits the form actually encodes (scaled immediates drop low bits).
+            covered = 0
+            for p in field.pieces:
+                covered |= ((1 << p.width) - 1) << p.value_lsb
+            v = rng.randint(lo, hi) & covered
+            if v > hi:
+                v -= 1 << field.bit_width
+            values[name] = v
+        try:
+            words.append(encoder.encode(inst_id, values))
+        except EncodeError:
+            # Drew a value excluded by a form constraint (e.g. RegDst!=RA); draw again.
+            continue
+    return words
+
+
 def main(argv: list[str]) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--spec", type=Path, required=True, help="Path to compiled ISA catalog JSON (for example isa/v0.3/linxisa-v0.3.json)")
     ap.add_argument("--out", type=Path, required=True, help="Output assembly file")
+    ap.add_argument("--random", type=int, default=0, metavar="N", help="Extra random-field vectors per form")
+    ap.add_argument("--seed", type=int, default=0, help="RNG seed for --random")
     args = ap.parse_args(argv)
 
     raw = json.loads(args.spec.read_text())
     instructions = raw.get("instructions", [])
+    encoder = Encoder(Catalog.from_spec(raw)) if args.random else None
+    rng = random.Random(args.seed)
 
     out: list[str] = []
     out.append(f"# Auto-generated from {args.spec}")
@@ -59,25 +109,20 @@ def main(argv: list[str]) -> int:
 
         out.append(f"    # {mnem} ({inst_id}) [{length_bits}]")
 
-        if length_bits == 16:
-            val = _parse_int(parts[0].get("match", "0")) & 0xFFFF
-            out.append(f"    .2byte 0x{val:04x}")
-        elif length_bits == 32:
-            val = _parse_int(parts[0].get("match", "0")) & 0xFFFFFFFF
-            out.append(f"    .4byte 0x{val:08x}")
-        elif length_bits == 48:
-            val = _parse_int(parts[0].get("match", "0")) & ((1 << 48) - 1)
-            lo = val & 0xFFFFFFFF
-            hi = (val >> 32) & 0xFFFF
-            out.append(f"    .4byte 0x{lo:08x}")
-            out.append(f"    .2byte 0x{hi:04x}")
-        elif length_bits == 64:
+        # Zero-field vector: the match bits of every part, packed like an encoded word.
+        if length_bits == 64:
             if len(parts) != 2:
                 continue
-            lo = _parse_int(parts[0].get("match", "0")) & 0xFFFFFFFF
-            hi = _parse_int(parts[1].get("match", "0")) & 0xFFFFFFFF
-            out.append(f"    .4byte 0x{lo:08x}")
-            out.append(f"    .4byte 0x{hi:08x}")
+            val = (_parse_int(parts[0].get("match", "0")) & 0xFFFFFFFF) | (
+                (_parse_int(parts[1].get("match", "0")) & 0xFFFFFFFF) << 32
+            )
+        else:
+            val = _parse_int(parts[0].get("match", "0"))
+        _emit_word(out, val, length_bits)
+
+        if encoder is not None:
+            for val in _random_vectors(encoder, inst_id, args.random, rng):
+                _emit_word(out, val, length_bits)
 
         out.append("")
 
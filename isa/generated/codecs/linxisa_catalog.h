@@ -0,0 +1,114 @@
+/* Auto-generated from tools/isa/linxisa/lxcat.py. */
+/* DO NOT EDIT: run `python3 tools/isa/gen_c_codec.py` to regenerate. */
+
+#pragma once
+
+#include <stddef.h>
+#include <stdint.h>
+#include <string.h>
+
+/*
+ * Memory-mappable LinxISA binary catalog (`isa/v0.3/linxisa-v0.3.lxcat`).
+ * Little-endian; every column is 8-byte aligned, so on little-endian hosts
+ * a mapped file can be read in place through the accessors below.
+ */
+
+#define LXCAT_MAGIC "LXCAT\0\0\0"
+#define LXCAT_FORMAT_VERSION 1u
+
+enum lxcat_column {
+  LXCAT_FORM_MASK,
+  LXCAT_FORM_MATCH,
+  LXCAT_FORM_ID,
+  LXCAT_FORM_UID,
+  LXCAT_FORM_MNEMONIC,
+  LXCAT_FORM_GROUP,
+  LXCAT_FORM_ASM,
+  LXCAT_FORM_SOURCE,
+  LXCAT_FORM_LENGTH_BITS,
+  LXCAT_FORM_FIXED_BITS,
+  LXCAT_FORM_FIELD_START,
+  LXCAT_FORM_FIELD_COUNT,
+  LXCAT_FORM_CONSTRAINT_START,
+  LXCAT_FORM_CONSTRAINT_COUNT,
+  LXCAT_FIELD_NAME,
+  LXCAT_FIELD_SIGNED_HINT,
+  LXCAT_FIELD_BIT_WIDTH,
+  LXCAT_FIELD_PIECE_START,
+  LXCAT_FIELD_PIECE_COUNT,
+  LXCAT_PIECE_INSN_LSB,
+  LXCAT_PIECE_WIDTH,
+  LXCAT_PIECE_VALUE_LSB,
+  LXCAT_CONSTRAINT_OP,
+  LXCAT_CONSTRAINT_SIGNED_HINT,
+  LXCAT_CONSTRAINT_BIT_WIDTH,
+  LXCAT_CONSTRAINT_VALUE,
+  LXCAT_CONSTRAINT_PIECE_START,
+  LXCAT_CONSTRAINT_PIECE_COUNT,
+  LXCAT_REG_CODE,
+  LXCAT_REG_NAME,
+  LXCAT_REG_ASM,
+  LXCAT_STRTAB,
+  LXCAT_NUM_COLUMNS
+};
+
+enum lxcat_op { LXCAT_OP_EQ, LXCAT_OP_NE, LXCAT_OP_LT, LXCAT_OP_LE, LXCAT_OP_GT, LXCAT_OP_GE };
+
+typedef struct {
+  char magic[8];
+  uint32_t version;
+  uint32_t num_columns;
+  uint32_t num_forms;
+  uint32_t num_fields;
+  uint32_t num_pieces;
+  uint32_t num_constraints;
+  uint32_t num_regs;
+  uint32_t num_strtab;
+  uint8_t source_sha256[32];
+  uint64_t column_offset[LXCAT_NUM_COLUMNS];
+} lxcat_header;
+
+/* Returns 0 when `buf` (of `size` bytes) holds a catalog this header can read. */
+static inline int lxcat_check(const void *buf, size_t size) {
+  const lxcat_header *h = (const lxcat_header *)buf;
+  if (size < sizeof(lxcat_header)) return -1;
+  if (memcmp(h->magic, LXCAT_MAGIC, 8) != 0) return -1;
+  if (h->version != LXCAT_FORMAT_VERSION || h->num_columns != LXCAT_NUM_COLUMNS) return -1;
+  if (h->column_offset[LXCAT_STRTAB] + h->num_strtab > size) return -1;
+  return 0;
+}
+
+static inline const uint64_t *lxcat_form_mask(const lxcat_header *h) { return (const uint64_t *)((const uint8_t *)h + h->column_offset[LXCAT_FORM_MASK]); }
+static inline const uint64_t *lxcat_form_match(const lxcat_header *h) { return (const uint64_t *)((const uint8_t *)h + h->column_offset[LXCAT_FORM_MATCH]); }
+static inline const uint32_t *lxcat_form_id(const lxcat_header *h) { return (const uint32_t *)((const uint8_t *)h + h->column_offset[LXCAT_FORM_ID]); }
+static inline const uint32_t *lxcat_form_uid(const lxcat_header *h) { return (const uint32_t *)((const uint8_t *)h + h->column_offset[LXCAT_FORM_UID]); }
+static inline const uint32_t *lxcat_form_mnemonic(const lxcat_header *h) { return (const uint32_t *)((const uint8_t *)h + h->column_offset[LXCAT_FORM_MNEMONIC]); }
+static inline const uint32_t *lxcat_form_group(const lxcat_header *h) { return (const uint32_t *)((const uint8_t *)h + h->column_offset[LXCAT_FORM_GROUP]); }
+static inline const uint32_t *lxcat_form_asm(const lxcat_header *h) { return (const uint32_t *)((const uint8_t *)h + h->column_offset[LXCAT_FORM_ASM]); }
+static inline const uint32_t *lxcat_form_source(const lxcat_header *h) { return (const uint32_t *)((const uint8_t *)h + h->column_offset[LXCAT_FORM_SOURCE]); }
+static inline const uint16_t *lxcat_form_length_bits(const lxcat_header *h) { return (const uint16_t *)((const uint8_t *)h + h->column_offset[LXCAT_FORM_LENGTH_BITS]); }
+static inline const uint16_t *lxcat_form_fixed_bits(const lxcat_header *h) { return (const uint16_t *)((const uint8_t *)h + h->column_offset[LXCAT_FORM_FIXED_BITS]); }
+static inline const uint32_t *lxcat_form_field_start(const lxcat_header *h) { return (const uint32_t *)((const uint8_t *)h + h->column_offset[LXCAT_FORM_FIELD_START]); }
+static inline const uint16_t *lxcat_form_field_count(const lxcat_header *h) { return (const uint16_t *)((const uint8_t *)h + h->column_offset[LXCAT_FORM_FIELD_COUNT]); }
+static inline const uint32_t *lxcat_form_constraint_start(const lxcat_header *h) { return (const uint32_t *)((const uint8_t *)h + h->column_offset[LXCAT_FORM_CONSTRAINT_START]); }
+static inline const uint16_t *lxcat_form_constraint_count(const lxcat_header *h) { return (const uint16_t *)((const uint8_t *)h + h->column_offset[LXCAT_FORM_CONSTRAINT_COUNT]); }
+static inline const uint32_t *lxcat_field_name(const lxcat_header *h) { return (const uint32_t *)((const uint8_t *)h + h->column_offset[LXCAT_FIELD_NAME]); }
+static inline const int8_t *lxcat_field_signed_hint(const lxcat_header *h) { return (const int8_t *)((const uint8_t *)h + h->column_offset[LXCAT_FIELD_SIGNED_HINT]); }
+static inline const uint16_t *lxcat_field_bit_width(const lxcat_header *h) { return (const uint16_t *)((const uint8_t *)h + h->column_offset[LXCAT_FIELD_BIT_WIDTH]); }
+static inline const uint32_t *lxcat_field_piece_start(const lxcat_header *h) { return (const uint32_t *)((const uint8_t *)h + h->column_offset[LXCAT_FIELD_PIECE_START]); }
+static inline const uint16_t *lxcat_field_piece_count(const lxcat_header *h) { return (const uint16_t *)((const uint8_t *)h + h->column_offset[LXCAT_FIELD_PIECE_COUNT]); }
+static inline const uint8_t *lxcat_piece_insn_lsb(const lxcat_header *h) { return (const uint8_t *)((const uint8_t *)h + h->column_offset[LXCAT_PIECE_INSN_LSB]); }
+static inline const uint8_t *lxcat_piece_width(const lxcat_header *h) { return (const uint8_t *)((const uint8_t *)h + h->column_offset[LXCAT_PIECE_WIDTH]); }
+static inline const uint8_t *lxcat_piece_value_lsb(const lxcat_header *h) { return (const uint8_t *)((const uint8_t *)h + h->column_offset[LXCAT_PIECE_VALUE_LSB]); }
+static inline const uint8_t *lxcat_constraint_op(const lxcat_header *h) { return (const uint8_t *)((const uint8_t *)h + h->column_offset[LXCAT_CONSTRAINT_OP]); }
+static inline const int8_t *lxcat_constraint_signed_hint(const lxcat_header *h) { return (const int8_t *)((const uint8_t *)h + h->column_offset[LXCAT_CONSTRAINT_SIGNED_HINT]); }
+static inline const uint16_t *lxcat_constraint_bit_width(const lxcat_header *h) { return (const uint16_t *)((const uint8_t *)h + h->column_offset[LXCAT_CONSTRAINT_BIT_WIDTH]); }
+static inline const int64_t *lxcat_constraint_value(const lxcat_header *h) { return (const int64_t *)((const uint8_t *)h + h->column_offset[LXCAT_CONSTRAINT_VALUE]); }
+static inline const uint32_t *lxcat_constraint_piece_start(const lxcat_header *h) { return (const uint32_t *)((const uint8_t *)h + h->column_offset[LXCAT_CONSTRAINT_PIECE_START]); }
+static inline const uint16_t *lxcat_constraint_piece_count(const lxcat_header *h) { return (const uint16_t *)((const uint8_t *)h + h->column_offset[LXCAT_CONSTRAINT_PIECE_COUNT]); }
+static inline const int16_t *lxcat_reg_code(const lxcat_header *h) { return (const int16_t *)((const uint8_t *)h + h->column_offset[LXCAT_REG_CODE]); }
+static inline const uint32_t *lxcat_reg_name(const lxcat_header *h) { return (const uint32_t *)((const uint8_t *)h + h->column_offset[LXCAT_REG_NAME]); }
+static inline const uint32_t *lxcat_reg_asm(const lxcat_header *h) { return (const uint32_t *)((const uint8_t *)h + h->column_offset[LXCAT_REG_ASM]); }
+static inline const char *lxcat_strtab(const lxcat_header *h) { return (const char *)((const uint8_t *)h + h->column_offset[LXCAT_STRTAB]); }
+
+static inline const char *lxcat_string(const lxcat_header *h, uint32_t off) { return lxcat_strtab(h) + off; }
@@ -6736,3 +6736,10614 @@ const linxisa_inst_form linxisa_inst_forms[] = {
 };
 const size_t linxisa_inst_forms_count = 740;
 
+static int linxisa_decode16(uint64_t insn)
+{
+  switch (insn & 0x000fULL) {
+  case 0x0000ULL:
+  {
+    switch (insn & 0xc7f0ULL) {
+    case 0x0000ULL:
+    {
+      if ((insn & 0xffffULL) == 0x0000ULL) return 98; /* C.BSTOP */
+      if ((insn & 0xc7ffULL) == 0x0000ULL) return 94; /* C.BSTART.STD */
+      return -1;
+    }
+    case 0x0040ULL:
+    {
+      if ((insn & 0xffffULL) == 0x0840ULL) return 95; /* C.BSTART.SYS */
+      return -1;
+    }
+    case 0x0080ULL:
+    {
+      if ((insn & 0xc7ffULL) == 0x0080ULL) return 91; /* C.BSTART.FP */
+      return -1;
+    }
+    case 0x00c0ULL:
+    {
+      if ((insn & 0xffffULL) == 0x08c0ULL) return 92; /* C.BSTART.MPAR */
+      return -1;
+    }
+    case 0x40c0ULL:
+    {
+      if ((insn & 0xffffULL) == 0x48c0ULL) return 93; /* C.BSTART.MSEQ */
+      return -1;
+    }
+    case 0x80c0ULL:
+    {
+      if ((insn & 0xffffULL) == 0x88c0ULL) return 96; /* C.BSTART.VPAR */
+      return -1;
+    }
+    case 0xc0c0ULL:
+    {
+      if ((insn & 0xffffULL) == 0xc8c0ULL) return 97; /* C.BSTART.VSEQ */
+      return -1;
+    }
+    default:
+      return -1;
+    }
+  }
+  case 0x0002ULL:
+  {
+    if ((insn & 0x000fULL) == 0x0002ULL) return 90; /* C.BSTART */
+    return -1;
+  }
+  case 0x0004ULL:
+  {
+    if ((insn & 0x000fULL) == 0x0004ULL) return 89; /* C.BSTART */
+    return -1;
+  }
+  case 0x0006ULL:
+  {
+    switch (insn & 0x0030ULL) {
+    case 0x0000ULL:
+    {
+      if ((insn & 0x003fULL) == 0x0006ULL) return 105; /* C.MOVR */
+      return -1;
+    }
+    case 0x0010ULL:
+    {
+      if ((insn & 0xf83fULL) == 0x5016ULL) return 111; /* C.SETRET */
+      if ((insn & 0x003fULL) == 0x0016ULL) return 104; /* C.MOVI */
+      return -1;
+    }
+    case 0x0020ULL:
+    {
+      if ((insn & 0x003fULL) == 0x0026ULL) return 108; /* C.SETC.EQ */
+      return -1;
+    }
+    case 0x0030ULL:
+    {
+      if ((insn & 0x003fULL) == 0x0036ULL) return 109; /* C.SETC.NE */
+      return -1;
+    }
+    default:
+      return -1;
+    }
+  }
+  case 0x0008ULL:
+  {
+    switch (insn & 0x0030ULL) {
+    case 0x0000ULL:
+    {
+      if ((insn & 0x003fULL) == 0x0008ULL) return 84; /* C.ADD */
+      return -1;
+    }
+    case 0x0010ULL:
+    {
+      if ((insn & 0x003fULL) == 0x0018ULL) return 118; /* C.SUB */
+      return -1;
+    }
+    case 0x0020ULL:
+    {
+      if ((insn & 0x003fULL) == 0x0028ULL) return 86; /* C.AND */
+      return -1;
+    }
+    case 0x0030ULL:
+    {
+      if ((insn & 0x003fULL) == 0x0038ULL) return 106; /* C.OR */
+      return -1;
+    }
+    default:
+      return -1;
+    }
+  }
+  case 0x000aULL:
+  {
+    switch (insn & 0x0030ULL) {
+    case 0x0000ULL:
+    {
+      if ((insn & 0x003fULL) == 0x000aULL) return 103; /* C.LWI */
+      return -1;
+    }
+    case 0x0010ULL:
+    {
+      if ((insn & 0x003fULL) == 0x001aULL) return 102; /* C.LDI */
+      return -1;
+    }
+    case 0x0020ULL:
+    {
+      if ((insn & 0x003fULL) == 0x002aULL) return 119; /* C.SWI */
+      return -1;
+    }
+    case 0x0030ULL:
+    {
+      if ((insn & 0x003fULL) == 0x003aULL) return 107; /* C.SDI */
+      return -1;
+    }
+    default:
+      return -1;
+    }
+  }
+  case 0x000cULL:
+  {
+    switch (insn & 0x0030ULL) {
+    case 0x0000ULL:
+    {
+      if ((insn & 0x003fULL) == 0x000cULL) return 85; /* C.ADDI */
+      return -1;
+    }
+    case 0x0010ULL:
+    {
+      switch (insn & 0xf800ULL) {
+      case 0x0000ULL:
+      {
+        if ((insn & 0xf83fULL) == 0x001cULL) return 110; /* C.SETC.TGT */
+        return -1;
+      }
+      case 0x4000ULL:
+      {
+        if ((insn & 0xf83fULL) == 0x401cULL) return 112; /* C.SEXT.B */
+        return -1;
+      }
+      case 0x4800ULL:
+      {
+        if ((insn & 0xf83fULL) == 0x481cULL) return 113; /* C.SEXT.H */
+        return -1;
+      }
+      case 0x5000ULL:
+      {
+        if ((insn & 0xf83fULL) == 0x501cULL) return 114; /* C.SEXT.W */
+        return -1;
+      }
+      case 0x5800ULL:
+      {
+        if ((insn & 0xf83fULL) == 0x581cULL) return 120; /* C.ZEXT.B */
+        return -1;
+      }
+      case 0x6000ULL:
+      {
+        if ((insn & 0xf83fULL) == 0x601cULL) return 121; /* C.ZEXT.H */
+        return -1;
+      }
+      case 0x6800ULL:
+      {
+        if ((insn & 0xf83fULL) == 0x681cULL) return 122; /* C.ZEXT.W */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x0020ULL:
+    {
+      switch (insn & 0xf800ULL) {
+      case 0x0000ULL:
+      {
+        if ((insn & 0xf83fULL) == 0x002cULL) return 99; /* C.CMP.EQI */
+        return -1;
+      }
+      case 0x0800ULL:
+      {
+        if ((insn & 0xf83fULL) == 0x082cULL) return 100; /* C.CMP.NEI */
+        return -1;
+      }
+      case 0x1000ULL:
+      {
+        if ((insn & 0xf83fULL) == 0x102cULL) return 115; /* C.SLLI */
+        return -1;
+      }
+      case 0x1800ULL:
+      {
+        if ((insn & 0xf83fULL) == 0x182cULL) return 116; /* C.SRLI */
+        return -1;
+      }
+      case 0x8000ULL:
+      {
+        if ((insn & 0xf83fULL) == 0x802cULL) return 117; /* C.SSRGET */
+        return -1;
+      }
+      case 0xc000ULL:
+      {
+        if ((insn & 0xf83fULL) == 0xc02cULL) return 101; /* C.EBREAK */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x0030ULL:
+    {
+      if ((insn & 0xc03fULL) == 0xc03cULL) return 87; /* C.B.DIM */
+      if ((insn & 0x003fULL) == 0x003cULL) return 88; /* C.B.DIMI */
+      return -1;
+    }
+    default:
+      return -1;
+    }
+  }
+  default:
+    return -1;
+  }
+}
+
+static int linxisa_decode32(uint64_t insn)
+{
+  switch (insn & 0x0000000fULL) {
+  case 0x00000001ULL:
+  {
+    switch (insn & 0x00000070ULL) {
+    case 0x00000000ULL:
+    {
+      switch (insn & 0x00007f80ULL) {
+      case 0x00000000ULL:
+      {
+        if ((insn & 0xffffffffULL) == 0x00000001ULL) return 78; /* BSTOP */
+        return -1;
+      }
+      case 0x00001000ULL:
+      {
+        if ((insn & 0x00007fffULL) == 0x00001001ULL) return 63; /* BSTART.STD */
+        return -1;
+      }
+      case 0x00001080ULL:
+      {
+        if ((insn & 0x00007fffULL) == 0x00001081ULL) return 68; /* BSTART.SYS */
+        return -1;
+      }
+      case 0x00001100ULL:
+      {
+        if ((insn & 0x00007fffULL) == 0x00001101ULL) return 57; /* BSTART.FP */
+        return -1;
+      }
+      case 0x00001180ULL:
+      {
+        switch (insn & 0x00008000ULL) {
+        case 0x00000000ULL:
+        {
+          switch (insn & 0x00010000ULL) {
+          case 0x00000000ULL:
+          {
+            switch (insn & 0x00020000ULL) {
+            case 0x00000000ULL:
+            {
+              switch (insn & 0x02000000ULL) {
+              case 0x00000000ULL:
+              {
+                if ((insn & 0xf9ffffffULL) == 0x00001181ULL) return 58; /* BSTART.MPAR */
+                return -1;
+              }
+              case 0x02000000ULL:
+              {
+                switch (insn & 0x04000000ULL) {
+                case 0x00000000ULL:
+                {
+                  switch (insn & 0x00040000ULL) {
+                  case 0x00000000ULL:
+                  {
+                    switch (insn & 0x00080000ULL) {
+                    case 0x00000000ULL:
+                    {
+                      switch (insn & 0x00100000ULL) {
+                      case 0x00000000ULL:
+                      {
+                        switch (insn & 0x00200000ULL) {
+                        case 0x00000000ULL:
+                        {
+                          switch (insn & 0x00400000ULL) {
+                          case 0x00000000ULL:
+                          {
+                            switch (insn & 0x00800000ULL) {
+                            case 0x00000000ULL:
+                            {
+                              switch (insn & 0x01000000ULL) {
+                              case 0x00000000ULL:
+                              {
+                                switch (insn & 0x08000000ULL) {
+                                case 0x00000000ULL:
+                                {
+                                  switch (insn & 0x10000000ULL) {
+                                  case 0x00000000ULL:
+                                  {
+                                    switch (insn & 0x20000000ULL) {
+                                    case 0x00000000ULL:
+                                    {
+                                      switch (insn & 0x40000000ULL) {
+                                      case 0x00000000ULL:
+                                      {
+                                        switch (insn & 0x80000000ULL) {
+                                        case 0x00000000ULL:
+                                        {
+                                          if ((insn & 0xf9ffffffULL) == 0x00001181ULL) return 58; /* BSTART.MPAR */
+                                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                          return -1;
+                                        }
+                                        case 0x80000000ULL:
+                                        {
+                                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                          return -1;
+                                        }
+                                        default:
+                                          return -1;
+                                        }
+                                      }
+                                      case 0x40000000ULL:
+                                      {
+                                        if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                        if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                        return -1;
+                                      }
+                                      default:
+                                        return -1;
+                                      }
+                                    }
+                                    case 0x20000000ULL:
+                                    {
+                                      if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                      if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                      return -1;
+                                    }
+                                    default:
+                                      return -1;
+                                    }
+                                  }
+                                  case 0x10000000ULL:
+                                  {
+                                    if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                    if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                    return -1;
+                                  }
+                                  default:
+                                    return -1;
+                                  }
+                                }
+                                case 0x08000000ULL:
+                                {
+                                  if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                  if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                  return -1;
+                                }
+                                default:
+                                  return -1;
+                                }
+                              }
+                              case 0x01000000ULL:
+                              {
+                                if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                return -1;
+                              }
+                              default:
+                                return -1;
+                              }
+                            }
+                            case 0x00800000ULL:
+                            {
+                              if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                              if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                              return -1;
+                            }
+                            default:
+                              return -1;
+                            }
+                          }
+                          case 0x00400000ULL:
+                          {
+                            if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                            if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                            return -1;
+                          }
+                          default:
+                            return -1;
+                          }
+                        }
+                        case 0x00200000ULL:
+                        {
+                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                          return -1;
+                        }
+                        default:
+                          return -1;
+                        }
+                      }
+                      case 0x00100000ULL:
+                      {
+                        if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                        if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                        return -1;
+                      }
+                      default:
+                        return -1;
+                      }
+                    }
+                    case 0x00080000ULL:
+                    {
+                      if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                      if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                      return -1;
+                    }
+                    default:
+                      return -1;
+                    }
+                  }
+                  case 0x00040000ULL:
+                  {
+                    if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                    if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                    return -1;
+                  }
+                  default:
+                    return -1;
+                  }
+                }
+                case 0x04000000ULL:
+                {
+                  if ((insn & 0xf9ffffffULL) == 0x00001181ULL) return 58; /* BSTART.MPAR */
+                  return -1;
+                }
+                default:
+                  return -1;
+                }
+              }
+              default:
+                return -1;
+              }
+            }
+            case 0x00020000ULL:
+            {
+              switch (insn & 0x02000000ULL) {
+              case 0x00000000ULL:
+              {
+                if ((insn & 0xf9ffffffULL) == 0x00021181ULL) return 76; /* BSTART.VPAR */
+                return -1;
+              }
+              case 0x02000000ULL:
+              {
+                switch (insn & 0x04000000ULL) {
+                case 0x00000000ULL:
+                {
+                  switch (insn & 0x00040000ULL) {
+                  case 0x00000000ULL:
+                  {
+                    switch (insn & 0x00080000ULL) {
+                    case 0x00000000ULL:
+                    {
+                      switch (insn & 0x00100000ULL) {
+                      case 0x00000000ULL:
+                      {
+                        switch (insn & 0x00200000ULL) {
+                        case 0x00000000ULL:
+                        {
+                          switch (insn & 0x00400000ULL) {
+                          case 0x00000000ULL:
+                          {
+                            switch (insn & 0x00800000ULL) {
+                            case 0x00000000ULL:
+                            {
+                              switch (insn & 0x01000000ULL) {
+                              case 0x00000000ULL:
+                              {
+                                switch (insn & 0x08000000ULL) {
+                                case 0x00000000ULL:
+                                {
+                                  switch (insn & 0x10000000ULL) {
+                                  case 0x00000000ULL:
+                                  {
+                                    switch (insn & 0x20000000ULL) {
+                                    case 0x00000000ULL:
+                                    {
+                                      switch (insn & 0x40000000ULL) {
+                                      case 0x00000000ULL:
+                                      {
+                                        switch (insn & 0x80000000ULL) {
+                                        case 0x00000000ULL:
+                                        {
+                                          if ((insn & 0xf9ffffffULL) == 0x00021181ULL) return 76; /* BSTART.VPAR */
+                                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                          return -1;
+                                        }
+                                        case 0x80000000ULL:
+                                        {
+                                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                          return -1;
+                                        }
+                                        default:
+                                          return -1;
+                                        }
+                                      }
+                                      case 0x40000000ULL:
+                                      {
+                                        if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                        if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                        return -1;
+                                      }
+                                      default:
+                                        return -1;
+                                      }
+                                    }
+                                    case 0x20000000ULL:
+                                    {
+                                      if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                      if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                      return -1;
+                                    }
+                                    default:
+                                      return -1;
+                                    }
+                                  }
+                                  case 0x10000000ULL:
+                                  {
+                                    if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                    if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                    return -1;
+                                  }
+                                  default:
+                                    return -1;
+                                  }
+                                }
+                                case 0x08000000ULL:
+                                {
+                                  if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                  if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                  return -1;
+                                }
+                                default:
+                                  return -1;
+                                }
+                              }
+                              case 0x01000000ULL:
+                              {
+                                if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                return -1;
+                              }
+                              default:
+                                return -1;
+                              }
+                            }
+                            case 0x00800000ULL:
+                            {
+                              if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                              if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                              return -1;
+                            }
+                            default:
+                              return -1;
+                            }
+                          }
+                          case 0x00400000ULL:
+                          {
+                            if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                            if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                            return -1;
+                          }
+                          default:
+                            return -1;
+                          }
+                        }
+                        case 0x00200000ULL:
+                        {
+                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                          return -1;
+                        }
+                        default:
+                          return -1;
+                        }
+                      }
+                      case 0x00100000ULL:
+                      {
+                        if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                        if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                        return -1;
+                      }
+                      default:
+                        return -1;
+                      }
+                    }
+                    case 0x00080000ULL:
+                    {
+                      if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                      if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                      return -1;
+                    }
+                    default:
+                      return -1;
+                    }
+                  }
+                  case 0x00040000ULL:
+                  {
+                    if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                    if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                    return -1;
+                  }
+                  default:
+                    return -1;
+                  }
+                }
+                case 0x04000000ULL:
+                {
+                  if ((insn & 0xf9ffffffULL) == 0x00021181ULL) return 76; /* BSTART.VPAR */
+                  return -1;
+                }
+                default:
+                  return -1;
+                }
+              }
+              default:
+                return -1;
+              }
+            }
+            default:
+              return -1;
+            }
+          }
+          case 0x00010000ULL:
+          {
+            switch (insn & 0x06000000ULL) {
+            case 0x00000000ULL:
+            {
+              switch (insn & 0x000e0000ULL) {
+              case 0x00000000ULL:
+              {
+                switch (insn & 0x00100000ULL) {
+                case 0x00000000ULL:
+                {
+                  switch (insn & 0x00200000ULL) {
+                  case 0x00000000ULL:
+                  {
+                    if ((insn & 0x07ffffffULL) == 0x00011181ULL) return 70; /* BSTART.TLOAD */
+                    if ((insn & 0x060fffffULL) == 0x00011181ULL) return 71; /* BSTART.TMA */
+                    return -1;
+                  }
+                  case 0x00200000ULL:
+                  {
+                    if ((insn & 0x07ffffffULL) == 0x00211181ULL) return 74; /* BSTART.TMOV */
+                    if ((insn & 0x060fffffULL) == 0x00011181ULL) return 71; /* BSTART.TMA */
+                    return -1;
+                  }
+                  default:
+                    return -1;
+                  }
+                }
+                case 0x00100000ULL:
+                {
+                  if ((insn & 0x07ffffffULL) == 0x00111181ULL) return 75; /* BSTART.TSTORE */
+                  if ((insn & 0x060fffffULL) == 0x00011181ULL) return 71; /* BSTART.TMA */
+                  return -1;
+                }
+                default:
+                  return -1;
+                }
+              }
+              case 0x00020000ULL:
+              {
+                switch (insn & 0x00100000ULL) {
+                case 0x00000000ULL:
+                {
+                  switch (insn & 0x00200000ULL) {
+                  case 0x00000000ULL:
+                  {
+                    switch (insn & 0x00400000ULL) {
+                    case 0x00000000ULL:
+                    {
+                      switch (insn & 0x00800000ULL) {
+                      case 0x00000000ULL:
+                      {
+                        if ((insn & 0x07ffffffULL) == 0x00031181ULL) return 72; /* BSTART.TMATMUL */
+                        if ((insn & 0x060fffffULL) == 0x00031181ULL) return 49; /* BSTART.CUBE */
+                        return -1;
+                      }
+                      case 0x00800000ULL:
+                      {
+                        if ((insn & 0x07ffffffULL) == 0x00831181ULL) return 48; /* BSTART.ACCCVT */
+                        if ((insn & 0x060fffffULL) == 0x00031181ULL) return 49; /* BSTART.CUBE */
+                        return -1;
+                      }
+                      default:
+                        return -1;
+                      }
+                    }
+                    case 0x00400000ULL:
+                    {
+                      if ((insn & 0x060fffffULL) == 0x00031181ULL) return 49; /* BSTART.CUBE */
+                      return -1;
+                    }
+                    default:
+                      return -1;
+                    }
+                  }
+                  case 0x00200000ULL:
+                  {
+                    if ((insn & 0x07ffffffULL) == 0x00231181ULL) return 73; /* BSTART.TMATMUL.ACC */
+                    if ((insn & 0x060fffffULL) == 0x00031181ULL) return 49; /* BSTART.CUBE */
+                    return -1;
+                  }
+                  default:
+                    return -1;
+                  }
+                }
+                case 0x00100000ULL:
+                {
+                  if ((insn & 0x060fffffULL) == 0x00031181ULL) return 49; /* BSTART.CUBE */
+                  return -1;
+                }
+                default:
+                  return -1;
+                }
+              }
+              default:
+                return -1;
+              }
+            }
+            case 0x02000000ULL:
+            {
+              if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+              if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+              return -1;
+            }
+            default:
+              return -1;
+            }
+          }
+          default:
+            return -1;
+          }
+        }
+        case 0x00008000ULL:
+        {
+          switch (insn & 0x00010000ULL) {
+          case 0x00000000ULL:
+          {
+            switch (insn & 0x00020000ULL) {
+            case 0x00000000ULL:
+            {
+              switch (insn & 0x02000000ULL) {
+              case 0x00000000ULL:
+              {
+                if ((insn & 0xf9ffffffULL) == 0x00009181ULL) return 59; /* BSTART.MSEQ */
+                return -1;
+              }
+              case 0x02000000ULL:
+              {
+                switch (insn & 0x04000000ULL) {
+                case 0x00000000ULL:
+                {
+                  switch (insn & 0x00040000ULL) {
+                  case 0x00000000ULL:
+                  {
+                    switch (insn & 0x00080000ULL) {
+                    case 0x00000000ULL:
+                    {
+                      switch (insn & 0x00100000ULL) {
+                      case 0x00000000ULL:
+                      {
+                        switch (insn & 0x00200000ULL) {
+                        case 0x00000000ULL:
+                        {
+                          switch (insn & 0x00400000ULL) {
+                          case 0x00000000ULL:
+                          {
+                            switch (insn & 0x00800000ULL) {
+                            case 0x00000000ULL:
+                            {
+                              switch (insn & 0x01000000ULL) {
+                              case 0x00000000ULL:
+                              {
+                                switch (insn & 0x08000000ULL) {
+                                case 0x00000000ULL:
+                                {
+                                  switch (insn & 0x10000000ULL) {
+                                  case 0x00000000ULL:
+                                  {
+                                    switch (insn & 0x20000000ULL) {
+                                    case 0x00000000ULL:
+                                    {
+                                      switch (insn & 0x40000000ULL) {
+                                      case 0x00000000ULL:
+                                      {
+                                        switch (insn & 0x80000000ULL) {
+                                        case 0x00000000ULL:
+                                        {
+                                          if ((insn & 0xf9ffffffULL) == 0x00009181ULL) return 59; /* BSTART.MSEQ */
+                                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                          return -1;
+                                        }
+                                        case 0x80000000ULL:
+                                        {
+                                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                          return -1;
+                                        }
+                                        default:
+                                          return -1;
+                                        }
+                                      }
+                                      case 0x40000000ULL:
+                                      {
+                                        if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                        if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                        return -1;
+                                      }
+                                      default:
+                                        return -1;
+                                      }
+                                    }
+                                    case 0x20000000ULL:
+                                    {
+                                      if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                      if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                      return -1;
+                                    }
+                                    default:
+                                      return -1;
+                                    }
+                                  }
+                                  case 0x10000000ULL:
+                                  {
+                                    if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                    if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                    return -1;
+                                  }
+                                  default:
+                                    return -1;
+                                  }
+                                }
+                                case 0x08000000ULL:
+                                {
+                                  if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                  if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                  return -1;
+                                }
+                                default:
+                                  return -1;
+                                }
+                              }
+                              case 0x01000000ULL:
+                              {
+                                if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                return -1;
+                              }
+                              default:
+                                return -1;
+                              }
+                            }
+                            case 0x00800000ULL:
+                            {
+                              if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                              if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                              return -1;
+                            }
+                            default:
+                              return -1;
+                            }
+                          }
+                          case 0x00400000ULL:
+                          {
+                            if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                            if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                            return -1;
+                          }
+                          default:
+                            return -1;
+                          }
+                        }
+                        case 0x00200000ULL:
+                        {
+                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                          return -1;
+                        }
+                        default:
+                          return -1;
+                        }
+                      }
+                      case 0x00100000ULL:
+                      {
+                        if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                        if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                        return -1;
+                      }
+                      default:
+                        return -1;
+                      }
+                    }
+                    case 0x00080000ULL:
+                    {
+                      if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                      if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                      return -1;
+                    }
+                    default:
+                      return -1;
+                    }
+                  }
+                  case 0x00040000ULL:
+                  {
+                    if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                    if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                    return -1;
+                  }
+                  default:
+                    return -1;
+                  }
+                }
+                case 0x04000000ULL:
+                {
+                  if ((insn & 0xf9ffffffULL) == 0x00009181ULL) return 59; /* BSTART.MSEQ */
+                  return -1;
+                }
+                default:
+                  return -1;
+                }
+              }
+              default:
+                return -1;
+              }
+            }
+            case 0x00020000ULL:
+            {
+              switch (insn & 0x02000000ULL) {
+              case 0x00000000ULL:
+              {
+                if ((insn & 0xf9ffffffULL) == 0x00029181ULL) return 77; /* BSTART.VSEQ */
+                return -1;
+              }
+              case 0x02000000ULL:
+              {
+                switch (insn & 0x04000000ULL) {
+                case 0x00000000ULL:
+                {
+                  switch (insn & 0x00040000ULL) {
+                  case 0x00000000ULL:
+                  {
+                    switch (insn & 0x00080000ULL) {
+                    case 0x00000000ULL:
+                    {
+                      switch (insn & 0x00100000ULL) {
+                      case 0x00000000ULL:
+                      {
+                        switch (insn & 0x00200000ULL) {
+                        case 0x00000000ULL:
+                        {
+                          switch (insn & 0x00400000ULL) {
+                          case 0x00000000ULL:
+                          {
+                            switch (insn & 0x00800000ULL) {
+                            case 0x00000000ULL:
+                            {
+                              switch (insn & 0x01000000ULL) {
+                              case 0x00000000ULL:
+                              {
+                                switch (insn & 0x08000000ULL) {
+                                case 0x00000000ULL:
+                                {
+                                  switch (insn & 0x10000000ULL) {
+                                  case 0x00000000ULL:
+                                  {
+                                    switch (insn & 0x20000000ULL) {
+                                    case 0x00000000ULL:
+                                    {
+                                      switch (insn & 0x40000000ULL) {
+                                      case 0x00000000ULL:
+                                      {
+                                        switch (insn & 0x80000000ULL) {
+                                        case 0x00000000ULL:
+                                        {
+                                          if ((insn & 0xf9ffffffULL) == 0x00029181ULL) return 77; /* BSTART.VSEQ */
+                                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                          return -1;
+                                        }
+                                        case 0x80000000ULL:
+                                        {
+                                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                          return -1;
+                                        }
+                                        default:
+                                          return -1;
+                                        }
+                                      }
+                                      case 0x40000000ULL:
+                                      {
+                                        if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                        if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                        return -1;
+                                      }
+                                      default:
+                                        return -1;
+                                      }
+                                    }
+                                    case 0x20000000ULL:
+                                    {
+                                      if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                      if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                      return -1;
+                                    }
+                                    default:
+                                      return -1;
+                                    }
+                                  }
+                                  case 0x10000000ULL:
+                                  {
+                                    if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                    if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                    return -1;
+                                  }
+                                  default:
+                                    return -1;
+                                  }
+                                }
+                                case 0x08000000ULL:
+                                {
+                                  if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                  if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                  return -1;
+                                }
+                                default:
+                                  return -1;
+                                }
+                              }
+                              case 0x01000000ULL:
+                              {
+                                if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                                if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                                return -1;
+                              }
+                              default:
+                                return -1;
+                              }
+                            }
+                            case 0x00800000ULL:
+                            {
+                              if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                              if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                              return -1;
+                            }
+                            default:
+                              return -1;
+                            }
+                          }
+                          case 0x00400000ULL:
+                          {
+                            if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                            if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                            return -1;
+                          }
+                          default:
+                            return -1;
+                          }
+                        }
+                        case 0x00200000ULL:
+                        {
+                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                          if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                          return -1;
+                        }
+                        default:
+                          return -1;
+                        }
+                      }
+                      case 0x00100000ULL:
+                      {
+                        if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                        if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                        return -1;
+                      }
+                      default:
+                        return -1;
+                      }
+                    }
+                    case 0x00080000ULL:
+                    {
+                      if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                      if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                      return -1;
+                    }
+                    default:
+                      return -1;
+                    }
+                  }
+                  case 0x00040000ULL:
+                  {
+                    if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+                    if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+                    return -1;
+                  }
+                  default:
+                    return -1;
+                  }
+                }
+                case 0x04000000ULL:
+                {
+                  if ((insn & 0xf9ffffffULL) == 0x00029181ULL) return 77; /* BSTART.VSEQ */
+                  return -1;
+                }
+                default:
+                  return -1;
+                }
+              }
+              default:
+                return -1;
+              }
+            }
+            default:
+              return -1;
+            }
+          }
+          case 0x00010000ULL:
+          {
+            switch (insn & 0x06000000ULL) {
+            case 0x00000000ULL:
+            {
+              if ((insn & 0x060fffffULL) == 0x00039181ULL) return 50; /* BSTART.FIXP */
+              return -1;
+            }
+            case 0x02000000ULL:
+            {
+              if ((insn & 0x06007fffULL) == 0x02001181ULL) return 60; /* BSTART.PAR */
+              if ((insn & 0x06007fffULL) == 0x02001181ULL) return 69; /* BSTART.TEPL */
+              return -1;
+            }
+            default:
+              return -1;
+            }
+          }
+          default:
+            return -1;
+          }
+        }
+        default:
+          return -1;
+        }
+      }
+      case 0x00002000ULL:
+      {
+        if ((insn & 0x00007fffULL) == 0x00002001ULL) return 67; /* BSTART.STD */
+        return -1;
+      }
+      case 0x00002100ULL:
+      {
+        if ((insn & 0x00007fffULL) == 0x00002101ULL) return 54; /* BSTART.FP */
+        return -1;
+      }
+      case 0x00003000ULL:
+      {
+        if ((insn & 0x00007fffULL) == 0x00003001ULL) return 61; /* BSTART.STD */
+        return -1;
+      }
+      case 0x00003100ULL:
+      {
+        if ((insn & 0x00007fffULL) == 0x00003101ULL) return 53; /* BSTART.FP */
+        return -1;
+      }
+      case 0x00004000ULL:
+      {
+        if ((insn & 0x00007fffULL) == 0x00004001ULL) return 65; /* BSTART.STD */
+        return -1;
+      }
+      case 0x00004100ULL:
+      {
+        if ((insn & 0x00007fffULL) == 0x00004101ULL) return 56; /* BSTART.FP */
+        return -1;
+      }
+      case 0x00005000ULL:
+      {
+        if ((insn & 0x00007fffULL) == 0x00005001ULL) return 66; /* BSTART.STD */
+        return -1;
+      }
+      case 0x00005100ULL:
+      {
+        if ((insn & 0x00007fffULL) == 0x00005101ULL) return 52; /* BSTART.FP */
+        return -1;
+      }
+      case 0x00006000ULL:
+      {
+        if ((insn & 0x00007fffULL) == 0x00006001ULL) return 64; /* BSTART.STD */
+        return -1;
+      }
+      case 0x00006100ULL:
+      {
+        if ((insn & 0x00007fffULL) == 0x00006101ULL) return 55; /* BSTART.FP */
+        return -1;
+      }
+      case 0x00006f80ULL:
+      {
+        if ((insn & 0x00007fffULL) == 0x00006f81ULL) return 735; /* XB */
+        return -1;
+      }
+      case 0x00007000ULL:
+      {
+        if ((insn & 0x00007fffULL) == 0x00007001ULL) return 62; /* BSTART.STD */
+        return -1;
+      }
+      case 0x00007100ULL:
+      {
+        if ((insn & 0x00007fffULL) == 0x00007101ULL) return 51; /* BSTART.FP */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x00000010ULL:
+    {
+      if ((insn & 0x0000007fULL) == 0x00000011ULL) return 45; /* BSTART */
+      return -1;
+    }
+    case 0x00000020ULL:
+    {
+      if ((insn & 0x0000007fULL) == 0x00000021ULL) return 46; /* BSTART */
+      return -1;
+    }
+    case 0x00000030ULL:
+    {
+      switch (insn & 0x06007f80ULL) {
+      case 0x00000000ULL:
+      {
+        if ((insn & 0x06007fffULL) == 0x00000031ULL) return 447; /* MCOPY */
+        return -1;
+      }
+      case 0x00001000ULL:
+      {
+        if ((insn & 0x06007fffULL) == 0x00001031ULL) return 450; /* MSET */
+        return -1;
+      }
+      case 0x00002000ULL:
+      {
+        if ((insn & 0x06007fffULL) == 0x00002031ULL) return 156; /* ESAVE */
+        return -1;
+      }
+      case 0x00003000ULL:
+      {
+        if ((insn & 0x06007fffULL) == 0x00003031ULL) return 155; /* ERCOV */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x00000040ULL:
+    {
+      switch (insn & 0x00007000ULL) {
+      case 0x00000000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00000041ULL) return 168; /* FENTRY */
+        return -1;
+      }
+      case 0x00001000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00001041ULL) return 171; /* FEXIT */
+        return -1;
+      }
+      case 0x00002000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00002041ULL) return 187; /* FRET.RA */
+        return -1;
+      }
+      case 0x00003000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00003041ULL) return 188; /* FRET.STK */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    default:
+      return -1;
+    }
+  }
+  case 0x00000002ULL:
+  {
+    if ((insn & 0xf83f000fULL) == 0x50160002ULL) return 47; /* BSTART CALL */
+    return -1;
+  }
+  case 0x00000003ULL:
+  {
+    switch (insn & 0x00000070ULL) {
+    case 0x00000000ULL:
+    {
+      if ((insn & 0x0000007fULL) == 0x00000003ULL) return 37; /* B.TEXT */
+      return -1;
+    }
+    case 0x00000010ULL:
+    {
+      switch (insn & 0x00007000ULL) {
+      case 0x00000000ULL:
+      {
+        if ((insn & 0x0600707fULL) == 0x00000013ULL) return 28; /* B.IOR */
+        return -1;
+      }
+      case 0x00001000ULL:
+      {
+        if ((insn & 0x0600707fULL) == 0x00001013ULL) return 27; /* B.IOD */
+        return -1;
+      }
+      case 0x00004000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00004013ULL) return 30; /* B.IOT */
+        return -1;
+      }
+      case 0x00005000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00005013ULL) return 29; /* B.IOT */
+        return -1;
+      }
+      case 0x00006000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00006013ULL) return 31; /* B.IOTI */
+        return -1;
+      }
+      case 0x00007000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00007013ULL) return 32; /* B.IOTI */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x00000020ULL:
+    {
+      switch (insn & 0x00007000ULL) {
+      case 0x00000000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00000023ULL) return 18; /* B.ATTR */
+        return -1;
+      }
+      case 0x00002000ULL:
+      {
+        switch (insn & 0xffff8f80ULL) {
+        case 0x000f8000ULL:
+        {
+          if ((insn & 0xffffffffULL) == 0x000fa023ULL) return 12; /* B.ARG */
+          return -1;
+        }
+        case 0x020f8e00ULL:
+        {
+          if ((insn & 0xffffffffULL) == 0x020fae23ULL) return 14; /* B.ARG */
+          return -1;
+        }
+        case 0x18008480ULL:
+        {
+          if ((insn & 0xffffffffULL) == 0x1800a4a3ULL) return 17; /* B.ARG */
+          return -1;
+        }
+        case 0x18020180ULL:
+        {
+          if ((insn & 0xffffffffULL) == 0x180221a3ULL) return 15; /* B.ARG */
+          return -1;
+        }
+        case 0x18020400ULL:
+        {
+          if ((insn & 0xffffffffULL) == 0x18022423ULL) return 16; /* B.ARG */
+          return -1;
+        }
+        default:
+          return -1;
+        }
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x00000030ULL:
+    {
+      if ((insn & 0x00087fffULL) == 0x00000033ULL) return 25; /* B.HINT */
+      if ((insn & 0x00007fffULL) == 0x00001033ULL) return 26; /* B.HINT */
+      return -1;
+    }
+    case 0x00000040ULL:
+    {
+      switch (insn & 0x00007000ULL) {
+      case 0x00000000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00000043ULL) return 20; /* B.DIM */
+        return -1;
+      }
+      case 0x00001000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00001043ULL) return 21; /* B.DIM */
+        return -1;
+      }
+      case 0x00002000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00002043ULL) return 19; /* B.DIM */
+        return -1;
+      }
+      case 0x00003000ULL:
+      {
+        if ((insn & 0xfffff07fULL) == 0x00003043ULL) return 13; /* B.ARG */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    default:
+      return -1;
+    }
+  }
+  case 0x00000005ULL:
+  {
+    switch (insn & 0x00007070ULL) {
+    case 0x00000000ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00000005ULL) return 2; /* ADD */
+      return -1;
+    }
+    case 0x00000010ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00000015ULL) return 3; /* ADDI */
+      return -1;
+    }
+    case 0x00000020ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00000025ULL) return 6; /* ADDW */
+      return -1;
+    }
+    case 0x00000030ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00000035ULL) return 4; /* ADDIW */
+      return -1;
+    }
+    case 0x00000040ULL:
+    {
+      if ((insn & 0xf800707fULL) == 0x00000045ULL) return 126; /* CMP.EQ */
+      return -1;
+    }
+    case 0x00000050ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00000055ULL) return 127; /* CMP.EQI */
+      return -1;
+    }
+    case 0x00000060ULL:
+    {
+      if ((insn & 0xf8007fffULL) == 0x00000065ULL) return 489; /* SETC.EQ */
+      return -1;
+    }
+    case 0x00000070ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00000075ULL) return 490; /* SETC.EQI */
+      return -1;
+    }
+    case 0x00001000ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00001005ULL) return 525; /* SUB */
+      return -1;
+    }
+    case 0x00001010ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00001015ULL) return 526; /* SUBI */
+      return -1;
+    }
+    case 0x00001020ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00001025ULL) return 528; /* SUBW */
+      return -1;
+    }
+    case 0x00001030ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00001035ULL) return 527; /* SUBIW */
+      return -1;
+    }
+    case 0x00001040ULL:
+    {
+      if ((insn & 0xf800707fULL) == 0x00001045ULL) return 136; /* CMP.NE */
+      return -1;
+    }
+    case 0x00001050ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00001055ULL) return 137; /* CMP.NEI */
+      return -1;
+    }
+    case 0x00001060ULL:
+    {
+      if ((insn & 0xf8007fffULL) == 0x00001065ULL) return 499; /* SETC.NE */
+      return -1;
+    }
+    case 0x00001070ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00001075ULL) return 500; /* SETC.NEI */
+      return -1;
+    }
+    case 0x00002000ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00002005ULL) return 7; /* AND */
+      return -1;
+    }
+    case 0x00002010ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00002015ULL) return 8; /* ANDI */
+      return -1;
+    }
+    case 0x00002020ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00002025ULL) return 10; /* ANDW */
+      return -1;
+    }
+    case 0x00002030ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00002035ULL) return 9; /* ANDIW */
+      return -1;
+    }
+    case 0x00002040ULL:
+    {
+      if ((insn & 0xf800707fULL) == 0x00002045ULL) return 124; /* CMP.AND */
+      return -1;
+    }
+    case 0x00002050ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00002055ULL) return 125; /* CMP.ANDI */
+      return -1;
+    }
+    case 0x00002060ULL:
+    {
+      if ((insn & 0xf8007fffULL) == 0x00002065ULL) return 487; /* SETC.AND */
+      return -1;
+    }
+    case 0x00002070ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00002075ULL) return 488; /* SETC.ANDI */
+      return -1;
+    }
+    case 0x00003000ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00003005ULL) return 455; /* OR */
+      return -1;
+    }
+    case 0x00003010ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00003015ULL) return 456; /* ORI */
+      return -1;
+    }
+    case 0x00003020ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00003025ULL) return 458; /* ORW */
+      return -1;
+    }
+    case 0x00003030ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00003035ULL) return 457; /* ORIW */
+      return -1;
+    }
+    case 0x00003040ULL:
+    {
+      if ((insn & 0xf800707fULL) == 0x00003045ULL) return 138; /* CMP.OR */
+      return -1;
+    }
+    case 0x00003050ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00003055ULL) return 139; /* CMP.ORI */
+      return -1;
+    }
+    case 0x00003060ULL:
+    {
+      if ((insn & 0xf8007fffULL) == 0x00003065ULL) return 501; /* SETC.OR */
+      return -1;
+    }
+    case 0x00003070ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00003075ULL) return 502; /* SETC.ORI */
+      return -1;
+    }
+    case 0x00004000ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00004005ULL) return 736; /* XOR */
+      return -1;
+    }
+    case 0x00004010ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00004015ULL) return 737; /* XORI */
+      return -1;
+    }
+    case 0x00004020ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00004025ULL) return 739; /* XORW */
+      return -1;
+    }
+    case 0x00004030ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00004035ULL) return 738; /* XORIW */
+      return -1;
+    }
+    case 0x00004040ULL:
+    {
+      if ((insn & 0xf800707fULL) == 0x00004045ULL) return 132; /* CMP.LT */
+      return -1;
+    }
+    case 0x00004050ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00004055ULL) return 133; /* CMP.LTI */
+      return -1;
+    }
+    case 0x00004060ULL:
+    {
+      if ((insn & 0xf8007fffULL) == 0x00004065ULL) return 495; /* SETC.LT */
+      return -1;
+    }
+    case 0x00004070ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00004075ULL) return 496; /* SETC.LTI */
+      return -1;
+    }
+    case 0x00005000ULL:
+    {
+      if ((insn & 0xfe00707fULL) == 0x00005005ULL) return 518; /* SRL */
+      return -1;
+    }
+    case 0x00005010ULL:
+    {
+      if ((insn & 0xfc00707fULL) == 0x00005015ULL) return 519; /* SRLI */
+      return -1;
+    }
+    case 0x00005020ULL:
+    {
+      if ((insn & 0xfe00707fULL) == 0x00005025ULL) return 521; /* SRLW */
+      return -1;
+    }
+    case 0x00005030ULL:
+    {
+      if ((insn & 0xfe00707fULL) == 0x00005035ULL) return 520; /* SRLIW */
+      return -1;
+    }
+    case 0x00005040ULL:
+    {
+      if ((insn & 0xf800707fULL) == 0x00005045ULL) return 128; /* CMP.GE */
+      return -1;
+    }
+    case 0x00005050ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00005055ULL) return 129; /* CMP.GEI */
+      return -1;
+    }
+    case 0x00005060ULL:
+    {
+      if ((insn & 0xf8007fffULL) == 0x00005065ULL) return 491; /* SETC.GE */
+      return -1;
+    }
+    case 0x00005070ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00005075ULL) return 492; /* SETC.GEI */
+      return -1;
+    }
+    case 0x00006000ULL:
+    {
+      if ((insn & 0xfe00707fULL) == 0x00006005ULL) return 514; /* SRA */
+      return -1;
+    }
+    case 0x00006010ULL:
+    {
+      if ((insn & 0xfc00707fULL) == 0x00006015ULL) return 515; /* SRAI */
+      return -1;
+    }
+    case 0x00006020ULL:
+    {
+      if ((insn & 0xfe00707fULL) == 0x00006025ULL) return 517; /* SRAW */
+      return -1;
+    }
+    case 0x00006030ULL:
+    {
+      if ((insn & 0xfe00707fULL) == 0x00006035ULL) return 516; /* SRAIW */
+      return -1;
+    }
+    case 0x00006040ULL:
+    {
+      if ((insn & 0xf800707fULL) == 0x00006045ULL) return 134; /* CMP.LTU */
+      return -1;
+    }
+    case 0x00006050ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00006055ULL) return 135; /* CMP.LTUI */
+      return -1;
+    }
+    case 0x00006060ULL:
+    {
+      if ((insn & 0xf8007fffULL) == 0x00006065ULL) return 497; /* SETC.LTU */
+      return -1;
+    }
+    case 0x00006070ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00006075ULL) return 498; /* SETC.LTUI */
+      return -1;
+    }
+    case 0x00007000ULL:
+    {
+      if ((insn & 0xfe00707fULL) == 0x00007005ULL) return 510; /* SLL */
+      return -1;
+    }
+    case 0x00007010ULL:
+    {
+      if ((insn & 0xfc00707fULL) == 0x00007015ULL) return 511; /* SLLI */
+      return -1;
+    }
+    case 0x00007020ULL:
+    {
+      if ((insn & 0xfe00707fULL) == 0x00007025ULL) return 513; /* SLLW */
+      return -1;
+    }
+    case 0x00007030ULL:
+    {
+      if ((insn & 0xfe00707fULL) == 0x00007035ULL) return 512; /* SLLIW */
+      return -1;
+    }
+    case 0x00007040ULL:
+    {
+      if ((insn & 0xf800707fULL) == 0x00007045ULL) return 130; /* CMP.GEU */
+      return -1;
+    }
+    case 0x00007050ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00007055ULL) return 131; /* CMP.GEUI */
+      return -1;
+    }
+    case 0x00007060ULL:
+    {
+      if ((insn & 0xf8007fffULL) == 0x00007065ULL) return 493; /* SETC.GEU */
+      return -1;
+    }
+    case 0x00007070ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00007075ULL) return 494; /* SETC.GEUI */
+      return -1;
+    }
+    default:
+      return -1;
+    }
+  }
+  case 0x00000007ULL:
+  {
+    switch (insn & 0x00000070ULL) {
+    case 0x00000000ULL:
+    {
+      if ((insn & 0x00000fffULL) == 0x00000507ULL) return 504; /* SETRET */
+      if ((insn & 0x0000007fULL) == 0x00000007ULL) return 5; /* ADDTPC */
+      return -1;
+    }
+    case 0x00000010ULL:
+    {
+      if ((insn & 0x0000007fULL) == 0x00000017ULL) return 426; /* LUI */
+      return -1;
+    }
+    case 0x00000020ULL:
+    {
+      switch (insn & 0x00007000ULL) {
+      case 0x00000000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00000027ULL) return 22; /* B.EQ */
+        return -1;
+      }
+      case 0x00001000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00001027ULL) return 35; /* B.NE */
+        return -1;
+      }
+      case 0x00002000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00002027ULL) return 33; /* B.LT */
+        return -1;
+      }
+      case 0x00003000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00003027ULL) return 23; /* B.GE */
+        return -1;
+      }
+      case 0x00004000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00004027ULL) return 34; /* B.LTU */
+        return -1;
+      }
+      case 0x00005000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00005027ULL) return 24; /* B.GEU */
+        return -1;
+      }
+      case 0x00006000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00006027ULL) return 394; /* JR */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x00000030ULL:
+    {
+      switch (insn & 0x00007000ULL) {
+      case 0x00000000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00000037ULL) return 393; /* J */
+        return -1;
+      }
+      case 0x00001000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00001037ULL) return 38; /* B.Z */
+        return -1;
+      }
+      case 0x00002000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00002037ULL) return 36; /* B.NZ */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x00000040ULL:
+    {
+      switch (insn & 0x06007000ULL) {
+      case 0x00000000ULL:
+      {
+        if ((insn & 0xfe00707fULL) == 0x00000047ULL) return 451; /* MUL */
+        return -1;
+      }
+      case 0x00001000ULL:
+      {
+        if ((insn & 0xfe00707fULL) == 0x00001047ULL) return 452; /* MULU */
+        return -1;
+      }
+      case 0x00002000ULL:
+      {
+        if ((insn & 0xfe00707fULL) == 0x00002047ULL) return 454; /* MULW */
+        return -1;
+      }
+      case 0x00003000ULL:
+      {
+        if ((insn & 0xfe00707fULL) == 0x00003047ULL) return 453; /* MULUW */
+        return -1;
+      }
+      case 0x00006000ULL:
+      {
+        if ((insn & 0x0600707fULL) == 0x00006047ULL) return 443; /* MADD */
+        return -1;
+      }
+      case 0x00007000ULL:
+      {
+        if ((insn & 0x0600707fULL) == 0x00007047ULL) return 444; /* MADDW */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x00000050ULL:
+    {
+      switch (insn & 0xfe007000ULL) {
+      case 0x00000000ULL:
+      {
+        if ((insn & 0xfe00707fULL) == 0x00000057ULL) return 150; /* DIV */
+        return -1;
+      }
+      case 0x00001000ULL:
+      {
+        if ((insn & 0xfe00707fULL) == 0x00001057ULL) return 151; /* DIVU */
+        return -1;
+      }
+      case 0x00002000ULL:
+      {
+        if ((insn & 0xfe00707fULL) == 0x00002057ULL) return 153; /* DIVW */
+        return -1;
+      }
+      case 0x00003000ULL:
+      {
+        if ((insn & 0xfe00707fULL) == 0x00003057ULL) return 152; /* DIVUW */
+        return -1;
+      }
+      case 0x00004000ULL:
+      {
+        if ((insn & 0xfe00707fULL) == 0x00004057ULL) return 461; /* REM */
+        return -1;
+      }
+      case 0x00005000ULL:
+      {
+        if ((insn & 0xfe00707fULL) == 0x00005057ULL) return 462; /* REMU */
+        return -1;
+      }
+      case 0x00006000ULL:
+      {
+        if ((insn & 0xfe00707fULL) == 0x00006057ULL) return 464; /* REMW */
+        return -1;
+      }
+      case 0x00007000ULL:
+      {
+        if ((insn & 0xfe00707fULL) == 0x00007057ULL) return 463; /* REMUW */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x00000060ULL:
+    {
+      switch (insn & 0x00007000ULL) {
+      case 0x00000000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00000067ULL) return 82; /* BXS */
+        return -1;
+      }
+      case 0x00001000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00001067ULL) return 83; /* BXU */
+        return -1;
+      }
+      case 0x00002000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00002067ULL) return 42; /* BIC */
+        return -1;
+      }
+      case 0x00003000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00003067ULL) return 43; /* BIS */
+        return -1;
+      }
+      case 0x00004000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00004067ULL) return 141; /* CTZ */
+        return -1;
+      }
+      case 0x00005000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00005067ULL) return 123; /* CLZ */
+        return -1;
+      }
+      case 0x00006000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00006067ULL) return 41; /* BCNT */
+        return -1;
+      }
+      case 0x00007000ULL:
+      {
+        if ((insn & 0x0000707fULL) == 0x00007067ULL) return 465; /* REV */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x00000070ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00000077ULL) return 140; /* CSEL */
+      return -1;
+    }
+    default:
+      return -1;
+    }
+  }
+  case 0x00000009ULL:
+  {
+    switch (insn & 0x00007070ULL) {
+    case 0x00000000ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00000009ULL) return 395; /* LB */
+      return -1;
+    }
+    case 0x00000010ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00000019ULL) return 397; /* LBI */
+      return -1;
+    }
+    case 0x00000030ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00000039ULL) return 396; /* LB.PCR */
+      return -1;
+    }
+    case 0x00000040ULL:
+    {
+      if ((insn & 0x00007fffULL) == 0x00000049ULL) return 466; /* SB */
+      return -1;
+    }
+    case 0x00000050ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00000059ULL) return 468; /* SBI */
+      return -1;
+    }
+    case 0x00000060ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00000069ULL) return 467; /* SB.PCR */
+      return -1;
+    }
+    case 0x00001000ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00001009ULL) return 413; /* LH */
+      return -1;
+    }
+    case 0x00001010ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00001019ULL) return 415; /* LHI */
+      return -1;
+    }
+    case 0x00001020ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00001029ULL) return 416; /* LHI.U */
+      return -1;
+    }
+    case 0x00001030ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00001039ULL) return 414; /* LH.PCR */
+      return -1;
+    }
+    case 0x00001040ULL:
+    {
+      if ((insn & 0x00007fffULL) == 0x00001049ULL) return 505; /* SH */
+      return -1;
+    }
+    case 0x00001050ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00001059ULL) return 508; /* SHI */
+      return -1;
+    }
+    case 0x00001060ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00001069ULL) return 506; /* SH.PCR */
+      return -1;
+    }
+    case 0x00002000ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00002009ULL) return 427; /* LW */
+      return -1;
+    }
+    case 0x00002010ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00002019ULL) return 437; /* LWI */
+      return -1;
+    }
+    case 0x00002020ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00002029ULL) return 438; /* LWI.U */
+      return -1;
+    }
+    case 0x00002030ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00002039ULL) return 431; /* LW.PCR */
+      return -1;
+    }
+    case 0x00002040ULL:
+    {
+      if ((insn & 0x00007fffULL) == 0x00002049ULL) return 529; /* SW */
+      return -1;
+    }
+    case 0x00002050ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00002059ULL) return 544; /* SWI */
+      return -1;
+    }
+    case 0x00002060ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00002069ULL) return 533; /* SW.PCR */
+      return -1;
+    }
+    case 0x00003000ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00003009ULL) return 401; /* LD */
+      return -1;
+    }
+    case 0x00003010ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00003019ULL) return 411; /* LDI */
+      return -1;
+    }
+    case 0x00003020ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00003029ULL) return 412; /* LDI.U */
+      return -1;
+    }
+    case 0x00003030ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00003039ULL) return 405; /* LD.PCR */
+      return -1;
+    }
+    case 0x00003040ULL:
+    {
+      if ((insn & 0x00007fffULL) == 0x00003049ULL) return 474; /* SD */
+      return -1;
+    }
+    case 0x00003050ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00003059ULL) return 485; /* SDI */
+      return -1;
+    }
+    case 0x00003060ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00003069ULL) return 478; /* SD.PCR */
+      return -1;
+    }
+    case 0x00004000ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00004009ULL) return 398; /* LBU */
+      return -1;
+    }
+    case 0x00004010ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00004019ULL) return 400; /* LBUI */
+      return -1;
+    }
+    case 0x00004030ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00004039ULL) return 399; /* LBU.PCR */
+      return -1;
+    }
+    case 0x00005000ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00005009ULL) return 417; /* LHU */
+      return -1;
+    }
+    case 0x00005010ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00005019ULL) return 419; /* LHUI */
+      return -1;
+    }
+    case 0x00005020ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00005029ULL) return 420; /* LHUI.U */
+      return -1;
+    }
+    case 0x00005030ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00005039ULL) return 418; /* LHU.PCR */
+      return -1;
+    }
+    case 0x00005040ULL:
+    {
+      if ((insn & 0x00007fffULL) == 0x00005049ULL) return 507; /* SH.U */
+      return -1;
+    }
+    case 0x00005050ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00005059ULL) return 509; /* SHI.U */
+      return -1;
+    }
+    case 0x00006000ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00006009ULL) return 439; /* LWU */
+      return -1;
+    }
+    case 0x00006010ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00006019ULL) return 441; /* LWUI */
+      return -1;
+    }
+    case 0x00006020ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00006029ULL) return 442; /* LWUI.U */
+      return -1;
+    }
+    case 0x00006030ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00006039ULL) return 440; /* LWU.PCR */
+      return -1;
+    }
+    case 0x00006040ULL:
+    {
+      if ((insn & 0x00007fffULL) == 0x00006049ULL) return 536; /* SW.U */
+      return -1;
+    }
+    case 0x00006050ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00006059ULL) return 545; /* SWI.U */
+      return -1;
+    }
+    case 0x00007000ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00007009ULL) return 459; /* PRF */
+      return -1;
+    }
+    case 0x00007020ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00007029ULL) return 460; /* PRFI.U */
+      return -1;
+    }
+    case 0x00007040ULL:
+    {
+      if ((insn & 0x00007fffULL) == 0x00007049ULL) return 481; /* SD.U */
+      return -1;
+    }
+    case 0x00007050ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x00007059ULL) return 486; /* SDI.U */
+      return -1;
+    }
+    default:
+      return -1;
+    }
+  }
+  case 0x0000000bULL:
+  {
+    switch (insn & 0x00007070ULL) {
+    case 0x00000000ULL:
+    {
+      switch (insn & 0xf0000000ULL) {
+      case 0x00000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x0000000bULL) return 421; /* LR.B */
+        return -1;
+      }
+      case 0x10000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x1000000bULL) return 423; /* LR.H */
+        return -1;
+      }
+      case 0x20000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x2000000bULL) return 424; /* LR.W */
+        return -1;
+      }
+      case 0x30000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x3000000bULL) return 422; /* LR.D */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x00000020ULL:
+    {
+      switch (insn & 0xfff00f80ULL) {
+      case 0x00000000ULL:
+      {
+        if ((insn & 0xfff07fffULL) == 0x0000002bULL) return 44; /* BSE */
+        return -1;
+      }
+      case 0x00100000ULL:
+      {
+        if ((insn & 0xfff07fffULL) == 0x0010002bULL) return 79; /* BWE */
+        return -1;
+      }
+      case 0x00200000ULL:
+      {
+        if ((insn & 0xfff07fffULL) == 0x0020002bULL) return 80; /* BWI */
+        return -1;
+      }
+      case 0x00300000ULL:
+      {
+        if ((insn & 0xfff07fffULL) == 0x0030002bULL) return 81; /* BWT */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x00000030ULL:
+    {
+      if ((insn & 0x000ff07fULL) == 0x0000003bULL) return 522; /* SSRGET */
+      return -1;
+    }
+    case 0x00000040ULL:
+    {
+      if ((insn & 0xf800707fULL) == 0x0000004bULL) return 158; /* FADD */
+      return -1;
+    }
+    case 0x00000050ULL:
+    {
+      if ((insn & 0xf800707fULL) == 0x0000005bULL) return 169; /* FEQ */
+      if ((insn & 0xf800707fULL) == 0x0800005bULL) return 170; /* FEQS */
+      return -1;
+    }
+    case 0x00000060ULL:
+    {
+      if ((insn & 0x01f0707fULL) == 0x0000006bULL) return 159; /* FCVT */
+      return -1;
+    }
+    case 0x00000070ULL:
+    {
+      if ((insn & 0xf9f0707fULL) == 0x0000007bULL) return 157; /* FABS */
+      return -1;
+    }
+    case 0x00001000ULL:
+    {
+      switch (insn & 0xf0000000ULL) {
+      case 0x00000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x0000100bULL) return 469; /* SC.B */
+        return -1;
+      }
+      case 0x10000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x1000100bULL) return 471; /* SC.H */
+        return -1;
+      }
+      case 0x20000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x2000100bULL) return 472; /* SC.W */
+        return -1;
+      }
+      case 0x30000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x3000100bULL) return 470; /* SC.D */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x00001020ULL:
+    {
+      if ((insn & 0xf0ffffffULL) == 0x0010102bULL) return 154; /* EBREAK */
+      if ((insn & 0xfff07fffULL) == 0x0000102bULL) return 11; /* ASSERT */
+      return -1;
+    }
+    case 0x00001030ULL:
+    {
+      if ((insn & 0x00007fffULL) == 0x0000103bULL) return 523; /* SSRSET */
+      return -1;
+    }
+    case 0x00001040ULL:
+    {
+      if ((insn & 0xf800707fULL) == 0x0000104bULL) return 190; /* FSUB */
+      return -1;
+    }
+    case 0x00001050ULL:
+    {
+      if ((insn & 0xf800707fULL) == 0x0000105bULL) return 182; /* FNE */
+      if ((insn & 0xf800707fULL) == 0x0800105bULL) return 183; /* FNES */
+      return -1;
+    }
+    case 0x00001060ULL:
+    {
+      if ((insn & 0x01f0707fULL) == 0x0000106bULL) return 160; /* FCVTA */
+      return -1;
+    }
+    case 0x00001070ULL:
+    {
+      if ((insn & 0xf9f0707fULL) == 0x0000107bULL) return 189; /* FSQRT */
+      return -1;
+    }
+    case 0x00002000ULL:
+    {
+      switch (insn & 0xf0000000ULL) {
+      case 0x00000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x0000200bULL) return 428; /* LW.ADD */
+        return -1;
+      }
+      case 0x10000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x1000200bULL) return 429; /* LW.AND */
+        return -1;
+      }
+      case 0x20000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x2000200bULL) return 430; /* LW.OR */
+        return -1;
+      }
+      case 0x30000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x3000200bULL) return 436; /* LW.XOR */
+        return -1;
+      }
+      case 0x40000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x4000200bULL) return 432; /* LW.SMAX */
+        return -1;
+      }
+      case 0x50000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x5000200bULL) return 433; /* LW.SMIN */
+        return -1;
+      }
+      case 0x60000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x6000200bULL) return 434; /* LW.UMAX */
+        return -1;
+      }
+      case 0x70000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x7000200bULL) return 435; /* LW.UMIN */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x00002020ULL:
+    {
+      if ((insn & 0xffffffffULL) == 0x1000202bULL) return 167; /* FENCE.I */
+      if ((insn & 0xf00fffffULL) == 0x0000202bULL) return 166; /* FENCE.D */
+      return -1;
+    }
+    case 0x00002030ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x0000203bULL) return 524; /* SSRSWAP */
+      return -1;
+    }
+    case 0x00002040ULL:
+    {
+      if ((insn & 0xf800707fULL) == 0x0000204bULL) return 181; /* FMUL */
+      return -1;
+    }
+    case 0x00002050ULL:
+    {
+      if ((insn & 0xf800707fULL) == 0x0000205bULL) return 175; /* FLT */
+      if ((insn & 0xf800707fULL) == 0x0800205bULL) return 176; /* FLTS */
+      return -1;
+    }
+    case 0x00002060ULL:
+    {
+      if ((insn & 0x01f0707fULL) == 0x0000206bULL) return 161; /* FCVTM */
+      return -1;
+    }
+    case 0x00002070ULL:
+    {
+      if ((insn & 0xf9f0707fULL) == 0x0000207bULL) return 186; /* FRECIP */
+      return -1;
+    }
+    case 0x00003000ULL:
+    {
+      switch (insn & 0xf4000f80ULL) {
+      case 0x00000000ULL:
+      {
+        if ((insn & 0xf4007fffULL) == 0x0000300bULL) return 530; /* SW.ADD */
+        return -1;
+      }
+      case 0x10000000ULL:
+      {
+        if ((insn & 0xf4007fffULL) == 0x1000300bULL) return 531; /* SW.AND */
+        return -1;
+      }
+      case 0x20000000ULL:
+      {
+        if ((insn & 0xf4007fffULL) == 0x2000300bULL) return 532; /* SW.OR */
+        return -1;
+      }
+      case 0x30000000ULL:
+      {
+        if ((insn & 0xf4007fffULL) == 0x3000300bULL) return 539; /* SW.XOR */
+        return -1;
+      }
+      case 0x40000000ULL:
+      {
+        if ((insn & 0xf4007fffULL) == 0x4000300bULL) return 534; /* SW.SMAX */
+        return -1;
+      }
+      case 0x50000000ULL:
+      {
+        if ((insn & 0xf4007fffULL) == 0x5000300bULL) return 535; /* SW.SMIN */
+        return -1;
+      }
+      case 0x60000000ULL:
+      {
+        if ((insn & 0xf4007fffULL) == 0x6000300bULL) return 537; /* SW.UMAX */
+        return -1;
+      }
+      case 0x70000000ULL:
+      {
+        if ((insn & 0xf4007fffULL) == 0x7000300bULL) return 538; /* SW.UMIN */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x00003020ULL:
+    {
+      if ((insn & 0xff0fffffULL) == 0x0000302bULL) return 0; /* ACRC */
+      if ((insn & 0xff0fffffULL) == 0x0100302bULL) return 1; /* ACRE */
+      return -1;
+    }
+    case 0x00003030ULL:
+    {
+      if ((insn & 0x000ff07fULL) == 0x0000303bULL) return 425; /* LSRGET */
+      return -1;
+    }
+    case 0x00003040ULL:
+    {
+      if ((insn & 0xf800707fULL) == 0x0000304bULL) return 165; /* FDIV */
+      return -1;
+    }
+    case 0x00003050ULL:
+    {
+      if ((insn & 0xf800707fULL) == 0x0000305bULL) return 173; /* FGE */
+      if ((insn & 0xf800707fULL) == 0x0800305bULL) return 174; /* FGES */
+      return -1;
+    }
+    case 0x00003060ULL:
+    {
+      if ((insn & 0x01f0707fULL) == 0x0000306bULL) return 162; /* FCVTN */
+      return -1;
+    }
+    case 0x00003070ULL:
+    {
+      if ((insn & 0xf9f0707fULL) == 0x0000307bULL) return 172; /* FEXP */
+      return -1;
+    }
+    case 0x00004000ULL:
+    {
+      switch (insn & 0xf0000000ULL) {
+      case 0x00000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x0000400bULL) return 402; /* LD.ADD */
+        return -1;
+      }
+      case 0x10000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x1000400bULL) return 403; /* LD.AND */
+        return -1;
+      }
+      case 0x20000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x2000400bULL) return 404; /* LD.OR */
+        return -1;
+      }
+      case 0x30000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x3000400bULL) return 410; /* LD.XOR */
+        return -1;
+      }
+      case 0x40000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x4000400bULL) return 406; /* LD.SMAX */
+        return -1;
+      }
+      case 0x50000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x5000400bULL) return 407; /* LD.SMIN */
+        return -1;
+      }
+      case 0x60000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x6000400bULL) return 408; /* LD.UMAX */
+        return -1;
+      }
+      case 0x70000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x7000400bULL) return 409; /* LD.UMIN */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x00004020ULL:
+    {
+      if ((insn & 0xffffffffULL) == 0x0010402bULL) return 39; /* BC.IALL */
+      if ((insn & 0xfff07fffULL) == 0x0000402bULL) return 40; /* BC.IVA */
+      return -1;
+    }
+    case 0x00004030ULL:
+    {
+      if ((insn & 0xfff07fffULL) == 0x0000403bULL) return 503; /* SETC.TGT */
+      return -1;
+    }
+    case 0x00004040ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x0000404bULL) return 177; /* FMADD */
+      return -1;
+    }
+    case 0x00004050ULL:
+    {
+      if ((insn & 0xfe00707fULL) == 0x0000405bULL) return 445; /* MAX */
+      if ((insn & 0xfe00707fULL) == 0x0800405bULL) return 446; /* MAXU */
+      return -1;
+    }
+    case 0x00004060ULL:
+    {
+      if ((insn & 0x01f0707fULL) == 0x0000406bULL) return 163; /* FCVTP */
+      return -1;
+    }
+    case 0x00005000ULL:
+    {
+      switch (insn & 0xf4000f80ULL) {
+      case 0x00000000ULL:
+      {
+        if ((insn & 0xf4007fffULL) == 0x0000500bULL) return 475; /* SD.ADD */
+        return -1;
+      }
+      case 0x10000000ULL:
+      {
+        if ((insn & 0xf4007fffULL) == 0x1000500bULL) return 476; /* SD.AND */
+        return -1;
+      }
+      case 0x20000000ULL:
+      {
+        if ((insn & 0xf4007fffULL) == 0x2000500bULL) return 477; /* SD.OR */
+        return -1;
+      }
+      case 0x30000000ULL:
+      {
+        if ((insn & 0xf4007fffULL) == 0x3000500bULL) return 484; /* SD.XOR */
+        return -1;
+      }
+      case 0x40000000ULL:
+      {
+        if ((insn & 0xf4007fffULL) == 0x4000500bULL) return 479; /* SD.SMAX */
+        return -1;
+      }
+      case 0x50000000ULL:
+      {
+        if ((insn & 0xf4007fffULL) == 0x5000500bULL) return 480; /* SD.SMIN */
+        return -1;
+      }
+      case 0x60000000ULL:
+      {
+        if ((insn & 0xf4007fffULL) == 0x6000500bULL) return 482; /* SD.UMAX */
+        return -1;
+      }
+      case 0x70000000ULL:
+      {
+        if ((insn & 0xf4007fffULL) == 0x7000500bULL) return 483; /* SD.UMIN */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x00005020ULL:
+    {
+      if ((insn & 0xffffffffULL) == 0x0010502bULL) return 391; /* IC.IALL */
+      if ((insn & 0xfff07fffULL) == 0x0000502bULL) return 392; /* IC.IVA */
+      return -1;
+    }
+    case 0x00005040ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x0000504bULL) return 180; /* FMSUB */
+      return -1;
+    }
+    case 0x00005050ULL:
+    {
+      if ((insn & 0xfe00707fULL) == 0x0000505bULL) return 448; /* MIN */
+      if ((insn & 0xfe00707fULL) == 0x0800505bULL) return 449; /* MINU */
+      return -1;
+    }
+    case 0x00005060ULL:
+    {
+      if ((insn & 0x01f0707fULL) == 0x0000506bULL) return 164; /* FCVTZ */
+      return -1;
+    }
+    case 0x00006000ULL:
+    {
+      switch (insn & 0xf0000000ULL) {
+      case 0x00000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x0000600bULL) return 540; /* SWAPB */
+        return -1;
+      }
+      case 0x10000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x1000600bULL) return 542; /* SWAPH */
+        return -1;
+      }
+      case 0x20000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x2000600bULL) return 543; /* SWAPW */
+        return -1;
+      }
+      case 0x30000000ULL:
+      {
+        if ((insn & 0xf000707fULL) == 0x3000600bULL) return 541; /* SWAPD */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x00006020ULL:
+    {
+      switch (insn & 0xfff00f80ULL) {
+      case 0x00000000ULL:
+      {
+        if ((insn & 0xfff07fffULL) == 0x0000602bULL) return 148; /* DC.IVA */
+        return -1;
+      }
+      case 0x00100000ULL:
+      {
+        if ((insn & 0xffffffffULL) == 0x0010602bULL) return 146; /* DC.IALL */
+        return -1;
+      }
+      case 0x00200000ULL:
+      {
+        if ((insn & 0xfff07fffULL) == 0x0020602bULL) return 145; /* DC.CVA */
+        return -1;
+      }
+      case 0x00300000ULL:
+      {
+        if ((insn & 0xfff07fffULL) == 0x0030602bULL) return 143; /* DC.CIVA */
+        return -1;
+      }
+      case 0x00400000ULL:
+      {
+        if ((insn & 0xfff07fffULL) == 0x0040602bULL) return 147; /* DC.ISW */
+        return -1;
+      }
+      case 0x00500000ULL:
+      {
+        if ((insn & 0xfff07fffULL) == 0x0050602bULL) return 144; /* DC.CSW */
+        return -1;
+      }
+      case 0x00600000ULL:
+      {
+        if ((insn & 0xfff07fffULL) == 0x0060602bULL) return 142; /* DC.CISW */
+        return -1;
+      }
+      case 0x00700000ULL:
+      {
+        if ((insn & 0xfff07fffULL) == 0x0070602bULL) return 149; /* DC.ZVA */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x00006040ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x0000604bULL) return 184; /* FNMADD */
+      return -1;
+    }
+    case 0x00006050ULL:
+    {
+      if ((insn & 0xf800707fULL) == 0x0000605bULL) return 178; /* FMAX */
+      return -1;
+    }
+    case 0x00006060ULL:
+    {
+      if ((insn & 0x01f0707fULL) == 0x0000606bULL) return 473; /* SCVTF */
+      return -1;
+    }
+    case 0x00007020ULL:
+    {
+      switch (insn & 0xfff00f80ULL) {
+      case 0x00000000ULL:
+      {
+        if ((insn & 0xfff07fffULL) == 0x0000702bULL) return 546; /* TLB.IA */
+        return -1;
+      }
+      case 0x00100000ULL:
+      {
+        if ((insn & 0xfff07fffULL) == 0x0010702bULL) return 549; /* TLB.IV */
+        return -1;
+      }
+      case 0x00200000ULL:
+      {
+        if ((insn & 0xfff07fffULL) == 0x0020702bULL) return 548; /* TLB.IAV */
+        return -1;
+      }
+      case 0x00300000ULL:
+      {
+        if ((insn & 0xffffffffULL) == 0x0030702bULL) return 547; /* TLB.IALL */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x00007040ULL:
+    {
+      if ((insn & 0x0000707fULL) == 0x0000704bULL) return 185; /* FNMSUB */
+      return -1;
+    }
+    case 0x00007050ULL:
+    {
+      if ((insn & 0xf800707fULL) == 0x0000705bULL) return 179; /* FMIN */
+      return -1;
+    }
+    case 0x00007060ULL:
+    {
+      if ((insn & 0x01f0707fULL) == 0x0000706bULL) return 550; /* UCVTF */
+      return -1;
+    }
+    default:
+      return -1;
+    }
+  }
+  default:
+    return -1;
+  }
+}
+
+static int linxisa_decode48(uint64_t insn)
+{
+  switch (insn & 0x00000000000fULL) {
+  case 0x000000000001ULL:
+  {
+    if ((insn & 0xf83f0000007fULL) == 0x501600000011ULL) return 197; /* HL.BSTART CALL */
+    return -1;
+  }
+  case 0x00000000000eULL:
+  {
+    switch (insn & 0x0000007f0000ULL) {
+    case 0x000000010000ULL:
+    {
+      switch (insn & 0x00007f800000ULL) {
+      case 0x000010000000ULL:
+      {
+        if ((insn & 0x00007fff000fULL) == 0x00001001000eULL) return 203; /* HL.BSTART.STD */
+        return -1;
+      }
+      case 0x000010800000ULL:
+      {
+        if ((insn & 0x00007fff000fULL) == 0x00001081000eULL) return 206; /* HL.BSTART.SYS */
+        return -1;
+      }
+      case 0x000011000000ULL:
+      {
+        if ((insn & 0x00007fff000fULL) == 0x00001101000eULL) return 199; /* HL.BSTART.FP */
+        return -1;
+      }
+      case 0x000020000000ULL:
+      {
+        if ((insn & 0x00007fff000fULL) == 0x00002001000eULL) return 205; /* HL.BSTART.STD */
+        return -1;
+      }
+      case 0x000021000000ULL:
+      {
+        if ((insn & 0x00007fff000fULL) == 0x00002101000eULL) return 201; /* HL.BSTART.FP */
+        return -1;
+      }
+      case 0x000030000000ULL:
+      {
+        if ((insn & 0x00007fff000fULL) == 0x00003001000eULL) return 204; /* HL.BSTART.STD */
+        return -1;
+      }
+      case 0x000031000000ULL:
+      {
+        if ((insn & 0x00007fff000fULL) == 0x00003101000eULL) return 198; /* HL.BSTART.FP */
+        return -1;
+      }
+      case 0x000040000000ULL:
+      {
+        if ((insn & 0x00007fff000fULL) == 0x00004001000eULL) return 202; /* HL.BSTART.STD */
+        return -1;
+      }
+      case 0x000041000000ULL:
+      {
+        if ((insn & 0x00007fff000fULL) == 0x00004101000eULL) return 200; /* HL.BSTART.FP */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x000000070000ULL:
+    {
+      if ((insn & 0x00000fff000fULL) == 0x00000507000eULL) return 354; /* HL.SETRET */
+      if ((insn & 0x0000007f000fULL) == 0x00000007000eULL) return 193; /* HL.ADDTPC */
+      return -1;
+    }
+    case 0x000000090000ULL:
+    {
+      switch (insn & 0x0000700007f0ULL) {
+      case 0x000000000010ULL:
+      {
+        if ((insn & 0x0000707f07ffULL) == 0x00000009001eULL) return 232; /* HL.LBP */
+        return -1;
+      }
+      case 0x000000000020ULL:
+      {
+        if ((insn & 0x0000707f07ffULL) == 0x00000009002eULL) return 227; /* HL.LB.PR */
+        return -1;
+      }
+      case 0x000000000030ULL:
+      {
+        if ((insn & 0x0000707f07ffULL) == 0x00000009003eULL) return 226; /* HL.LB.PO */
+        return -1;
+      }
+      case 0x000010000010ULL:
+      {
+        if ((insn & 0x0000707f07ffULL) == 0x00001009001eULL) return 264; /* HL.LHP */
+        return -1;
+      }
+      case 0x000010000020ULL:
+      {
+        if ((insn & 0x0000707f07ffULL) == 0x00001009002eULL) return 255; /* HL.LH.PR */
+        return -1;
+      }
+      case 0x000010000030ULL:
+      {
+        if ((insn & 0x0000707f07ffULL) == 0x00001009003eULL) return 254; /* HL.LH.PO */
+        return -1;
+      }
+      case 0x000020000010ULL:
+      {
+        if ((insn & 0x0000707f07ffULL) == 0x00002009001eULL) return 291; /* HL.LWP */
+        return -1;
+      }
+      case 0x000020000020ULL:
+      {
+        if ((insn & 0x0000707f07ffULL) == 0x00002009002eULL) return 282; /* HL.LW.PR */
+        return -1;
+      }
+      case 0x000020000030ULL:
+      {
+        if ((insn & 0x0000707f07ffULL) == 0x00002009003eULL) return 281; /* HL.LW.PO */
+        return -1;
+      }
+      case 0x000030000010ULL:
+      {
+        if ((insn & 0x0000707f07ffULL) == 0x00003009001eULL) return 252; /* HL.LDP */
+        return -1;
+      }
+      case 0x000030000020ULL:
+      {
+        if ((insn & 0x0000707f07ffULL) == 0x00003009002eULL) return 243; /* HL.LD.PR */
+        return -1;
+      }
+      case 0x000030000030ULL:
+      {
+        if ((insn & 0x0000707f07ffULL) == 0x00003009003eULL) return 242; /* HL.LD.PO */
+        return -1;
+      }
+      case 0x000040000010ULL:
+      {
+        if ((insn & 0x0000707f07ffULL) == 0x00004009001eULL) return 240; /* HL.LBUP */
+        return -1;
+      }
+      case 0x000040000020ULL:
+      {
+        if ((insn & 0x0000707f07ffULL) == 0x00004009002eULL) return 235; /* HL.LBU.PR */
+        return -1;
+      }
+      case 0x000040000030ULL:
+      {
+        if ((insn & 0x0000707f07ffULL) == 0x00004009003eULL) return 234; /* HL.LBU.PO */
+        return -1;
+      }
+      case 0x000050000010ULL:
+      {
+        if ((insn & 0x0000707f07ffULL) == 0x00005009001eULL) return 276; /* HL.LHUP */
+        return -1;
+      }
+      case 0x000050000020ULL:
+      {
+        if ((insn & 0x0000707f07ffULL) == 0x00005009002eULL) return 267; /* HL.LHU.PR */
+        return -1;
+      }
+      case 0x000050000030ULL:
+      {
+        if ((insn & 0x0000707f07ffULL) == 0x00005009003eULL) return 266; /* HL.LHU.PO */
+        return -1;
+      }
+      case 0x000060000010ULL:
+      {
+        if ((insn & 0x0000707f07ffULL) == 0x00006009001eULL) return 303; /* HL.LWUP */
+        return -1;
+      }
+      case 0x000060000020ULL:
+      {
+        if ((insn & 0x0000707f07ffULL) == 0x00006009002eULL) return 294; /* HL.LWU.PR */
+        return -1;
+      }
+      case 0x000060000030ULL:
+      {
+        if ((insn & 0x0000707f07ffULL) == 0x00006009003eULL) return 293; /* HL.LWU.PO */
+        return -1;
+      }
+      case 0x000070000000ULL:
+      {
+        if ((insn & 0x00007fff07ffULL) == 0x00007009000eULL) return 312; /* HL.PRF */
+        return -1;
+      }
+      case 0x000070000010ULL:
+      {
+        if ((insn & 0x0000707f07ffULL) == 0x00007009001eULL) return 313; /* HL.PRF.A */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x0000000b0000ULL:
+    {
+      switch (insn & 0xf0007000f830ULL) {
+      case 0x000060000000ULL:
+      {
+        if ((insn & 0xf000707ff83fULL) == 0x0000600b000eULL) return 207; /* HL.CASB */
+        return -1;
+      }
+      case 0x100060000000ULL:
+      {
+        if ((insn & 0xf000707ff83fULL) == 0x1000600b000eULL) return 209; /* HL.CASH */
+        return -1;
+      }
+      case 0x200060000000ULL:
+      {
+        if ((insn & 0xf000707ff83fULL) == 0x2000600b000eULL) return 210; /* HL.CASW */
+        return -1;
+      }
+      case 0x300060000000ULL:
+      {
+        if ((insn & 0xf000707ff83fULL) == 0x3000600b000eULL) return 208; /* HL.CASD */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x0000000d0000ULL:
+    {
+      if ((insn & 0x0000007f000fULL) == 0x0000000d000eULL) return 277; /* HL.LIS */
+      return -1;
+    }
+    case 0x000000150000ULL:
+    {
+      switch (insn & 0x000070000000ULL) {
+      case 0x000000000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00000015000eULL) return 191; /* HL.ADDI */
+        return -1;
+      }
+      case 0x000010000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00001015000eULL) return 372; /* HL.SUBI */
+        return -1;
+      }
+      case 0x000020000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00002015000eULL) return 194; /* HL.ANDI */
+        return -1;
+      }
+      case 0x000030000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00003015000eULL) return 310; /* HL.ORI */
+        return -1;
+      }
+      case 0x000040000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00004015000eULL) return 389; /* HL.XORI */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x000000170000ULL:
+    {
+      if ((insn & 0x0000007f000fULL) == 0x00000017000eULL) return 279; /* HL.LUI */
+      return -1;
+    }
+    case 0x000000190000ULL:
+    {
+      switch (insn & 0x000070000030ULL) {
+      case 0x000000000000ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00000019000eULL) return 228; /* HL.LBI */
+        return -1;
+      }
+      case 0x000000000010ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00000019001eULL) return 231; /* HL.LBIP */
+        return -1;
+      }
+      case 0x000000000020ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00000019002eULL) return 230; /* HL.LBI.PR */
+        return -1;
+      }
+      case 0x000000000030ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00000019003eULL) return 229; /* HL.LBI.PO */
+        return -1;
+      }
+      case 0x000010000000ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00001019000eULL) return 256; /* HL.LHI */
+        return -1;
+      }
+      case 0x000010000010ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00001019001eULL) return 262; /* HL.LHIP */
+        return -1;
+      }
+      case 0x000010000020ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00001019002eULL) return 258; /* HL.LHI.PR */
+        return -1;
+      }
+      case 0x000010000030ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00001019003eULL) return 257; /* HL.LHI.PO */
+        return -1;
+      }
+      case 0x000020000000ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00002019000eULL) return 283; /* HL.LWI */
+        return -1;
+      }
+      case 0x000020000010ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00002019001eULL) return 289; /* HL.LWIP */
+        return -1;
+      }
+      case 0x000020000020ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00002019002eULL) return 285; /* HL.LWI.PR */
+        return -1;
+      }
+      case 0x000020000030ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00002019003eULL) return 284; /* HL.LWI.PO */
+        return -1;
+      }
+      case 0x000030000000ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00003019000eULL) return 244; /* HL.LDI */
+        return -1;
+      }
+      case 0x000030000010ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00003019001eULL) return 250; /* HL.LDIP */
+        return -1;
+      }
+      case 0x000030000020ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00003019002eULL) return 246; /* HL.LDI.PR */
+        return -1;
+      }
+      case 0x000030000030ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00003019003eULL) return 245; /* HL.LDI.PO */
+        return -1;
+      }
+      case 0x000040000000ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00004019000eULL) return 236; /* HL.LBUI */
+        return -1;
+      }
+      case 0x000040000010ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00004019001eULL) return 239; /* HL.LBUIP */
+        return -1;
+      }
+      case 0x000040000020ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00004019002eULL) return 238; /* HL.LBUI.PR */
+        return -1;
+      }
+      case 0x000040000030ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00004019003eULL) return 237; /* HL.LBUI.PO */
+        return -1;
+      }
+      case 0x000050000000ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00005019000eULL) return 268; /* HL.LHUI */
+        return -1;
+      }
+      case 0x000050000010ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00005019001eULL) return 274; /* HL.LHUIP */
+        return -1;
+      }
+      case 0x000050000020ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00005019002eULL) return 270; /* HL.LHUI.PR */
+        return -1;
+      }
+      case 0x000050000030ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00005019003eULL) return 269; /* HL.LHUI.PO */
+        return -1;
+      }
+      case 0x000060000000ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00006019000eULL) return 295; /* HL.LWUI */
+        return -1;
+      }
+      case 0x000060000010ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00006019001eULL) return 301; /* HL.LWUIP */
+        return -1;
+      }
+      case 0x000060000020ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00006019002eULL) return 297; /* HL.LWUI.PR */
+        return -1;
+      }
+      case 0x000060000030ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00006019003eULL) return 296; /* HL.LWUI.PO */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x0000001d0000ULL:
+    {
+      if ((insn & 0x0000007f000fULL) == 0x0000001d000eULL) return 278; /* HL.LIU */
+      return -1;
+    }
+    case 0x000000290000ULL:
+    {
+      switch (insn & 0x000070000030ULL) {
+      case 0x000010000000ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00001029000eULL) return 259; /* HL.LHI.U */
+        return -1;
+      }
+      case 0x000010000010ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00001029001eULL) return 263; /* HL.LHIP.U */
+        return -1;
+      }
+      case 0x000010000020ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00001029002eULL) return 261; /* HL.LHI.UPR */
+        return -1;
+      }
+      case 0x000010000030ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00001029003eULL) return 260; /* HL.LHI.UPO */
+        return -1;
+      }
+      case 0x000020000000ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00002029000eULL) return 286; /* HL.LWI.U */
+        return -1;
+      }
+      case 0x000020000010ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00002029001eULL) return 290; /* HL.LWIP.U */
+        return -1;
+      }
+      case 0x000020000020ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00002029002eULL) return 288; /* HL.LWI.UPR */
+        return -1;
+      }
+      case 0x000020000030ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00002029003eULL) return 287; /* HL.LWI.UPO */
+        return -1;
+      }
+      case 0x000030000000ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00003029000eULL) return 247; /* HL.LDI.U */
+        return -1;
+      }
+      case 0x000030000010ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00003029001eULL) return 251; /* HL.LDIP.U */
+        return -1;
+      }
+      case 0x000030000020ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00003029002eULL) return 249; /* HL.LDI.UPR */
+        return -1;
+      }
+      case 0x000030000030ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00003029003eULL) return 248; /* HL.LDI.UPO */
+        return -1;
+      }
+      case 0x000050000000ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00005029000eULL) return 271; /* HL.LHUI.U */
+        return -1;
+      }
+      case 0x000050000010ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00005029001eULL) return 275; /* HL.LHUIP.U */
+        return -1;
+      }
+      case 0x000050000020ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00005029002eULL) return 273; /* HL.LHUI.UPR */
+        return -1;
+      }
+      case 0x000050000030ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00005029003eULL) return 272; /* HL.LHUI.UPO */
+        return -1;
+      }
+      case 0x000060000000ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00006029000eULL) return 298; /* HL.LWUI.U */
+        return -1;
+      }
+      case 0x000060000010ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00006029001eULL) return 302; /* HL.LWUIP.U */
+        return -1;
+      }
+      case 0x000060000020ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00006029002eULL) return 300; /* HL.LWUI.UPR */
+        return -1;
+      }
+      case 0x000060000030ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00006029003eULL) return 299; /* HL.LWUI.UPO */
+        return -1;
+      }
+      case 0x000070000000ULL:
+      {
+        if ((insn & 0x00007fff003fULL) == 0x00007029000eULL) return 314; /* HL.PRFI.U */
+        return -1;
+      }
+      case 0x000070000010ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00007029001eULL) return 315; /* HL.PRFI.UA */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x000000350000ULL:
+    {
+      switch (insn & 0x000070000000ULL) {
+      case 0x000000000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00000035000eULL) return 192; /* HL.ADDIW */
+        return -1;
+      }
+      case 0x000010000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00001035000eULL) return 373; /* HL.SUBIW */
+        return -1;
+      }
+      case 0x000020000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00002035000eULL) return 195; /* HL.ANDIW */
+        return -1;
+      }
+      case 0x000030000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00003035000eULL) return 311; /* HL.ORIW */
+        return -1;
+      }
+      case 0x000040000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00004035000eULL) return 390; /* HL.XORIW */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x000000390000ULL:
+    {
+      switch (insn & 0x000070000000ULL) {
+      case 0x000000000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00000039000eULL) return 225; /* HL.LB.PCR */
+        return -1;
+      }
+      case 0x000010000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00001039000eULL) return 253; /* HL.LH.PCR */
+        return -1;
+      }
+      case 0x000020000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00002039000eULL) return 280; /* HL.LW.PCR */
+        return -1;
+      }
+      case 0x000030000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00003039000eULL) return 241; /* HL.LD.PCR */
+        return -1;
+      }
+      case 0x000040000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00004039000eULL) return 233; /* HL.LBU.PCR */
+        return -1;
+      }
+      case 0x000050000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00005039000eULL) return 265; /* HL.LHU.PCR */
+        return -1;
+      }
+      case 0x000060000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00006039000eULL) return 292; /* HL.LWU.PCR */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x0000003b0000ULL:
+    {
+      if ((insn & 0x000ff07f000fULL) == 0x0000003b000eULL) return 370; /* HL.SSRGET */
+      if ((insn & 0x00007fff000fULL) == 0x0000103b000eULL) return 371; /* HL.SSRSET */
+      return -1;
+    }
+    case 0x000000470000ULL:
+    {
+      switch (insn & 0x0600700007f0ULL) {
+      case 0x000000000000ULL:
+      {
+        if ((insn & 0xfe00707f07ffULL) == 0x00000047000eULL) return 308; /* HL.MUL */
+        return -1;
+      }
+      case 0x000010000000ULL:
+      {
+        if ((insn & 0xfe00707f07ffULL) == 0x00001047000eULL) return 309; /* HL.MULU */
+        return -1;
+      }
+      case 0x000060000000ULL:
+      {
+        if ((insn & 0x0600707f07ffULL) == 0x00006047000eULL) return 304; /* HL.MADD */
+        return -1;
+      }
+      case 0x000070000000ULL:
+      {
+        if ((insn & 0x0600707f07ffULL) == 0x00007047000eULL) return 305; /* HL.MADDW */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x000000490000ULL:
+    {
+      switch (insn & 0x00007f800030ULL) {
+      case 0x000000000010ULL:
+      {
+        if ((insn & 0x00007ffff83fULL) == 0x00000049001eULL) return 330; /* HL.SBP */
+        return -1;
+      }
+      case 0x000000000020ULL:
+      {
+        if ((insn & 0x00007fff07ffULL) == 0x00000049002eULL) return 325; /* HL.SB.PR */
+        return -1;
+      }
+      case 0x000000000030ULL:
+      {
+        if ((insn & 0x00007fff07ffULL) == 0x00000049003eULL) return 324; /* HL.SB.PO */
+        return -1;
+      }
+      case 0x000010000010ULL:
+      {
+        if ((insn & 0x00007ffff83fULL) == 0x00001049001eULL) return 368; /* HL.SHP */
+        return -1;
+      }
+      case 0x000010000020ULL:
+      {
+        if ((insn & 0x00007fff07ffULL) == 0x00001049002eULL) return 357; /* HL.SH.PR */
+        return -1;
+      }
+      case 0x000010000030ULL:
+      {
+        if ((insn & 0x00007fff07ffULL) == 0x00001049003eULL) return 356; /* HL.SH.PO */
+        return -1;
+      }
+      case 0x000020000010ULL:
+      {
+        if ((insn & 0x00007ffff83fULL) == 0x00002049001eULL) return 387; /* HL.SWP */
+        return -1;
+      }
+      case 0x000020000020ULL:
+      {
+        if ((insn & 0x00007fff07ffULL) == 0x00002049002eULL) return 376; /* HL.SW.PR */
+        return -1;
+      }
+      case 0x000020000030ULL:
+      {
+        if ((insn & 0x00007fff07ffULL) == 0x00002049003eULL) return 375; /* HL.SW.PO */
+        return -1;
+      }
+      case 0x000030000010ULL:
+      {
+        if ((insn & 0x00007ffff83fULL) == 0x00003049001eULL) return 344; /* HL.SDP */
+        return -1;
+      }
+      case 0x000030000020ULL:
+      {
+        if ((insn & 0x00007fff07ffULL) == 0x00003049002eULL) return 333; /* HL.SD.PR */
+        return -1;
+      }
+      case 0x000030000030ULL:
+      {
+        if ((insn & 0x00007fff07ffULL) == 0x00003049003eULL) return 332; /* HL.SD.PO */
+        return -1;
+      }
+      case 0x000050000010ULL:
+      {
+        if ((insn & 0x00007ffff83fULL) == 0x00005049001eULL) return 369; /* HL.SHP.U */
+        return -1;
+      }
+      case 0x000050000020ULL:
+      {
+        if ((insn & 0x00007fff07ffULL) == 0x00005049002eULL) return 359; /* HL.SH.UPR */
+        return -1;
+      }
+      case 0x000050000030ULL:
+      {
+        if ((insn & 0x00007fff07ffULL) == 0x00005049003eULL) return 358; /* HL.SH.UPO */
+        return -1;
+      }
+      case 0x000060000010ULL:
+      {
+        if ((insn & 0x00007ffff83fULL) == 0x00006049001eULL) return 388; /* HL.SWP.U */
+        return -1;
+      }
+      case 0x000060000020ULL:
+      {
+        if ((insn & 0x00007fff07ffULL) == 0x00006049002eULL) return 378; /* HL.SW.UPR */
+        return -1;
+      }
+      case 0x000060000030ULL:
+      {
+        if ((insn & 0x00007fff07ffULL) == 0x00006049003eULL) return 377; /* HL.SW.UPO */
+        return -1;
+      }
+      case 0x000070000010ULL:
+      {
+        if ((insn & 0x00007ffff83fULL) == 0x00007049001eULL) return 345; /* HL.SDP.U */
+        return -1;
+      }
+      case 0x000070000020ULL:
+      {
+        if ((insn & 0x00007fff07ffULL) == 0x00007049002eULL) return 335; /* HL.SD.UPR */
+        return -1;
+      }
+      case 0x000070000030ULL:
+      {
+        if ((insn & 0x00007fff07ffULL) == 0x00007049003eULL) return 334; /* HL.SD.UPO */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x0000004d0000ULL:
+    {
+      switch (insn & 0x000070000000ULL) {
+      case 0x000000000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x0000004d000eULL) return 306; /* HL.MIADD */
+        return -1;
+      }
+      case 0x000010000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x0000104d000eULL) return 307; /* HL.MISUB */
+        return -1;
+      }
+      case 0x000020000000ULL:
+      {
+        if ((insn & 0xfe00707f000fULL) == 0x0000204d000eULL) return 196; /* HL.BFI */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x000000550000ULL:
+    {
+      switch (insn & 0x000070000000ULL) {
+      case 0x000000000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00000055000eULL) return 214; /* HL.CMP.EQI */
+        return -1;
+      }
+      case 0x000010000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00001055000eULL) return 219; /* HL.CMP.NEI */
+        return -1;
+      }
+      case 0x000020000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00002055000eULL) return 213; /* HL.CMP.ANDI */
+        return -1;
+      }
+      case 0x000030000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00003055000eULL) return 220; /* HL.CMP.ORI */
+        return -1;
+      }
+      case 0x000040000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00004055000eULL) return 217; /* HL.CMP.LTI */
+        return -1;
+      }
+      case 0x000050000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00005055000eULL) return 215; /* HL.CMP.GEI */
+        return -1;
+      }
+      case 0x000060000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00006055000eULL) return 218; /* HL.CMP.LTUI */
+        return -1;
+      }
+      case 0x000070000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00007055000eULL) return 216; /* HL.CMP.GEUI */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x000000570000ULL:
+    {
+      switch (insn & 0xfe00700007f0ULL) {
+      case 0x000000000000ULL:
+      {
+        if ((insn & 0xfe00707f07ffULL) == 0x00000057000eULL) return 221; /* HL.DIV */
+        return -1;
+      }
+      case 0x000010000000ULL:
+      {
+        if ((insn & 0xfe00707f07ffULL) == 0x00001057000eULL) return 222; /* HL.DIVU */
+        return -1;
+      }
+      case 0x000020000000ULL:
+      {
+        if ((insn & 0xfe00707f07ffULL) == 0x00002057000eULL) return 224; /* HL.DIVW */
+        return -1;
+      }
+      case 0x000030000000ULL:
+      {
+        if ((insn & 0xfe00707f07ffULL) == 0x00003057000eULL) return 223; /* HL.DIVUW */
+        return -1;
+      }
+      case 0x000040000000ULL:
+      {
+        if ((insn & 0xfe00707f07ffULL) == 0x00004057000eULL) return 319; /* HL.REM */
+        return -1;
+      }
+      case 0x000050000000ULL:
+      {
+        if ((insn & 0xfe00707f07ffULL) == 0x00005057000eULL) return 320; /* HL.REMU */
+        return -1;
+      }
+      case 0x000060000000ULL:
+      {
+        if ((insn & 0xfe00707f07ffULL) == 0x00006057000eULL) return 322; /* HL.REMW */
+        return -1;
+      }
+      case 0x000070000000ULL:
+      {
+        if ((insn & 0xfe00707f07ffULL) == 0x00007057000eULL) return 321; /* HL.REMUW */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x000000590000ULL:
+    {
+      switch (insn & 0x000070000030ULL) {
+      case 0x000000000000ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00000059000eULL) return 326; /* HL.SBI */
+        return -1;
+      }
+      case 0x000000000010ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00000059001eULL) return 329; /* HL.SBIP */
+        return -1;
+      }
+      case 0x000000000020ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00000059002eULL) return 328; /* HL.SBI.PR */
+        return -1;
+      }
+      case 0x000000000030ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00000059003eULL) return 327; /* HL.SBI.PO */
+        return -1;
+      }
+      case 0x000010000000ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00001059000eULL) return 360; /* HL.SHI */
+        return -1;
+      }
+      case 0x000010000010ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00001059001eULL) return 366; /* HL.SHIP */
+        return -1;
+      }
+      case 0x000010000020ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00001059002eULL) return 362; /* HL.SHI.PR */
+        return -1;
+      }
+      case 0x000010000030ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00001059003eULL) return 361; /* HL.SHI.PO */
+        return -1;
+      }
+      case 0x000020000000ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00002059000eULL) return 379; /* HL.SWI */
+        return -1;
+      }
+      case 0x000020000010ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00002059001eULL) return 385; /* HL.SWIP */
+        return -1;
+      }
+      case 0x000020000020ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00002059002eULL) return 381; /* HL.SWI.PR */
+        return -1;
+      }
+      case 0x000020000030ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00002059003eULL) return 380; /* HL.SWI.PO */
+        return -1;
+      }
+      case 0x000030000000ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00003059000eULL) return 336; /* HL.SDI */
+        return -1;
+      }
+      case 0x000030000010ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00003059001eULL) return 342; /* HL.SDIP */
+        return -1;
+      }
+      case 0x000030000020ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00003059002eULL) return 338; /* HL.SDI.PR */
+        return -1;
+      }
+      case 0x000030000030ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00003059003eULL) return 337; /* HL.SDI.PO */
+        return -1;
+      }
+      case 0x000050000000ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00005059000eULL) return 363; /* HL.SHI.U */
+        return -1;
+      }
+      case 0x000050000010ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00005059001eULL) return 367; /* HL.SHIP.U */
+        return -1;
+      }
+      case 0x000050000020ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00005059002eULL) return 365; /* HL.SHI.UPR */
+        return -1;
+      }
+      case 0x000050000030ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00005059003eULL) return 364; /* HL.SHI.UPO */
+        return -1;
+      }
+      case 0x000060000000ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00006059000eULL) return 382; /* HL.SWI.U */
+        return -1;
+      }
+      case 0x000060000010ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00006059001eULL) return 386; /* HL.SWIP.U */
+        return -1;
+      }
+      case 0x000060000020ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00006059002eULL) return 384; /* HL.SWI.UPR */
+        return -1;
+      }
+      case 0x000060000030ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00006059003eULL) return 383; /* HL.SWI.UPO */
+        return -1;
+      }
+      case 0x000070000000ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00007059000eULL) return 339; /* HL.SDI.U */
+        return -1;
+      }
+      case 0x000070000010ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00007059001eULL) return 343; /* HL.SDIP.U */
+        return -1;
+      }
+      case 0x000070000020ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00007059002eULL) return 341; /* HL.SDI.UPR */
+        return -1;
+      }
+      case 0x000070000030ULL:
+      {
+        if ((insn & 0x0000707f003fULL) == 0x00007059003eULL) return 340; /* HL.SDI.UPO */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x0000005d0000ULL:
+    {
+      if ((insn & 0x0000707f07ffULL) == 0x0000105d000eULL) return 211; /* HL.CCAT */
+      if ((insn & 0x0000707f07ffULL) == 0x0000205d000eULL) return 212; /* HL.CCATW */
+      return -1;
+    }
+    case 0x000000690000ULL:
+    {
+      switch (insn & 0x000070000000ULL) {
+      case 0x000000000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00000069000eULL) return 323; /* HL.SB.PCR */
+        return -1;
+      }
+      case 0x000010000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00001069000eULL) return 355; /* HL.SH.PCR */
+        return -1;
+      }
+      case 0x000020000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00002069000eULL) return 374; /* HL.SW.PCR */
+        return -1;
+      }
+      case 0x000030000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00003069000eULL) return 331; /* HL.SD.PCR */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x000000750000ULL:
+    {
+      switch (insn & 0x000070000000ULL) {
+      case 0x000000000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00000075000eULL) return 347; /* HL.SETC.EQI */
+        return -1;
+      }
+      case 0x000010000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00001075000eULL) return 352; /* HL.SETC.NEI */
+        return -1;
+      }
+      case 0x000020000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00002075000eULL) return 346; /* HL.SETC.ANDI */
+        return -1;
+      }
+      case 0x000030000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00003075000eULL) return 353; /* HL.SETC.ORI */
+        return -1;
+      }
+      case 0x000040000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00004075000eULL) return 350; /* HL.SETC.LTI */
+        return -1;
+      }
+      case 0x000050000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00005075000eULL) return 348; /* HL.SETC.GEI */
+        return -1;
+      }
+      case 0x000060000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00006075000eULL) return 351; /* HL.SETC.LTUI */
+        return -1;
+      }
+      case 0x000070000000ULL:
+      {
+        if ((insn & 0x0000707f000fULL) == 0x00007075000eULL) return 349; /* HL.SETC.GEUI */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    case 0x0000007d0000ULL:
+    {
+      switch (insn & 0xe000700007f0ULL) {
+      case 0x000000000000ULL:
+      {
+        if ((insn & 0xe000707fffffULL) == 0x0000007d000eULL) return 316; /* HL.QMT */
+        return -1;
+      }
+      case 0x000010000000ULL:
+      {
+        if ((insn & 0xf000707fffffULL) == 0x0000107d000eULL) return 318; /* HL.QPUSH */
+        return -1;
+      }
+      case 0x000020000000ULL:
+      {
+        if ((insn & 0xf800707f07ffULL) == 0x0000207d000eULL) return 317; /* HL.QPOP */
+        return -1;
+      }
+      default:
+        return -1;
+      }
+    }
+    default:
+      return -1;
+    }
+  }
+  default:
+    return -1;
+  }
+}
+
+static int linxisa_decode64(uint64_t insn)
+{
+  switch (insn & 0x0000707f0000207fULL) {
+  case 0x000000050000007fULL:
+  {
+    if ((insn & 0x0000707ffe00707fULL) == 0x000000050000007fULL) return 551; /* V.ADD */
+    return -1;
+  }
+  case 0x000000090000007fULL:
+  {
+    if ((insn & 0x0600707ffe00207fULL) == 0x000000090000007fULL) return 607; /* V.LB */
+    return -1;
+  }
+  case 0x000000090000207fULL:
+  {
+    if ((insn & 0x0600707ffe00207fULL) == 0x000000090000207fULL) return 608; /* V.LB.BRG */
+    return -1;
+  }
+  case 0x0000000b0000007fULL:
+  {
+    if ((insn & 0xfc007ffff8007fffULL) == 0x0000000b0000107fULL) return 720; /* V.SW.ADD */
+    if ((insn & 0xf800707ffc00707fULL) == 0x0000000b0000007fULL) return 640; /* V.LW.ADD */
+    return -1;
+  }
+  case 0x0000000b0000207fULL:
+  {
+    if ((insn & 0xfc007ffff8007fffULL) == 0x0000000b0000307fULL) return 682; /* V.SD.ADD */
+    if ((insn & 0xf800707ffc00707fULL) == 0x0000000b0000207fULL) return 616; /* V.LD.ADD */
+    return -1;
+  }
+  case 0x0000000d0000007fULL:
+  {
+    if ((insn & 0xfff0707ffff0707fULL) == 0x0000000d0000007fULL) return 666; /* V.RDADD */
+    if ((insn & 0xfff0707ffff0707fULL) == 0x0000000d0000107fULL) return 671; /* V.RDMAX */
+    return -1;
+  }
+  case 0x000000150000007fULL:
+  {
+    if ((insn & 0x0000707ffff0707fULL) == 0x000000150000007fULL) return 552; /* V.ADDI */
+    return -1;
+  }
+  case 0x000000190000007fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000000190000007fULL) return 609; /* V.LBI */
+    return -1;
+  }
+  case 0x000000190000207fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000000190000207fULL) return 610; /* V.LBI.BRG */
+    return -1;
+  }
+  case 0x0000001d0000007fULL:
+  {
+    if ((insn & 0x0600707f0600707fULL) == 0x0000001d0000007fULL) return 702; /* V.SHFL.UP */
+    return -1;
+  }
+  case 0x000000450000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x000000450000007fULL) return 563; /* V.CMP.EQ */
+    return -1;
+  }
+  case 0x000000470000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x000000470000007fULL) return 660; /* V.MUL */
+    return -1;
+  }
+  case 0x000000490000007fULL:
+  {
+    if ((insn & 0x06007fff0600207fULL) == 0x000000490000007fULL) return 677; /* V.SB */
+    return -1;
+  }
+  case 0x000000490000207fULL:
+  {
+    if ((insn & 0x06007fff0600207fULL) == 0x000000490000207fULL) return 678; /* V.SB.BRG */
+    return -1;
+  }
+  case 0x0000004b0000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x0000004b0000007fULL) return 581; /* V.FADD */
+    return -1;
+  }
+  case 0x000000550000007fULL:
+  {
+    if ((insn & 0x0000707ffff0707fULL) == 0x000000550000007fULL) return 564; /* V.CMP.EQI */
+    return -1;
+  }
+  case 0x000000570000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x000000570000007fULL) return 579; /* V.DIV */
+    return -1;
+  }
+  case 0x000000590000007fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000000590000007fULL) return 679; /* V.SBI */
+    return -1;
+  }
+  case 0x000000590000207fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000000590000207fULL) return 680; /* V.SBI.BRG */
+    return -1;
+  }
+  case 0x0000005b0000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x0000005b0000007fULL) return 586; /* V.FEQ */
+    if ((insn & 0xfe00707ffe00707fULL) == 0x0000005b0000107fULL) return 658; /* V.MAX */
+    return -1;
+  }
+  case 0x000000670000007fULL:
+  {
+    if ((insn & 0x0000707ffff0707fULL) == 0x000000670000007fULL) return 558; /* V.BXS */
+    return -1;
+  }
+  case 0x0000006b0000007fULL:
+  {
+    if ((insn & 0x0600707ffff0707fULL) == 0x0000006b0000007fULL) return 583; /* V.FCVT */
+    return -1;
+  }
+  case 0x000000770000007fULL:
+  {
+    if ((insn & 0x0000707f0600707fULL) == 0x000000770000007fULL) return 577; /* V.CSEL */
+    return -1;
+  }
+  case 0x0000007b0000007fULL:
+  {
+    if ((insn & 0xfff0707ffff0707fULL) == 0x0000007b0000007fULL) return 580; /* V.FABS */
+    return -1;
+  }
+  case 0x000010050000007fULL:
+  {
+    if ((insn & 0x0000707ffe00707fULL) == 0x000010050000007fULL) return 717; /* V.SUB */
+    return -1;
+  }
+  case 0x000010090000007fULL:
+  {
+    if ((insn & 0x0600707ffe00207fULL) == 0x000010090000007fULL) return 627; /* V.LH */
+    return -1;
+  }
+  case 0x000010090000207fULL:
+  {
+    if ((insn & 0x0600707ffe00207fULL) == 0x000010090000207fULL) return 628; /* V.LH.BRG */
+    return -1;
+  }
+  case 0x0000100b0000007fULL:
+  {
+    if ((insn & 0xfc007ffff8007fffULL) == 0x0000100b0000107fULL) return 721; /* V.SW.AND */
+    if ((insn & 0xf800707ffc00707fULL) == 0x0000100b0000007fULL) return 641; /* V.LW.AND */
+    return -1;
+  }
+  case 0x0000100b0000207fULL:
+  {
+    if ((insn & 0xfc007ffff8007fffULL) == 0x0000100b0000307fULL) return 683; /* V.SD.AND */
+    if ((insn & 0xf800707ffc00707fULL) == 0x0000100b0000207fULL) return 617; /* V.LD.AND */
+    return -1;
+  }
+  case 0x0000100d0000007fULL:
+  {
+    if ((insn & 0xfff0707ffff0707fULL) == 0x0000100d0000007fULL) return 667; /* V.RDAND */
+    if ((insn & 0xfff0707ffff0707fULL) == 0x0000100d0000107fULL) return 672; /* V.RDMIN */
+    return -1;
+  }
+  case 0x000010150000007fULL:
+  {
+    if ((insn & 0x0000707ffff0707fULL) == 0x000010150000007fULL) return 718; /* V.SUBI */
+    return -1;
+  }
+  case 0x000010190000007fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000010190000007fULL) return 629; /* V.LHI */
+    return -1;
+  }
+  case 0x000010190000207fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000010190000207fULL) return 630; /* V.LHI.BRG */
+    return -1;
+  }
+  case 0x0000101d0000007fULL:
+  {
+    if ((insn & 0x0600707f0600707fULL) == 0x0000101d0000007fULL) return 700; /* V.SHFL.DOWN */
+    return -1;
+  }
+  case 0x000010290000007fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000010290000007fULL) return 631; /* V.LHI.U */
+    return -1;
+  }
+  case 0x000010290000207fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000010290000207fULL) return 632; /* V.LHI.U.BRG */
+    return -1;
+  }
+  case 0x000010450000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x000010450000007fULL) return 573; /* V.CMP.NE */
+    return -1;
+  }
+  case 0x000010490000007fULL:
+  {
+    if ((insn & 0x06007fff0600207fULL) == 0x000010490000007fULL) return 695; /* V.SH */
+    return -1;
+  }
+  case 0x000010490000207fULL:
+  {
+    if ((insn & 0x06007fff0600207fULL) == 0x000010490000207fULL) return 696; /* V.SH.BRG */
+    return -1;
+  }
+  case 0x0000104b0000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x0000104b0000007fULL) return 604; /* V.FSUB */
+    return -1;
+  }
+  case 0x000010550000007fULL:
+  {
+    if ((insn & 0x0000707ffff0707fULL) == 0x000010550000007fULL) return 574; /* V.CMP.NEI */
+    return -1;
+  }
+  case 0x000010590000007fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000010590000007fULL) return 707; /* V.SHI */
+    return -1;
+  }
+  case 0x000010590000207fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000010590000207fULL) return 708; /* V.SHI.BRG */
+    return -1;
+  }
+  case 0x0000105b0000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x0000105b0000007fULL) return 598; /* V.FNE */
+    if ((insn & 0xfe00707ffe00707fULL) == 0x0000105b0000107fULL) return 659; /* V.MIN */
+    return -1;
+  }
+  case 0x000010670000007fULL:
+  {
+    if ((insn & 0x0000707ffff0707fULL) == 0x000010670000007fULL) return 559; /* V.BXU */
+    return -1;
+  }
+  case 0x0000106b0000007fULL:
+  {
+    if ((insn & 0x0600707ffff0707fULL) == 0x0000106b0000007fULL) return 584; /* V.FCVTI */
+    return -1;
+  }
+  case 0x000010770000007fULL:
+  {
+    if ((insn & 0x0000707f0600707fULL) == 0x000010770000007fULL) return 663; /* V.PSEL */
+    return -1;
+  }
+  case 0x0000107b0000007fULL:
+  {
+    if ((insn & 0xfff0707ffff0707fULL) == 0x0000107b0000007fULL) return 603; /* V.FSQRT */
+    return -1;
+  }
+  case 0x0000107d0000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x0000107d0000007fULL) return 665; /* V.QPUSH */
+    return -1;
+  }
+  case 0x000020050000007fULL:
+  {
+    if ((insn & 0x0000707ffe00707fULL) == 0x000020050000007fULL) return 553; /* V.AND */
+    return -1;
+  }
+  case 0x000020090000007fULL:
+  {
+    if ((insn & 0x0600707ffe00207fULL) == 0x000020090000007fULL) return 639; /* V.LW */
+    return -1;
+  }
+  case 0x000020090000207fULL:
+  {
+    if ((insn & 0x0600707ffe00207fULL) == 0x000020090000207fULL) return 642; /* V.LW.BRG */
+    return -1;
+  }
+  case 0x0000200b0000007fULL:
+  {
+    if ((insn & 0xfc007ffff8007fffULL) == 0x0000200b0000107fULL) return 725; /* V.SW.OR */
+    if ((insn & 0xf800707ffc00707fULL) == 0x0000200b0000007fULL) return 645; /* V.LW.OR */
+    return -1;
+  }
+  case 0x0000200b0000207fULL:
+  {
+    if ((insn & 0xfc007ffff8007fffULL) == 0x0000200b0000307fULL) return 687; /* V.SD.OR */
+    if ((insn & 0xf800707ffc00707fULL) == 0x0000200b0000207fULL) return 621; /* V.LD.OR */
+    return -1;
+  }
+  case 0x0000200d0000007fULL:
+  {
+    if ((insn & 0xfff0707ffff0707fULL) == 0x0000200d0000107fULL) return 669; /* V.RDFMAX */
+    if ((insn & 0xfff0707ffff0707fULL) == 0x0000200d0000007fULL) return 673; /* V.RDOR */
+    return -1;
+  }
+  case 0x000020150000007fULL:
+  {
+    if ((insn & 0x0000707ffff0707fULL) == 0x000020150000007fULL) return 554; /* V.ANDI */
+    return -1;
+  }
+  case 0x000020190000007fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000020190000007fULL) return 647; /* V.LWI */
+    return -1;
+  }
+  case 0x000020190000207fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000020190000207fULL) return 648; /* V.LWI.BRG */
+    return -1;
+  }
+  case 0x0000201d0000007fULL:
+  {
+    if ((insn & 0x07f0707f07f0707fULL) == 0x0000201d0000007fULL) return 699; /* V.SHFL.BFLY */
+    return -1;
+  }
+  case 0x000020290000007fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000020290000007fULL) return 649; /* V.LWI.U */
+    return -1;
+  }
+  case 0x000020290000207fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000020290000207fULL) return 650; /* V.LWI.U.BRG */
+    return -1;
+  }
+  case 0x000020450000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x000020450000007fULL) return 561; /* V.CMP.AND */
+    return -1;
+  }
+  case 0x000020490000007fULL:
+  {
+    if ((insn & 0x06007fff0600207fULL) == 0x000020490000007fULL) return 719; /* V.SW */
+    return -1;
+  }
+  case 0x000020490000207fULL:
+  {
+    if ((insn & 0x06007fff0600207fULL) == 0x000020490000207fULL) return 722; /* V.SW.BRG */
+    return -1;
+  }
+  case 0x0000204b0000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x0000204b0000007fULL) return 597; /* V.FMUL */
+    return -1;
+  }
+  case 0x000020550000007fULL:
+  {
+    if ((insn & 0x0000707ffff0707fULL) == 0x000020550000007fULL) return 562; /* V.CMP.ANDI */
+    return -1;
+  }
+  case 0x000020590000007fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000020590000007fULL) return 729; /* V.SWI */
+    return -1;
+  }
+  case 0x000020590000207fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000020590000207fULL) return 730; /* V.SWI.BRG */
+    return -1;
+  }
+  case 0x0000205b0000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x0000205b0000007fULL) return 591; /* V.FLT */
+    if ((insn & 0xfe00707ffe00707fULL) == 0x0000205b0000107fULL) return 594; /* V.FMAX */
+    return -1;
+  }
+  case 0x000020670000007fULL:
+  {
+    if ((insn & 0x0000707ffff0707fULL) == 0x000020670000007fULL) return 556; /* V.BIC */
+    return -1;
+  }
+  case 0x0000207b0000007fULL:
+  {
+    if ((insn & 0xfff0707ffff0707fULL) == 0x0000207b0000007fULL) return 602; /* V.FRECIP */
+    return -1;
+  }
+  case 0x0000207d0000007fULL:
+  {
+    if ((insn & 0xfff0707ffff0707fULL) == 0x0000207d0000007fULL) return 664; /* V.QPOP */
+    return -1;
+  }
+  case 0x000030050000007fULL:
+  {
+    if ((insn & 0x0000707ffe00707fULL) == 0x000030050000007fULL) return 661; /* V.OR */
+    return -1;
+  }
+  case 0x000030090000007fULL:
+  {
+    if ((insn & 0x0600707ffe00207fULL) == 0x000030090000007fULL) return 615; /* V.LD */
+    return -1;
+  }
+  case 0x000030090000207fULL:
+  {
+    if ((insn & 0x0600707ffe00207fULL) == 0x000030090000207fULL) return 618; /* V.LD.BRG */
+    return -1;
+  }
+  case 0x0000300b0000007fULL:
+  {
+    if ((insn & 0xfc007ffff8007fffULL) == 0x0000300b0000107fULL) return 728; /* V.SW.XOR */
+    if ((insn & 0xf800707ffc00707fULL) == 0x0000300b0000007fULL) return 646; /* V.LW.XOR */
+    return -1;
+  }
+  case 0x0000300b0000207fULL:
+  {
+    if ((insn & 0xfc007ffff8007fffULL) == 0x0000300b0000307fULL) return 690; /* V.SD.XOR */
+    if ((insn & 0xf800707ffc00707fULL) == 0x0000300b0000207fULL) return 622; /* V.LD.XOR */
+    return -1;
+  }
+  case 0x0000300d0000007fULL:
+  {
+    if ((insn & 0xfff0707ffff0707fULL) == 0x0000300d0000107fULL) return 670; /* V.RDFMIN */
+    if ((insn & 0xfff0707ffff0707fULL) == 0x0000300d0000007fULL) return 674; /* V.RDXOR */
+    return -1;
+  }
+  case 0x000030150000007fULL:
+  {
+    if ((insn & 0x0000707ffff0707fULL) == 0x000030150000007fULL) return 662; /* V.ORI */
+    return -1;
+  }
+  case 0x000030190000007fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000030190000007fULL) return 623; /* V.LDI */
+    return -1;
+  }
+  case 0x000030190000207fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000030190000207fULL) return 624; /* V.LDI.BRG */
+    return -1;
+  }
+  case 0x0000301d0000007fULL:
+  {
+    if ((insn & 0x0600707f0600707fULL) == 0x0000301d0000007fULL) return 701; /* V.SHFL.IDX */
+    return -1;
+  }
+  case 0x000030290000007fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000030290000007fULL) return 625; /* V.LDI.U */
+    return -1;
+  }
+  case 0x000030290000207fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000030290000207fULL) return 626; /* V.LDI.U.BRG */
+    return -1;
+  }
+  case 0x000030450000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x000030450000007fULL) return 575; /* V.CMP.OR */
+    return -1;
+  }
+  case 0x000030490000007fULL:
+  {
+    if ((insn & 0x06007fff0600207fULL) == 0x000030490000007fULL) return 681; /* V.SD */
+    return -1;
+  }
+  case 0x000030490000207fULL:
+  {
+    if ((insn & 0x06007fff0600207fULL) == 0x000030490000207fULL) return 684; /* V.SD.BRG */
+    return -1;
+  }
+  case 0x0000304b0000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x0000304b0000007fULL) return 585; /* V.FDIV */
+    return -1;
+  }
+  case 0x000030550000007fULL:
+  {
+    if ((insn & 0x0000707ffff0707fULL) == 0x000030550000007fULL) return 576; /* V.CMP.ORI */
+    return -1;
+  }
+  case 0x000030590000007fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000030590000007fULL) return 691; /* V.SDI */
+    return -1;
+  }
+  case 0x000030590000207fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000030590000207fULL) return 692; /* V.SDI.BRG */
+    return -1;
+  }
+  case 0x0000305b0000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x0000305b0000007fULL) return 589; /* V.FGE */
+    if ((insn & 0xfe00707ffe00707fULL) == 0x0000305b0000107fULL) return 595; /* V.FMIN */
+    return -1;
+  }
+  case 0x000030670000007fULL:
+  {
+    if ((insn & 0x0000707ffff0707fULL) == 0x000030670000007fULL) return 557; /* V.BIS */
+    return -1;
+  }
+  case 0x0000307b0000007fULL:
+  {
+    if ((insn & 0xfff0707ffff0707fULL) == 0x0000307b0000007fULL) return 588; /* V.FEXP */
+    return -1;
+  }
+  case 0x000040050000007fULL:
+  {
+    if ((insn & 0x0000707ffe00707fULL) == 0x000040050000007fULL) return 733; /* V.XOR */
+    return -1;
+  }
+  case 0x000040090000007fULL:
+  {
+    if ((insn & 0x0600707ffe00207fULL) == 0x000040090000007fULL) return 611; /* V.LBU */
+    return -1;
+  }
+  case 0x000040090000207fULL:
+  {
+    if ((insn & 0x0600707ffe00207fULL) == 0x000040090000207fULL) return 612; /* V.LBU.BRG */
+    return -1;
+  }
+  case 0x0000400b0000007fULL:
+  {
+    if ((insn & 0xfc007ffff8007fffULL) == 0x0000400b0000107fULL) return 723; /* V.SW.MAX */
+    if ((insn & 0xf800707ffc00707fULL) == 0x0000400b0000007fULL) return 643; /* V.LW.MAX */
+    return -1;
+  }
+  case 0x0000400b0000207fULL:
+  {
+    if ((insn & 0xfc007ffff8007fffULL) == 0x0000400b0000307fULL) return 685; /* V.SD.MAX */
+    if ((insn & 0xf800707ffc00707fULL) == 0x0000400b0000207fULL) return 619; /* V.LD.MAX */
+    return -1;
+  }
+  case 0x0000400d0000007fULL:
+  {
+    if ((insn & 0xfff0707ffff0707fULL) == 0x0000400d0000007fULL) return 668; /* V.RDFADD */
+    return -1;
+  }
+  case 0x000040150000007fULL:
+  {
+    if ((insn & 0x0000707ffff0707fULL) == 0x000040150000007fULL) return 734; /* V.XORI */
+    return -1;
+  }
+  case 0x000040190000007fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000040190000007fULL) return 613; /* V.LBUI */
+    return -1;
+  }
+  case 0x000040190000207fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000040190000207fULL) return 614; /* V.LBUI.BRG */
+    return -1;
+  }
+  case 0x0000402d0000007fULL:
+  {
+    if ((insn & 0x0000707f0000707fULL) == 0x0000402d0000007fULL) return 706; /* V.SHFLI.UP */
+    return -1;
+  }
+  case 0x000040450000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x000040450000007fULL) return 569; /* V.CMP.LT */
+    return -1;
+  }
+  case 0x0000404b0000007fULL:
+  {
+    if ((insn & 0x0600707f0600707fULL) == 0x0000404b0000007fULL) return 593; /* V.FMADD */
+    return -1;
+  }
+  case 0x000040550000007fULL:
+  {
+    if ((insn & 0x0000707ffff0707fULL) == 0x000040550000007fULL) return 570; /* V.CMP.LTI */
+    return -1;
+  }
+  case 0x000040570000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x000040570000007fULL) return 675; /* V.REM */
+    return -1;
+  }
+  case 0x0000405b0000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x0000405b0000007fULL) return 587; /* V.FEQS */
+    return -1;
+  }
+  case 0x000040670000007fULL:
+  {
+    if ((insn & 0x0000707ffff0707fULL) == 0x000040670000007fULL) return 578; /* V.CTZ */
+    return -1;
+  }
+  case 0x000050050000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x000050050000007fULL) return 715; /* V.SRL */
+    return -1;
+  }
+  case 0x000050090000007fULL:
+  {
+    if ((insn & 0x0600707ffe00207fULL) == 0x000050090000007fULL) return 633; /* V.LHU */
+    return -1;
+  }
+  case 0x000050090000207fULL:
+  {
+    if ((insn & 0x0600707ffe00207fULL) == 0x000050090000207fULL) return 634; /* V.LHU.BRG */
+    return -1;
+  }
+  case 0x0000500b0000007fULL:
+  {
+    if ((insn & 0xfc007ffff8007fffULL) == 0x0000500b0000107fULL) return 724; /* V.SW.MIN */
+    if ((insn & 0xf800707ffc00707fULL) == 0x0000500b0000007fULL) return 644; /* V.LW.MIN */
+    return -1;
+  }
+  case 0x0000500b0000207fULL:
+  {
+    if ((insn & 0xfc007ffff8007fffULL) == 0x0000500b0000307fULL) return 686; /* V.SD.MIN */
+    if ((insn & 0xf800707ffc00707fULL) == 0x0000500b0000207fULL) return 620; /* V.LD.MIN */
+    return -1;
+  }
+  case 0x000050150000007fULL:
+  {
+    if ((insn & 0xfc00707ffff0707fULL) == 0x000050150000007fULL) return 716; /* V.SRLI */
+    return -1;
+  }
+  case 0x000050190000007fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000050190000007fULL) return 635; /* V.LHUI */
+    return -1;
+  }
+  case 0x000050190000207fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000050190000207fULL) return 636; /* V.LHUI.BRG */
+    return -1;
+  }
+  case 0x000050290000007fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000050290000007fULL) return 637; /* V.LHUI.U */
+    return -1;
+  }
+  case 0x000050290000207fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000050290000207fULL) return 638; /* V.LHUI.U.BRG */
+    return -1;
+  }
+  case 0x0000502d0000007fULL:
+  {
+    if ((insn & 0x0000707f0000707fULL) == 0x0000502d0000007fULL) return 704; /* V.SHFLI.DOWN */
+    return -1;
+  }
+  case 0x000050450000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x000050450000007fULL) return 565; /* V.CMP.GE */
+    return -1;
+  }
+  case 0x000050490000007fULL:
+  {
+    if ((insn & 0x06007fff0600207fULL) == 0x000050490000007fULL) return 697; /* V.SH.U */
+    return -1;
+  }
+  case 0x000050490000207fULL:
+  {
+    if ((insn & 0x06007fff0600207fULL) == 0x000050490000207fULL) return 698; /* V.SH.U.BRG */
+    return -1;
+  }
+  case 0x0000504b0000007fULL:
+  {
+    if ((insn & 0x0600707f0600707fULL) == 0x0000504b0000007fULL) return 596; /* V.FMSUB */
+    return -1;
+  }
+  case 0x000050550000007fULL:
+  {
+    if ((insn & 0x0000707ffff0707fULL) == 0x000050550000007fULL) return 566; /* V.CMP.GEI */
+    return -1;
+  }
+  case 0x000050590000007fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000050590000007fULL) return 709; /* V.SHI.U */
+    return -1;
+  }
+  case 0x000050590000207fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000050590000207fULL) return 710; /* V.SHI.U.BRG */
+    return -1;
+  }
+  case 0x0000505b0000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x0000505b0000007fULL) return 599; /* V.FNES */
+    return -1;
+  }
+  case 0x000050670000007fULL:
+  {
+    if ((insn & 0x0000707ffff0707fULL) == 0x000050670000007fULL) return 560; /* V.CLZ */
+    return -1;
+  }
+  case 0x000060050000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x000060050000007fULL) return 713; /* V.SRA */
+    return -1;
+  }
+  case 0x000060090000007fULL:
+  {
+    if ((insn & 0x0600707ffe00207fULL) == 0x000060090000007fULL) return 651; /* V.LWU */
+    return -1;
+  }
+  case 0x000060090000207fULL:
+  {
+    if ((insn & 0x0600707ffe00207fULL) == 0x000060090000207fULL) return 652; /* V.LWU.BRG */
+    return -1;
+  }
+  case 0x000060150000007fULL:
+  {
+    if ((insn & 0xfc00707ffff0707fULL) == 0x000060150000007fULL) return 714; /* V.SRAI */
+    return -1;
+  }
+  case 0x000060190000007fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000060190000007fULL) return 653; /* V.LWUI */
+    return -1;
+  }
+  case 0x000060190000207fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000060190000207fULL) return 654; /* V.LWUI.BRG */
+    return -1;
+  }
+  case 0x000060290000007fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000060290000007fULL) return 655; /* V.LWUI.U */
+    return -1;
+  }
+  case 0x000060290000207fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000060290000207fULL) return 656; /* V.LWUI.U.BRG */
+    return -1;
+  }
+  case 0x0000602d0000007fULL:
+  {
+    if ((insn & 0x01f0707f01f0707fULL) == 0x0000602d0000007fULL) return 703; /* V.SHFLI.BFLY */
+    return -1;
+  }
+  case 0x000060450000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x000060450000007fULL) return 571; /* V.CMP.LTU */
+    return -1;
+  }
+  case 0x000060470000007fULL:
+  {
+    if ((insn & 0x0600707f0600707fULL) == 0x000060470000007fULL) return 657; /* V.MADD */
+    return -1;
+  }
+  case 0x000060490000007fULL:
+  {
+    if ((insn & 0x06007fff0600207fULL) == 0x000060490000007fULL) return 726; /* V.SW.U */
+    return -1;
+  }
+  case 0x000060490000207fULL:
+  {
+    if ((insn & 0x06007fff0600207fULL) == 0x000060490000207fULL) return 727; /* V.SW.U.BRG */
+    return -1;
+  }
+  case 0x0000604b0000007fULL:
+  {
+    if ((insn & 0x0600707f0600707fULL) == 0x0000604b0000007fULL) return 600; /* V.FNMADD */
+    return -1;
+  }
+  case 0x000060550000007fULL:
+  {
+    if ((insn & 0x0000707ffff0707fULL) == 0x000060550000007fULL) return 572; /* V.CMP.LTUI */
+    return -1;
+  }
+  case 0x000060590000007fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000060590000007fULL) return 731; /* V.SWI.U */
+    return -1;
+  }
+  case 0x000060590000207fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000060590000207fULL) return 732; /* V.SWI.U.BRG */
+    return -1;
+  }
+  case 0x0000605b0000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x0000605b0000007fULL) return 592; /* V.FLTS */
+    return -1;
+  }
+  case 0x000060670000007fULL:
+  {
+    if ((insn & 0x0000707ffff0707fULL) == 0x000060670000007fULL) return 555; /* V.BCNT */
+    return -1;
+  }
+  case 0x0000606b0000007fULL:
+  {
+    if ((insn & 0x0600707ffff0707fULL) == 0x0000606b0000007fULL) return 605; /* V.ICVT */
+    return -1;
+  }
+  case 0x000070050000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x000070050000007fULL) return 711; /* V.SLL */
+    return -1;
+  }
+  case 0x000070150000007fULL:
+  {
+    if ((insn & 0xfc00707ffff0707fULL) == 0x000070150000007fULL) return 712; /* V.SLLI */
+    return -1;
+  }
+  case 0x0000702d0000007fULL:
+  {
+    if ((insn & 0x0000707f0000707fULL) == 0x0000702d0000007fULL) return 705; /* V.SHFLI.IDX */
+    return -1;
+  }
+  case 0x000070450000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x000070450000007fULL) return 567; /* V.CMP.GEU */
+    return -1;
+  }
+  case 0x000070490000007fULL:
+  {
+    if ((insn & 0x06007fff0600207fULL) == 0x000070490000007fULL) return 688; /* V.SD.U */
+    return -1;
+  }
+  case 0x000070490000207fULL:
+  {
+    if ((insn & 0x06007fff0600207fULL) == 0x000070490000207fULL) return 689; /* V.SD.U.BRG */
+    return -1;
+  }
+  case 0x0000704b0000007fULL:
+  {
+    if ((insn & 0x0600707f0600707fULL) == 0x0000704b0000007fULL) return 601; /* V.FNMSUB */
+    return -1;
+  }
+  case 0x000070550000007fULL:
+  {
+    if ((insn & 0x0000707ffff0707fULL) == 0x000070550000007fULL) return 568; /* V.CMP.GEUI */
+    return -1;
+  }
+  case 0x000070590000007fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000070590000007fULL) return 693; /* V.SDI.U */
+    return -1;
+  }
+  case 0x000070590000207fULL:
+  {
+    if ((insn & 0x0000707f0000207fULL) == 0x000070590000207fULL) return 694; /* V.SDI.U.BRG */
+    return -1;
+  }
+  case 0x0000705b0000007fULL:
+  {
+    if ((insn & 0xfe00707ffe00707fULL) == 0x0000705b0000007fULL) return 590; /* V.FGES */
+    return -1;
+  }
+  case 0x000070670000007fULL:
+  {
+    if ((insn & 0x0000707ffff0707fULL) == 0x000070670000007fULL) return 676; /* V.REV */
+    return -1;
+  }
+  case 0x0000706b0000007fULL:
+  {
+    if ((insn & 0x0600707ffff0707fULL) == 0x0000706b0000007fULL) return 606; /* V.ICVTF */
+    return -1;
+  }
+  case 0x0000707b0000007fULL:
+  {
+    if ((insn & 0xfff0707ffff0707fULL) == 0x0000707b0000007fULL) return 582; /* V.FCLASS */
+    return -1;
+  }
+  default:
+    return -1;
+  }
+}
+
+int linxisa_decode(uint64_t insn, unsigned length_bits)
+{
+  switch (length_bits) {
+  case 16:
+    return linxisa_decode16(insn);
+  case 32:
+    return linxisa_decode32(insn);
+  case 48:
+    return linxisa_decode48(insn);
+  case 64:
+    return linxisa_decode64(insn);
+  default:
+    return -1;
+  }
+}
+
+const uint16_t linxisa_decode16_table[65536] = {
+  /* 0x0000 */ 98, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0010 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x0020 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x0030 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0040 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0050 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x0060 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x0070 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0080 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0090 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x00a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x00b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x00c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x00d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x00e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x00f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0100 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0110 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x0120 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x0130 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0140 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0150 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x0160 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x0170 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0180 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0190 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x01a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x01b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x01c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x01d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x01e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x01f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0200 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0210 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x0220 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x0230 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0240 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0250 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x0260 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x0270 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0280 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0290 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x02a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x02b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x02c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x02d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x02e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x02f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0300 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0310 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x0320 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x0330 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0340 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0350 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x0360 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x0370 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0380 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0390 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x03a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x03b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x03c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x03d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x03e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x03f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0400 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0410 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x0420 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x0430 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0440 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0450 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x0460 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x0470 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0480 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0490 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x04a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x04b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x04c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x04d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x04e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x04f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0500 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0510 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x0520 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x0530 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0540 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0550 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x0560 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x0570 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0580 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0590 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x05a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x05b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x05c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x05d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x05e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x05f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0600 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0610 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x0620 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x0630 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0640 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0650 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x0660 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x0670 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0680 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0690 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x06a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x06b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x06c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x06d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x06e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x06f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0700 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0710 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x0720 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x0730 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0740 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0750 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x0760 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x0770 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0780 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0790 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x07a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x07b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x07c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x07d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 110, 65535, 65535, 65535,
+  /* 0x07e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 99, 65535, 65535, 65535,
+  /* 0x07f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0800 */ 94, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0810 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0820 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0830 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0840 */ 95, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0850 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0860 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0870 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0880 */ 91, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0890 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x08a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x08b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x08c0 */ 92, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x08d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x08e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x08f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0900 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0910 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0920 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0930 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0940 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0950 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0960 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0970 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0980 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0990 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x09a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x09b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x09c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x09d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x09e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x09f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0a00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0a10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0a20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0a30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0a40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0a50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0a60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0a70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0a80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0a90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0aa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0ab0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0ac0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0ad0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0ae0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0af0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0b00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0b10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0b20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0b30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0b40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0b50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0b60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0b70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0b80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0b90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0ba0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0bb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0bc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0bd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0be0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0bf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0c00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0c10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0c20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0c30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0c40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0c50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0c60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0c70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0c80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0c90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0ca0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0cb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0cc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0cd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0ce0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0cf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0d00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0d10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0d20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0d30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0d40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0d50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0d60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0d70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0d80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0d90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0da0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0db0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0dc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0dd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0de0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0df0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0e00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0e10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0e20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0e30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0e40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0e50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0e60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0e70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0e80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0e90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0ea0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0eb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0ec0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0ed0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0ee0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0ef0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0f00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0f10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0f20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0f30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0f40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0f50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0f60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0f70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0f80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0f90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0fa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0fb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x0fc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x0fd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x0fe0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 100, 65535, 65535, 65535,
+  /* 0x0ff0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1000 */ 94, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1010 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1020 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x1030 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1040 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1050 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1060 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x1070 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1080 */ 91, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1090 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x10a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x10b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x10c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x10d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x10e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x10f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1100 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1110 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1120 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x1130 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1140 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1150 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1160 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x1170 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1180 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1190 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x11a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x11b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x11c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x11d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x11e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x11f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1200 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1210 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1220 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x1230 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1240 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1250 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1260 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x1270 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1280 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1290 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x12a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x12b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x12c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x12d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x12e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x12f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1300 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1310 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1320 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x1330 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1340 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1350 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1360 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x1370 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1380 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1390 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x13a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x13b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x13c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x13d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x13e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x13f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1400 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1410 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1420 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x1430 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1440 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1450 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1460 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x1470 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1480 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1490 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x14a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x14b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x14c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x14d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x14e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x14f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1500 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1510 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1520 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x1530 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1540 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1550 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1560 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x1570 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1580 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1590 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x15a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x15b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x15c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x15d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x15e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x15f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1600 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1610 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1620 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x1630 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1640 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1650 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1660 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x1670 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1680 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1690 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x16a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x16b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x16c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x16d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x16e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x16f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1700 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1710 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1720 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x1730 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1740 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1750 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1760 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x1770 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1780 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1790 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x17a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x17b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x17c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x17d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x17e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 115, 65535, 65535, 65535,
+  /* 0x17f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1800 */ 94, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1810 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1820 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1830 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1840 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1850 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1860 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1870 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1880 */ 91, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1890 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x18a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x18b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x18c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x18d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x18e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x18f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1900 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1910 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1920 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1930 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1940 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1950 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1960 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1970 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1980 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1990 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x19a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x19b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x19c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x19d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x19e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x19f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1a00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1a10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1a20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1a30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1a40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1a50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1a60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1a70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1a80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1a90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1aa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1ab0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1ac0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1ad0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1ae0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1af0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1b00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1b10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1b20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1b30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1b40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1b50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1b60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1b70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1b80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1b90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1ba0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1bb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1bc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1bd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1be0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1bf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1c00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1c10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1c20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1c30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1c40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1c50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1c60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1c70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1c80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1c90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1ca0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1cb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1cc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1cd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1ce0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1cf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1d00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1d10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1d20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1d30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1d40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1d50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1d60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1d70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1d80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1d90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1da0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1db0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1dc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1dd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1de0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1df0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1e00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1e10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1e20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1e30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1e40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1e50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1e60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1e70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1e80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1e90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1ea0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1eb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1ec0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1ed0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1ee0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1ef0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1f00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1f10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1f20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1f30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1f40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1f50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1f60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1f70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1f80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1f90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1fa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1fb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x1fc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x1fd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x1fe0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 116, 65535, 65535, 65535,
+  /* 0x1ff0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2000 */ 94, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2010 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2020 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2030 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2040 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2050 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2060 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2070 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2080 */ 91, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2090 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x20a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x20b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x20c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x20d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x20e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x20f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2100 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2110 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2120 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2130 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2140 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2150 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2160 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2170 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2180 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2190 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x21a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x21b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x21c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x21d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x21e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x21f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2200 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2210 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2220 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2230 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2240 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2250 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2260 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2270 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2280 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2290 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x22a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x22b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x22c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x22d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x22e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x22f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2300 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2310 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2320 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2330 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2340 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2350 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2360 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2370 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2380 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2390 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x23a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x23b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x23c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x23d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x23e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x23f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2400 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2410 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2420 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2430 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2440 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2450 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2460 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2470 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2480 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2490 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x24a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x24b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x24c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x24d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x24e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x24f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2500 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2510 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2520 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2530 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2540 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2550 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2560 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2570 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2580 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2590 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x25a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x25b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x25c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x25d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x25e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x25f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2600 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2610 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2620 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2630 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2640 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2650 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2660 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2670 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2680 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2690 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x26a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x26b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x26c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x26d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x26e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x26f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2700 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2710 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2720 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2730 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2740 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2750 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2760 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2770 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2780 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2790 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x27a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x27b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x27c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x27d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x27e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x27f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2800 */ 94, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2810 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2820 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2830 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2840 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2850 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2860 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2870 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2880 */ 91, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2890 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x28a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x28b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x28c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x28d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x28e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x28f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2900 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2910 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2920 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2930 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2940 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2950 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2960 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2970 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2980 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2990 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x29a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x29b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x29c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x29d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x29e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x29f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2a00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2a10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2a20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2a30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2a40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2a50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2a60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2a70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2a80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2a90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2aa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2ab0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2ac0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2ad0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2ae0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2af0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2b00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2b10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2b20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2b30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2b40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2b50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2b60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2b70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2b80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2b90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2ba0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2bb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2bc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2bd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2be0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2bf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2c00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2c10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2c20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2c30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2c40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2c50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2c60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2c70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2c80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2c90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2ca0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2cb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2cc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2cd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2ce0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2cf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2d00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2d10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2d20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2d30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2d40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2d50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2d60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2d70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2d80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2d90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2da0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2db0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2dc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2dd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2de0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2df0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2e00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2e10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2e20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2e30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2e40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2e50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2e60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2e70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2e80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2e90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2ea0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2eb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2ec0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2ed0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2ee0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2ef0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2f00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2f10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2f20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2f30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2f40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2f50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2f60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2f70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2f80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2f90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2fa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2fb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x2fc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x2fd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2fe0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x2ff0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3000 */ 94, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3010 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3020 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3030 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3040 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3050 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3060 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3070 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3080 */ 91, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3090 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x30a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x30b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x30c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x30d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x30e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x30f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3100 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3110 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3120 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3130 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3140 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3150 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3160 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3170 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3180 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3190 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x31a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x31b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x31c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x31d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x31e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x31f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3200 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3210 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3220 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3230 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3240 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3250 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3260 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3270 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3280 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3290 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x32a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x32b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x32c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x32d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x32e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x32f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3300 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3310 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3320 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3330 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3340 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3350 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3360 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3370 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3380 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3390 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x33a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x33b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x33c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x33d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x33e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x33f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3400 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3410 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3420 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3430 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3440 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3450 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3460 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3470 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3480 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3490 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x34a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x34b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x34c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x34d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x34e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x34f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3500 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3510 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3520 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3530 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3540 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3550 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3560 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3570 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3580 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3590 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x35a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x35b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x35c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x35d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x35e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x35f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3600 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3610 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3620 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3630 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3640 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3650 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3660 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3670 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3680 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3690 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x36a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x36b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x36c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x36d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x36e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x36f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3700 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3710 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3720 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3730 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3740 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3750 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3760 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3770 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3780 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3790 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x37a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x37b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x37c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x37d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x37e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x37f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3800 */ 94, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3810 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3820 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3830 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3840 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3850 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3860 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3870 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3880 */ 91, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3890 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x38a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x38b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x38c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x38d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x38e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x38f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3900 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3910 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3920 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3930 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3940 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3950 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3960 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3970 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3980 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3990 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x39a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x39b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x39c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x39d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x39e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x39f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3a00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3a10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3a20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3a30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3a40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3a50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3a60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3a70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3a80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3a90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3aa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3ab0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3ac0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3ad0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3ae0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3af0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3b00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3b10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3b20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3b30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3b40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3b50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3b60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3b70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3b80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3b90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3ba0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3bb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3bc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3bd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3be0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3bf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3c00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3c10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3c20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3c30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3c40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3c50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3c60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3c70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3c80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3c90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3ca0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3cb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3cc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3cd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3ce0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3cf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3d00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3d10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3d20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3d30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3d40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3d50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3d60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3d70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3d80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3d90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3da0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3db0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3dc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3dd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3de0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3df0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3e00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3e10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3e20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3e30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3e40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3e50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3e60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3e70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3e80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3e90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3ea0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3eb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3ec0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3ed0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3ee0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3ef0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3f00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3f10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3f20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3f30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3f40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3f50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3f60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3f70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3f80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3f90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3fa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3fb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x3fc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x3fd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3fe0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x3ff0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4000 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4010 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x4020 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4030 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4040 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4050 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x4060 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4070 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4080 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4090 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x40a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x40b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x40c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x40d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x40e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x40f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4100 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4110 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x4120 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4130 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4140 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4150 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x4160 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4170 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4180 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4190 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x41a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x41b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x41c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x41d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x41e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x41f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4200 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4210 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x4220 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4230 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4240 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4250 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x4260 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4270 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4280 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4290 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x42a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x42b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x42c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x42d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x42e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x42f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4300 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4310 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x4320 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4330 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4340 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4350 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x4360 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4370 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4380 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4390 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x43a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x43b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x43c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x43d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x43e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x43f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4400 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4410 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x4420 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4430 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4440 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4450 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x4460 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4470 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4480 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4490 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x44a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x44b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x44c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x44d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x44e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x44f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4500 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4510 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x4520 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4530 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4540 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4550 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x4560 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4570 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4580 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4590 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x45a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x45b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x45c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x45d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x45e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x45f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4600 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4610 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x4620 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4630 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4640 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4650 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x4660 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4670 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4680 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4690 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x46a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x46b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x46c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x46d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x46e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x46f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4700 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4710 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x4720 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4730 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4740 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4750 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x4760 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4770 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4780 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4790 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x47a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x47b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x47c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x47d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 112, 65535, 65535, 65535,
+  /* 0x47e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x47f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4800 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4810 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4820 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4830 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4840 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4850 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4860 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4870 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4880 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4890 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x48a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x48b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x48c0 */ 93, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x48d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x48e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x48f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4900 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4910 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4920 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4930 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4940 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4950 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4960 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4970 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4980 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4990 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x49a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x49b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x49c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x49d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x49e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x49f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4a00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4a10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4a20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4a30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4a40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4a50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4a60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4a70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4a80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4a90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4aa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4ab0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4ac0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4ad0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4ae0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4af0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4b00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4b10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4b20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4b30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4b40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4b50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4b60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4b70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4b80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4b90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4ba0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4bb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4bc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4bd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4be0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4bf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4c00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4c10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4c20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4c30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4c40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4c50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4c60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4c70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4c80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4c90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4ca0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4cb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4cc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4cd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4ce0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4cf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4d00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4d10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4d20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4d30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4d40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4d50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4d60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4d70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4d80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4d90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4da0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4db0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4dc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4dd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4de0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4df0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4e00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4e10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4e20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4e30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4e40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4e50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4e60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4e70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4e80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4e90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4ea0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4eb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4ec0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4ed0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4ee0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4ef0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4f00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4f10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4f20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4f30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4f40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4f50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4f60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4f70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4f80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4f90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4fa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4fb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x4fc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x4fd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 113, 65535, 65535, 65535,
+  /* 0x4fe0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x4ff0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5000 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5010 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x5020 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5030 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5040 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5050 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x5060 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5070 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5080 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5090 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x50a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x50b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x50c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x50d0 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x50e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x50f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5100 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5110 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x5120 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5130 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5140 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5150 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x5160 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5170 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5180 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5190 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x51a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x51b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x51c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x51d0 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x51e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x51f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5200 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5210 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x5220 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5230 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5240 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5250 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x5260 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5270 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5280 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5290 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x52a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x52b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x52c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x52d0 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x52e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x52f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5300 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5310 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x5320 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5330 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5340 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5350 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x5360 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5370 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5380 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5390 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x53a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x53b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x53c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x53d0 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x53e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x53f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5400 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5410 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x5420 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5430 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5440 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5450 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x5460 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5470 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5480 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5490 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x54a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x54b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x54c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x54d0 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x54e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x54f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5500 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5510 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x5520 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5530 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5540 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5550 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x5560 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5570 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5580 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5590 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x55a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x55b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x55c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x55d0 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x55e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x55f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5600 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5610 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x5620 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5630 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5640 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5650 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x5660 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5670 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5680 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5690 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x56a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x56b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x56c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x56d0 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x56e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x56f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5700 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5710 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x5720 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5730 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5740 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5750 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x5760 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5770 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5780 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5790 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x57a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x57b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x57c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x57d0 */ 65535, 65535, 90, 65535, 89, 65535, 111, 65535, 118, 65535, 102, 65535, 114, 65535, 65535, 65535,
+  /* 0x57e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x57f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5800 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5810 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5820 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5830 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5840 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5850 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5860 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5870 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5880 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5890 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x58a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x58b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x58c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x58d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x58e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x58f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5900 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5910 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5920 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5930 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5940 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5950 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5960 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5970 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5980 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5990 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x59a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x59b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x59c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x59d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x59e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x59f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5a00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5a10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5a20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5a30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5a40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5a50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5a60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5a70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5a80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5a90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5aa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5ab0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5ac0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5ad0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5ae0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5af0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5b00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5b10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5b20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5b30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5b40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5b50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5b60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5b70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5b80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5b90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5ba0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5bb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5bc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5bd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5be0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5bf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5c00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5c10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5c20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5c30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5c40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5c50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5c60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5c70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5c80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5c90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5ca0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5cb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5cc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5cd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5ce0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5cf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5d00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5d10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5d20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5d30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5d40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5d50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5d60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5d70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5d80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5d90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5da0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5db0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5dc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5dd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5de0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5df0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5e00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5e10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5e20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5e30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5e40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5e50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5e60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5e70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5e80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5e90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5ea0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5eb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5ec0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5ed0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5ee0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5ef0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5f00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5f10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5f20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5f30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5f40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5f50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5f60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5f70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5f80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5f90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5fa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5fb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x5fc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x5fd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 120, 65535, 65535, 65535,
+  /* 0x5fe0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x5ff0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6000 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6010 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x6020 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6030 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6040 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6050 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x6060 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6070 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6080 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6090 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x60a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x60b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x60c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x60d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x60e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x60f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6100 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6110 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x6120 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6130 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6140 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6150 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x6160 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6170 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6180 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6190 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x61a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x61b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x61c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x61d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x61e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x61f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6200 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6210 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x6220 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6230 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6240 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6250 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x6260 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6270 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6280 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6290 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x62a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x62b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x62c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x62d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x62e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x62f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6300 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6310 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x6320 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6330 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6340 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6350 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x6360 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6370 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6380 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6390 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x63a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x63b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x63c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x63d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x63e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x63f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6400 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6410 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x6420 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6430 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6440 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6450 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x6460 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6470 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6480 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6490 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x64a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x64b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x64c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x64d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x64e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x64f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6500 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6510 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x6520 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6530 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6540 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6550 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x6560 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6570 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6580 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6590 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x65a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x65b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x65c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x65d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x65e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x65f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6600 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6610 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x6620 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6630 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6640 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6650 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x6660 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6670 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6680 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6690 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x66a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x66b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x66c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x66d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x66e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x66f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6700 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6710 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x6720 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6730 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6740 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6750 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x6760 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6770 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6780 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6790 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x67a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x67b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x67c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x67d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 121, 65535, 65535, 65535,
+  /* 0x67e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x67f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6800 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6810 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6820 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6830 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6840 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6850 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6860 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6870 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6880 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6890 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x68a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x68b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x68c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x68d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x68e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x68f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6900 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6910 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6920 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6930 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6940 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6950 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6960 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6970 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6980 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6990 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x69a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x69b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x69c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x69d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x69e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x69f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6a00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6a10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6a20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6a30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6a40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6a50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6a60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6a70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6a80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6a90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6aa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6ab0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6ac0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6ad0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6ae0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6af0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6b00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6b10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6b20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6b30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6b40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6b50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6b60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6b70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6b80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6b90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6ba0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6bb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6bc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6bd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6be0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6bf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6c00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6c10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6c20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6c30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6c40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6c50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6c60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6c70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6c80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6c90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6ca0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6cb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6cc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6cd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6ce0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6cf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6d00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6d10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6d20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6d30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6d40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6d50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6d60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6d70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6d80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6d90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6da0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6db0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6dc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6dd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6de0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6df0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6e00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6e10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6e20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6e30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6e40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6e50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6e60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6e70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6e80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6e90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6ea0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6eb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6ec0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6ed0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6ee0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6ef0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6f00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6f10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6f20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6f30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6f40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6f50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6f60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6f70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6f80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6f90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6fa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6fb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x6fc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x6fd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 122, 65535, 65535, 65535,
+  /* 0x6fe0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x6ff0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7000 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7010 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7020 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7030 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7040 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7050 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7060 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7070 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7080 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7090 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x70a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x70b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x70c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x70d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x70e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x70f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7100 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7110 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7120 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7130 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7140 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7150 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7160 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7170 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7180 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7190 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x71a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x71b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x71c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x71d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x71e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x71f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7200 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7210 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7220 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7230 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7240 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7250 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7260 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7270 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7280 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7290 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x72a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x72b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x72c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x72d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x72e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x72f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7300 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7310 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7320 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7330 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7340 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7350 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7360 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7370 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7380 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7390 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x73a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x73b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x73c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x73d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x73e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x73f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7400 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7410 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7420 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7430 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7440 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7450 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7460 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7470 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7480 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7490 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x74a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x74b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x74c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x74d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x74e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x74f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7500 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7510 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7520 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7530 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7540 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7550 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7560 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7570 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7580 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7590 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x75a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x75b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x75c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x75d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x75e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x75f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7600 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7610 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7620 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7630 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7640 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7650 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7660 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7670 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7680 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7690 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x76a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x76b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x76c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x76d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x76e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x76f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7700 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7710 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7720 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7730 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7740 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7750 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7760 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7770 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7780 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7790 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x77a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x77b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x77c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x77d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x77e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x77f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7800 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7810 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7820 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7830 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7840 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7850 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7860 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7870 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7880 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7890 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x78a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x78b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x78c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x78d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x78e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x78f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7900 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7910 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7920 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7930 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7940 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7950 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7960 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7970 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7980 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7990 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x79a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x79b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x79c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x79d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x79e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x79f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7a00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7a10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7a20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7a30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7a40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7a50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7a60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7a70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7a80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7a90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7aa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7ab0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7ac0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7ad0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7ae0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7af0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7b00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7b10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7b20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7b30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7b40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7b50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7b60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7b70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7b80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7b90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7ba0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7bb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7bc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7bd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7be0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7bf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7c00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7c10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7c20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7c30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7c40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7c50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7c60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7c70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7c80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7c90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7ca0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7cb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7cc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7cd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7ce0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7cf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7d00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7d10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7d20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7d30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7d40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7d50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7d60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7d70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7d80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7d90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7da0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7db0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7dc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7dd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7de0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7df0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7e00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7e10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7e20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7e30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7e40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7e50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7e60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7e70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7e80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7e90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7ea0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7eb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7ec0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7ed0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7ee0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7ef0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7f00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7f10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7f20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7f30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7f40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7f50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7f60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7f70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7f80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7f90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7fa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7fb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x7fc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x7fd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7fe0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x7ff0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8000 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8010 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8020 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x8030 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8040 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8050 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8060 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x8070 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8080 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8090 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x80a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x80b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x80c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x80d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x80e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x80f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8100 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8110 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8120 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x8130 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8140 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8150 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8160 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x8170 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8180 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8190 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x81a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x81b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x81c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x81d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x81e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x81f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8200 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8210 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8220 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x8230 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8240 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8250 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8260 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x8270 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8280 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8290 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x82a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x82b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x82c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x82d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x82e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x82f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8300 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8310 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8320 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x8330 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8340 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8350 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8360 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x8370 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8380 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8390 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x83a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x83b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x83c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x83d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x83e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x83f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8400 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8410 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8420 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x8430 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8440 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8450 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8460 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x8470 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8480 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8490 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x84a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x84b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x84c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x84d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x84e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x84f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8500 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8510 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8520 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x8530 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8540 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8550 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8560 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x8570 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8580 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8590 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x85a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x85b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x85c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x85d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x85e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x85f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8600 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8610 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8620 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x8630 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8640 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8650 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8660 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x8670 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8680 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8690 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x86a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x86b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x86c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x86d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x86e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x86f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8700 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8710 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8720 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x8730 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8740 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8750 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8760 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x8770 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8780 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8790 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x87a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x87b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x87c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x87d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x87e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 117, 65535, 65535, 65535,
+  /* 0x87f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8800 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8810 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8820 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8830 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8840 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8850 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8860 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8870 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8880 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8890 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x88a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x88b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x88c0 */ 96, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x88d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x88e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x88f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8900 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8910 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8920 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8930 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8940 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8950 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8960 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8970 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8980 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8990 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x89a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x89b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x89c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x89d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x89e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x89f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8a00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8a10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8a20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8a30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8a40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8a50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8a60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8a70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8a80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8a90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8aa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8ab0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8ac0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8ad0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8ae0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8af0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8b00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8b10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8b20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8b30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8b40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8b50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8b60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8b70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8b80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8b90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8ba0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8bb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8bc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8bd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8be0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8bf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8c00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8c10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8c20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8c30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8c40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8c50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8c60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8c70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8c80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8c90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8ca0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8cb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8cc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8cd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8ce0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8cf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8d00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8d10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8d20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8d30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8d40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8d50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8d60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8d70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8d80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8d90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8da0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8db0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8dc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8dd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8de0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8df0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8e00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8e10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8e20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8e30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8e40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8e50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8e60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8e70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8e80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8e90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8ea0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8eb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8ec0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8ed0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8ee0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8ef0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8f00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8f10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8f20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8f30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8f40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8f50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8f60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8f70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8f80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8f90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8fa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8fb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x8fc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x8fd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8fe0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x8ff0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9000 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9010 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9020 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9030 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9040 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9050 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9060 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9070 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9080 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9090 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x90a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x90b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x90c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x90d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x90e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x90f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9100 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9110 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9120 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9130 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9140 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9150 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9160 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9170 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9180 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9190 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x91a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x91b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x91c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x91d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x91e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x91f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9200 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9210 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9220 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9230 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9240 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9250 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9260 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9270 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9280 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9290 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x92a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x92b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x92c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x92d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x92e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x92f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9300 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9310 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9320 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9330 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9340 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9350 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9360 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9370 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9380 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9390 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x93a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x93b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x93c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x93d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x93e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x93f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9400 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9410 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9420 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9430 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9440 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9450 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9460 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9470 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9480 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9490 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x94a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x94b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x94c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x94d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x94e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x94f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9500 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9510 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9520 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9530 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9540 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9550 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9560 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9570 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9580 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9590 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x95a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x95b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x95c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x95d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x95e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x95f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9600 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9610 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9620 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9630 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9640 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9650 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9660 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9670 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9680 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9690 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x96a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x96b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x96c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x96d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x96e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x96f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9700 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9710 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9720 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9730 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9740 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9750 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9760 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9770 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9780 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9790 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x97a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x97b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x97c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x97d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x97e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x97f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9800 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9810 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9820 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9830 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9840 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9850 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9860 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9870 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9880 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9890 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x98a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x98b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x98c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x98d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x98e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x98f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9900 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9910 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9920 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9930 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9940 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9950 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9960 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9970 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9980 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9990 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x99a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x99b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x99c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x99d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x99e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x99f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9a00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9a10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9a20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9a30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9a40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9a50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9a60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9a70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9a80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9a90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9aa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9ab0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9ac0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9ad0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9ae0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9af0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9b00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9b10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9b20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9b30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9b40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9b50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9b60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9b70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9b80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9b90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9ba0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9bb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9bc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9bd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9be0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9bf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9c00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9c10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9c20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9c30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9c40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9c50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9c60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9c70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9c80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9c90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9ca0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9cb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9cc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9cd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9ce0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9cf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9d00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9d10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9d20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9d30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9d40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9d50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9d60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9d70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9d80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9d90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9da0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9db0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9dc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9dd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9de0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9df0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9e00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9e10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9e20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9e30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9e40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9e50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9e60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9e70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9e80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9e90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9ea0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9eb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9ec0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9ed0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9ee0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9ef0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9f00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9f10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9f20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9f30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9f40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9f50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9f60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9f70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9f80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9f90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9fa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9fb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0x9fc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0x9fd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9fe0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0x9ff0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa000 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa010 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa020 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa030 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa040 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa050 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa060 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa070 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa080 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa090 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa0a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa0b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa0c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa0d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa0e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa0f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa100 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa110 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa120 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa130 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa140 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa150 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa160 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa170 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa180 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa190 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa1a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa1b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa1c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa1d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa1e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa1f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa200 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa210 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa220 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa230 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa240 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa250 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa260 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa270 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa280 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa290 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa2a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa2b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa2c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa2d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa2e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa2f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa300 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa310 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa320 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa330 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa340 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa350 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa360 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa370 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa380 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa390 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa3a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa3b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa3c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa3d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa3e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa3f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa400 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa410 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa420 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa430 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa440 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa450 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa460 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa470 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa480 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa490 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa4a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa4b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa4c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa4d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa4e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa4f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa500 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa510 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa520 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa530 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa540 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa550 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa560 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa570 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa580 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa590 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa5a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa5b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa5c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa5d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa5e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa5f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa600 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa610 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa620 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa630 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa640 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa650 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa660 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa670 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa680 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa690 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa6a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa6b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa6c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa6d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa6e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa6f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa700 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa710 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa720 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa730 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa740 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa750 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa760 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa770 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa780 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa790 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa7a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa7b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa7c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa7d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa7e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa7f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa800 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa810 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa820 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa830 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa840 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa850 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa860 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa870 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa880 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa890 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa8a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa8b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa8c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa8d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa8e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa8f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa900 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa910 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa920 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa930 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa940 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa950 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa960 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa970 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa980 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa990 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa9a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa9b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xa9c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xa9d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa9e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xa9f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xaa00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xaa10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xaa20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xaa30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xaa40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xaa50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xaa60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xaa70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xaa80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xaa90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xaaa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xaab0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xaac0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xaad0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xaae0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xaaf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xab00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xab10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xab20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xab30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xab40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xab50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xab60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xab70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xab80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xab90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xaba0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xabb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xabc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xabd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xabe0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xabf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xac00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xac10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xac20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xac30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xac40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xac50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xac60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xac70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xac80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xac90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xaca0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xacb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xacc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xacd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xace0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xacf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xad00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xad10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xad20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xad30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xad40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xad50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xad60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xad70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xad80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xad90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xada0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xadb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xadc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xadd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xade0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xadf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xae00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xae10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xae20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xae30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xae40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xae50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xae60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xae70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xae80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xae90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xaea0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xaeb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xaec0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xaed0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xaee0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xaef0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xaf00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xaf10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xaf20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xaf30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xaf40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xaf50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xaf60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xaf70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xaf80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xaf90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xafa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xafb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xafc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xafd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xafe0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xaff0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb000 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb010 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb020 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb030 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb040 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb050 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb060 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb070 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb080 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb090 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb0a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb0b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb0c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb0d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb0e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb0f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb100 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb110 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb120 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb130 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb140 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb150 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb160 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb170 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb180 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb190 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb1a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb1b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb1c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb1d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb1e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb1f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb200 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb210 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb220 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb230 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb240 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb250 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb260 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb270 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb280 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb290 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb2a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb2b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb2c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb2d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb2e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb2f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb300 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb310 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb320 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb330 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb340 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb350 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb360 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb370 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb380 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb390 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb3a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb3b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb3c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb3d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb3e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb3f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb400 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb410 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb420 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb430 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb440 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb450 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb460 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb470 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb480 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb490 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb4a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb4b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb4c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb4d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb4e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb4f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb500 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb510 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb520 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb530 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb540 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb550 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb560 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb570 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb580 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb590 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb5a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb5b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb5c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb5d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb5e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb5f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb600 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb610 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb620 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb630 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb640 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb650 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb660 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb670 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb680 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb690 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb6a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb6b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb6c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb6d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb6e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb6f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb700 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb710 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb720 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb730 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb740 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb750 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb760 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb770 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb780 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb790 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb7a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb7b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb7c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb7d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb7e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb7f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb800 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb810 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb820 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb830 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb840 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb850 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb860 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb870 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb880 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb890 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb8a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb8b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb8c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb8d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb8e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb8f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb900 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb910 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb920 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb930 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb940 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb950 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb960 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb970 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb980 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb990 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb9a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb9b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xb9c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xb9d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb9e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xb9f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xba00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xba10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xba20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xba30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xba40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xba50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xba60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xba70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xba80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xba90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbaa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbab0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xbac0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xbad0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbae0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbaf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xbb00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xbb10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbb20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbb30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xbb40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xbb50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbb60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbb70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xbb80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xbb90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbba0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbbb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xbbc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xbbd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbbe0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbbf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xbc00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xbc10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbc20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbc30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xbc40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xbc50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbc60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbc70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xbc80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xbc90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbca0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbcb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xbcc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xbcd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbce0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbcf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xbd00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xbd10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbd20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbd30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xbd40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xbd50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbd60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbd70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xbd80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xbd90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbda0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbdb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xbdc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xbdd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbde0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbdf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xbe00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xbe10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbe20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbe30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xbe40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xbe50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbe60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbe70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xbe80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xbe90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbea0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbeb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xbec0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xbed0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbee0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbef0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xbf00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xbf10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbf20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbf30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xbf40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xbf50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbf60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbf70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xbf80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xbf90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbfa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbfb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xbfc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xbfd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbfe0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xbff0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 88, 65535, 65535, 65535,
+  /* 0xc000 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc010 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc020 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc030 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc040 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc050 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc060 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc070 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc080 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc090 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc0a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc0b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc0c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc0d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc0e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc0f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc100 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc110 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc120 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc130 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc140 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc150 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc160 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc170 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc180 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc190 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc1a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc1b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc1c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc1d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc1e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc1f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc200 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc210 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc220 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc230 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc240 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc250 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc260 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc270 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc280 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc290 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc2a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc2b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc2c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc2d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc2e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc2f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc300 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc310 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc320 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc330 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc340 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc350 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc360 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc370 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc380 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc390 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc3a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc3b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc3c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc3d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc3e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc3f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc400 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc410 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc420 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc430 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc440 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc450 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc460 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc470 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc480 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc490 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc4a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc4b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc4c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc4d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc4e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc4f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc500 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc510 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc520 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc530 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc540 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc550 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc560 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc570 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc580 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc590 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc5a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc5b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc5c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc5d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc5e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc5f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc600 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc610 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc620 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc630 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc640 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc650 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc660 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc670 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc680 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc690 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc6a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc6b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc6c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc6d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc6e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc6f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc700 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc710 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc720 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc730 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc740 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc750 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc760 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc770 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc780 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc790 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc7a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc7b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc7c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc7d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc7e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 101, 65535, 65535, 65535,
+  /* 0xc7f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc800 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc810 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc820 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc830 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc840 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc850 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc860 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc870 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc880 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc890 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc8a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc8b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc8c0 */ 97, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc8d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc8e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc8f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc900 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc910 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc920 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc930 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc940 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc950 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc960 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc970 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc980 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc990 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc9a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc9b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xc9c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xc9d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc9e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xc9f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xca00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xca10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xca20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xca30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xca40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xca50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xca60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xca70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xca80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xca90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcaa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcab0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xcac0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xcad0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcae0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcaf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xcb00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xcb10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcb20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcb30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xcb40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xcb50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcb60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcb70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xcb80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xcb90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcba0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcbb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xcbc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xcbd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcbe0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcbf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xcc00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xcc10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcc20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcc30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xcc40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xcc50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcc60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcc70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xcc80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xcc90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcca0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xccb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xccc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xccd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcce0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xccf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xcd00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xcd10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcd20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcd30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xcd40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xcd50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcd60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcd70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xcd80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xcd90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcda0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcdb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xcdc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xcdd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcde0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcdf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xce00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xce10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xce20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xce30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xce40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xce50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xce60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xce70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xce80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xce90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcea0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xceb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xcec0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xced0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcee0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcef0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xcf00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xcf10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcf20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcf30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xcf40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xcf50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcf60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcf70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xcf80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xcf90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcfa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcfb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xcfc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xcfd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcfe0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xcff0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd000 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd010 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd020 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd030 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd040 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd050 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd060 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd070 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd080 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd090 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd0a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd0b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd0c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd0d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd0e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd0f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd100 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd110 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd120 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd130 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd140 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd150 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd160 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd170 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd180 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd190 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd1a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd1b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd1c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd1d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd1e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd1f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd200 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd210 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd220 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd230 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd240 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd250 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd260 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd270 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd280 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd290 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd2a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd2b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd2c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd2d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd2e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd2f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd300 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd310 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd320 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd330 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd340 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd350 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd360 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd370 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd380 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd390 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd3a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd3b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd3c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd3d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd3e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd3f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd400 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd410 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd420 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd430 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd440 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd450 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd460 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd470 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd480 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd490 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd4a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd4b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd4c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd4d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd4e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd4f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd500 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd510 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd520 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd530 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd540 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd550 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd560 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd570 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd580 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd590 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd5a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd5b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd5c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd5d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd5e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd5f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd600 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd610 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd620 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd630 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd640 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd650 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd660 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd670 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd680 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd690 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd6a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd6b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd6c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd6d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd6e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd6f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd700 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd710 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd720 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd730 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd740 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd750 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd760 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd770 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd780 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd790 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd7a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd7b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd7c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd7d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd7e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd7f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd800 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd810 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd820 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd830 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd840 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd850 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd860 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd870 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd880 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd890 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd8a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd8b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd8c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd8d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd8e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd8f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd900 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd910 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd920 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd930 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd940 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd950 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd960 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd970 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd980 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd990 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd9a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd9b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xd9c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xd9d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd9e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xd9f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xda00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xda10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xda20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xda30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xda40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xda50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xda60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xda70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xda80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xda90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdaa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdab0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xdac0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xdad0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdae0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdaf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xdb00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xdb10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdb20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdb30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xdb40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xdb50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdb60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdb70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xdb80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xdb90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdba0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdbb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xdbc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xdbd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdbe0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdbf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xdc00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xdc10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdc20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdc30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xdc40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xdc50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdc60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdc70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xdc80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xdc90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdca0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdcb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xdcc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xdcd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdce0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdcf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xdd00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xdd10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdd20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdd30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xdd40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xdd50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdd60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdd70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xdd80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xdd90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdda0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xddb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xddc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xddd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdde0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xddf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xde00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xde10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xde20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xde30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xde40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xde50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xde60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xde70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xde80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xde90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdea0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdeb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xdec0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xded0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdee0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdef0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xdf00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xdf10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdf20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdf30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xdf40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xdf50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdf60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdf70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xdf80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xdf90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdfa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdfb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xdfc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xdfd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdfe0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xdff0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe000 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe010 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe020 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe030 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe040 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe050 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe060 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe070 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe080 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe090 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe0a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe0b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe0c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe0d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe0e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe0f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe100 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe110 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe120 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe130 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe140 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe150 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe160 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe170 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe180 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe190 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe1a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe1b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe1c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe1d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe1e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe1f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe200 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe210 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe220 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe230 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe240 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe250 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe260 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe270 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe280 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe290 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe2a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe2b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe2c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe2d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe2e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe2f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe300 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe310 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe320 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe330 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe340 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe350 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe360 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe370 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe380 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe390 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe3a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe3b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe3c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe3d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe3e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe3f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe400 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe410 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe420 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe430 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe440 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe450 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe460 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe470 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe480 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe490 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe4a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe4b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe4c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe4d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe4e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe4f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe500 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe510 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe520 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe530 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe540 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe550 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe560 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe570 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe580 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe590 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe5a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe5b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe5c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe5d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe5e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe5f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe600 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe610 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe620 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe630 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe640 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe650 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe660 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe670 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe680 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe690 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe6a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe6b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe6c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe6d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe6e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe6f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe700 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe710 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe720 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe730 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe740 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe750 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe760 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe770 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe780 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe790 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe7a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe7b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe7c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe7d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe7e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe7f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe800 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe810 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe820 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe830 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe840 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe850 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe860 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe870 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe880 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe890 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe8a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe8b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe8c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe8d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe8e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe8f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe900 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe910 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe920 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe930 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe940 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe950 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe960 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe970 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe980 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe990 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe9a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe9b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xe9c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xe9d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe9e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xe9f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xea00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xea10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xea20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xea30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xea40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xea50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xea60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xea70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xea80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xea90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xeaa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xeab0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xeac0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xead0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xeae0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xeaf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xeb00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xeb10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xeb20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xeb30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xeb40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xeb50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xeb60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xeb70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xeb80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xeb90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xeba0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xebb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xebc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xebd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xebe0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xebf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xec00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xec10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xec20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xec30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xec40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xec50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xec60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xec70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xec80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xec90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xeca0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xecb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xecc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xecd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xece0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xecf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xed00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xed10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xed20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xed30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xed40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xed50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xed60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xed70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xed80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xed90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xeda0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xedb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xedc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xedd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xede0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xedf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xee00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xee10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xee20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xee30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xee40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xee50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xee60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xee70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xee80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xee90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xeea0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xeeb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xeec0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xeed0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xeee0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xeef0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xef00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xef10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xef20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xef30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xef40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xef50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xef60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xef70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xef80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xef90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xefa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xefb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xefc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xefd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xefe0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xeff0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf000 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf010 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf020 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf030 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf040 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf050 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf060 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf070 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf080 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf090 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf0a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf0b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf0c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf0d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf0e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf0f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf100 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf110 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf120 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf130 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf140 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf150 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf160 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf170 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf180 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf190 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf1a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf1b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf1c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf1d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf1e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf1f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf200 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf210 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf220 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf230 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf240 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf250 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf260 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf270 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf280 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf290 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf2a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf2b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf2c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf2d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf2e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf2f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf300 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf310 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf320 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf330 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf340 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf350 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf360 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf370 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf380 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf390 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf3a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf3b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf3c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf3d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf3e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf3f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf400 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf410 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf420 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf430 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf440 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf450 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf460 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf470 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf480 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf490 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf4a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf4b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf4c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf4d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf4e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf4f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf500 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf510 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf520 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf530 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf540 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf550 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf560 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf570 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf580 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf590 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf5a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf5b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf5c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf5d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf5e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf5f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf600 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf610 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf620 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf630 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf640 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf650 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf660 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf670 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf680 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf690 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf6a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf6b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf6c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf6d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf6e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf6f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf700 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf710 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf720 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf730 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf740 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf750 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf760 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf770 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf780 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf790 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf7a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf7b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf7c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf7d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf7e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf7f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf800 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf810 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf820 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf830 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf840 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf850 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf860 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf870 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf880 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf890 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf8a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf8b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf8c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf8d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf8e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf8f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf900 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf910 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf920 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf930 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf940 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf950 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf960 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf970 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf980 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf990 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf9a0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf9b0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xf9c0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xf9d0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf9e0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xf9f0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xfa00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xfa10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfa20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfa30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xfa40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xfa50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfa60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfa70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xfa80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xfa90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfaa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfab0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xfac0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xfad0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfae0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfaf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xfb00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xfb10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfb20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfb30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xfb40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xfb50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfb60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfb70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xfb80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xfb90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfba0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfbb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xfbc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xfbd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfbe0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfbf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xfc00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xfc10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfc20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfc30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xfc40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xfc50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfc60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfc70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xfc80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xfc90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfca0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfcb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xfcc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xfcd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfce0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfcf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xfd00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xfd10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfd20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfd30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xfd40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xfd50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfd60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfd70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xfd80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xfd90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfda0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfdb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xfdc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xfdd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfde0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfdf0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xfe00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xfe10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfe20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfe30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xfe40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xfe50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfe60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfe70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xfe80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xfe90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfea0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfeb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xfec0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xfed0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfee0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfef0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xff00 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xff10 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xff20 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xff30 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xff40 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xff50 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xff60 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xff70 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xff80 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xff90 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xffa0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xffb0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+  /* 0xffc0 */ 65535, 65535, 90, 65535, 89, 65535, 105, 65535, 84, 65535, 103, 65535, 85, 65535, 65535, 65535,
+  /* 0xffd0 */ 65535, 65535, 90, 65535, 89, 65535, 104, 65535, 118, 65535, 102, 65535, 65535, 65535, 65535, 65535,
+  /* 0xffe0 */ 65535, 65535, 90, 65535, 89, 65535, 108, 65535, 86, 65535, 119, 65535, 65535, 65535, 65535, 65535,
+  /* 0xfff0 */ 65535, 65535, 90, 65535, 89, 65535, 109, 65535, 106, 65535, 107, 65535, 87, 65535, 65535, 65535,
+};
+
+static void linxisa_extract_0(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 20) & 0xfULL); /* RST_Type */
+}
+
+static void linxisa_extract_1(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 20) & 0xfULL); /* RRA_Type */
+}
+
+static void linxisa_extract_2(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 7) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)((insn >> 20) & 0x1fULL); /* SrcR */
+  out[3] = (int64_t)((insn >> 25) & 0x3ULL); /* SrcRType */
+  out[4] = (int64_t)((insn >> 27) & 0x1fULL); /* shamt */
+}
+
+static void linxisa_extract_3(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 7) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)((insn >> 20) & 0xfffULL); /* uimm12 */
+}
+
+static void linxisa_extract_4(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 7) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 12) & 0xfffffULL); /* imm20 */
+}
+
+static void linxisa_extract_5(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 7) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)(((insn >> 20) & 0xfffULL) ^ 0x800ULL) - 0x800LL; /* simm12 */
+}
+
+static void linxisa_extract_6(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+}
+
+static void linxisa_extract_7(uint64_t insn, int64_t *out)
+{
+  (void)insn;
+  (void)out;
+}
+
+static void linxisa_extract_8(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 7) & 0x1fULL); /* format */
+}
+
+static void linxisa_extract_9(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 25) & 0x1ULL); /* C */
+  out[1] = (int64_t)((insn >> 26) & 0x1ULL); /* DR */
+  out[2] = (int64_t)((insn >> 7) & 0x1fULL); /* DataLayout */
+  out[3] = (int64_t)((insn >> 20) & 0x1fULL); /* DataType */
+  out[4] = (int64_t)((insn >> 27) & 0x1fULL); /* PadValue */
+  out[5] = (int64_t)((insn >> 19) & 0x1ULL); /* T */
+  out[6] = (int64_t)((insn >> 16) & 0x1ULL); /* aq */
+  out[7] = (int64_t)((insn >> 17) & 0x1ULL); /* atom */
+  out[8] = (int64_t)((insn >> 18) & 0x1ULL); /* far */
+  out[9] = (int64_t)((insn >> 15) & 0x1ULL); /* rl */
+}
+
+static void linxisa_extract_10(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 15) & 0x1fULL); /* RegSrc */
+  out[1] = (int64_t)(((insn >> 20) & 0xfffULL) | (((insn >> 7) & 0x1fULL) << 12)); /* uimm17 */
+}
+
+static void linxisa_extract_11(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[1] = (int64_t)((insn >> 20) & 0x1fULL); /* SrcR */
+  out[2] = (int64_t)((((insn >> 25) & 0x7fULL) | (((insn >> 7) & 0x1fULL) << 7)) ^ 0x800ULL) - 0x800LL; /* simm12 */
+}
+
+static void linxisa_extract_12(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 16) & 0x1ULL); /* L/UL */
+  out[1] = (int64_t)((insn >> 15) & 0x1ULL); /* V */
+  out[2] = (int64_t)((insn >> 20) & 0xfffULL); /* prefetch_size */
+  out[3] = (int64_t)((insn >> 17) & 0x3ULL); /* temp */
+}
+
+static void linxisa_extract_13(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 15) & 0x1ULL); /* B/E */
+  out[1] = (int64_t)((insn >> 16) & 0xffffULL); /* reserve */
+}
+
+static void linxisa_extract_14(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 7) & 0x1fULL); /* DepDst */
+  out[1] = (int64_t)((insn >> 15) & 0x1fULL); /* DepSrc0 */
+  out[2] = (int64_t)((insn >> 20) & 0x1fULL); /* DepSrc1 */
+  out[3] = (int64_t)((insn >> 27) & 0x1fULL); /* DepSrc2 */
+}
+
+static void linxisa_extract_15(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 7) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 15) & 0x1fULL); /* RegSrc0 */
+  out[2] = (int64_t)((insn >> 20) & 0x1fULL); /* RegSrc1 */
+  out[3] = (int64_t)((insn >> 27) & 0x1fULL); /* RegSrc2 */
+}
+
+static void linxisa_extract_16(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 25) & 0x7ULL); /* DstTile */
+  out[1] = (int64_t)((insn >> 7) & 0x1fULL); /* RegSrc */
+  out[2] = (int64_t)((insn >> 30) & 0x1ULL); /* S0R */
+  out[3] = (int64_t)((insn >> 28) & 0x1ULL); /* S0V */
+  out[4] = (int64_t)((insn >> 31) & 0x1ULL); /* S1R */
+  out[5] = (int64_t)((insn >> 29) & 0x1ULL); /* S1V */
+  out[6] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcTile0 */
+  out[7] = (int64_t)((insn >> 20) & 0x1fULL); /* SrcTile1 */
+}
+
+static void linxisa_extract_17(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 25) & 0x7ULL); /* DstTile */
+  out[1] = (int64_t)((insn >> 30) & 0x1ULL); /* S0R */
+  out[2] = (int64_t)((insn >> 28) & 0x1ULL); /* S0V */
+  out[3] = (int64_t)((insn >> 31) & 0x1ULL); /* S1R */
+  out[4] = (int64_t)((insn >> 29) & 0x1ULL); /* S1V */
+  out[5] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcTile0 */
+  out[6] = (int64_t)((insn >> 20) & 0x1fULL); /* SrcTile1 */
+  out[7] = (int64_t)((insn >> 7) & 0x1fULL); /* imm5 */
+}
+
+static void linxisa_extract_18(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((((insn >> 15) & 0x1ffffULL) | (((insn >> 7) & 0x1fULL) << 17)) ^ 0x200000ULL) - 0x200000LL; /* simm22 */
+}
+
+static void linxisa_extract_19(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 7) & 0x1ffffffULL) ^ 0x1000000ULL) - 0x1000000LL; /* simm25 */
+}
+
+static void linxisa_extract_20(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 7) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)((insn >> 20) & 0x3fULL); /* imml */
+  out[3] = (int64_t)((insn >> 26) & 0x3fULL); /* imms */
+}
+
+static void linxisa_extract_21(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 4) & 0xfffULL) ^ 0x800ULL) - 0x800LL; /* simm12 */
+  out[1] = (int64_t)((insn >> 22) & 0x1fULL); /* uimm5 */
+}
+
+static void linxisa_extract_22(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 27) & 0x1fULL); /* DataType */
+}
+
+static void linxisa_extract_23(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 27) & 0x1fULL); /* DataType */
+  out[1] = (int64_t)((insn >> 20) & 0x1fULL); /* Function */
+}
+
+static void linxisa_extract_24(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 15) & 0x1ffffULL); /* reserve */
+}
+
+static void linxisa_extract_25(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 15) & 0x1ffffULL) ^ 0x10000ULL) - 0x10000LL; /* simm17 */
+}
+
+static void linxisa_extract_26(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 25) & 0x3ULL); /* Mode */
+}
+
+static void linxisa_extract_27(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 27) & 0x1fULL); /* DataType */
+  out[1] = (int64_t)((insn >> 15) & 0x3ffULL); /* TileOp10 */
+}
+
+static void linxisa_extract_28(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 6) & 0x1fULL); /* SrcL */
+  out[1] = (int64_t)((insn >> 11) & 0x1fULL); /* SrcR */
+}
+
+static void linxisa_extract_29(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 6) & 0x1fULL); /* SrcL */
+  out[1] = (int64_t)(((insn >> 11) & 0x1fULL) ^ 0x10ULL) - 0x10LL; /* simm5 */
+}
+
+static void linxisa_extract_30(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 11) & 0x7ULL); /* LoopNest */
+  out[1] = (int64_t)((insn >> 6) & 0x1fULL); /* RegSrc */
+}
+
+static void linxisa_extract_31(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 14) & 0x3ULL); /* LoopNest */
+  out[1] = (int64_t)((insn >> 6) & 0xffULL); /* imm8 */
+}
+
+static void linxisa_extract_32(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 4) & 0xfffULL) ^ 0x800ULL) - 0x800LL; /* simm12 */
+}
+
+static void linxisa_extract_33(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 11) & 0x7ULL); /* BrType */
+}
+
+static void linxisa_extract_34(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 6) & 0x1fULL) ^ 0x10ULL) - 0x10LL; /* simm5 */
+}
+
+static void linxisa_extract_35(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 6) & 0x1fULL); /* imm5 */
+}
+
+static void linxisa_extract_36(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 11) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)(((insn >> 6) & 0x1fULL) ^ 0x10ULL) - 0x10LL; /* simm5 */
+}
+
+static void linxisa_extract_37(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 11) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 6) & 0x1fULL); /* SrcL */
+}
+
+static void linxisa_extract_38(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 6) & 0x1fULL); /* SrcL */
+}
+
+static void linxisa_extract_39(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 6) & 0x1fULL); /* uimm5 */
+}
+
+static void linxisa_extract_40(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 6) & 0x1fULL); /* SSRID */
+}
+
+static void linxisa_extract_41(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 7) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)((insn >> 20) & 0x1fULL); /* SrcR */
+  out[3] = (int64_t)((insn >> 25) & 0x3ULL); /* SrcRType */
+}
+
+static void linxisa_extract_42(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 7) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)((insn >> 27) & 0x1fULL); /* SrcP */
+  out[3] = (int64_t)((insn >> 20) & 0x1fULL); /* SrcR */
+  out[4] = (int64_t)((insn >> 25) & 0x3ULL); /* SrcRType */
+}
+
+static void linxisa_extract_43(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 7) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)((insn >> 20) & 0x1fULL); /* SrcR */
+}
+
+static void linxisa_extract_44(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 24) & 0xfULL); /* imm4 */
+}
+
+static void linxisa_extract_45(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 15) & 0x1fULL); /* RegSrc0=BasePtr */
+  out[1] = (int64_t)((insn >> 20) & 0x1fULL); /* RegSrc1=LenBytes */
+  out[2] = (int64_t)((insn >> 27) & 0x1fULL); /* RegSrc2=Kind */
+}
+
+static void linxisa_extract_46(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 7) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)((insn >> 25) & 0x3ULL); /* SrcType */
+}
+
+static void linxisa_extract_47(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 7) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)((insn >> 20) & 0x1fULL); /* SrcR */
+  out[3] = (int64_t)((insn >> 25) & 0x3ULL); /* SrcType */
+}
+
+static void linxisa_extract_48(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 27) & 0x1fULL); /* DstType */
+  out[1] = (int64_t)((insn >> 7) & 0x1fULL); /* RegDst */
+  out[2] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[3] = (int64_t)((insn >> 25) & 0x3ULL); /* SrcType */
+}
+
+static void linxisa_extract_49(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 24) & 0xfULL); /* PRED_IMM */
+  out[1] = (int64_t)((insn >> 20) & 0xfULL); /* SUCC_IMM */
+}
+
+static void linxisa_extract_50(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcBegin */
+  out[1] = (int64_t)((insn >> 20) & 0x1fULL); /* SrcEnd */
+  out[2] = (int64_t)((((insn >> 25) & 0x7fULL) << 3) | (((insn >> 7) & 0x1fULL) << 10)); /* uimm */
+}
+
+static void linxisa_extract_51(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 15) & 0x1fULL); /* DstBegin */
+  out[1] = (int64_t)((insn >> 20) & 0x1fULL); /* DstEnd */
+  out[2] = (int64_t)((((insn >> 25) & 0x7fULL) << 3) | (((insn >> 7) & 0x1fULL) << 10)); /* uimm */
+}
+
+static void linxisa_extract_52(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 7) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 27) & 0x1fULL); /* SrcA */
+  out[2] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[3] = (int64_t)((insn >> 20) & 0x1fULL); /* SrcR */
+  out[4] = (int64_t)((insn >> 25) & 0x3ULL); /* SrcType */
+}
+
+static void linxisa_extract_53(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 23) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)(((insn >> 36) & 0xfffULL) | (((insn >> 4) & 0xfffULL) << 12)); /* uimm24 */
+}
+
+static void linxisa_extract_54(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 23) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)(((insn >> 28) & 0xfffffULL) | (((insn >> 4) & 0xfffULL) << 20)); /* imm32 */
+}
+
+static void linxisa_extract_55(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 23) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)((((insn >> 36) & 0xfffULL) | (((insn >> 4) & 0xfffULL) << 12)) ^ 0x800000ULL) - 0x800000LL; /* simm24 */
+}
+
+static void linxisa_extract_56(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 23) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)((insn >> 36) & 0x1fULL); /* SrcR */
+  out[3] = (int64_t)((insn >> 4) & 0x3fULL); /* immr */
+  out[4] = (int64_t)((insn >> 10) & 0x3fULL); /* imms */
+}
+
+static void linxisa_extract_57(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 7) & 0x1ffffffULL) ^ 0x1000000ULL) - 0x1000000LL; /* simm25 */
+  out[1] = (int64_t)((insn >> 38) & 0x1fULL); /* uimm5 */
+}
+
+static void linxisa_extract_58(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((((insn >> 31) & 0x1ffffULL) << 1) | (((insn >> 4) & 0xfffULL) << 18)) ^ 0x20000000ULL) - 0x20000000LL; /* simm */
+}
+
+static void linxisa_extract_59(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 23) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 6) & 0x1fULL); /* SrcD */
+  out[2] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+  out[3] = (int64_t)((insn >> 36) & 0x1fULL); /* SrcR */
+  out[4] = (int64_t)((insn >> 42) & 0x1ULL); /* aq */
+  out[5] = (int64_t)((insn >> 43) & 0x1ULL); /* far */
+  out[6] = (int64_t)((insn >> 41) & 0x1ULL); /* rl */
+}
+
+static void linxisa_extract_60(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 23) & 0x1fULL); /* RegDst0 */
+  out[1] = (int64_t)((insn >> 11) & 0x1fULL); /* RegDst1 */
+  out[2] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+  out[3] = (int64_t)((insn >> 36) & 0x1fULL); /* SrcR */
+  out[4] = (int64_t)((insn >> 41) & 0x7fULL); /* shamt */
+}
+
+static void linxisa_extract_61(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 23) & 0x1fULL); /* RegDst0 */
+  out[1] = (int64_t)((insn >> 11) & 0x1fULL); /* RegDst1 */
+  out[2] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+  out[3] = (int64_t)((insn >> 36) & 0x1fULL); /* SrcR */
+}
+
+static void linxisa_extract_62(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 23) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((((insn >> 31) & 0x1ffffULL) | (((insn >> 4) & 0xfffULL) << 17)) ^ 0x10000000ULL) - 0x10000000LL; /* simm */
+}
+
+static void linxisa_extract_63(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 23) & 0x1fULL); /* RegDst0 */
+  out[1] = (int64_t)((insn >> 11) & 0x1fULL); /* RegDst1 */
+  out[2] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+  out[3] = (int64_t)((insn >> 36) & 0x1fULL); /* SrcR */
+  out[4] = (int64_t)((insn >> 41) & 0x3ULL); /* SrcRType */
+  out[5] = (int64_t)((insn >> 43) & 0x1fULL); /* shamt */
+}
+
+static void linxisa_extract_64(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 23) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)((((insn >> 36) & 0xfffULL) | (((insn >> 6) & 0x3ffULL) << 12)) ^ 0x200000ULL) - 0x200000LL; /* simm22 */
+}
+
+static void linxisa_extract_65(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 23) & 0x1fULL); /* RegDst0 */
+  out[1] = (int64_t)((insn >> 11) & 0x1fULL); /* RegDst1 */
+  out[2] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+  out[3] = (int64_t)((((insn >> 36) & 0xfffULL) | (((insn >> 6) & 0x1fULL) << 12)) ^ 0x10000ULL) - 0x10000LL; /* simm17 */
+}
+
+static void linxisa_extract_66(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 23) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((((insn >> 28) & 0xfffffULL) | (((insn >> 4) & 0xfffULL) << 20)) ^ 0x80000000ULL) - 0x80000000LL; /* simm32 */
+}
+
+static void linxisa_extract_67(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 23) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)(((insn >> 28) & 0xfffffULL) | (((insn >> 4) & 0xfffULL) << 20)); /* uimm32 */
+}
+
+static void linxisa_extract_68(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 23) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)(((insn >> 28) & 0xfffffULL) | (((insn >> 4) & 0xfffULL) << 20)); /* imm */
+}
+
+static void linxisa_extract_69(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 23) & 0x1fULL); /* RegDst0 */
+  out[1] = (int64_t)((insn >> 11) & 0x1fULL); /* RegDst1 */
+  out[2] = (int64_t)((insn >> 43) & 0x1fULL); /* SrcD */
+  out[3] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+  out[4] = (int64_t)((insn >> 36) & 0x1fULL); /* SrcR */
+}
+
+static void linxisa_extract_70(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 23) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)((insn >> 36) & 0x1fULL); /* SrcR */
+  out[3] = (int64_t)(((insn >> 41) & 0x7fULL) | (((insn >> 4) & 0xfffULL) << 7)); /* uimm19 */
+}
+
+static void linxisa_extract_71(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+  out[1] = (int64_t)((insn >> 36) & 0x1fULL); /* SrcR */
+  out[2] = (int64_t)((insn >> 41) & 0x3ULL); /* SrcRType */
+  out[3] = (int64_t)((insn >> 11) & 0x1fULL); /* model */
+  out[4] = (int64_t)((insn >> 43) & 0x1fULL); /* shamt */
+}
+
+static void linxisa_extract_72(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 23) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)((insn >> 36) & 0x1fULL); /* SrcR */
+  out[3] = (int64_t)((insn >> 41) & 0x3ULL); /* SrcRType */
+  out[4] = (int64_t)((insn >> 11) & 0x1fULL); /* model */
+  out[5] = (int64_t)((insn >> 43) & 0x1fULL); /* shamt */
+}
+
+static void linxisa_extract_73(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+  out[1] = (int64_t)((insn >> 11) & 0x1fULL); /* model */
+  out[2] = (int64_t)((((insn >> 36) & 0xfffULL) | (((insn >> 6) & 0x1fULL) << 12)) ^ 0x10000ULL) - 0x10000LL; /* simm17 */
+}
+
+static void linxisa_extract_74(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 23) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)((insn >> 11) & 0x1fULL); /* model */
+  out[3] = (int64_t)((((insn >> 36) & 0xfffULL) | (((insn >> 6) & 0x1fULL) << 12)) ^ 0x10000ULL) - 0x10000LL; /* simm17 */
+}
+
+static void linxisa_extract_75(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 23) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)((insn >> 36) & 0x1fULL); /* SrcR */
+  out[3] = (int64_t)((insn >> 41) & 0x1ULL); /* e */
+  out[4] = (int64_t)((insn >> 44) & 0x1ULL); /* i */
+  out[5] = (int64_t)((insn >> 42) & 0x1ULL); /* r */
+  out[6] = (int64_t)((insn >> 43) & 0x1ULL); /* s */
+}
+
+static void linxisa_extract_76(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 23) & 0x1fULL); /* RegDst0 */
+  out[1] = (int64_t)((insn >> 11) & 0x1fULL); /* RegDst1 */
+  out[2] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+  out[3] = (int64_t)((insn >> 36) & 0x1fULL); /* SrcR */
+  out[4] = (int64_t)((insn >> 41) & 0x1ULL); /* e */
+  out[5] = (int64_t)((insn >> 42) & 0x1ULL); /* r */
+}
+
+static void linxisa_extract_77(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 23) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)((insn >> 36) & 0x1fULL); /* SrcR */
+  out[3] = (int64_t)((insn >> 41) & 0x1ULL); /* e */
+  out[4] = (int64_t)((insn >> 43) & 0x1ULL); /* h */
+  out[5] = (int64_t)((insn >> 42) & 0x1ULL); /* r */
+}
+
+static void linxisa_extract_78(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+  out[1] = (int64_t)((((insn >> 36) & 0xfffULL) | (((insn >> 23) & 0x1fULL) << 12) | (((insn >> 4) & 0xfffULL) << 17)) ^ 0x10000000ULL) - 0x10000000LL; /* simm */
+}
+
+static void linxisa_extract_79(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 11) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 43) & 0x1fULL); /* SrcD */
+  out[2] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+  out[3] = (int64_t)((insn >> 36) & 0x1fULL); /* SrcR */
+  out[4] = (int64_t)((insn >> 41) & 0x3ULL); /* SrcRType */
+}
+
+static void linxisa_extract_80(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcD */
+  out[1] = (int64_t)((insn >> 36) & 0x1fULL); /* SrcR */
+  out[2] = (int64_t)((((insn >> 41) & 0x7fULL) | (((insn >> 23) & 0x1fULL) << 7) | (((insn >> 6) & 0x3ffULL) << 12)) ^ 0x200000ULL) - 0x200000LL; /* simm22 */
+}
+
+static void linxisa_extract_81(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 11) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcD */
+  out[2] = (int64_t)((insn >> 36) & 0x1fULL); /* SrcR */
+  out[3] = (int64_t)((((insn >> 41) & 0x7fULL) | (((insn >> 23) & 0x1fULL) << 7) | (((insn >> 6) & 0x1fULL) << 12)) ^ 0x10000ULL) - 0x10000LL; /* simm17 */
+}
+
+static void linxisa_extract_82(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcD */
+  out[1] = (int64_t)((insn >> 6) & 0x1fULL); /* SrcD1 */
+  out[2] = (int64_t)((insn >> 36) & 0x1fULL); /* SrcR */
+  out[3] = (int64_t)((((insn >> 41) & 0x7fULL) | (((insn >> 23) & 0x1fULL) << 7) | (((insn >> 11) & 0x1fULL) << 12)) ^ 0x10000ULL) - 0x10000LL; /* simm17 */
+}
+
+static void linxisa_extract_83(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 43) & 0x1fULL); /* SrcD */
+  out[1] = (int64_t)((insn >> 6) & 0x1fULL); /* SrcD1 */
+  out[2] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+  out[3] = (int64_t)((insn >> 36) & 0x1fULL); /* SrcR */
+  out[4] = (int64_t)((insn >> 41) & 0x3ULL); /* SrcRType */
+}
+
+static void linxisa_extract_84(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+  out[1] = (int64_t)((insn >> 23) & 0x1fULL); /* shamt */
+  out[2] = (int64_t)((((insn >> 36) & 0xfffULL) | (((insn >> 4) & 0xfffULL) << 12)) ^ 0x800000ULL) - 0x800000LL; /* simm24 */
+}
+
+static void linxisa_extract_85(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+  out[1] = (int64_t)((insn >> 23) & 0x1fULL); /* shamt */
+  out[2] = (int64_t)(((insn >> 36) & 0xfffULL) | (((insn >> 4) & 0xfffULL) << 12)); /* uimm24 */
+}
+
+static void linxisa_extract_86(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 28) & 0xfffffULL) | (((insn >> 4) & 0xfffULL) << 20)); /* imm32 */
+}
+
+static void linxisa_extract_87(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 23) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)(((insn >> 36) & 0xfffULL) | (((insn >> 4) & 0xfffULL) << 12)); /* SSR_ID */
+}
+
+static void linxisa_extract_88(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 36) & 0xfffULL) | (((insn >> 4) & 0xfffULL) << 12)); /* SSR_ID */
+  out[1] = (int64_t)((insn >> 31) & 0x1fULL); /* SrcL */
+}
+
+static void linxisa_extract_89(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[1] = (int64_t)((insn >> 20) & 0x1fULL); /* SrcZero */
+  out[2] = (int64_t)((((insn >> 25) & 0x7fULL) | (((insn >> 7) & 0x1fULL) << 7)) ^ 0x800ULL) - 0x800LL; /* simm12 */
+}
+
+static void linxisa_extract_90(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 7) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)(((insn >> 15) & 0x1ffffULL) ^ 0x10000ULL) - 0x10000LL; /* simm17 */
+}
+
+static void linxisa_extract_91(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 7) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)((insn >> 20) & 0x1fULL); /* SrcR */
+  out[3] = (int64_t)((insn >> 26) & 0x1ULL); /* aq */
+  out[4] = (int64_t)((insn >> 27) & 0x1ULL); /* far */
+  out[5] = (int64_t)((insn >> 25) & 0x1ULL); /* rl */
+}
+
+static void linxisa_extract_92(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 7) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)((insn >> 20) & 0x1fULL); /* SrcZero */
+  out[3] = (int64_t)((insn >> 26) & 0x1ULL); /* aq */
+  out[4] = (int64_t)((insn >> 27) & 0x1ULL); /* far */
+  out[5] = (int64_t)((insn >> 25) & 0x1ULL); /* rl */
+}
+
+static void linxisa_extract_93(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 20) & 0xfffULL); /* LSR_ID */
+  out[1] = (int64_t)((insn >> 7) & 0x1fULL); /* RegDst */
+}
+
+static void linxisa_extract_94(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 7) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 27) & 0x1fULL); /* SrcD */
+  out[2] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[3] = (int64_t)((insn >> 20) & 0x1fULL); /* SrcR */
+}
+
+static void linxisa_extract_95(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 15) & 0x1fULL); /* RegSrc0=DstAddr */
+  out[1] = (int64_t)((insn >> 20) & 0x1fULL); /* RegSrc1=SrcAddr */
+  out[2] = (int64_t)((insn >> 27) & 0x1fULL); /* RegSrc2=Size */
+}
+
+static void linxisa_extract_96(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 15) & 0x1fULL); /* RegSrc0=DstAddr */
+  out[1] = (int64_t)((insn >> 20) & 0x1fULL); /* RegSrc1=Value */
+  out[2] = (int64_t)((insn >> 27) & 0x1fULL); /* RegSrc2=Size */
+}
+
+static void linxisa_extract_97(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 7) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)((insn >> 20) & 0x3fULL); /* imml */
+  out[3] = (int64_t)((insn >> 26) & 0x3fULL); /* immr */
+}
+
+static void linxisa_extract_98(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 27) & 0x1fULL); /* SrcD */
+  out[1] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)((insn >> 20) & 0x1fULL); /* SrcR */
+  out[3] = (int64_t)((insn >> 25) & 0x3ULL); /* SrcRType */
+}
+
+static void linxisa_extract_99(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[1] = (int64_t)((((insn >> 20) & 0xfffULL) | (((insn >> 7) & 0x1fULL) << 12)) ^ 0x10000ULL) - 0x10000LL; /* simm */
+}
+
+static void linxisa_extract_100(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[1] = (int64_t)((insn >> 20) & 0x1fULL); /* SrcR */
+  out[2] = (int64_t)((insn >> 27) & 0x1ULL); /* far */
+  out[3] = (int64_t)((insn >> 25) & 0x1ULL); /* rl */
+}
+
+static void linxisa_extract_101(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[1] = (int64_t)((insn >> 20) & 0x1fULL); /* SrcR */
+  out[2] = (int64_t)((insn >> 25) & 0x3ULL); /* SrcRType */
+}
+
+static void linxisa_extract_102(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[1] = (int64_t)((insn >> 7) & 0x1fULL); /* shamt */
+  out[2] = (int64_t)(((insn >> 20) & 0xfffULL) ^ 0x800ULL) - 0x800LL; /* simm12 */
+}
+
+static void linxisa_extract_103(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[1] = (int64_t)((insn >> 7) & 0x1fULL); /* shamt */
+  out[2] = (int64_t)((insn >> 20) & 0xfffULL); /* uimm12 */
+}
+
+static void linxisa_extract_104(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 12) & 0xfffffULL); /* imm20 */
+}
+
+static void linxisa_extract_105(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 7) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)((insn >> 20) & 0x3fULL); /* shamt */
+}
+
+static void linxisa_extract_106(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 7) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+  out[2] = (int64_t)((insn >> 20) & 0x1fULL); /* shamt */
+}
+
+static void linxisa_extract_107(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 7) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 20) & 0xfffULL); /* SSR_ID */
+}
+
+static void linxisa_extract_108(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 20) & 0xfffULL); /* SSR_ID */
+  out[1] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+}
+
+static void linxisa_extract_109(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 7) & 0x1fULL); /* RegDst */
+  out[1] = (int64_t)((insn >> 20) & 0xfffULL); /* SSR_ID */
+  out[2] = (int64_t)((insn >> 15) & 0x1fULL); /* SrcL */
+}
+
+static void linxisa_extract_110(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 39) & 0x1fULL) | (((insn >> 7) & 0x1fULL) << 5)); /* RegDst */
+  out[1] = (int64_t)(((insn >> 47) & 0x1fULL) | (((insn >> 15) & 0x1fULL) << 5)); /* SrcL */
+  out[2] = (int64_t)(((insn >> 52) & 0x1fULL) | (((insn >> 20) & 0x1fULL) << 5)); /* SrcR */
+  out[3] = (int64_t)((insn >> 57) & 0x3ULL); /* SrcRType */
+  out[4] = (int64_t)(insn >> 59); /* shamt */
+}
+
+static void linxisa_extract_111(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 39) & 0x1fULL) | (((insn >> 7) & 0x1fULL) << 5)); /* RegDst */
+  out[1] = (int64_t)(((insn >> 47) & 0x1fULL) | (((insn >> 15) & 0x1fULL) << 5)); /* SrcL */
+  out[2] = (int64_t)(insn >> 52); /* uimm12 */
+}
+
+static void linxisa_extract_112(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 39) & 0x1fULL) | (((insn >> 7) & 0x1fULL) << 5)); /* RegDst */
+  out[1] = (int64_t)(((insn >> 47) & 0x1fULL) | (((insn >> 15) & 0x1fULL) << 5)); /* SrcL */
+  out[2] = (int64_t)((insn >> 52) ^ 0x800ULL) - 0x800LL; /* simm12 */
+}
+
+static void linxisa_extract_113(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 39) & 0x1fULL) | (((insn >> 7) & 0x1fULL) << 5)); /* RegDst */
+  out[1] = (int64_t)(((insn >> 47) & 0x1fULL) | (((insn >> 15) & 0x1fULL) << 5)); /* SrcL */
+  out[2] = (int64_t)((insn >> 52) & 0x3fULL); /* imml */
+  out[3] = (int64_t)(insn >> 58); /* imms */
+}
+
+static void linxisa_extract_114(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 39) & 0x1fULL) | (((insn >> 7) & 0x1fULL) << 5)); /* RegDst */
+  out[1] = (int64_t)(((insn >> 47) & 0x1fULL) | (((insn >> 15) & 0x1fULL) << 5)); /* SrcL */
+  out[2] = (int64_t)(((insn >> 52) & 0x1fULL) | (((insn >> 20) & 0x1fULL) << 5)); /* SrcR */
+}
+
+static void linxisa_extract_115(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 39) & 0x1fULL) | (((insn >> 7) & 0x1fULL) << 5)); /* RegDst */
+  out[1] = (int64_t)(((insn >> 47) & 0x1fULL) | (((insn >> 15) & 0x1fULL) << 5)); /* SrcL */
+  out[2] = (int64_t)((insn >> 59) | (((insn >> 27) & 0x1fULL) << 5)); /* SrcP */
+  out[3] = (int64_t)(((insn >> 52) & 0x1fULL) | (((insn >> 20) & 0x1fULL) << 5)); /* SrcR */
+  out[4] = (int64_t)((insn >> 57) & 0x3ULL); /* SrcRType */
+}
+
+static void linxisa_extract_116(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 39) & 0x1fULL) | (((insn >> 7) & 0x1fULL) << 5)); /* RegDst */
+  out[1] = (int64_t)(((insn >> 47) & 0x1fULL) | (((insn >> 15) & 0x1fULL) << 5)); /* SrcL */
+}
+
+static void linxisa_extract_117(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(insn >> 59); /* DstType */
+  out[1] = (int64_t)(((insn >> 39) & 0x1fULL) | (((insn >> 7) & 0x1fULL) << 5)); /* RegDst */
+  out[2] = (int64_t)(((insn >> 47) & 0x1fULL) | (((insn >> 15) & 0x1fULL) << 5)); /* SrcL */
+  out[3] = (int64_t)((insn >> 52) & 0x1fULL); /* SrcType */
+}
+
+static void linxisa_extract_118(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 39) & 0x1fULL) | (((insn >> 7) & 0x1fULL) << 5)); /* RegDst */
+  out[1] = (int64_t)((insn >> 59) | (((insn >> 27) & 0x1fULL) << 5)); /* SrcA */
+  out[2] = (int64_t)(((insn >> 47) & 0x1fULL) | (((insn >> 15) & 0x1fULL) << 5)); /* SrcL */
+  out[3] = (int64_t)(((insn >> 52) & 0x1fULL) | (((insn >> 20) & 0x1fULL) << 5)); /* SrcR */
+}
+
+static void linxisa_extract_119(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 12) & 0x1ULL); /* C */
+  out[1] = (int64_t)((insn >> 14) & 0x1ULL); /* L */
+  out[2] = (int64_t)(((insn >> 39) & 0x1fULL) | (((insn >> 7) & 0x1fULL) << 5)); /* RegDst */
+  out[3] = (int64_t)(((insn >> 47) & 0x1fULL) | (((insn >> 15) & 0x1fULL) << 5)); /* SrcL */
+  out[4] = (int64_t)(((insn >> 52) & 0x1fULL) | (((insn >> 20) & 0x1fULL) << 5)); /* SrcR */
+  out[5] = (int64_t)(insn >> 59); /* shamt */
+}
+
+static void linxisa_extract_120(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 12) & 0x1ULL); /* C */
+  out[1] = (int64_t)((insn >> 14) & 0x1ULL); /* L */
+  out[2] = (int64_t)(((insn >> 39) & 0x1fULL) | (((insn >> 7) & 0x1fULL) << 5)); /* RegDst */
+  out[3] = (int64_t)(((insn >> 47) & 0x1fULL) | (((insn >> 15) & 0x1fULL) << 5)); /* SrcL */
+  out[4] = (int64_t)(((insn >> 52) | (((insn >> 20) & 0xfffULL) << 12)) ^ 0x800000ULL) - 0x800000LL; /* simm24 */
+}
+
+static void linxisa_extract_121(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 39) & 0x1fULL) | (((insn >> 7) & 0x1fULL) << 5)); /* RegDst */
+  out[1] = (int64_t)(((insn >> 47) & 0x1fULL) | (((insn >> 15) & 0x1fULL) << 5)); /* SrcL */
+  out[2] = (int64_t)(((insn >> 52) & 0x1fULL) | (((insn >> 20) & 0x1fULL) << 5)); /* SrcR */
+  out[3] = (int64_t)((insn >> 58) & 0x1ULL); /* aq */
+  out[4] = (int64_t)((insn >> 25) & 0x1ULL); /* far */
+  out[5] = (int64_t)((insn >> 57) & 0x1ULL); /* rl */
+}
+
+static void linxisa_extract_122(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 39) & 0x1fULL) | (((insn >> 7) & 0x1fULL) << 5)); /* RegDst */
+  out[1] = (int64_t)((insn >> 59) | (((insn >> 27) & 0x1fULL) << 5)); /* SrcD */
+  out[2] = (int64_t)(((insn >> 47) & 0x1fULL) | (((insn >> 15) & 0x1fULL) << 5)); /* SrcL */
+  out[3] = (int64_t)(((insn >> 52) & 0x1fULL) | (((insn >> 20) & 0x1fULL) << 5)); /* SrcR */
+}
+
+static void linxisa_extract_123(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 39) & 0x1fULL) | (((insn >> 7) & 0x1fULL) << 5)); /* RegDst */
+  out[1] = (int64_t)(((insn >> 47) & 0x1fULL) | (((insn >> 15) & 0x1fULL) << 5)); /* SrcL */
+  out[2] = (int64_t)(((insn >> 52) & 0x1fULL) | (((insn >> 20) & 0x1fULL) << 5)); /* SrcR */
+  out[3] = (int64_t)((insn >> 57) & 0x3ULL); /* SrcRType */
+  out[4] = (int64_t)((insn >> 59) | (((insn >> 27) & 0x1fULL) << 5)); /* SrcZero */
+}
+
+static void linxisa_extract_124(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 39) & 0x1fULL) | (((insn >> 7) & 0x1fULL) << 5)); /* RegDst */
+  out[1] = (int64_t)(((insn >> 47) & 0x1fULL) | (((insn >> 15) & 0x1fULL) << 5)); /* SrcL */
+  out[2] = (int64_t)((insn >> 52) & 0x3fULL); /* imml */
+  out[3] = (int64_t)(insn >> 58); /* immr */
+}
+
+static void linxisa_extract_125(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 12) & 0x1ULL); /* C */
+  out[1] = (int64_t)((insn >> 14) & 0x1ULL); /* L */
+  out[2] = (int64_t)((insn >> 59) | (((insn >> 27) & 0x1fULL) << 5)); /* SrcD */
+  out[3] = (int64_t)(((insn >> 47) & 0x1fULL) | (((insn >> 15) & 0x1fULL) << 5)); /* SrcL */
+  out[4] = (int64_t)(((insn >> 52) & 0x1fULL) | (((insn >> 20) & 0x1fULL) << 5)); /* SrcR */
+  out[5] = (int64_t)((insn >> 7) & 0x1fULL); /* shamt */
+}
+
+static void linxisa_extract_126(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 12) & 0x1ULL); /* C */
+  out[1] = (int64_t)((insn >> 14) & 0x1ULL); /* L */
+  out[2] = (int64_t)(((insn >> 47) & 0x1fULL) | (((insn >> 15) & 0x1fULL) << 5)); /* SrcL */
+  out[3] = (int64_t)(((insn >> 52) & 0x1fULL) | (((insn >> 20) & 0x1fULL) << 5)); /* SrcR */
+  out[4] = (int64_t)(((insn >> 57) | (((insn >> 39) & 0x1fULL) << 7) | (((insn >> 25) & 0x7fULL) << 12) | (((insn >> 7) & 0x1fULL) << 19)) ^ 0x800000ULL) - 0x800000LL; /* simm24 */
+}
+
+static void linxisa_extract_127(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 47) & 0x1fULL) | (((insn >> 15) & 0x1fULL) << 5)); /* SrcL */
+  out[1] = (int64_t)(((insn >> 52) & 0x1fULL) | (((insn >> 20) & 0x1fULL) << 5)); /* SrcR */
+  out[2] = (int64_t)((insn >> 25) & 0x1ULL); /* far */
+  out[3] = (int64_t)((insn >> 26) & 0x1ULL); /* rd */
+  out[4] = (int64_t)((insn >> 57) & 0x1ULL); /* rl */
+}
+
+static void linxisa_extract_128(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 39) & 0x1fULL) | (((insn >> 7) & 0x1fULL) << 5)); /* RegDst */
+  out[1] = (int64_t)(((insn >> 47) & 0x1fULL) | (((insn >> 15) & 0x1fULL) << 5)); /* SrcL */
+  out[2] = (int64_t)((insn >> 59) | (((insn >> 27) & 0x1fULL) << 5)); /* SrcP */
+}
+
+static void linxisa_extract_129(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 39) & 0x1fULL) | (((insn >> 7) & 0x1fULL) << 5)); /* RegDst */
+  out[1] = (int64_t)(((insn >> 47) & 0x1fULL) | (((insn >> 15) & 0x1fULL) << 5)); /* SrcL */
+  out[2] = (int64_t)((insn >> 59) | (((insn >> 27) & 0x1fULL) << 5)); /* SrcP */
+  out[3] = (int64_t)(((insn >> 52) & 0x1fULL) | (((insn >> 20) & 0x1fULL) << 5)); /* SrcR */
+}
+
+static void linxisa_extract_130(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 39) & 0x1fULL) | (((insn >> 7) & 0x1fULL) << 5)); /* RegDst */
+  out[1] = (int64_t)(((insn >> 47) & 0x1fULL) | (((insn >> 15) & 0x1fULL) << 5)); /* SrcL */
+  out[2] = (int64_t)((insn >> 57) | (((insn >> 25) & 0x7fULL) << 7)); /* imm */
+}
+
+static void linxisa_extract_131(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 39) & 0x1fULL) | (((insn >> 7) & 0x1fULL) << 5)); /* RegDst */
+  out[1] = (int64_t)(((insn >> 47) & 0x1fULL) | (((insn >> 15) & 0x1fULL) << 5)); /* SrcL */
+  out[2] = (int64_t)(((insn >> 52) & 0x1fULL) | (((insn >> 20) & 0x1fULL) << 5)); /* SrcR */
+  out[3] = (int64_t)((insn >> 57) | (((insn >> 25) & 0x7fULL) << 7)); /* imm */
+}
+
+static void linxisa_extract_132(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)(((insn >> 39) & 0x1fULL) | (((insn >> 7) & 0x1fULL) << 5)); /* RegDst */
+  out[1] = (int64_t)(((insn >> 47) & 0x1fULL) | (((insn >> 15) & 0x1fULL) << 5)); /* SrcL */
+  out[2] = (int64_t)((insn >> 52) & 0x3fULL); /* shamt */
+}
+
+static void linxisa_extract_133(uint64_t insn, int64_t *out)
+{
+  out[0] = (int64_t)((insn >> 15) & 0x3ffULL); /* ACR-ID */
+  out[1] = (int64_t)((insn >> 25) & 0x7fULL); /* CROSS-BID */
+}
+
+const linxisa_extract_fn linxisa_field_extractors[] = {
+  linxisa_extract_0, /* ACRC */
+  linxisa_extract_1, /* ACRE */
+  linxisa_extract_2, /* ADD */
+  linxisa_extract_3, /* ADDI */
+  linxisa_extract_3, /* ADDIW */
+  linxisa_extract_4, /* ADDTPC */
+  linxisa_extract_2, /* ADDW */
+  linxisa_extract_2, /* AND */
+  linxisa_extract_5, /* ANDI */
+  linxisa_extract_5, /* ANDIW */
+  linxisa_extract_2, /* ANDW */
+  linxisa_extract_6, /* ASSERT */
+  linxisa_extract_7, /* B.ARG */
+  linxisa_extract_8, /* B.ARG */
+  linxisa_extract_7, /* B.ARG */
+  linxisa_extract_7, /* B.ARG */
+  linxisa_extract_7, /* B.ARG */
+  linxisa_extract_7, /* B.ARG */
+  linxisa_extract_9, /* B.ATTR */
+  linxisa_extract_10, /* B.DIM */
+  linxisa_extract_10, /* B.DIM */
+  linxisa_extract_10, /* B.DIM */
+  linxisa_extract_11, /* B.EQ */
+  linxisa_extract_11, /* B.GE */
+  linxisa_extract_11, /* B.GEU */
+  linxisa_extract_12, /* B.HINT */
+  linxisa_extract_13, /* B.HINT */
+  linxisa_extract_14, /* B.IOD */
+  linxisa_extract_15, /* B.IOR */
+  linxisa_extract_16, /* B.IOT */
+  linxisa_extract_16, /* B.IOT */
+  linxisa_extract_17, /* B.IOTI */
+  linxisa_extract_17, /* B.IOTI */
+  linxisa_extract_11, /* B.LT */
+  linxisa_extract_11, /* B.LTU */
+  linxisa_extract_11, /* B.NE */
+  linxisa_extract_18, /* B.NZ */
+  linxisa_extract_19, /* B.TEXT */
+  linxisa_extract_18, /* B.Z */
+  linxisa_extract_7, /* BC.IALL */
+  linxisa_extract_6, /* BC.IVA */
+  linxisa_extract_20, /* BCNT */
+  linxisa_extract_20, /* BIC */
+  linxisa_extract_20, /* BIS */
+  linxisa_extract_6, /* BSE */
+  linxisa_extract_19, /* BSTART */
+  linxisa_extract_19, /* BSTART */
+  linxisa_extract_21, /* BSTART CALL */
+  linxisa_extract_22, /* BSTART.ACCCVT */
+  linxisa_extract_23, /* BSTART.CUBE */
+  linxisa_extract_23, /* BSTART.FIXP */
+  linxisa_extract_24, /* BSTART.FP */
+  linxisa_extract_24, /* BSTART.FP */
+  linxisa_extract_25, /* BSTART.FP */
+  linxisa_extract_25, /* BSTART.FP */
+  linxisa_extract_24, /* BSTART.FP */
+  linxisa_extract_25, /* BSTART.FP */
+  linxisa_extract_25, /* BSTART.FP */
+  linxisa_extract_26, /* BSTART.MPAR */
+  linxisa_extract_26, /* BSTART.MSEQ */
+  linxisa_extract_27, /* BSTART.PAR */
+  linxisa_extract_25, /* BSTART.STD */
+  linxisa_extract_24, /* BSTART.STD */
+  linxisa_extract_25, /* BSTART.STD */
+  linxisa_extract_24, /* BSTART.STD */
+  linxisa_extract_25, /* BSTART.STD */
+  linxisa_extract_24, /* BSTART.STD */
+  linxisa_extract_25, /* BSTART.STD */
+  linxisa_extract_25, /* BSTART.SYS */
+  linxisa_extract_27, /* BSTART.TEPL */
+  linxisa_extract_22, /* BSTART.TLOAD */
+  linxisa_extract_23, /* BSTART.TMA */
+  linxisa_extract_22, /* BSTART.TMATMUL */
+  linxisa_extract_22, /* BSTART.TMATMUL.ACC */
+  linxisa_extract_22, /* BSTART.TMOV */
+  linxisa_extract_22, /* BSTART.TSTORE */
+  linxisa_extract_26, /* BSTART.VPAR */
+  linxisa_extract_26, /* BSTART.VSEQ */
+  linxisa_extract_7, /* BSTOP */
+  linxisa_extract_6, /* BWE */
+  linxisa_extract_6, /* BWI */
+  linxisa_extract_6, /* BWT */
+  linxisa_extract_20, /* BXS */
+  linxisa_extract_20, /* BXU */
+  linxisa_extract_28, /* C.ADD */
+  linxisa_extract_29, /* C.ADDI */
+  linxisa_extract_28, /* C.AND */
+  linxisa_extract_30, /* C.B.DIM */
+  linxisa_extract_31, /* C.B.DIMI */
+  linxisa_extract_32, /* C.BSTART */
+  linxisa_extract_32, /* C.BSTART */
+  linxisa_extract_33, /* C.BSTART.FP */
+  linxisa_extract_7, /* C.BSTART.MPAR */
+  linxisa_extract_7, /* C.BSTART.MSEQ */
+  linxisa_extract_33, /* C.BSTART.STD */
+  linxisa_extract_7, /* C.BSTART.SYS */
+  linxisa_extract_7, /* C.BSTART.VPAR */
+  linxisa_extract_7, /* C.BSTART.VSEQ */
+  linxisa_extract_7, /* C.BSTOP */
+  linxisa_extract_34, /* C.CMP.EQI */
+  linxisa_extract_34, /* C.CMP.NEI */
+  linxisa_extract_35, /* C.EBREAK */
+  linxisa_extract_29, /* C.LDI */
+  linxisa_extract_29, /* C.LWI */
+  linxisa_extract_36, /* C.MOVI */
+  linxisa_extract_37, /* C.MOVR */
+  linxisa_extract_28, /* C.OR */
+  linxisa_extract_29, /* C.SDI */
+  linxisa_extract_28, /* C.SETC.EQ */
+  linxisa_extract_28, /* C.SETC.NE */
+  linxisa_extract_38, /* C.SETC.TGT */
+  linxisa_extract_39, /* C.SETRET */
+  linxisa_extract_38, /* C.SEXT.B */
+  linxisa_extract_38, /* C.SEXT.H */
+  linxisa_extract_38, /* C.SEXT.W */
+  linxisa_extract_39, /* C.SLLI */
+  linxisa_extract_39, /* C.SRLI */
+  linxisa_extract_40, /* C.SSRGET */
+  linxisa_extract_28, /* C.SUB */
+  linxisa_extract_29, /* C.SWI */
+  linxisa_extract_38, /* C.ZEXT.B */
+  linxisa_extract_38, /* C.ZEXT.H */
+  linxisa_extract_38, /* C.ZEXT.W */
+  linxisa_extract_20, /* CLZ */
+  linxisa_extract_41, /* CMP.AND */
+  linxisa_extract_5, /* CMP.ANDI */
+  linxisa_extract_41, /* CMP.EQ */
+  linxisa_extract_5, /* CMP.EQI */
+  linxisa_extract_41, /* CMP.GE */
+  linxisa_extract_5, /* CMP.GEI */
+  linxisa_extract_41, /* CMP.GEU */
+  linxisa_extract_3, /* CMP.GEUI */
+  linxisa_extract_41, /* CMP.LT */
+  linxisa_extract_5, /* CMP.LTI */
+  linxisa_extract_41, /* CMP.LTU */
+  linxisa_extract_3, /* CMP.LTUI */
+  linxisa_extract_41, /* CMP.NE */
+  linxisa_extract_5, /* CMP.NEI */
+  linxisa_extract_41, /* CMP.OR */
+  linxisa_extract_5, /* CMP.ORI */
+  linxisa_extract_42, /* CSEL */
+  linxisa_extract_20, /* CTZ */
+  linxisa_extract_6, /* DC.CISW */
+  linxisa_extract_6, /* DC.CIVA */
+  linxisa_extract_6, /* DC.CSW */
+  linxisa_extract_6, /* DC.CVA */
+  linxisa_extract_7, /* DC.IALL */
+  linxisa_extract_6, /* DC.ISW */
+  linxisa_extract_6, /* DC.IVA */
+  linxisa_extract_6, /* DC.ZVA */
+  linxisa_extract_43, /* DIV */
+  linxisa_extract_43, /* DIVU */
+  linxisa_extract_43, /* DIVUW */
+  linxisa_extract_43, /* DIVW */
+  linxisa_extract_44, /* EBREAK */
+  linxisa_extract_45, /* ERCOV */
+  linxisa_extract_45, /* ESAVE */
+  linxisa_extract_46, /* FABS */
+  linxisa_extract_47, /* FADD */
+  linxisa_extract_48, /* FCVT */
+  linxisa_extract_48, /* FCVTA */
+  linxisa_extract_48, /* FCVTM */
+  linxisa_extract_48, /* FCVTN */
+  linxisa_extract_48, /* FCVTP */
+  linxisa_extract_48, /* FCVTZ */
+  linxisa_extract_47, /* FDIV */
+  linxisa_extract_49, /* FENCE.D */
+  linxisa_extract_7, /* FENCE.I */
+  linxisa_extract_50, /* FENTRY */
+  linxisa_extract_47, /* FEQ */
+  linxisa_extract_47, /* FEQS */
+  linxisa_extract_51, /* FEXIT */
+  linxisa_extract_46, /* FEXP */
+  linxisa_extract_47, /* FGE */
+  linxisa_extract_47, /* FGES */
+  linxisa_extract_47, /* FLT */
+  linxisa_extract_47, /* FLTS */
+  linxisa_extract_52, /* FMADD */
+  linxisa_extract_47, /* FMAX */
+  linxisa_extract_47, /* FMIN */
+  linxisa_extract_52, /* FMSUB */
+  linxisa_extract_47, /* FMUL */
+  linxisa_extract_47, /* FNE */
+  linxisa_extract_47, /* FNES */
+  linxisa_extract_52, /* FNMADD */
+  linxisa_extract_52, /* FNMSUB */
+  linxisa_extract_46, /* FRECIP */
+  linxisa_extract_51, /* FRET.RA */
+  linxisa_extract_51, /* FRET.STK */
+  linxisa_extract_46, /* FSQRT */
+  linxisa_extract_47, /* FSUB */
+  linxisa_extract_53, /* HL.ADDI */
+  linxisa_extract_53, /* HL.ADDIW */
+  linxisa_extract_54, /* HL.ADDTPC */
+  linxisa_extract_55, /* HL.ANDI */
+  linxisa_extract_55, /* HL.ANDIW */
+  linxisa_extract_56, /* HL.BFI */
+  linxisa_extract_57, /* HL.BSTART CALL */
+  linxisa_extract_58, /* HL.BSTART.FP */
+  linxisa_extract_58, /* HL.BSTART.FP */
+  linxisa_extract_58, /* HL.BSTART.FP */
+  linxisa_extract_58, /* HL.BSTART.FP */
+  linxisa_extract_58, /* HL.BSTART.STD */
+  linxisa_extract_58, /* HL.BSTART.STD */
+  linxisa_extract_58, /* HL.BSTART.STD */
+  linxisa_extract_58, /* HL.BSTART.STD */
+  linxisa_extract_58, /* HL.BSTART.SYS */
+  linxisa_extract_59, /* HL.CASB */
+  linxisa_extract_59, /* HL.CASD */
+  linxisa_extract_59, /* HL.CASH */
+  linxisa_extract_59, /* HL.CASW */
+  linxisa_extract_60, /* HL.CCAT */
+  linxisa_extract_60, /* HL.CCATW */
+  linxisa_extract_55, /* HL.CMP.ANDI */
+  linxisa_extract_55, /* HL.CMP.EQI */
+  linxisa_extract_55, /* HL.CMP.GEI */
+  linxisa_extract_53, /* HL.CMP.GEUI */
+  linxisa_extract_55, /* HL.CMP.LTI */
+  linxisa_extract_53, /* HL.CMP.LTUI */
+  linxisa_extract_55, /* HL.CMP.NEI */
+  linxisa_extract_55, /* HL.CMP.ORI */
+  linxisa_extract_61, /* HL.DIV */
+  linxisa_extract_61, /* HL.DIVU */
+  linxisa_extract_61, /* HL.DIVUW */
+  linxisa_extract_61, /* HL.DIVW */
+  linxisa_extract_62, /* HL.LB.PCR */
+  linxisa_extract_63, /* HL.LB.PO */
+  linxisa_extract_63, /* HL.LB.PR */
+  linxisa_extract_64, /* HL.LBI */
+  linxisa_extract_65, /* HL.LBI.PO */
+  linxisa_extract_65, /* HL.LBI.PR */
+  linxisa_extract_65, /* HL.LBIP */
+  linxisa_extract_63, /* HL.LBP */
+  linxisa_extract_62, /* HL.LBU.PCR */
+  linxisa_extract_63, /* HL.LBU.PO */
+  linxisa_extract_63, /* HL.LBU.PR */
+  linxisa_extract_64, /* HL.LBUI */
+  linxisa_extract_65, /* HL.LBUI.PO */
+  linxisa_extract_65, /* HL.LBUI.PR */
+  linxisa_extract_65, /* HL.LBUIP */
+  linxisa_extract_63, /* HL.LBUP */
+  linxisa_extract_62, /* HL.LD.PCR */
+  linxisa_extract_63, /* HL.LD.PO */
+  linxisa_extract_63, /* HL.LD.PR */
+  linxisa_extract_64, /* HL.LDI */
+  linxisa_extract_65, /* HL.LDI.PO */
+  linxisa_extract_65, /* HL.LDI.PR */
+  linxisa_extract_64, /* HL.LDI.U */
+  linxisa_extract_65, /* HL.LDI.UPO */
+  linxisa_extract_65, /* HL.LDI.UPR */
+  linxisa_extract_65, /* HL.LDIP */
+  linxisa_extract_65, /* HL.LDIP.U */
+  linxisa_extract_63, /* HL.LDP */
+  linxisa_extract_62, /* HL.LH.PCR */
+  linxisa_extract_63, /* HL.LH.PO */
+  linxisa_extract_63, /* HL.LH.PR */
+  linxisa_extract_64, /* HL.LHI */
+  linxisa_extract_65, /* HL.LHI.PO */
+  linxisa_extract_65, /* HL.LHI.PR */
+  linxisa_extract_64, /* HL.LHI.U */
+  linxisa_extract_65, /* HL.LHI.UPO */
+  linxisa_extract_65, /* HL.LHI.UPR */
+  linxisa_extract_65, /* HL.LHIP */
+  linxisa_extract_65, /* HL.LHIP.U */
+  linxisa_extract_63, /* HL.LHP */
+  linxisa_extract_62, /* HL.LHU.PCR */
+  linxisa_extract_63, /* HL.LHU.PO */
+  linxisa_extract_63, /* HL.LHU.PR */
+  linxisa_extract_64, /* HL.LHUI */
+  linxisa_extract_65, /* HL.LHUI.PO */
+  linxisa_extract_65, /* HL.LHUI.PR */
+  linxisa_extract_64, /* HL.LHUI.U */
+  linxisa_extract_65, /* HL.LHUI.UPO */
+  linxisa_extract_65, /* HL.LHUI.UPR */
+  linxisa_extract_65, /* HL.LHUIP */
+  linxisa_extract_65, /* HL.LHUIP.U */
+  linxisa_extract_63, /* HL.LHUP */
+  linxisa_extract_66, /* HL.LIS */
+  linxisa_extract_67, /* HL.LIU */
+  linxisa_extract_68, /* HL.LUI */
+  linxisa_extract_62, /* HL.LW.PCR */
+  linxisa_extract_63, /* HL.LW.PO */
+  linxisa_extract_63, /* HL.LW.PR */
+  linxisa_extract_64, /* HL.LWI */
+  linxisa_extract_65, /* HL.LWI.PO */
+  linxisa_extract_65, /* HL.LWI.PR */
+  linxisa_extract_64, /* HL.LWI.U */
+  linxisa_extract_65, /* HL.LWI.UPO */
+  linxisa_extract_65, /* HL.LWI.UPR */
+  linxisa_extract_65, /* HL.LWIP */
+  linxisa_extract_65, /* HL.LWIP.U */
+  linxisa_extract_63, /* HL.LWP */
+  linxisa_extract_62, /* HL.LWU.PCR */
+  linxisa_extract_63, /* HL.LWU.PO */
+  linxisa_extract_63, /* HL.LWU.PR */
+  linxisa_extract_64, /* HL.LWUI */
+  linxisa_extract_65, /* HL.LWUI.PO */
+  linxisa_extract_65, /* HL.LWUI.PR */
+  linxisa_extract_64, /* HL.LWUI.U */
+  linxisa_extract_65, /* HL.LWUI.UPO */
+  linxisa_extract_65, /* HL.LWUI.UPR */
+  linxisa_extract_65, /* HL.LWUIP */
+  linxisa_extract_65, /* HL.LWUIP.U */
+  linxisa_extract_63, /* HL.LWUP */
+  linxisa_extract_69, /* HL.MADD */
+  linxisa_extract_69, /* HL.MADDW */
+  linxisa_extract_70, /* HL.MIADD */
+  linxisa_extract_70, /* HL.MISUB */
+  linxisa_extract_61, /* HL.MUL */
+  linxisa_extract_61, /* HL.MULU */
+  linxisa_extract_55, /* HL.ORI */
+  linxisa_extract_55, /* HL.ORIW */
+  linxisa_extract_71, /* HL.PRF */
+  linxisa_extract_72, /* HL.PRF.A */
+  linxisa_extract_73, /* HL.PRFI.U */
+  linxisa_extract_74, /* HL.PRFI.UA */
+  linxisa_extract_75, /* HL.QMT */
+  linxisa_extract_76, /* HL.QPOP */
+  linxisa_extract_77, /* HL.QPUSH */
+  linxisa_extract_61, /* HL.REM */
+  linxisa_extract_61, /* HL.REMU */
+  linxisa_extract_61, /* HL.REMUW */
+  linxisa_extract_61, /* HL.REMW */
+  linxisa_extract_78, /* HL.SB.PCR */
+  linxisa_extract_79, /* HL.SB.PO */
+  linxisa_extract_79, /* HL.SB.PR */
+  linxisa_extract_80, /* HL.SBI */
+  linxisa_extract_81, /* HL.SBI.PO */
+  linxisa_extract_81, /* HL.SBI.PR */
+  linxisa_extract_82, /* HL.SBIP */
+  linxisa_extract_83, /* HL.SBP */
+  linxisa_extract_78, /* HL.SD.PCR */
+  linxisa_extract_79, /* HL.SD.PO */
+  linxisa_extract_79, /* HL.SD.PR */
+  linxisa_extract_79, /* HL.SD.UPO */
+  linxisa_extract_79, /* HL.SD.UPR */
+  linxisa_extract_80, /* HL.SDI */
+  linxisa_extract_81, /* HL.SDI.PO */
+  linxisa_extract_81, /* HL.SDI.PR */
+  linxisa_extract_80, /* HL.SDI.U */
+  linxisa_extract_81, /* HL.SDI.UPO */
+  linxisa_extract_81, /* HL.SDI.UPR */
+  linxisa_extract_82, /* HL.SDIP */
+  linxisa_extract_82, /* HL.SDIP.U */
+  linxisa_extract_83, /* HL.SDP */
+  linxisa_extract_83, /* HL.SDP.U */
+  linxisa_extract_84, /* HL.SETC.ANDI */
+  linxisa_extract_84, /* HL.SETC.EQI */
+  linxisa_extract_84, /* HL.SETC.GEI */
+  linxisa_extract_85, /* HL.SETC.GEUI */
+  linxisa_extract_84, /* HL.SETC.LTI */
+  linxisa_extract_85, /* HL.SETC.LTUI */
+  linxisa_extract_84, /* HL.SETC.NEI */
+  linxisa_extract_84, /* HL.SETC.ORI */
+  linxisa_extract_86, /* HL.SETRET */
+  linxisa_extract_78, /* HL.SH.PCR */
+  linxisa_extract_79, /* HL.SH.PO */
+  linxisa_extract_79, /* HL.SH.PR */
+  linxisa_extract_79, /* HL.SH.UPO */
+  linxisa_extract_79, /* HL.SH.UPR */
+  linxisa_extract_80, /* HL.SHI */
+  linxisa_extract_81, /* HL.SHI.PO */
+  linxisa_extract_81, /* HL.SHI.PR */
+  linxisa_extract_80, /* HL.SHI.U */
+  linxisa_extract_81, /* HL.SHI.UPO */
+  linxisa_extract_81, /* HL.SHI.UPR */
+  linxisa_extract_82, /* HL.SHIP */
+  linxisa_extract_82, /* HL.SHIP.U */
+  linxisa_extract_83, /* HL.SHP */
+  linxisa_extract_83, /* HL.SHP.U */
+  linxisa_extract_87, /* HL.SSRGET */
+  linxisa_extract_88, /* HL.SSRSET */
+  linxisa_extract_53, /* HL.SUBI */
+  linxisa_extract_53, /* HL.SUBIW */
+  linxisa_extract_78, /* HL.SW.PCR */
+  linxisa_extract_79, /* HL.SW.PO */
+  linxisa_extract_79, /* HL.SW.PR */
+  linxisa_extract_79, /* HL.SW.UPO */
+  linxisa_extract_79, /* HL.SW.UPR */
+  linxisa_extract_80, /* HL.SWI */
+  linxisa_extract_81, /* HL.SWI.PO */
+  linxisa_extract_81, /* HL.SWI.PR */
+  linxisa_extract_80, /* HL.SWI.U */
+  linxisa_extract_81, /* HL.SWI.UPO */
+  linxisa_extract_81, /* HL.SWI.UPR */
+  linxisa_extract_82, /* HL.SWIP */
+  linxisa_extract_82, /* HL.SWIP.U */
+  linxisa_extract_83, /* HL.SWP */
+  linxisa_extract_83, /* HL.SWP.U */
+  linxisa_extract_55, /* HL.XORI */
+  linxisa_extract_55, /* HL.XORIW */
+  linxisa_extract_7, /* IC.IALL */
+  linxisa_extract_6, /* IC.IVA */
+  linxisa_extract_18, /* J */
+  linxisa_extract_89, /* JR */
+  linxisa_extract_2, /* LB */
+  linxisa_extract_90, /* LB.PCR */
+  linxisa_extract_5, /* LBI */
+  linxisa_extract_2, /* LBU */
+  linxisa_extract_90, /* LBU.PCR */
+  linxisa_extract_5, /* LBUI */
+  linxisa_extract_2, /* LD */
+  linxisa_extract_91, /* LD.ADD */
+  linxisa_extract_91, /* LD.AND */
+  linxisa_extract_91, /* LD.OR */
+  linxisa_extract_90, /* LD.PCR */
+  linxisa_extract_91, /* LD.SMAX */
+  linxisa_extract_91, /* LD.SMIN */
+  linxisa_extract_91, /* LD.UMAX */
+  linxisa_extract_91, /* LD.UMIN */
+  linxisa_extract_91, /* LD.XOR */
+  linxisa_extract_5, /* LDI */
+  linxisa_extract_5, /* LDI.U */
+  linxisa_extract_2, /* LH */
+  linxisa_extract_90, /* LH.PCR */
+  linxisa_extract_5, /* LHI */
+  linxisa_extract_5, /* LHI.U */
+  linxisa_extract_2, /* LHU */
+  linxisa_extract_90, /* LHU.PCR */
+  linxisa_extract_5, /* LHUI */
+  linxisa_extract_5, /* LHUI.U */
+  linxisa_extract_92, /* LR.B */
+  linxisa_extract_92, /* LR.D */
+  linxisa_extract_92, /* LR.H */
+  linxisa_extract_92, /* LR.W */
+  linxisa_extract_93, /* LSRGET */
+  linxisa_extract_4, /* LUI */
+  linxisa_extract_2, /* LW */
+  linxisa_extract_91, /* LW.ADD */
+  linxisa_extract_91, /* LW.AND */
+  linxisa_extract_91, /* LW.OR */
+  linxisa_extract_90, /* LW.PCR */
+  linxisa_extract_91, /* LW.SMAX */
+  linxisa_extract_91, /* LW.SMIN */
+  linxisa_extract_91, /* LW.UMAX */
+  linxisa_extract_91, /* LW.UMIN */
+  linxisa_extract_91, /* LW.XOR */
+  linxisa_extract_5, /* LWI */
+  linxisa_extract_5, /* LWI.U */
+  linxisa_extract_2, /* LWU */
+  linxisa_extract_90, /* LWU.PCR */
+  linxisa_extract_5, /* LWUI */
+  linxisa_extract_5, /* LWUI.U */
+  linxisa_extract_94, /* MADD */
+  linxisa_extract_94, /* MADDW */
+  linxisa_extract_43, /* MAX */
+  linxisa_extract_43, /* MAXU */
+  linxisa_extract_95, /* MCOPY */
+  linxisa_extract_43, /* MIN */
+  linxisa_extract_43, /* MINU */
+  linxisa_extract_96, /* MSET */
+  linxisa_extract_43, /* MUL */
+  linxisa_extract_43, /* MULU */
+  linxisa_extract_43, /* MULUW */
+  linxisa_extract_43, /* MULW */
+  linxisa_extract_2, /* OR */
+  linxisa_extract_5, /* ORI */
+  linxisa_extract_5, /* ORIW */
+  linxisa_extract_2, /* ORW */
+  linxisa_extract_2, /* PRF */
+  linxisa_extract_5, /* PRFI.U */
+  linxisa_extract_43, /* REM */
+  linxisa_extract_43, /* REMU */
+  linxisa_extract_43, /* REMUW */
+  linxisa_extract_43, /* REMW */
+  linxisa_extract_97, /* REV */
+  linxisa_extract_98, /* SB */
+  linxisa_extract_99, /* SB.PCR */
+  linxisa_extract_11, /* SBI */
+  linxisa_extract_91, /* SC.B */
+  linxisa_extract_91, /* SC.D */
+  linxisa_extract_91, /* SC.H */
+  linxisa_extract_91, /* SC.W */
+  linxisa_extract_48, /* SCVTF */
+  linxisa_extract_98, /* SD */
+  linxisa_extract_100, /* SD.ADD */
+  linxisa_extract_100, /* SD.AND */
+  linxisa_extract_100, /* SD.OR */
+  linxisa_extract_99, /* SD.PCR */
+  linxisa_extract_100, /* SD.SMAX */
+  linxisa_extract_100, /* SD.SMIN */
+  linxisa_extract_98, /* SD.U */
+  linxisa_extract_100, /* SD.UMAX */
+  linxisa_extract_100, /* SD.UMIN */
+  linxisa_extract_100, /* SD.XOR */
+  linxisa_extract_11, /* SDI */
+  linxisa_extract_11, /* SDI.U */
+  linxisa_extract_101, /* SETC.AND */
+  linxisa_extract_102, /* SETC.ANDI */
+  linxisa_extract_101, /* SETC.EQ */
+  linxisa_extract_102, /* SETC.EQI */
+  linxisa_extract_101, /* SETC.GE */
+  linxisa_extract_102, /* SETC.GEI */
+  linxisa_extract_101, /* SETC.GEU */
+  linxisa_extract_103, /* SETC.GEUI */
+  linxisa_extract_101, /* SETC.LT */
+  linxisa_extract_102, /* SETC.LTI */
+  linxisa_extract_101, /* SETC.LTU */
+  linxisa_extract_103, /* SETC.LTUI */
+  linxisa_extract_101, /* SETC.NE */
+  linxisa_extract_102, /* SETC.NEI */
+  linxisa_extract_101, /* SETC.OR */
+  linxisa_extract_102, /* SETC.ORI */
+  linxisa_extract_6, /* SETC.TGT */
+  linxisa_extract_104, /* SETRET */
+  linxisa_extract_98, /* SH */
+  linxisa_extract_99, /* SH.PCR */
+  linxisa_extract_98, /* SH.U */
+  linxisa_extract_11, /* SHI */
+  linxisa_extract_11, /* SHI.U */
+  linxisa_extract_43, /* SLL */
+  linxisa_extract_105, /* SLLI */
+  linxisa_extract_106, /* SLLIW */
+  linxisa_extract_43, /* SLLW */
+  linxisa_extract_43, /* SRA */
+  linxisa_extract_105, /* SRAI */
+  linxisa_extract_106, /* SRAIW */
+  linxisa_extract_43, /* SRAW */
+  linxisa_extract_43, /* SRL */
+  linxisa_extract_105, /* SRLI */
+  linxisa_extract_106, /* SRLIW */
+  linxisa_extract_43, /* SRLW */
+  linxisa_extract_107, /* SSRGET */
+  linxisa_extract_108, /* SSRSET */
+  linxisa_extract_109, /* SSRSWAP */
+  linxisa_extract_2, /* SUB */
+  linxisa_extract_3, /* SUBI */
+  linxisa_extract_3, /* SUBIW */
+  linxisa_extract_2, /* SUBW */
+  linxisa_extract_98, /* SW */
+  linxisa_extract_100, /* SW.ADD */
+  linxisa_extract_100, /* SW.AND */
+  linxisa_extract_100, /* SW.OR */
+  linxisa_extract_99, /* SW.PCR */
+  linxisa_extract_100, /* SW.SMAX */
+  linxisa_extract_100, /* SW.SMIN */
+  linxisa_extract_98, /* SW.U */
+  linxisa_extract_100, /* SW.UMAX */
+  linxisa_extract_100, /* SW.UMIN */
+  linxisa_extract_100, /* SW.XOR */
+  linxisa_extract_91, /* SWAPB */
+  linxisa_extract_91, /* SWAPD */
+  linxisa_extract_91, /* SWAPH */
+  linxisa_extract_91, /* SWAPW */
+  linxisa_extract_11, /* SWI */
+  linxisa_extract_11, /* SWI.U */
+  linxisa_extract_6, /* TLB.IA */
+  linxisa_extract_7, /* TLB.IALL */
+  linxisa_extract_6, /* TLB.IAV */
+  linxisa_extract_6, /* TLB.IV */
+  linxisa_extract_48, /* UCVTF */
+  linxisa_extract_110, /* V.ADD */
+  linxisa_extract_111, /* V.ADDI */
+  linxisa_extract_110, /* V.AND */
+  linxisa_extract_112, /* V.ANDI */
+  linxisa_extract_113, /* V.BCNT */
+  linxisa_extract_113, /* V.BIC */
+  linxisa_extract_113, /* V.BIS */
+  linxisa_extract_113, /* V.BXS */
+  linxisa_extract_113, /* V.BXU */
+  linxisa_extract_113, /* V.CLZ */
+  linxisa_extract_114, /* V.CMP.AND */
+  linxisa_extract_112, /* V.CMP.ANDI */
+  linxisa_extract_114, /* V.CMP.EQ */
+  linxisa_extract_112, /* V.CMP.EQI */
+  linxisa_extract_114, /* V.CMP.GE */
+  linxisa_extract_112, /* V.CMP.GEI */
+  linxisa_extract_114, /* V.CMP.GEU */
+  linxisa_extract_111, /* V.CMP.GEUI */
+  linxisa_extract_114, /* V.CMP.LT */
+  linxisa_extract_112, /* V.CMP.LTI */
+  linxisa_extract_114, /* V.CMP.LTU */
+  linxisa_extract_111, /* V.CMP.LTUI */
+  linxisa_extract_114, /* V.CMP.NE */
+  linxisa_extract_112, /* V.CMP.NEI */
+  linxisa_extract_114, /* V.CMP.OR */
+  linxisa_extract_112, /* V.CMP.ORI */
+  linxisa_extract_115, /* V.CSEL */
+  linxisa_extract_113, /* V.CTZ */
+  linxisa_extract_114, /* V.DIV */
+  linxisa_extract_116, /* V.FABS */
+  linxisa_extract_114, /* V.FADD */
+  linxisa_extract_116, /* V.FCLASS */
+  linxisa_extract_117, /* V.FCVT */
+  linxisa_extract_117, /* V.FCVTI */
+  linxisa_extract_114, /* V.FDIV */
+  linxisa_extract_114, /* V.FEQ */
+  linxisa_extract_114, /* V.FEQS */
+  linxisa_extract_116, /* V.FEXP */
+  linxisa_extract_114, /* V.FGE */
+  linxisa_extract_114, /* V.FGES */
+  linxisa_extract_114, /* V.FLT */
+  linxisa_extract_114, /* V.FLTS */
+  linxisa_extract_118, /* V.FMADD */
+  linxisa_extract_114, /* V.FMAX */
+  linxisa_extract_114, /* V.FMIN */
+  linxisa_extract_118, /* V.FMSUB */
+  linxisa_extract_114, /* V.FMUL */
+  linxisa_extract_114, /* V.FNE */
+  linxisa_extract_114, /* V.FNES */
+  linxisa_extract_118, /* V.FNMADD */
+  linxisa_extract_118, /* V.FNMSUB */
+  linxisa_extract_116, /* V.FRECIP */
+  linxisa_extract_116, /* V.FSQRT */
+  linxisa_extract_114, /* V.FSUB */
+  linxisa_extract_117, /* V.ICVT */
+  linxisa_extract_117, /* V.ICVTF */
+  linxisa_extract_119, /* V.LB */
+  linxisa_extract_119, /* V.LB.BRG */
+  linxisa_extract_120, /* V.LBI */
+  linxisa_extract_120, /* V.LBI.BRG */
+  linxisa_extract_119, /* V.LBU */
+  linxisa_extract_119, /* V.LBU.BRG */
+  linxisa_extract_120, /* V.LBUI */
+  linxisa_extract_120, /* V.LBUI.BRG */
+  linxisa_extract_119, /* V.LD */
+  linxisa_extract_121, /* V.LD.ADD */
+  linxisa_extract_121, /* V.LD.AND */
+  linxisa_extract_119, /* V.LD.BRG */
+  linxisa_extract_121, /* V.LD.MAX */
+  linxisa_extract_121, /* V.LD.MIN */
+  linxisa_extract_121, /* V.LD.OR */
+  linxisa_extract_121, /* V.LD.XOR */
+  linxisa_extract_120, /* V.LDI */
+  linxisa_extract_120, /* V.LDI.BRG */
+  linxisa_extract_120, /* V.LDI.U */
+  linxisa_extract_120, /* V.LDI.U.BRG */
+  linxisa_extract_119, /* V.LH */
+  linxisa_extract_119, /* V.LH.BRG */
+  linxisa_extract_120, /* V.LHI */
+  linxisa_extract_120, /* V.LHI.BRG */
+  linxisa_extract_120, /* V.LHI.U */
+  linxisa_extract_120, /* V.LHI.U.BRG */
+  linxisa_extract_119, /* V.LHU */
+  linxisa_extract_119, /* V.LHU.BRG */
+  linxisa_extract_120, /* V.LHUI */
+  linxisa_extract_120, /* V.LHUI.BRG */
+  linxisa_extract_120, /* V.LHUI.U */
+  linxisa_extract_120, /* V.LHUI.U.BRG */
+  linxisa_extract_119, /* V.LW */
+  linxisa_extract_121, /* V.LW.ADD */
+  linxisa_extract_121, /* V.LW.AND */
+  linxisa_extract_119, /* V.LW.BRG */
+  linxisa_extract_121, /* V.LW.MAX */
+  linxisa_extract_121, /* V.LW.MIN */
+  linxisa_extract_121, /* V.LW.OR */
+  linxisa_extract_121, /* V.LW.XOR */
+  linxisa_extract_120, /* V.LWI */
+  linxisa_extract_120, /* V.LWI.BRG */
+  linxisa_extract_120, /* V.LWI.U */
+  linxisa_extract_120, /* V.LWI.U.BRG */
+  linxisa_extract_119, /* V.LWU */
+  linxisa_extract_119, /* V.LWU.BRG */
+  linxisa_extract_120, /* V.LWUI */
+  linxisa_extract_120, /* V.LWUI.BRG */
+  linxisa_extract_120, /* V.LWUI.U */
+  linxisa_extract_120, /* V.LWUI.U.BRG */
+  linxisa_extract_122, /* V.MADD */
+  linxisa_extract_114, /* V.MAX */
+  linxisa_extract_114, /* V.MIN */
+  linxisa_extract_114, /* V.MUL */
+  linxisa_extract_110, /* V.OR */
+  linxisa_extract_112, /* V.ORI */
+  linxisa_extract_123, /* V.PSEL */
+  linxisa_extract_116, /* V.QPOP */
+  linxisa_extract_114, /* V.QPUSH */
+  linxisa_extract_116, /* V.RDADD */
+  linxisa_extract_116, /* V.RDAND */
+  linxisa_extract_116, /* V.RDFADD */
+  linxisa_extract_116, /* V.RDFMAX */
+  linxisa_extract_116, /* V.RDFMIN */
+  linxisa_extract_116, /* V.RDMAX */
+  linxisa_extract_116, /* V.RDMIN */
+  linxisa_extract_116, /* V.RDOR */
+  linxisa_extract_116, /* V.RDXOR */
+  linxisa_extract_114, /* V.REM */
+  linxisa_extract_124, /* V.REV */
+  linxisa_extract_125, /* V.SB */
+  linxisa_extract_125, /* V.SB.BRG */
+  linxisa_extract_126, /* V.SBI */
+  linxisa_extract_126, /* V.SBI.BRG */
+  linxisa_extract_125, /* V.SD */
+  linxisa_extract_127, /* V.SD.ADD */
+  linxisa_extract_127, /* V.SD.AND */
+  linxisa_extract_125, /* V.SD.BRG */
+  linxisa_extract_127, /* V.SD.MAX */
+  linxisa_extract_127, /* V.SD.MIN */
+  linxisa_extract_127, /* V.SD.OR */
+  linxisa_extract_125, /* V.SD.U */
+  linxisa_extract_125, /* V.SD.U.BRG */
+  linxisa_extract_127, /* V.SD.XOR */
+  linxisa_extract_126, /* V.SDI */
+  linxisa_extract_126, /* V.SDI.BRG */
+  linxisa_extract_126, /* V.SDI.U */
+  linxisa_extract_126, /* V.SDI.U.BRG */
+  linxisa_extract_125, /* V.SH */
+  linxisa_extract_125, /* V.SH.BRG */
+  linxisa_extract_125, /* V.SH.U */
+  linxisa_extract_125, /* V.SH.U.BRG */
+  linxisa_extract_128, /* V.SHFL.BFLY */
+  linxisa_extract_129, /* V.SHFL.DOWN */
+  linxisa_extract_129, /* V.SHFL.IDX */
+  linxisa_extract_129, /* V.SHFL.UP */
+  linxisa_extract_130, /* V.SHFLI.BFLY */
+  linxisa_extract_131, /* V.SHFLI.DOWN */
+  linxisa_extract_131, /* V.SHFLI.IDX */
+  linxisa_extract_131, /* V.SHFLI.UP */
+  linxisa_extract_126, /* V.SHI */
+  linxisa_extract_126, /* V.SHI.BRG */
+  linxisa_extract_126, /* V.SHI.U */
+  linxisa_extract_126, /* V.SHI.U.BRG */
+  linxisa_extract_114, /* V.SLL */
+  linxisa_extract_132, /* V.SLLI */
+  linxisa_extract_114, /* V.SRA */
+  linxisa_extract_132, /* V.SRAI */
+  linxisa_extract_114, /* V.SRL */
+  linxisa_extract_132, /* V.SRLI */
+  linxisa_extract_110, /* V.SUB */
+  linxisa_extract_111, /* V.SUBI */
+  linxisa_extract_125, /* V.SW */
+  linxisa_extract_127, /* V.SW.ADD */
+  linxisa_extract_127, /* V.SW.AND */
+  linxisa_extract_125, /* V.SW.BRG */
+  linxisa_extract_127, /* V.SW.MAX */
+  linxisa_extract_127, /* V.SW.MIN */
+  linxisa_extract_127, /* V.SW.OR */
+  linxisa_extract_125, /* V.SW.U */
+  linxisa_extract_125, /* V.SW.U.BRG */
+  linxisa_extract_127, /* V.SW.XOR */
+  linxisa_extract_126, /* V.SWI */
+  linxisa_extract_126, /* V.SWI.BRG */
+  linxisa_extract_126, /* V.SWI.U */
+  linxisa_extract_126, /* V.SWI.U.BRG */
+  linxisa_extract_110, /* V.XOR */
+  linxisa_extract_112, /* V.XORI */
+  linxisa_extract_133, /* XB */
+  linxisa_extract_2, /* XOR */
+  linxisa_extract_5, /* XORI */
+  linxisa_extract_5, /* XORIW */
+  linxisa_extract_2, /* XORW */
+};
+
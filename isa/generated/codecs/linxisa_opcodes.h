@@ -41,3 +41,42 @@ extern const size_t linxisa_fields_count;
 extern const linxisa_field_piece linxisa_field_pieces[];
 extern const size_t linxisa_field_pieces_count;
 
+/*
+ * Decode a packed instruction word (first part in the low bits) of the given
+ * length. Returns the linxisa_inst_forms[] index of the matching form with the
+ * most fixed bits (the first in table order on ties), or -1 if none matches.
+ * Form constraints are not checked. This is the result of a linear scan over
+ * linxisa_inst_forms[], found through a generated decision tree instead.
+ */
+int linxisa_decode(uint64_t insn, unsigned length_bits);
+
+/*
+ * 16-bit direct-index decode: the linxisa_inst_forms[] index of every 16-bit
+ * word, with form constraints applied, or LINXISA_FORM_NONE.
+ */
+#define LINXISA_FORM_NONE 0xFFFFu
+extern const uint16_t linxisa_decode16_table[65536];
+
+static inline int linxisa_decode16_direct(uint16_t insn)
+{
+  uint16_t idx = linxisa_decode16_table[insn];
+  return idx == LINXISA_FORM_NONE ? -1 : (int)idx;
+}
+
+/*
+ * Per-form field extraction: linxisa_field_extractors[idx](insn, out) stores
+ * the values of form idx's fields in out[0 .. field_count), in
+ * linxisa_fields[field_start ..] order. Split immediates are reassembled and
+ * signed fields (signed_hint 1) sign-extended from bit_width; the result is
+ * the same as walking linxisa_field_pieces[], with the pieces folded into
+ * constant shifts and masks. out must hold LINXISA_MAX_FIELDS values.
+ */
+#define LINXISA_MAX_FIELDS 10
+typedef void (*linxisa_extract_fn)(uint64_t insn, int64_t *out);
+extern const linxisa_extract_fn linxisa_field_extractors[];
+
+static inline void linxisa_extract_fields(int idx, uint64_t insn, int64_t *out)
+{
+  linxisa_field_extractors[idx](insn, out);
+}
+
@@ -12,6 +12,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "isa"))
+from linxisa.jsonindex import CatalogJSON  # noqa: E402
+
 
 _RE_LINE = re.compile(
     r"^\s*([0-9a-fA-F]+):\s+([0-9a-fA-F]{2}(?:\s+[0-9a-fA-F]{2})*)\s+(.*)$"
@@ -30,14 +33,14 @@ def _load_gpr_names(spec_path: Path | None) -> set[str]:
     if spec_path is None or not spec_path.exists():
         return set()
     try:
-        raw = json.loads(spec_path.read_text(encoding="utf-8", errors="replace"))
-        reg5 = (raw.get("registers") or {}).get("reg5") or {}
+        # Only registers.reg5 is needed; the offset index avoids parsing the whole catalog.
+        reg5 = CatalogJSON.open(spec_path).register("reg5") or {}
         out: set[str] = set()
-        for e in reg5.get("entries") or []:
-            asm = str(e.get("asm", "")).strip()
+        for e in reg5.get("entries", []) or []:
+            asm = str(e.get("asm") or "").strip()
             if asm:
                 out.add(asm.lower())
-            name = str(e.get("name", "")).strip()
+            name = str(e.get("name") or "").strip()
             if name:
                 out.add(name.lower())
             for a in e.get("aliases") or []:
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark suite for the LinxISA catalog tooling.
+
+Builds synthetic instruction-word corpora from the catalog and times the hot
+paths shared by the tools in this directory:
+
+  load.json        `json.loads` of the catalog bytes
+  load.compile     catalog derivation (`linxisa.cache.compile_spec`, cache miss)
+  load.cached      `load_compiled()` served from the compiled cache (cache hit)
+  load.catalog     `Catalog` record construction
+  load.decoder     `LinxDecoder` decision-tree build
+  <corpus>.decode        tree decode, one word at a time
+  <corpus>.decode_batch  `LinxDecoder.decode_batch` (NumPy)
+  <corpus>.extract       field extraction of the decoded form
+  <corpus>.format        pretty formatting of extracted fields
+  <corpus>.encode        `Encoder.encode` of the extracted fields
+  <corpus>.encode_batch  `Encoder.encode_batch`, one batch per form (NumPy)
+
+Corpora:
+
+  forms   cycles over every form with all fields zero (the form's `match`)
+  random  cycles over every form with randomized field values
+  mix     randomized field values, forms drawn by the `opcode_hist` of a
+          `tools/analysis/objdump_stats.py` JSON (`--opcode-mix`); uniform over
+          mnemonics when no histogram is given
+
+Random words are redrawn until they decode back to their form (so constraint
+exclusions such as `RegDst!=RA` are respected); forms that are always shadowed
+are kept with their last draw.
+
+Each stage is run `--repeat` times and the best time is reported. Results are
+written as JSON (`--out`) and can be compared against a previous run
+(`--baseline`): a stage regresses when its time per operation grows by more
+than `--threshold`. `--compare OLD NEW` compares two saved results without
+running anything.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from linxdisasm import LinxDecoder, _extract_fields, _format_inst_pretty, _load_forms, _load_reg5
+from linxisa.cache import compile_spec, load_compiled
+from linxisa.catalog import Catalog, Instruction
+from linxisa.encoder import Encoder
+
+
+RESULTS_FORMAT = 1
+
+# Redraws per word before giving up on a shadowed form.
+_MAX_REDRAWS = 16
+
+Corpus = List[Tuple[Instruction, int]]
+
+
+def _optional_numpy() -> Any:
+    try:
+        import numpy  # type: ignore
+    except Exception:
+        return None
+    return numpy
+
+
+def _git_commit(repo: Path) -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=str(repo),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def _mnemonic_key(s: str) -> str:
+    return s.strip().lower().replace(" ", ".")
+
+
+def _load_opcode_mix(path: Path, catalog: Catalog) -> Tuple[List[Tuple[Instruction, float]], int, int]:
+    """
+    Map an `objdump_stats` `opcode_hist` onto catalog forms.
+
+    objdump mnemonics carry suffixes the catalog mnemonic does not (`.aq`,
+    data types, ...), so unmatched names are retried with trailing `.`
+    components dropped. A mnemonic's count is split evenly across its forms.
+    Returns (weighted forms, matched count, unmatched count).
+    """
+    data = json.loads(path.read_text(encoding="utf-8"))
+    hist = data.get("opcode_hist", data) if isinstance(data, dict) else data
+    items = hist.items() if isinstance(hist, dict) else hist
+
+    by_mnem: Dict[str, List[Instruction]] = {}
+    for inst in catalog.instructions:
+        by_mnem.setdefault(_mnemonic_key(inst.mnemonic), []).append(inst)
+
+    weights: Dict[str, float] = {}
+    matched = unmatched = 0
+    for mnem, count in items:
+        key = _mnemonic_key(str(mnem))
+        forms = by_mnem.get(key)
+        while forms is None and "." in key:
+            key = key.rsplit(".", 1)[0]
+            forms = by_mnem.get(key)
+        if not forms:
+            unmatched += int(count)
+            continue
+        matched += int(count)
+        for inst in forms:
+            weights[inst.id] = weights.get(inst.id, 0.0) + int(count) / len(forms)
+    mix = [(inst, weights[inst.id]) for inst in catalog.instructions if weights.get(inst.id, 0.0) > 0]
+    return mix, matched, unmatched
+
+
+def _random_word(inst: Instruction, decoder: LinxDecoder, rng: random.Random) -> int:
+    width_mask = (1 << inst.length_bits) - 1
+    free = ~inst.mask & width_mask
+    word = inst.match
+    for _ in range(_MAX_REDRAWS):
+        word = inst.match | (rng.getrandbits(inst.length_bits) & free)
+        if decoder.decode(word, inst.length_bits) is inst:
+            break
+    return word
+
+
+def _build_corpora(
+    catalog: Catalog,
+    decoder: LinxDecoder,
+    count: int,
+    seed: int,
+    mix: Optional[List[Tuple[Instruction, float]]],
+) -> Dict[str, Corpus]:
+    forms = catalog.instructions
+    rng = random.Random(seed)
+    corpora: Dict[str, Corpus] = {}
+    corpora["forms"] = [(forms[i % len(forms)], forms[i % len(forms)].match) for i in range(count)]
+    corpora["random"] = [(inst, _random_word(inst, decoder, rng)) for inst in (forms[i % len(forms)] for i in range(count))]
+
+    if mix:
+        population = [inst for inst, _ in mix]
+        picks = rng.choices(population, weights=[w for _, w in mix], k=count)
+    else:
+        by_mnem: Dict[str, List[Instruction]] = {}
+        for inst in forms:
+            by_mnem.setdefault(inst.mnemonic, []).append(inst)
+        groups = list(by_mnem.values())
+        picks = [rng.choice(rng.choice(groups)) for _ in range(count)]
+    corpora["mix"] = [(inst, _random_word(inst, decoder, rng)) for inst in picks]
+    return corpora
+
+
+def _best_of(repeat: int, fn: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _record(results: Dict[str, Dict[str, Any]], name: str, ops: int, seconds: float) -> None:
+    results[name] = {
+        "ops": ops,
+        "seconds": seconds,
+        "ns_per_op": seconds / ops * 1e9 if ops else 0.0,
+        "ops_per_sec": ops / seconds if seconds > 0 else 0.0,
+    }
+
+
+def _bench_load(spec_path: Path, repeat: int, results: Dict[str, Dict[str, Any]]) -> Catalog:
+    raw = spec_path.read_bytes()
+    spec = json.loads(raw)
+    _record(results, "load.json", 1, _best_of(repeat, lambda: json.loads(raw)))
+    _record(results, "load.compile", 1, _best_of(repeat, lambda: compile_spec(spec)))
+    load_compiled(spec_path)  # populate the cache so the next stage measures a hit
+    _record(results, "load.cached", 1, _best_of(repeat, lambda: load_compiled(spec_path)))
+
+    compiled = load_compiled(spec_path)
+    _record(results, "load.catalog", 1, _best_of(repeat, lambda: Catalog(compiled).instructions))
+    catalog = Catalog(compiled)
+    forms_by_len = _load_forms(catalog)
+    _record(results, "load.decoder", 1, _best_of(repeat, lambda: LinxDecoder(forms_by_len)))
+    return catalog
+
+
+def _bench_corpus(
+    name: str,
+    corpus: Corpus,
+    decoder: LinxDecoder,
+    encoder: Encoder,
+    reg5: Dict[int, str],
+    repeat: int,
+    np: Any,
+    results: Dict[str, Dict[str, Any]],
+) -> int:
+    """Time the per-word stages over one corpus; returns the number of words that failed to decode."""
+    decode = decoder.decode
+    items = [(w, inst.length_bits) for inst, w in corpus]
+    _record(results, f"{name}.decode", len(items), _best_of(repeat, lambda: [decode(w, n) for w, n in items]))
+
+    decoded = [(decode(w, n), w) for w, n in items]
+    misses = sum(1 for f, _ in decoded if f is None)
+    hits = [(f, w) for f, w in decoded if f is not None]
+
+    if np is not None:
+        by_len: Dict[int, List[int]] = {}
+        for w, n in items:
+            by_len.setdefault(n, []).append(w)
+        arrays = [(np.array(ws, dtype=np.uint64), n) for n, ws in sorted(by_len.items())]
+        decoder.decode_batch(arrays[0][0][:1], arrays[0][1])  # NumPy warm-up
+        _record(
+            results,
+            f"{name}.decode_batch",
+            len(items),
+            _best_of(repeat, lambda: [decoder.decode_batch(a, n) for a, n in arrays]),
+        )
+
+    _record(results, f"{name}.extract", len(hits), _best_of(repeat, lambda: [_extract_fields(w, f) for f, w in hits]))
+
+    extracted = [(f, _extract_fields(w, f)) for f, w in hits]
+    _record(
+        results,
+        f"{name}.format",
+        len(extracted),
+        _best_of(repeat, lambda: [_format_inst_pretty(f, fields, reg5) for f, fields in extracted]),
+    )
+
+    encode = encoder.encode
+    jobs = [(f.id, fields) for f, fields in extracted]
+    for form_id in {i for i, _ in jobs}:
+        encoder.form(form_id)  # compile plans outside the timed loop
+    _record(results, f"{name}.encode", len(jobs), _best_of(repeat, lambda: [encode(i, values=v) for i, v in jobs]))
+
+    if np is not None:
+        per_form: Dict[str, Dict[str, List[int]]] = {}
+        sizes: Dict[str, int] = {}
+        for form_id, fields in jobs:
+            cols = per_form.setdefault(form_id, {k: [] for k in fields})
+            for k, v in fields.items():
+                cols[k].append(v)
+            sizes[form_id] = sizes.get(form_id, 0) + 1
+        batches = [
+            (form_id, {k: np.array(v, dtype=np.int64) for k, v in cols.items()}, sizes[form_id])
+            for form_id, cols in per_form.items()
+        ]
+        _record(
+            results,
+            f"{name}.encode_batch",
+            len(jobs),
+            _best_of(repeat, lambda: [encoder.encode_batch(i, cols, count=n) for i, cols, n in batches]),
+        )
+    return misses
+
+
+def _compare(base: Dict[str, Any], new: Dict[str, Any], threshold: float) -> int:
+    """Print per-stage deltas (time per op) and return the number of regressions."""
+    old_res = base.get("results", {})
+    new_res = new.get("results", {})
+    print(f"baseline: {base.get('commit') or '?'}  current: {new.get('commit') or '?'}  threshold: {threshold:+.0%}")
+    for key in ("spec_sha256", "count", "seed", "mix", "numpy"):
+        if base.get(key) != new.get(key):
+            print(f"warning: {key} differs ({base.get(key)!r} vs {new.get(key)!r}); results may not be comparable")
+    print("stage\tbase_ns\tnew_ns\tdelta\tstatus")
+    regressions = 0
+    for name in sorted(set(old_res) | set(new_res)):
+        a = old_res.get(name)
+        b = new_res.get(name)
+        if a is None or b is None:
+            print(f"{name}\t{a['ns_per_op'] if a else '-'}\t{b['ns_per_op'] if b else '-'}\t-\t{'new' if a is None else 'gone'}")
+            continue
+        old_ns = float(a["ns_per_op"])
+        new_ns = float(b["ns_per_op"])
+        delta = new_ns / old_ns - 1 if old_ns > 0 else 0.0
+        status = "ok"
+        if delta > threshold:
+            status = "REGRESSION"
+            regressions += 1
+        elif delta < -threshold:
+            status = "faster"
+        print(f"{name}\t{old_ns:.1f}\t{new_ns:.1f}\t{delta:+.1%}\t{status}")
+    return regressions
+
+
+def _load_results(path: Path) -> Dict[str, Any]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("format") != RESULTS_FORMAT:
+        raise SystemExit(f"error: {path}: unsupported results format {data.get('format')!r}")
+    return data
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark LinxISA spec load, decode, extraction, formatting and encoding.")
+    ap.add_argument("--spec", default="isa/v0.3/linxisa-v0.3.json", help="Path to compiled ISA JSON")
+    ap.add_argument("--count", type=int, default=20000, help="Words per corpus (default: 20000)")
+    ap.add_argument("--seed", type=int, default=1, help="Corpus RNG seed (default: 1)")
+    ap.add_argument("--repeat", type=int, default=5, help="Runs per stage; the best time is kept (default: 5)")
+    ap.add_argument("--opcode-mix", type=Path, help="objdump_stats JSON whose opcode_hist weights the 'mix' corpus")
+    ap.add_argument("--no-numpy", action="store_true", help="Skip the NumPy batch stages")
+    ap.add_argument("--out", type=Path, help="Write JSON results to this file")
+    ap.add_argument("--baseline", type=Path, help="Compare against a previous JSON result")
+    ap.add_argument("--compare", nargs=2, type=Path, metavar=("OLD", "NEW"), help="Compare two saved results and exit")
+    ap.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative slowdown per op that counts as a regression (default: 0.10)",
+    )
+    args = ap.parse_args(argv)
+
+    if args.compare:
+        old, new = (_load_results(p) for p in args.compare)
+        return 1 if _compare(old, new, args.threshold) else 0
+
+    spec_path = Path(args.spec)
+    np = None if args.no_numpy else _optional_numpy()
+    results: Dict[str, Dict[str, Any]] = {}
+
+    catalog = _bench_load(spec_path, args.repeat, results)
+    decoder = LinxDecoder.from_catalog(catalog)
+    encoder = Encoder(catalog)
+    reg5 = _load_reg5(catalog)
+
+    mix = None
+    mix_info: Dict[str, Any] = {"source": None}
+    if args.opcode_mix:
+        mix, matched, unmatched = _load_opcode_mix(args.opcode_mix, catalog)
+        mix_info = {"source": str(args.opcode_mix), "matched": matched, "unmatched": unmatched, "forms": len(mix)}
+        if not mix:
+            print(f"error: no opcode_hist mnemonic in {args.opcode_mix} matches the catalog", file=sys.stderr)
+            return 2
+
+    corpora = _build_corpora(catalog, decoder, args.count, args.seed, mix)
+    misses: Dict[str, int] = {}
+    for name, corpus in corpora.items():
+        misses[name] = _bench_corpus(name, corpus, decoder, encoder, reg5, args.repeat, np, results)
+
+    report: Dict[str, Any] = {
+        "format": RESULTS_FORMAT,
+        "commit": _git_commit(spec_path.resolve().parent),
+        "spec": str(spec_path),
+        "spec_sha256": catalog.sha256,
+        "forms": len(catalog),
+        "python": platform.python_version(),
+        "numpy": getattr(np, "__version__", None),
+        "count": args.count,
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "mix": mix_info,
+        "decode_misses": misses,
+        "results": results,
+    }
+
+    print("stage\tops\tbest_s\tns_per_op\tops_per_sec")
+    for name, r in results.items():
+        print(f"{name}\t{r['ops']}\t{r['seconds']:.6f}\t{r['ns_per_op']:.1f}\t{r['ops_per_sec']:.0f}")
+
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"ok: wrote {args.out}")
+
+    if args.baseline:
+        print()
+        if _compare(_load_results(args.baseline), report, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -20,12 +20,19 @@ import argparse
 import hashlib
 import json
 import os
+import pickle
 import re
 import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from linxisa.cache import cache_dir, cache_disabled, compile_spec, write_atomic
+from linxisa.catalog import Catalog
+from linxisa.encoding import hex_width, parse_int
+from linxisa.jsonindex import build_index, index_path_for, render_index
+from linxisa.lxcat import encode_catalog
+
 
 _RE_CNST_BIN = re.compile(r"^(?P<w>\d+)'b(?P<bits>[01_]+)$")
 _RE_CNST_HEX = re.compile(r"^(?P<w>\d+)'h(?P<hex>[0-9a-fA-F_]+)$")
@@ -51,20 +58,6 @@ def _write_json(path: Path, obj: Any, pretty: bool) -> None:
     path.write_text(text, encoding="utf-8")
 
 
-def _hex_width(val: int, width_bits: int) -> str:
-    hex_digits = (width_bits + 3) // 4
-    return f"0x{val:0{hex_digits}x}"
-
-
-def _parse_int_value(s: str) -> int:
-    s = s.strip()
-    if s.startswith("0x") or s.startswith("0X"):
-        return int(s, 16)
-    if s.startswith("0b") or s.startswith("0B"):
-        return int(s, 2)
-    return int(s, 10)
-
-
 def _parse_const_token(token: str, width_bits: int) -> Optional[Dict[str, Any]]:
     """
     Return {"width": width_bits, "value": int} for constant-like tokens, else None.
@@ -104,29 +97,12 @@ def _parse_const_token(token: str, width_bits: int) -> Optional[Dict[str, Any]]:
 
     # plain ints; interpret as value with the segment width
     try:
-        value = _parse_int_value(t)
+        value = parse_int(t)
     except ValueError:
         return None
     return {"width": int(width_bits), "value": int(value)}
 
 
-def _pattern_to_mask_match(pattern: str) -> Tuple[int, int]:
-    # pattern is MSB->LSB with '0','1','.'
-    width_bits = len(pattern)
-    mask = 0
-    match = 0
-    for i, ch in enumerate(pattern):
-        bit = width_bits - 1 - i
-        if ch == ".":
-            continue
-        if ch not in ("0", "1"):
-            raise ValueError(f"invalid pattern char {ch!r}")
-        mask |= 1 << bit
-        if ch == "1":
-            match |= 1 << bit
-    return mask, match
-
-
 def _augment_with_encoding(instructions: List[Dict[str, Any]]) -> None:
     """
     Derive `encoding` (mask/match/pattern and field pieces) from raw segments.
@@ -193,8 +169,8 @@ def _augment_with_encoding(instructions: List[Dict[str, Any]]) -> None:
             enc_part: Dict[str, Any] = {
                 "index": part_index,
                 "width_bits": width_bits,
-                "mask": _hex_width(fixed_mask, width_bits),
-                "match": _hex_width(fixed_bits, width_bits),
+                "mask": hex_width(fixed_mask, width_bits),
+                "match": hex_width(fixed_bits, width_bits),
                 "pattern": "".join(pattern[::-1]),
                 "fields": fields_list,
             }
@@ -395,6 +371,148 @@ def _iter_opc_lines(path: Path, seen: set[Path]) -> Iterable[Tuple[Path, int, st
         yield path, idx0 + 1, line.rstrip("\n")
 
 
+def _opc_sources(path: Path, seen: set[Path]) -> List[Tuple[Path, bytes]]:
+    """
+    Contents of `path` and of the files it `$import`s, in `_iter_opc_lines`
+    visit order (updating `seen` the same way).
+    """
+    p = path.resolve()
+    if p in seen:
+        return []
+    seen.add(p)
+    data = path.read_bytes()
+    out: List[Tuple[Path, bytes]] = [(p, data)]
+    for line in data.decode("utf-8", errors="strict").splitlines():
+        raw = line.strip()
+        if raw.startswith("$import"):
+            _, rel = raw.split(None, 1)
+            out.extend(_opc_sources((path.parent / rel.strip()).resolve(), seen))
+    return out
+
+
+def _digest(*chunks: bytes) -> str:
+    h = hashlib.sha256()
+    for c in chunks:
+        h.update(len(c).to_bytes(8, "little"))
+        h.update(c)
+    return h.hexdigest()
+
+
+# Files whose code shapes the output; editing them invalidates every cached parse
+# and the stamp. The whole `linxisa` package is included: the JSON, `.idx` and
+# `.lxcat` writers reach into most of it (cache, catalog, constraints, ...).
+_BUILDER_SOURCES = (
+    Path(__file__).resolve(),
+    *sorted((Path(__file__).resolve().parent / "linxisa").glob("*.py")),
+)
+
+# Bump when the cached entry layout changes.
+_PARSE_CACHE_FORMAT = 1
+
+
+class _ParseCache:
+    """
+    Parsed and augmented instructions per top-level `.opc` file, kept across
+    runs in the linxisa cache directory (`LINXISA_CACHE_DIR`).
+
+    A file entry is reused as-is while the content hashes of the file and of
+    everything it `$import`s are unchanged. Otherwise the file is re-walked and
+    each line is looked up by its text, so editing one line re-parses only that
+    line (and shifted lines just get their `source.line` updated). All entries
+    are dropped when `formats.json` or the builder itself changes.
+
+    The cache also keeps a stamp of the last verified (inputs, output) digests,
+    which lets a no-op `--check` skip the build altogether.
+    """
+
+    def __init__(self, path: Optional[Path]) -> None:
+        self.path = path
+        self.env = ""
+        self.files: Dict[str, Tuple[str, List[Tuple[str, Dict[str, Any]]]]] = {}
+        self.lines: Dict[str, Dict[str, Any]] = {}
+        self.used: set[str] = set()
+        self.dirty = False
+
+    @classmethod
+    def open(cls, in_dir: Path) -> "_ParseCache":
+        tag = hashlib.sha256(str(in_dir.resolve()).encode("utf-8")).hexdigest()[:16]
+        cache = cls(cache_dir() / f"golden-{tag}.pickle")
+        try:
+            with cache.path.open("rb") as f:
+                data = pickle.load(f)
+        except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+            return cache
+        if isinstance(data, dict) and data.get("format") == _PARSE_CACHE_FORMAT:
+            cache.env = data["env"]
+            cache.files = data["files"]
+        return cache
+
+    def begin(self, env: str) -> None:
+        if env != self.env:
+            self.env = env
+            self.files = {}
+            self.dirty = True
+        self.lines = {k: inst for _, entries in self.files.values() for k, inst in entries}
+
+    def file_entries(self, name: str, key: str) -> Optional[List[Tuple[str, Dict[str, Any]]]]:
+        self.used.add(name)
+        hit = self.files.get(name)
+        if hit is None or hit[0] != key:
+            return None
+        return hit[1]
+
+    def line(self, key: str, src_file: str, lineno: int) -> Optional[Dict[str, Any]]:
+        inst = self.lines.get(key)
+        if inst is None:
+            return None
+        return dict(inst, source={"file": src_file, "line": int(lineno)})
+
+    def store(self, name: str, key: str, entries: List[Tuple[str, Dict[str, Any]]]) -> None:
+        self.files[name] = (key, entries)
+        self.dirty = True
+
+    def save(self) -> None:
+        if self.path is None or not (self.dirty or set(self.files) - self.used):
+            return
+        files = {name: entry for name, entry in self.files.items() if name in self.used}
+        data = {"format": _PARSE_CACHE_FORMAT, "env": self.env, "files": files}
+        write_atomic(self.path, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def _stamp_path(self) -> Optional[Path]:
+        return self.path.with_suffix(".stamp") if self.path is not None else None
+
+    def stamp_matches(self, inputs: str, out_path: Path, output: str) -> bool:
+        stamp_path = self._stamp_path()
+        if stamp_path is None:
+            return False
+        try:
+            stamp = json.loads(stamp_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        return stamp == {"inputs": inputs, "out": str(out_path.resolve()), "output": output}
+
+    def write_stamp(self, inputs: str, out_path: Path, output: str) -> None:
+        stamp_path = self._stamp_path()
+        if stamp_path is not None:
+            stamp = {"inputs": inputs, "out": str(out_path.resolve()), "output": output}
+            write_atomic(stamp_path, json.dumps(stamp, sort_keys=True).encode("utf-8"))
+
+
+def _input_digest(in_dir: Path) -> str:
+    """Digest of every file `build()` reads, plus the builder sources."""
+    paths: List[Path] = [*_BUILDER_SOURCES, in_dir / "meta.json", in_dir / "encoding" / "formats.json"]
+    paths.extend(sorted((in_dir / "registers").glob("*.json")))
+    paths.extend(sorted((in_dir / "state").glob("*.json")))
+    chunks: List[bytes] = []
+    for p in paths:
+        chunks += [p.as_posix().encode("utf-8"), p.read_bytes()]
+    seen: set[Path] = set()
+    for opc_path in sorted((in_dir / "opcodes").glob("*.opc")):
+        for p, data in _opc_sources(opc_path, seen):
+            chunks += [p.as_posix().encode("utf-8"), data]
+    return _digest(*chunks)
+
+
 def _parse_opc_line(path: Path, lineno: int, line: str) -> _OpcodeLine:
     # MNEMONIC [JSON] : <assignments> [| <assignments>] ; <operands> ; <constraints>
     mnemonic, rest = _parse_mnemonic_prefix(line)
@@ -452,7 +570,88 @@ def _assignments_to_part(assignments: List[Tuple[int, int, str]], width_bits: in
     return {"width_bits": int(width_bits), "segments": segments}
 
 
-def build(in_dir: Path) -> Dict[str, Any]:
+def _build_instruction(
+    formats_by_len: Dict[int, List[int]], src_path: Path, src_file: str, lineno: int, raw_line: str
+) -> Dict[str, Any]:
+    """Parse one opcode line into a catalog instruction (encoding and stable id included)."""
+    try:
+        ol = _parse_opc_line(src_path, lineno, raw_line)
+    except Exception as e:
+        raise ValueError(f"{src_path}:{lineno}: {e}\\n  line: {raw_line}") from e
+
+    asm = str(ol.meta.get("asm") or "").strip()
+    group = str(ol.meta.get("group") or "").strip()
+    length_bits = int(ol.meta.get("length_bits") or 0)
+    if not length_bits:
+        raise ValueError(f"{src_path}:{lineno}: meta.length_bits is required")
+    part_widths = formats_by_len.get(length_bits)
+    if not part_widths:
+        raise ValueError(f"{src_path}:{lineno}: unknown length_bits {length_bits}")
+    if len(ol.parts) != len(part_widths):
+        raise ValueError(
+            f"{src_path}:{lineno}: part count {len(ol.parts)} does not match format parts {len(part_widths)}"
+        )
+
+    parts: List[Dict[str, Any]] = []
+    for assigns, width in zip(ol.parts, part_widths):
+        parts.append(_assignments_to_part(assigns, width))
+
+    inst: Dict[str, Any] = {
+        "mnemonic": ol.mnemonic,
+        "group": group,
+        "source": {"file": src_file, "line": int(lineno)},
+        "parts": parts,
+        "length_bits": int(length_bits),
+    }
+    if asm:
+        inst["asm"] = asm
+    # Preserve optional metadata (for example human-facing notes) from
+    # opcode source entries so generated references stay self-describing.
+    for mk, mv in ol.meta.items():
+        if mk in {"asm", "group", "length_bits"}:
+            continue
+        inst[mk] = mv
+
+    # constraints are attached to encoding.part[0] to match legacy behavior
+    if ol.constraints:
+        inst["_constraints_part0"] = _parse_constraint_tokens(ol.constraints)
+
+    _augment_with_encoding([inst])
+    _assign_stable_ids([inst])
+    # strip internal fields
+    inst.pop("_constraints_part0", None)
+    return inst
+
+
+# Below this many lines to parse, process start-up costs more than it saves.
+_PARALLEL_MIN_LINES = 128
+_CHUNKS_PER_JOB = 4
+
+
+def _build_chunk(
+    formats_by_len: Dict[int, List[int]], lines: List[Tuple[Path, str, int, str]]
+) -> List[Dict[str, Any]]:
+    return [_build_instruction(formats_by_len, *line) for line in lines]
+
+
+def _build_instructions(
+    formats_by_len: Dict[int, List[int]], lines: List[Tuple[Path, str, int, str]], jobs: int
+) -> List[Dict[str, Any]]:
+    """`_build_instruction` over `lines`, in order; chunks run in a process pool when `jobs` > 1."""
+    if jobs <= 1 or len(lines) < _PARALLEL_MIN_LINES:
+        return _build_chunk(formats_by_len, lines)
+    from concurrent.futures import ProcessPoolExecutor
+
+    step = -(-len(lines) // (jobs * _CHUNKS_PER_JOB))
+    chunks = [lines[i : i + step] for i in range(0, len(lines), step)]
+    out: List[Dict[str, Any]] = []
+    with ProcessPoolExecutor(max_workers=min(jobs, len(chunks))) as pool:
+        for built in pool.map(_build_chunk, [formats_by_len] * len(chunks), chunks):
+            out.extend(built)
+    return out
+
+
+def build(in_dir: Path, cache: Optional["_ParseCache"] = None, jobs: int = 1) -> Dict[str, Any]:
     meta = _read_json(in_dir / "meta.json")
     formats = _read_json(in_dir / "encoding" / "formats.json")
 
@@ -479,68 +678,59 @@ def build(in_dir: Path) -> Dict[str, Any]:
         for p in sorted(state_dir.glob("*.json")):
             state[p.stem] = _read_json(p)
 
-    # opcodes
+    # opcodes (parsed per top-level file through the parse cache)
+    if cache is None:
+        cache = _ParseCache(None)
+    cache.begin(_digest(*(p.read_bytes() for p in _BUILDER_SOURCES), _canonical_json(formats_by_len).encode("utf-8")))
     opc_dir = in_dir / "opcodes"
-    instructions: List[Dict[str, Any]] = []
     seen: set[Path] = set()
+    src_files: Dict[Path, str] = {}
+    # Per top-level file: (name, cache key, entries, fresh). Entries of lines
+    # that still need parsing hold None until the parse pass below fills them.
+    per_file: List[Tuple[str, str, List[Tuple[str, Optional[Dict[str, Any]]]], bool]] = []
+    pending: List[Tuple[Path, str, int, str]] = []
+    slots: List[Tuple[List[Tuple[str, Optional[Dict[str, Any]]]], int]] = []
     for opc_path in sorted(opc_dir.glob("*.opc")):
-        for src_path, lineno, raw_line in _iter_opc_lines(opc_path, seen):
-            try:
-                ol = _parse_opc_line(src_path, lineno, raw_line)
-            except Exception as e:
-                raise ValueError(f"{src_path}:{lineno}: {e}\\n  line: {raw_line}") from e
-
-            asm = str(ol.meta.get("asm") or "").strip()
-            group = str(ol.meta.get("group") or "").strip()
-            length_bits = int(ol.meta.get("length_bits") or 0)
-            if not length_bits:
-                raise ValueError(f"{src_path}:{lineno}: meta.length_bits is required")
-            part_widths = formats_by_len.get(length_bits)
-            if not part_widths:
-                raise ValueError(f"{src_path}:{lineno}: unknown length_bits {length_bits}")
-            if len(ol.parts) != len(part_widths):
-                raise ValueError(
-                    f"{src_path}:{lineno}: part count {len(ol.parts)} does not match format parts {len(part_widths)}"
-                )
-
-            parts: List[Dict[str, Any]] = []
-            for assigns, width in zip(ol.parts, part_widths):
-                parts.append(_assignments_to_part(assigns, width))
-
-            # Normalize sources to be stable across invocation paths.
-            try:
-                src_file = str(src_path.resolve().relative_to(in_dir.resolve()).as_posix())
-            except Exception:
-                src_file = str(src_path.as_posix())
-
-            inst: Dict[str, Any] = {
-                "mnemonic": ol.mnemonic,
-                "group": group,
-                "source": {"file": src_file, "line": int(lineno)},
-                "parts": parts,
-                "length_bits": int(length_bits),
-            }
-            if asm:
-                inst["asm"] = asm
-            # Preserve optional metadata (for example human-facing notes) from
-            # opcode source entries so generated references stay self-describing.
-            for mk, mv in ol.meta.items():
-                if mk in {"asm", "group", "length_bits"}:
-                    continue
-                inst[mk] = mv
-
-            # constraints are attached to encoding.part[0] to match legacy behavior
-            if ol.constraints:
-                inst["_constraints_part0"] = _parse_constraint_tokens(ol.constraints)
-
-            instructions.append(inst)
-
-    _augment_with_encoding(instructions)
-    _assign_stable_ids(instructions)
+        # Files already pulled in through `$import` are skipped, so the entry
+        # also depends on what earlier files imported.
+        before = set(seen)
+        sources = _opc_sources(opc_path, seen)
+        key = _digest(
+            *(p.as_posix().encode("utf-8") for p in sorted(before)),
+            *(c for p, data in sources for c in (p.as_posix().encode("utf-8"), data)),
+        )
+        cached = cache.file_entries(opc_path.name, key)
+        if cached is not None:
+            per_file.append((opc_path.name, key, list(cached), False))
+            continue
+        entries: List[Tuple[str, Optional[Dict[str, Any]]]] = []
+        for src_path, lineno, raw_line in _iter_opc_lines(opc_path, before):
+            src_file = src_files.get(src_path)
+            if src_file is None:
+                # Normalize sources to be stable across invocation paths.
+                try:
+                    src_file = str(src_path.resolve().relative_to(in_dir.resolve()).as_posix())
+                except Exception:
+                    src_file = str(src_path.as_posix())
+                src_files[src_path] = src_file
+            line_key = _digest(src_file.encode("utf-8"), raw_line.encode("utf-8"))
+            inst = cache.line(line_key, src_file, lineno)
+            if inst is None:
+                pending.append((src_path, src_file, lineno, raw_line))
+                slots.append((entries, len(entries)))
+            entries.append((line_key, inst))
+        per_file.append((opc_path.name, key, entries, True))
+
+    # Results come back in submission order, so the merged list (and the first
+    # error raised) is the same for any worker count.
+    for (entries, i), inst in zip(slots, _build_instructions(formats_by_len, pending, jobs)):
+        entries[i] = (entries[i][0], inst)
 
-    # strip internal fields
-    for inst in instructions:
-        inst.pop("_constraints_part0", None)
+    instructions: List[Dict[str, Any]] = []
+    for name, key, entries, fresh in per_file:
+        if fresh:
+            cache.store(name, key, entries)
+        instructions.extend(inst for _, inst in entries if inst is not None)
 
     # stable ordering (human-friendly then stable)
     instructions.sort(key=lambda i: (str(i.get("mnemonic")), int(i.get("length_bits", 0)), str(i.get("id"))))
@@ -597,11 +787,20 @@ def _canonical_json(obj: Any) -> str:
     return json.dumps(obj, sort_keys=True, separators=(",", ":"))
 
 
+def _binary_catalog(built: Dict[str, Any], json_bytes: bytes) -> bytes:
+    """The `.lxcat` image of `built`, stamped with the digest of its JSON serialization."""
+    return encode_catalog(Catalog(compile_spec(built, hashlib.sha256(json_bytes).hexdigest())))
+
+
+def _output_digest(*paths: Path) -> str:
+    return _digest(*(p.read_bytes() if p.exists() else b"" for p in paths))
+
+
 def _profile_defaults() -> Tuple[str, str]:
     return "isa/v0.3", "isa/v0.3/linxisa-v0.3.json"
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument(
         "--profile",
@@ -612,20 +811,50 @@ def main() -> int:
     ap.add_argument("--in", dest="in_dir", default=None, help="Golden source directory")
     ap.add_argument("--out", default=None, help="Output catalog JSON path")
     ap.add_argument("--pretty", action="store_true", help="Pretty-print JSON")
+    ap.add_argument("--bin-out", default=None, help="Output binary catalog path (default: --out with .lxcat suffix)")
     ap.add_argument("--check", action="store_true", help="Verify output is up-to-date without writing")
-    args = ap.parse_args()
+    ap.add_argument("--no-cache", action="store_true", help="Parse every opcode file from scratch (no parse cache)")
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for parsing opcode lines that miss the parse cache (0: one per CPU)",
+    )
+    args = ap.parse_args(argv)
 
     default_in, default_out = _profile_defaults()
     in_dir = Path(args.in_dir or default_in)
     out_path = Path(args.out or default_out)
 
-    built = build(in_dir)
+    bin_path = Path(args.bin_out) if args.bin_out else out_path.with_suffix(".lxcat")
+    idx_path = index_path_for(out_path)
+
+    cache = None if args.no_cache or cache_disabled() else _ParseCache.open(in_dir)
+    inputs = _input_digest(in_dir) if cache is not None else ""
+
+    if args.check and cache is not None and out_path.exists():
+        if cache.stamp_matches(inputs, out_path, _output_digest(out_path, bin_path, idx_path)):
+            print("OK")
+            return 0
+
+    built = build(in_dir, cache, jobs=args.jobs if args.jobs > 0 else (os.cpu_count() or 1))
+    if cache is not None:
+        cache.save()
 
     if args.check and out_path.exists():
-        existing = _read_json(out_path)
+        existing_bytes = out_path.read_bytes()
+        existing = json.loads(existing_bytes)
         if _canonical_json(existing) != _canonical_json(built):
             print(f"error: {out_path} is not up-to-date; re-run build_golden.py", file=sys.stderr)
             return 2
+        if not bin_path.exists() or bin_path.read_bytes() != _binary_catalog(built, existing_bytes):
+            print(f"error: {bin_path} is not up-to-date; re-run build_golden.py", file=sys.stderr)
+            return 2
+        if not idx_path.exists() or idx_path.read_text(encoding="utf-8") != render_index(build_index(existing_bytes)):
+            print(f"error: {idx_path} is not up-to-date; re-run build_golden.py", file=sys.stderr)
+            return 2
+        if cache is not None:
+            cache.write_stamp(inputs, out_path, _output_digest(out_path, bin_path, idx_path))
         print("OK")
         return 0
 
@@ -634,6 +863,11 @@ def main() -> int:
         return 2
 
     _write_json(out_path, built, pretty=bool(args.pretty))
+    json_bytes = out_path.read_bytes()
+    bin_path.write_bytes(_binary_catalog(built, json_bytes))
+    idx_path.write_text(render_index(build_index(json_bytes)), encoding="utf-8")
+    if cache is not None:
+        cache.write_stamp(inputs, out_path, _output_digest(out_path, bin_path, idx_path))
     return 0
 
 
@@ -0,0 +1,265 @@
+/*
+ * Host benchmark for the generated C codec (isa/generated/codecs/linxisa_opcodes.c).
+ *
+ * For each instruction length, builds a corpus that cycles over every form with
+ * randomized free bits (as `linxdisasm.py --bench` does), checks that
+ * linxisa_decode() agrees with a linear scan over linxisa_inst_forms[] on the
+ * corpus and on random words, then times both. The 16-bit class also times
+ * the direct-index table (linxisa_decode16_direct), after checking that every
+ * word it maps to a form hits that form's mask/match. Finally, for the forms
+ * the corpus words were built from, checks the per-form field extractors
+ * (linxisa_field_extractors[]) against the generic walk over
+ * linxisa_field_pieces[] and times both.
+ *
+ * Build and run with tools/isa/cbench/run_bench_codec.sh.
+ */
+
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+
+#include "linxisa_opcodes.h"
+
+static uint64_t rng_state = 0x9e3779b97f4a7c15ULL;
+
+static uint64_t splitmix64(void)
+{
+    uint64_t z = (rng_state += 0x9e3779b97f4a7c15ULL);
+    z = (z ^ (z >> 30)) * 0xbf58476d1ce4e5b9ULL;
+    z = (z ^ (z >> 27)) * 0x94d049bb133111ebULL;
+    return z ^ (z >> 31);
+}
+
+static double now_sec(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + (double)ts.tv_nsec * 1e-9;
+}
+
+/* The decode loop C consumers used before linxisa_decode(): most fixed bits wins. */
+static int decode_linear(uint64_t insn, unsigned length_bits)
+{
+    int best = -1;
+    unsigned best_fixed = 0;
+    for (size_t i = 0; i < linxisa_inst_forms_count; i++) {
+        const linxisa_inst_form *f = &linxisa_inst_forms[i];
+        if ((unsigned)f->length_bits != length_bits) {
+            continue;
+        }
+        if ((insn & f->mask) != f->match) {
+            continue;
+        }
+        unsigned fixed = (unsigned)__builtin_popcountll((unsigned long long)f->mask);
+        if (best < 0 || fixed > best_fixed) {
+            best = (int)i;
+            best_fixed = fixed;
+        }
+    }
+    return best;
+}
+
+/* The field loop C consumers used before linxisa_field_extractors[]. */
+static void extract_generic(int idx, uint64_t insn, int64_t *out)
+{
+    const linxisa_inst_form *f = &linxisa_inst_forms[idx];
+    for (uint16_t k = 0; k < f->field_count; k++) {
+        const linxisa_field *fld = &linxisa_fields[f->field_start + k];
+        uint64_t v = 0;
+        for (uint8_t j = 0; j < fld->piece_count; j++) {
+            const linxisa_field_piece *p = &linxisa_field_pieces[fld->piece_start + j];
+            uint64_t m = p->width >= 64 ? ~0ULL : ((1ULL << p->width) - 1);
+            v |= ((insn >> p->insn_lsb) & m) << p->value_lsb;
+        }
+        if (fld->signed_hint == 1 && fld->bit_width > 0 && fld->bit_width < 64) {
+            uint64_t sign = 1ULL << (fld->bit_width - 1);
+            out[k] = (int64_t)(v ^ sign) - (int64_t)sign;
+        } else {
+            out[k] = (int64_t)v;
+        }
+    }
+}
+
+static void extract_specialized(int idx, uint64_t insn, int64_t *out)
+{
+    linxisa_extract_fields(idx, insn, out);
+}
+
+typedef void (*extract_fn)(int idx, uint64_t insn, int64_t *out);
+
+static int check_extract(const uint64_t *words, const int *idxs, size_t n)
+{
+    int64_t a[LINXISA_MAX_FIELDS], b[LINXISA_MAX_FIELDS];
+    for (size_t i = 0; i < n; i++) {
+        const linxisa_inst_form *f = &linxisa_inst_forms[idxs[i]];
+        extract_generic(idxs[i], words[i], a);
+        extract_specialized(idxs[i], words[i], b);
+        for (uint16_t k = 0; k < f->field_count; k++) {
+            if (a[k] != b[k]) {
+                fprintf(stderr, "error: %s field %s of 0x%llx: generic=%lld specialized=%lld\n", f->mnemonic,
+                        linxisa_fields[f->field_start + k].name, (unsigned long long)words[i], (long long)a[k],
+                        (long long)b[k]);
+                return 1;
+            }
+        }
+    }
+    return 0;
+}
+
+static double time_extract(extract_fn fn, const uint64_t *words, const int *idxs, size_t n, int repeat, long *sink)
+{
+    int64_t out[LINXISA_MAX_FIELDS] = {0};
+    double best = 0.0;
+    for (int r = 0; r < repeat; r++) {
+        long acc = 0;
+        double t0 = now_sec();
+        for (size_t i = 0; i < n; i++) {
+            fn(idxs[i], words[i], out);
+            acc += (long)out[0];
+        }
+        double dt = now_sec() - t0;
+        *sink += acc;
+        if (r == 0 || dt < best) {
+            best = dt;
+        }
+    }
+    return best;
+}
+
+typedef int (*decode_fn)(uint64_t insn, unsigned length_bits);
+
+static int decode_direct16(uint64_t insn, unsigned length_bits)
+{
+    (void)length_bits;
+    return linxisa_decode16_direct((uint16_t)insn);
+}
+
+/* Every table entry names a 16-bit form whose fixed bits the word carries. */
+static int check_direct16(void)
+{
+    for (uint32_t w = 0; w < 0x10000u; w++) {
+        int idx = linxisa_decode16_direct((uint16_t)w);
+        if (idx < 0) {
+            continue;
+        }
+        if ((size_t)idx >= linxisa_inst_forms_count) {
+            fprintf(stderr, "error: linxisa_decode16_table[0x%04x] = %d is out of range\n", (unsigned)w, idx);
+            return 1;
+        }
+        const linxisa_inst_form *f = &linxisa_inst_forms[idx];
+        if (f->length_bits != 16 || (w & f->mask) != f->match) {
+            fprintf(stderr, "error: linxisa_decode16_table[0x%04x] = %d does not match\n", (unsigned)w, idx);
+            return 1;
+        }
+    }
+    return 0;
+}
+
+static double time_decode(decode_fn fn, const uint64_t *words, size_t n, unsigned length_bits, int repeat,
+                          long *sink)
+{
+    double best = 0.0;
+    for (int r = 0; r < repeat; r++) {
+        long acc = 0;
+        double t0 = now_sec();
+        for (size_t i = 0; i < n; i++) {
+            acc += fn(words[i], length_bits);
+        }
+        double dt = now_sec() - t0;
+        *sink += acc;
+        if (r == 0 || dt < best) {
+            best = dt;
+        }
+    }
+    return best;
+}
+
+int main(int argc, char **argv)
+{
+    size_t count = argc > 1 ? (size_t)strtoull(argv[1], NULL, 0) : 200000;
+    int repeat = argc > 2 ? atoi(argv[2]) : 3;
+    static const unsigned lengths[] = {16, 32, 48, 64};
+    long sink = 0;
+    int rc = 0;
+
+    double direct16_mwps = 0.0, tree16_mwps = 0.0;
+    double extract_generic_mwps[4] = {0}, extract_fn_mwps[4] = {0};
+    rc |= check_direct16();
+
+    printf("length\tforms\twords\tlinear_mwps\ttree_mwps\tspeedup\n");
+    for (size_t li = 0; li < sizeof(lengths) / sizeof(lengths[0]); li++) {
+        unsigned length_bits = lengths[li];
+        uint64_t width_mask = length_bits == 64 ? ~0ULL : ((1ULL << length_bits) - 1);
+
+        size_t nforms = 0;
+        for (size_t i = 0; i < linxisa_inst_forms_count; i++) {
+            nforms += linxisa_inst_forms[i].length_bits == length_bits;
+        }
+        if (nforms == 0 || count == 0) {
+            continue;
+        }
+        const linxisa_inst_form **forms = malloc(nforms * sizeof(*forms));
+        uint64_t *words = malloc(count * sizeof(*words));
+        int *idxs = malloc(count * sizeof(*idxs));
+        if (!forms || !words || !idxs) {
+            fprintf(stderr, "error: out of memory\n");
+            return 2;
+        }
+        for (size_t i = 0, k = 0; i < linxisa_inst_forms_count; i++) {
+            if (linxisa_inst_forms[i].length_bits == length_bits) {
+                forms[k++] = &linxisa_inst_forms[i];
+            }
+        }
+        for (size_t i = 0; i < count; i++) {
+            const linxisa_inst_form *f = forms[i % nforms];
+            words[i] = f->match | (splitmix64() & ~f->mask & width_mask);
+            idxs[i] = (int)(f - linxisa_inst_forms);
+        }
+
+        /* Agreement on the corpus and on random words (mostly invalid encodings). */
+        for (size_t i = 0; i < 2 * count; i++) {
+            uint64_t w = i < count ? words[i] : (splitmix64() & width_mask);
+            int a = decode_linear(w, length_bits);
+            int b = linxisa_decode(w, length_bits);
+            if (a != b) {
+                fprintf(stderr, "error: decode mismatch for 0x%llx [%u]: linear=%d tree=%d\n",
+                        (unsigned long long)w, length_bits, a, b);
+                rc = 1;
+                break;
+            }
+        }
+
+        double t_linear = time_decode(decode_linear, words, count, length_bits, repeat, &sink);
+        double t_tree = time_decode(linxisa_decode, words, count, length_bits, repeat, &sink);
+        printf("%u\t%zu\t%zu\t%.2f\t%.2f\t%.1fx\n", length_bits, nforms, count, count / t_linear * 1e-6,
+               count / t_tree * 1e-6, t_linear / t_tree);
+        if (length_bits == 16) {
+            double t_direct = time_decode(decode_direct16, words, count, length_bits, repeat, &sink);
+            direct16_mwps = count / t_direct * 1e-6;
+            tree16_mwps = count / t_tree * 1e-6;
+        }
+        rc |= check_extract(words, idxs, count);
+        double t_generic = time_extract(extract_generic, words, idxs, count, repeat, &sink);
+        double t_fn = time_extract(extract_specialized, words, idxs, count, repeat, &sink);
+        extract_generic_mwps[li] = count / t_generic * 1e-6;
+        extract_fn_mwps[li] = count / t_fn * 1e-6;
+        free(forms);
+        free(words);
+        free(idxs);
+    }
+    if (direct16_mwps > 0.0) {
+        printf("\n16-bit direct table: %.2f mwps (%.1fx the tree)\n", direct16_mwps, direct16_mwps / tree16_mwps);
+    }
+    printf("\nlength\tgeneric_extract_mwps\tspecialized_extract_mwps\tspeedup\n");
+    for (size_t li = 0; li < sizeof(lengths) / sizeof(lengths[0]); li++) {
+        if (extract_fn_mwps[li] > 0.0) {
+            printf("%u\t%.2f\t%.2f\t%.1fx\n", lengths[li], extract_generic_mwps[li], extract_fn_mwps[li],
+                   extract_fn_mwps[li] / extract_generic_mwps[li]);
+        }
+    }
+    if (sink == 42) {
+        printf("\n");
+    }
+    return rc;
+}
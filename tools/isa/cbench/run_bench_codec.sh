@@ -0,0 +1,20 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+REPO_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../../.." && pwd)"
+CODEC_DIR="$REPO_ROOT/isa/generated/codecs"
+
+OUT_DIR="${OUT_DIR:-$REPO_ROOT/out/bench}"
+OUT_BIN="$OUT_DIR/bench_codec"
+CC="${CC:-cc}"
+
+mkdir -p "$OUT_DIR"
+
+"$CC" -O2 -std=c11 -D_POSIX_C_SOURCE=199309L \
+  -I"$CODEC_DIR" \
+  -o "$OUT_BIN" \
+  "$REPO_ROOT/tools/isa/cbench/bench_codec.c" \
+  "$CODEC_DIR/linxisa_opcodes.c"
+
+# Arguments: [words per length] [repeat]
+"$OUT_BIN" "$@"
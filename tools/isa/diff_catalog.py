@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Structural diff between two LinxISA catalogs, keyed on the stable form id.
+
+Reports forms added, removed, re-encoded (same mnemonic/length, new encoding,
+hence a new uid) and changed in place, plus the mnemonics and groups they
+touch. `--out` writes the diff JSON that `gen_encoding_svg.py --diff` and
+`gen_manual_adoc.py --diff` use to regenerate only the affected outputs.
+
+  python3 tools/isa/diff_catalog.py --old-rev HEAD --out /tmp/catalog.diff.json
+  python3 tools/isa/diff_catalog.py --old old.json --new isa/v0.3/linxisa-v0.3.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from linxisa.diff import CatalogDiff, diff_bytes
+
+
+def _git_show(rev: str, path: Path) -> bytes:
+    path = path.resolve()
+    try:
+        top = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            cwd=path.parent,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        rel = path.relative_to(Path(top).resolve()).as_posix()
+        return subprocess.run(
+            ["git", "show", f"{rev}:{rel}"], cwd=top, check=True, capture_output=True
+        ).stdout
+    except (OSError, ValueError, subprocess.CalledProcessError) as exc:
+        detail = getattr(exc, "stderr", None) or exc
+        if isinstance(detail, bytes):
+            detail = detail.decode("utf-8", "replace").strip()
+        raise SystemExit(f"error: cannot read {path} at {rev}: {detail}")
+
+
+def _render_text(d: CatalogDiff) -> str:
+    lines: List[str] = []
+    for i in d.added:
+        lines.append(f"+ {i} {d.new[i].get('mnemonic')}")
+    for i in d.removed:
+        lines.append(f"- {i} {d.old[i].get('mnemonic')}")
+    for o, n in d.reencoded:
+        lines.append(f"~ {o} -> {n} {d.new[n].get('mnemonic')} (re-encoded)")
+    for i, keys in d.changed.items():
+        lines.append(f"* {i} {d.new[i].get('mnemonic')}: {', '.join(keys)}")
+    for k in d.keys_changed:
+        lines.append(f"* catalog key {k!r} changed")
+    lines.append(
+        f"{len(d.added)} added, {len(d.removed)} removed, {len(d.reencoded)} re-encoded, "
+        f"{len(d.changed)} changed; affected: {len(d.affected_mnemonics)} mnemonic(s), "
+        f"{len(d.affected_groups)} group(s)"
+    )
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Diff two LinxISA catalogs by form id.")
+    ap.add_argument(
+        "--profile",
+        choices=["v0.3"],
+        default="v0.3",
+        help="ISA profile for default --new path (v0.3 only)",
+    )
+    ap.add_argument("--new", default=None, help="New catalog JSON (default: the profile catalog)")
+    src = ap.add_mutually_exclusive_group(required=True)
+    src.add_argument("--old", default=None, help="Old catalog JSON")
+    src.add_argument("--old-rev", default=None, help="Read the old catalog from this git revision of --new")
+    ap.add_argument("--out", default=None, help="Write the diff JSON here")
+    ap.add_argument("--json", action="store_true", help="Print the diff JSON instead of the text summary")
+    args = ap.parse_args(argv)
+
+    new_path = Path(args.new or "isa/v0.3/linxisa-v0.3.json")
+    new_data = new_path.read_bytes()
+    old_data = Path(args.old).read_bytes() if args.old else _git_show(args.old_rev, new_path)
+
+    d = diff_bytes(old_data, new_data)
+    doc = json.dumps(d.to_json(), indent=2, sort_keys=True) + "\n"
+    if args.out:
+        out = Path(args.out)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(doc, encoding="utf-8")
+    sys.stdout.write(doc if args.json else _render_text(d))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -9,16 +9,23 @@ The generated tables are intended as a low-friction bridge for:
 
 Outputs into `isa/generated/codecs/`:
   - linxisa_opcodes.h
-  - linxisa_opcodes.c
+  - linxisa_opcodes.c  (tables plus `linxisa_decode()`, a switch-based decision tree,
+                        `linxisa_decode16_table[]`, see linxisa/decode16.py, and
+                        `linxisa_field_extractors[]`, straight-line per-form field
+                        extraction)
+  - linxisa_catalog.h  (reader for the `.lxcat` binary catalog, see linxisa/lxcat.py)
 """
 
 from __future__ import annotations
 
 import argparse
-import json
 import os
 from typing import Any, Dict, List, Optional, Tuple
 
+from linxisa import decode16
+from linxisa.catalog import Catalog, load_catalog
+from linxisa.lxcat import render_c_header
+
 
 def _c_string(s: str) -> str:
     s = s.replace("\\", "\\\\")
@@ -43,85 +50,7 @@ def _normalize_spec_label(spec_path: str) -> str:
     return os.path.normpath(spec_path)
 
 
-def _pattern_to_mask_match(pattern: str) -> Tuple[int, int]:
-    # pattern is MSB->LSB with '0','1','.'
-    width_bits = len(pattern)
-    mask = 0
-    match = 0
-    for i, ch in enumerate(pattern):
-        bit = width_bits - 1 - i
-        if ch == ".":
-            continue
-        if ch not in ("0", "1"):
-            raise ValueError(f"invalid pattern char {ch!r}")
-        mask |= 1 << bit
-        if ch == "1":
-            match |= 1 << bit
-    return mask, match
-
-
-def _build_combined_encoding(inst: Dict[str, Any]) -> Tuple[int, str, Dict[str, Any]]:
-    """
-    Return (length_bits, pattern_msb_to_lsb, combined_fields_by_base).
-
-    For multi-part instructions, we treat the instruction as a single bit-vector with:
-      - part0 at bit offset 0 (first in stream)
-      - part1 at bit offset width(part0)
-    """
-    enc = inst.get("encoding", {})
-    parts: List[Dict[str, Any]] = list(enc.get("parts", []))
-
-    length_bits = int(enc.get("length_bits", inst.get("length_bits", 0)))
-    if not parts:
-        return length_bits, "." * length_bits, {}
-
-    offsets: List[int] = []
-    off = 0
-    for p in parts:
-        offsets.append(off)
-        off += int(p.get("width_bits", 0))
-
-    combined_pattern = "".join(
-        str(parts[i].get("pattern", "")).replace(" ", "") for i in reversed(range(len(parts)))
-    )
-    if len(combined_pattern) != length_bits:
-        combined_pattern = (("." * length_bits) + combined_pattern)[-length_bits:]
-
-    fields: Dict[str, Any] = {}
-    for part_index, part in enumerate(parts):
-        part_off = offsets[part_index]
-        for f in part.get("fields", []):
-            base = str(f.get("name", ""))
-            if not base:
-                continue
-            existing = fields.get(base)
-            if existing is None:
-                existing = {"name": base, "signed": f.get("signed", None), "pieces": []}
-                fields[base] = existing
-            if existing.get("signed") is None and f.get("signed") is not None:
-                existing["signed"] = f.get("signed")
-
-            for piece in f.get("pieces", []):
-                p = dict(piece)
-                p["insn_lsb"] = int(piece.get("insn_lsb", 0)) + part_off
-                p["insn_msb"] = int(piece.get("insn_msb", 0)) + part_off
-                existing["pieces"].append(p)
-
-    # Deterministic ordering: sort pieces by value slice (lsb), then insn bits.
-    for f in fields.values():
-        pieces = list(f.get("pieces", []))
-        pieces.sort(
-            key=lambda p: (
-                int(p.get("value_lsb", 0) if p.get("value_lsb") is not None else 0),
-                int(p.get("insn_lsb", 0)),
-            )
-        )
-        f["pieces"] = pieces
-
-    return length_bits, combined_pattern, fields
-
-
-def _render_header(spec_label: str) -> str:
+def _render_header(spec_label: str, max_fields: int) -> str:
     spec_label = os.path.normpath(spec_label)
     return "\n".join(
         [
@@ -168,53 +97,250 @@ def _render_header(spec_label: str) -> str:
             "extern const linxisa_field_piece linxisa_field_pieces[];",
             "extern const size_t linxisa_field_pieces_count;",
             "",
+            "/*",
+            " * Decode a packed instruction word (first part in the low bits) of the given",
+            " * length. Returns the linxisa_inst_forms[] index of the matching form with the",
+            " * most fixed bits (the first in table order on ties), or -1 if none matches.",
+            " * Form constraints are not checked. This is the result of a linear scan over",
+            " * linxisa_inst_forms[], found through a generated decision tree instead.",
+            " */",
+            "int linxisa_decode(uint64_t insn, unsigned length_bits);",
+            "",
+            "/*",
+            " * 16-bit direct-index decode: the linxisa_inst_forms[] index of every 16-bit",
+            " * word, with form constraints applied, or LINXISA_FORM_NONE.",
+            " */",
+            f"#define LINXISA_FORM_NONE 0x{decode16.NONE:04X}u",
+            f"extern const uint16_t linxisa_decode16_table[{decode16.SIZE}];",
+            "",
+            "static inline int linxisa_decode16_direct(uint16_t insn)",
+            "{",
+            "  uint16_t idx = linxisa_decode16_table[insn];",
+            "  return idx == LINXISA_FORM_NONE ? -1 : (int)idx;",
+            "}",
+            "",
+            "/*",
+            " * Per-form field extraction: linxisa_field_extractors[idx](insn, out) stores",
+            " * the values of form idx's fields in out[0 .. field_count), in",
+            " * linxisa_fields[field_start ..] order. Split immediates are reassembled and",
+            " * signed fields (signed_hint 1) sign-extended from bit_width; the result is",
+            " * the same as walking linxisa_field_pieces[], with the pieces folded into",
+            " * constant shifts and masks. out must hold LINXISA_MAX_FIELDS values.",
+            " */",
+            f"#define LINXISA_MAX_FIELDS {max_fields}",
+            "typedef void (*linxisa_extract_fn)(uint64_t insn, int64_t *out);",
+            "extern const linxisa_extract_fn linxisa_field_extractors[];",
+            "",
+            "static inline void linxisa_extract_fields(int idx, uint64_t insn, int64_t *out)",
+            "{",
+            "  linxisa_field_extractors[idx](insn, out);",
+            "}",
+            "",
         ]
     )
 
 
-def _emit_tables(spec: Dict[str, Any], spec_label: str) -> Tuple[str, str]:
-    insts = list(spec.get("instructions", []))
-    # Stable ordering.
-    insts.sort(key=lambda i: (str(i.get("mnemonic", "")), str(i.get("id", ""))))
+# Decision-tree leaves at or below this size are tested form by form.
+_DECODE_LEAF_FORMS = 2
+
+
+def _decode_tree(forms: List[Dict[str, Any]], idxs: Tuple[int, ...], used_mask: int) -> Any:
+    """
+    Build the decision tree for candidate forms `idxs` (in priority order).
+
+    Same construction as `LinxDecoder._compile` in linxdisasm.py: split on the
+    bits every candidate fixes, else on the single bit fixed by the most
+    candidates, replicating the forms that leave it free. Returns the leaf
+    tuple of form indices, or (split mask, {key: child}).
+    """
+    if len(idxs) <= _DECODE_LEAF_FORMS:
+        return idxs
+
+    common = ~used_mask
+    for i in idxs:
+        common &= forms[i]["mask"]
+    if common:
+        split_mask = common
+    else:
+        counts: Dict[int, int] = {}
+        for i in idxs:
+            free = forms[i]["mask"] & ~used_mask
+            while free:
+                low = free & -free
+                counts[low] = counts.get(low, 0) + 1
+                free ^= low
+        if not counts:
+            return idxs
+        split_mask = max(counts, key=lambda b: (counts[b], -b))
+
+    buckets: Dict[int, List[int]] = {}
+    wildcard: List[int] = []
+    for i in idxs:
+        if (forms[i]["mask"] & split_mask) == split_mask:
+            buckets.setdefault(forms[i]["match"] & split_mask, []).append(i)
+        else:
+            wildcard.append(i)
+    if wildcard:
+        # Only single-bit splits produce wildcards, so both keys are reachable.
+        order = {i: k for k, i in enumerate(idxs)}
+        for key in (0, split_mask):
+            bucket = buckets.setdefault(key, [])
+            bucket.extend(wildcard)
+            bucket.sort(key=order.__getitem__)
+        if all(len(b) == len(idxs) for b in buckets.values()):
+            return idxs
+
+    children = {key: _decode_tree(forms, tuple(b), used_mask | split_mask) for key, b in buckets.items()}
+    return split_mask, children
+
+
+def _is_inner(node: Any) -> bool:
+    return len(node) == 2 and isinstance(node[1], dict)
+
+
+def _emit_decode_node(node: Any, forms: List[Dict[str, Any]], width_bits: int, indent: str, out: List[str]) -> None:
+    digits = (width_bits + 3) // 4
+    if not _is_inner(node):
+        for i in node:
+            f = forms[i]
+            out.append(
+                f"{indent}if ((insn & 0x{f['mask']:0{digits}x}ULL) == 0x{f['match']:0{digits}x}ULL) "
+                f"return {i}; /* {f['mnemonic']} */"
+            )
+        out.append(f"{indent}return -1;")
+        return
+
+    split_mask, children = node
+    # Keys whose subtrees hold the same candidates share one case body.
+    bodies: Dict[Any, List[int]] = {}
+    for key in sorted(children):
+        bodies.setdefault(repr(children[key]), []).append(key)
+    out.append(f"{indent}switch (insn & 0x{split_mask:0{digits}x}ULL) {{")
+    for keys in sorted(bodies.values()):
+        for key in keys:
+            out.append(f"{indent}case 0x{key:0{digits}x}ULL:")
+        out.append(f"{indent}{{")
+        _emit_decode_node(children[keys[0]], forms, width_bits, indent + "  ", out)
+        out.append(f"{indent}}}")
+    out.append(f"{indent}default:")
+    out.append(f"{indent}  return -1;")
+    out.append(f"{indent}}}")
+
+
+def _emit_decoder(forms: List[Dict[str, Any]]) -> List[str]:
+    """C source for `linxisa_decode()`: one decision tree per instruction length."""
+    by_len: Dict[int, List[int]] = {}
+    for i, f in enumerate(forms):
+        by_len.setdefault(int(f["length_bits"]), []).append(i)
+
+    lines: List[str] = []
+    for length_bits in sorted(by_len):
+        # Most fixed bits first, then table order: the linear scan's winner comes first.
+        idxs = tuple(sorted(by_len[length_bits], key=lambda i: (-bin(forms[i]["mask"]).count("1"), i)))
+        lines.append(f"static int linxisa_decode{length_bits}(uint64_t insn)")
+        lines.append("{")
+        _emit_decode_node(_decode_tree(forms, idxs, 0), forms, length_bits, "  ", lines)
+        lines.append("}")
+        lines.append("")
+
+    lines.append("int linxisa_decode(uint64_t insn, unsigned length_bits)")
+    lines.append("{")
+    lines.append("  switch (length_bits) {")
+    for length_bits in sorted(by_len):
+        lines.append(f"  case {length_bits}:")
+        lines.append(f"    return linxisa_decode{length_bits}(insn);")
+    lines.append("  default:")
+    lines.append("    return -1;")
+    lines.append("  }")
+    lines.append("}")
+    lines.append("")
+    return lines
+
+
+def _piece_expr(p: Dict[str, Any]) -> str:
+    insn_lsb, width, value_lsb = int(p["insn_lsb"]), int(p["width"]), int(p["value_lsb"])
+    expr = f"(insn >> {insn_lsb})" if insn_lsb else "insn"
+    if insn_lsb + width < 64:
+        expr = f"({expr} & 0x{(1 << width) - 1:x}ULL)"
+    if value_lsb:
+        expr = f"({expr} << {value_lsb})"
+    return expr
+
+
+def _extract_stmt(k: int, f: Dict[str, Any], field_pieces: List[Dict[str, Any]]) -> str:
+    pieces = field_pieces[f["piece_start"] : f["piece_start"] + f["piece_count"]]
+    expr = " | ".join(_piece_expr(p) for p in pieces)
+    if len(pieces) != 1:
+        expr = f"({expr or 0})"
+    width = int(f["bit_width"])
+    if f["signed_hint"] == 1 and 0 < width < 64:
+        # Flip the sign bit and subtract it: two's-complement sign extension without shifts.
+        sign = 1 << (width - 1)
+        value = f"(int64_t)({expr} ^ 0x{sign:x}ULL) - 0x{sign:x}LL"
+    else:
+        value = f"(int64_t){expr}"
+    return f"  out[{k}] = {value}; /* {f['name']} */"
+
+
+def _emit_extractors(
+    forms: List[Dict[str, Any]], fields: List[Dict[str, Any]], field_pieces: List[Dict[str, Any]]
+) -> List[str]:
+    """C source for `linxisa_field_extractors[]`: one function per distinct field layout."""
+    bodies: Dict[Tuple[str, ...], int] = {}
+    form_fn: List[int] = []
+    lines: List[str] = []
+    for form in forms:
+        start = int(form["field_start"])
+        body = tuple(
+            _extract_stmt(k, f, field_pieces) for k, f in enumerate(fields[start : start + int(form["field_count"])])
+        )
+        n = bodies.get(body)
+        if n is None:
+            n = bodies[body] = len(bodies)
+            lines.append(f"static void linxisa_extract_{n}(uint64_t insn, int64_t *out)")
+            lines.append("{")
+            if not body:
+                lines.append("  (void)insn;")
+                lines.append("  (void)out;")
+            lines.extend(body)
+            lines.append("}")
+            lines.append("")
+        form_fn.append(n)
+
+    lines.append("const linxisa_extract_fn linxisa_field_extractors[] = {")
+    for form, n in zip(forms, form_fn):
+        lines.append(f"  linxisa_extract_{n}, /* {form['mnemonic']} */")
+    lines.append("};")
+    lines.append("")
+    return lines
+
+
+def _emit_tables(catalog: Catalog, spec_label: str) -> Tuple[str, str]:
+    # Stable ordering (shared with the 16-bit direct-index table).
+    insts = decode16.c_form_order(catalog)
 
     field_pieces: List[Dict[str, Any]] = []
     fields: List[Dict[str, Any]] = []
     forms: List[Dict[str, Any]] = []
 
     for inst in insts:
-        length_bits, pattern, combined_fields = _build_combined_encoding(inst)
-        mask, match = _pattern_to_mask_match(pattern)
-
         inst_field_start = len(fields)
 
-        for fname in sorted(combined_fields.keys()):
-            f = combined_fields[fname]
-            signed = f.get("signed", None)
+        for fname in sorted(inst.fields.keys()):
+            f = inst.fields[fname]
             signed_hint = -1
-            if signed is True:
+            if f.signed is True:
                 signed_hint = 1
-            elif signed is False:
+            elif f.signed is False:
                 signed_hint = 0
 
-            pieces = list(f.get("pieces", []))
-            if pieces:
-                # bit-width derives from value slice when present, otherwise piece width.
-                if all(p.get("value_msb") is not None for p in pieces):
-                    bit_width = max(int(p["value_msb"]) for p in pieces) + 1
-                else:
-                    bit_width = max(int(p.get("width", 0)) for p in pieces)
-            else:
-                bit_width = 0
-
             piece_start = len(field_pieces)
-            for p in pieces:
-                width = int(p.get("width", 0))
-                value_lsb = int(p.get("value_lsb", 0) if p.get("value_lsb") is not None else 0)
+            for p in f.pieces:
                 field_pieces.append(
                     {
-                        "insn_lsb": int(p.get("insn_lsb", 0)),
-                        "width": width,
-                        "value_lsb": value_lsb,
+                        "insn_lsb": p.insn_lsb,
+                        "width": p.width,
+                        "value_lsb": p.value_lsb,
                     }
                 )
 
@@ -222,27 +348,27 @@ def _emit_tables(spec: Dict[str, Any], spec_label: str) -> Tuple[str, str]:
                 {
                     "name": fname,
                     "signed_hint": signed_hint,
-                    "bit_width": bit_width,
+                    "bit_width": f.bit_width,
                     "piece_start": piece_start,
-                    "piece_count": len(pieces),
+                    "piece_count": len(f.pieces),
                 }
             )
 
         forms.append(
             {
-                "id": str(inst.get("id", "")),
-                "mnemonic": str(inst.get("mnemonic", "")),
-                "asm_fmt": str(inst.get("asm", "")) if inst.get("asm") is not None else "",
-                "length_bits": length_bits,
-                "mask": mask,
-                "match": match,
+                "id": inst.id,
+                "mnemonic": inst.mnemonic,
+                "asm_fmt": inst.asm,
+                "length_bits": inst.length_bits,
+                "mask": inst.mask,
+                "match": inst.match,
                 "field_start": inst_field_start,
                 "field_count": len(fields) - inst_field_start,
             }
         )
 
     # Header.
-    h = _render_header(spec_label)
+    h = _render_header(spec_label, max((int(f["field_count"]) for f in forms), default=0) or 1)
 
     # C source.
     c_lines: List[str] = []
@@ -301,6 +427,18 @@ def _emit_tables(spec: Dict[str, Any], spec_label: str) -> Tuple[str, str]:
     c_lines.append(f"const size_t linxisa_inst_forms_count = {len(forms)};")
     c_lines.append("")
 
+    c_lines.extend(_emit_decoder(forms))
+
+    table16 = decode16.build_table(catalog)
+    c_lines.append(f"const uint16_t linxisa_decode16_table[{decode16.SIZE}] = {{")
+    for base in range(0, decode16.SIZE, 16):
+        row = ", ".join(str(v) for v in table16[base : base + 16])
+        c_lines.append(f"  /* 0x{base:04x} */ {row},")
+    c_lines.append("};")
+    c_lines.append("")
+
+    c_lines.extend(_emit_extractors(forms, fields, field_pieces))
+
     return h + "\n", "\n".join(c_lines) + "\n"
 
 
@@ -319,7 +457,7 @@ def _write_if_different(path: str, content: str, check: bool) -> None:
         f.write(content)
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument(
         "--profile",
@@ -330,22 +468,23 @@ def main() -> int:
     ap.add_argument("--spec", default=None, help="Path to the ISA spec JSON")
     ap.add_argument("--out-dir", default="isa/generated/codecs", help="Output directory")
     ap.add_argument("--check", action="store_true", help="Fail if outputs are not up-to-date")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     default_spec = "isa/v0.3/linxisa-v0.3.json"
     spec_path = args.spec or default_spec
 
-    with open(spec_path, "r", encoding="utf-8") as f:
-        spec = json.load(f)
-    spec_label = os.path.normpath(str(spec.get("_spec_path") or _normalize_spec_label(spec_path)))
+    catalog = load_catalog(spec_path)
+    spec_label = os.path.normpath(str(catalog.spec_path or _normalize_spec_label(spec_path)))
 
-    header, source = _emit_tables(spec, spec_label)
+    header, source = _emit_tables(catalog, spec_label)
 
     out_h = os.path.join(args.out_dir, "linxisa_opcodes.h")
     out_c = os.path.join(args.out_dir, "linxisa_opcodes.c")
+    out_cat = os.path.join(args.out_dir, "linxisa_catalog.h")
 
     _write_if_different(out_h, header, check=args.check)
     _write_if_different(out_c, source, check=args.check)
+    _write_if_different(out_cat, render_c_header(), check=args.check)
 
     if args.check:
         print("OK")
@@ -18,7 +18,9 @@ import json
 import os
 import re
 from collections import OrderedDict
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from linxisa.diff import DiffSummary
 
 # Color scheme for different field types
 COLORS = {
@@ -390,10 +392,45 @@ def generate_encoding_table_svg(inst: Dict[str, Any], total_bits: int = 32) -> s
     return '\n'.join(svg_lines)
 
 
-def generate_all_svg(spec: Dict[str, Any], out_dir: str) -> Dict[str, str]:
+def _svg_safe_name(mnemonic: str) -> str:
+    return re.sub(r'[^a-zA-Z0-9]', '_', mnemonic.lower())
+
+
+def _prune_svgs(out_dir: str, safe_names: Set[str], counts: Dict[str, int]) -> int:
+    """Delete SVGs of `safe_names` that a full run would no longer write.
+
+    `counts` maps each safe name still in the spec to its number of forms
+    (main diagram plus `_var{i}` files). Returns the number of files removed.
+    """
+    removed = 0
+    for name in sorted(os.listdir(out_dir)):
+        for safe in safe_names:
+            if not name.startswith(f"enc_{safe}"):
+                continue
+            if name == f"enc_{safe}.svg":
+                stale = safe not in counts
+            else:
+                m = re.fullmatch(rf"enc_{re.escape(safe)}_var(\d+)\.svg", name)
+                # `enc_x_var1.svg` may also be the main diagram of mnemonic `X_VAR1`.
+                stale = bool(m) and int(m.group(1)) >= counts.get(safe, 0) and name[4:-4] not in counts
+            if stale:
+                os.remove(os.path.join(out_dir, name))
+                removed += 1
+                break
+    return removed
+
+
+def generate_all_svg(
+    spec: Dict[str, Any], out_dir: str, mnemonics_only: Optional[Set[str]] = None
+) -> Dict[str, str]:
     """Generate SVG encoding diagrams for all instructions in the spec.
     
-    Returns a dictionary mapping instruction IDs to SVG content.
+    With `mnemonics_only` (e.g. the affected mnemonics of a catalog diff), only
+    the diagrams of those mnemonics are rewritten, and their files that a full
+    run would no longer produce (removed mnemonics, dropped variants) are
+    deleted, so the directory ends up as a full run would leave it.
+
+    Returns a dictionary mapping mnemonics to the SVG file written.
     """
     
     instructions = spec.get('instructions', [])
@@ -406,10 +443,20 @@ def generate_all_svg(spec: Dict[str, Any], out_dir: str) -> Dict[str, str]:
         if mnem not in mnemonics:
             mnemonics[mnem] = []
         mnemonics[mnem].append(inst)
-    
-    print(f"Generating SVGs for {len(mnemonics)} unique mnemonics...")
+
+    selected: Optional[Set[str]] = None
+    if mnemonics_only is not None:
+        # Mnemonics that differ only in punctuation share files; rewrite all of them.
+        selected = {_svg_safe_name(m) for m in mnemonics_only}
+        print(f"Regenerating SVGs for {len(mnemonics_only)} affected mnemonics...")
+    else:
+        print(f"Generating SVGs for {len(mnemonics)} unique mnemonics...")
     
     for mnemonic, insts in mnemonics.items():
+        safe_name = _svg_safe_name(mnemonic)
+        if selected is not None and safe_name not in selected:
+            continue
+
         # Use the first variant for the main SVG (most common case)
         inst = insts[0]
         inst_id = inst.get('id', mnemonic.lower())
@@ -419,7 +466,6 @@ def generate_all_svg(spec: Dict[str, Any], out_dir: str) -> Dict[str, str]:
         svg_content = generate_encoding_table_svg(inst, length_bits)
         
         # Save SVG file
-        safe_name = re.sub(r'[^a-zA-Z0-9]', '_', mnemonic.lower())
         filename = f"enc_{safe_name}.svg"
         filepath = os.path.join(out_dir, filename)
         
@@ -440,6 +486,15 @@ def generate_all_svg(spec: Dict[str, Any], out_dir: str) -> Dict[str, str]:
                 
                 with open(var_filepath, 'w', encoding='utf-8') as f:
                     f.write(var_svg)
+
+    if selected is not None:
+        counts: Dict[str, int] = {}
+        for mnemonic, insts in mnemonics.items():
+            safe_name = _svg_safe_name(mnemonic)
+            counts[safe_name] = max(counts.get(safe_name, 0), len(insts))
+        removed = _prune_svgs(out_dir, selected, counts)
+        if removed:
+            print(f"Removed {removed} stale SVG files from {out_dir}")
     
     print(f"Generated {len(svg_map)} SVG files in {out_dir}")
     
@@ -458,16 +513,28 @@ def main(argv: Optional[List[str]] = None) -> int:
         default="docs/architecture/isa-manual/src/generated/encodings",
         help="Output directory for SVG files"
     )
+    ap.add_argument(
+        "--diff",
+        default=None,
+        help="Catalog diff JSON (diff_catalog.py --out); only rewrite the affected mnemonics' SVGs"
+    )
     args = ap.parse_args(args=argv)
     
     # Read the spec
     spec = _read_json(args.spec)
+
+    mnemonics_only: Optional[Set[str]] = None
+    if args.diff:
+        diff = DiffSummary.load(args.diff)
+        if not diff.matches(args.spec):
+            raise SystemExit(f"error: {args.diff} was not computed against {args.spec}")
+        mnemonics_only = diff.mnemonics
     
     # Create output directory
     _mkdirp(args.out_dir)
     
     # Generate SVGs
-    svg_map = generate_all_svg(spec, args.out_dir)
+    svg_map = generate_all_svg(spec, args.out_dir, mnemonics_only)
     
     # Print summary
     print(f"\nGenerated encoding SVGs for {len(svg_map)} instructions")
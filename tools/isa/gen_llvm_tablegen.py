@@ -11,6 +11,7 @@ from __future__ import annotations
 import argparse
 import json
 import re
+import sys
 from collections import defaultdict
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
@@ -217,7 +218,7 @@ def _generate_tablegen_file(spec: Dict[str, Any], output_path: Path) -> None:
     print(f'Generated {output_path} with {len(instructions)} instructions')
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     parser = argparse.ArgumentParser(
         description='Generate LLVM TableGen instruction definitions from ISA spec'
     )
@@ -234,7 +235,7 @@ def main() -> int:
         help='Output TableGen file path'
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not args.spec.exists():
         print(f'Error: spec file not found: {args.spec}', file=sys.stderr)
@@ -248,5 +249,4 @@ def main() -> int:
 
 
 if __name__ == '__main__':
-    import sys
     sys.exit(main())
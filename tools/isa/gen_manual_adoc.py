@@ -12,6 +12,9 @@ Outputs (into an output directory, typically `docs/architecture/isa-manual/src/g
   - mnemonic_index.adoc
   - instruction_reference.adoc
   - instruction_details.adoc
+
+With `--diff` (from `diff_catalog.py --out`), only the outputs and per-group sections the catalog diff
+touches are re-rendered; the rest is carried over from the existing files.
 """
 
 from __future__ import annotations
@@ -22,7 +25,10 @@ import os
 import re
 import tempfile
 from collections import Counter, OrderedDict
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from linxisa.diff import DiffSummary
 
 def _read_json(path: str) -> Dict[str, Any]:
     with open(path, "r", encoding="utf-8") as f:
@@ -945,185 +951,272 @@ def _write_instruction_group_summary(groups: "OrderedDict[str, List[Dict[str, An
         f.write("\n".join(lines))
 
 
-def _write_instruction_reference(groups: "OrderedDict[str, List[Dict[str, Any]]]", out_path: str) -> None:
-    lines: List[str] = []
-    lines.append("// Generated file; do not edit by hand.")
-    lines.append("")
-
-    used_anchors: set[str] = set()
-    for group, insts in groups.items():
-        base_anchor = re.sub(r"[^a-z0-9]+", "-", group.strip().lower()).strip("-")
-        if not base_anchor:
-            base_anchor = "group"
+def _unique_anchors(groups: Iterable[str], base: Callable[[str], str]) -> List[str]:
+    used: set[str] = set()
+    out: List[str] = []
+    for group in groups:
+        base_anchor = base(group)
         anchor = base_anchor
         suffix = 2
-        while anchor in used_anchors:
+        while anchor in used:
             anchor = f"{base_anchor}-{suffix}"
             suffix += 1
-        used_anchors.add(anchor)
-        lines.append(f"[[insnref-{anchor}]]")
-        lines.append(f"=== {group}")
-        lines.append("")
-        lines.append('[cols="1,1,2,4,6",options="header"]')
-        lines.append("|===")
-        lines.append("|Mnemonic |Len |Decode |Assembly |Notes")
-
-        for inst in insts:
-            mnem = str(inst.get("mnemonic", "")).strip()
-            asm = str(inst.get("asm") or "").strip()
-            note = str(inst.get("note") or "").strip()
-            length = int(inst.get("length_bits", 0))
-            decode = _decode_tag(inst)
-
-            asm = _fixup_asm_for_docs(mnem, asm)
-            asm = _normalize_asm(asm) if asm else ""
-            note = _translate_note(note)
-            note = _collapse_ws(note) if note else ""
-
-            mnem_cell = f"`{_escape_table_cell(mnem)}`" if mnem else "-"
-            asm_cell = f"`{_escape_table_cell(asm)}`" if asm else "-"
-            note_cell = _escape_table_cell(note) if note else "-"
-            decode_cell = _escape_table_cell(decode)
-
-            lines.append(f"|{mnem_cell} |{length} |{decode_cell} |{asm_cell} |{note_cell}")
-
-        lines.append("|===")
-        lines.append("")
+        used.add(anchor)
+        out.append(anchor)
+    return out
+
+
+def _split_sections(
+    out_path: str, header_text: str, leads: List[str], heading_re: str, headings: List[str]
+) -> Optional[List[str]]:
+    """
+    Cut an existing generated file into its per-group sections.
+
+    `leads` are the first lines of each section in order. Returns None unless
+    the file starts with `header_text` and its group headings (`heading_re`
+    lines) are exactly `headings`, i.e. it holds the same groups in the same
+    order.
+    """
+    try:
+        with open(out_path, "r", encoding="utf-8") as f:
+            text = f.read()
+    except OSError:
+        return None
+    if not text.startswith(header_text + "\n"):
+        return None
+    if re.findall(heading_re, text[len(header_text):]) != headings:
+        return None
+    starts: List[int] = []
+    pos = len(header_text)
+    for lead in leads:
+        pos = text.find("\n" + lead, pos)
+        if pos < 0:
+            return None
+        starts.append(pos + 1)
+    ends = [p - 1 for p in starts[1:]] + [len(text)]
+    return [text[s:e] for s, e in zip(starts, ends)]
+
+
+def _write_sections(
+    out_path: str,
+    header: List[str],
+    sections: List[Tuple[str, List[str], Callable[[], List[str]]]],
+    heading_re: str,
+    only_groups: Optional[set[str]] = None,
+) -> None:
+    """
+    Write `header` followed by one section per group: (group, first two lines, renderer).
+
+    With `only_groups`, the sections of other groups are copied from the existing file instead of being
+    re-rendered; if that file does not hold the same groups in the same order, every section is rendered.
+    """
+    header_text = "\n".join(header)
+    kept: Optional[List[str]] = None
+    if only_groups is not None:
+        kept = _split_sections(
+            out_path,
+            header_text,
+            ["\n".join(lead) + "\n" for _, lead, _ in sections],
+            heading_re,
+            [lead[1] for _, lead, _ in sections],
+        )
+    chunks = [header_text]
+    for i, (group, _, render) in enumerate(sections):
+        if kept is not None and only_groups is not None and group not in only_groups:
+            chunks.append(kept[i])
+        else:
+            chunks.append("\n".join(render()))
 
     _mkdirp(os.path.dirname(out_path))
     with open(out_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+        f.write("\n".join(chunks))
 
 
-def _write_instruction_details(
-    groups: "OrderedDict[str, List[Dict[str, Any]]]", out_path: str, spec_version: str,
-    svg_dir: Optional[str] = None
-) -> None:
+def _reference_anchor_base(group: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", group.strip().lower()).strip("-") or "group"
+
+
+def _instruction_reference_section(group: str, insts: List[Dict[str, Any]], anchor: str) -> List[str]:
     lines: List[str] = []
-    lines.append("// Generated file; do not edit by hand.")
+    lines.append(f"[[insnref-{anchor}]]")
+    lines.append(f"=== {group}")
     lines.append("")
-    lines.append("[[insnref-details]]")
-    lines.append("=== Instruction descriptions (by mnemonic)")
-    lines.append("")
-    lines.append(
-        "This section provides per-mnemonic descriptions. The tables above remain the authoritative listing of encodable "
-        f"forms and decode layouts in the v{spec_version} catalog. Descriptions and pseudocode here are derived from mnemonic naming "
-        "conventions plus catalog assembly templates/notes and are intended to be *informative*."
-    )
+    lines.append('[cols="1,1,2,4,6",options="header"]')
+    lines.append("|===")
+    lines.append("|Mnemonic |Len |Decode |Assembly |Notes")
+
+    for inst in insts:
+        mnem = str(inst.get("mnemonic", "")).strip()
+        asm = str(inst.get("asm") or "").strip()
+        note = str(inst.get("note") or "").strip()
+        length = int(inst.get("length_bits", 0))
+        decode = _decode_tag(inst)
+
+        asm = _fixup_asm_for_docs(mnem, asm)
+        asm = _normalize_asm(asm) if asm else ""
+        note = _translate_note(note)
+        note = _collapse_ws(note) if note else ""
+
+        mnem_cell = f"`{_escape_table_cell(mnem)}`" if mnem else "-"
+        asm_cell = f"`{_escape_table_cell(asm)}`" if asm else "-"
+        note_cell = _escape_table_cell(note) if note else "-"
+        decode_cell = _escape_table_cell(decode)
+
+        lines.append(f"|{mnem_cell} |{length} |{decode_cell} |{asm_cell} |{note_cell}")
+
+    lines.append("|===")
     lines.append("")
+    return lines
+
+
+def _write_instruction_reference(
+    groups: "OrderedDict[str, List[Dict[str, Any]]]", out_path: str, only_groups: Optional[set[str]] = None
+) -> None:
+    header = ["// Generated file; do not edit by hand.", ""]
+    anchors = _unique_anchors(groups, _reference_anchor_base)
+    sections = [
+        (
+            group,
+            [f"[[insnref-{anchor}]]", f"=== {group}"],
+            lambda group=group, insts=insts, anchor=anchor: _instruction_reference_section(group, insts, anchor),
+        )
+        for (group, insts), anchor in zip(groups.items(), anchors)
+    ]
+    _write_sections(out_path, header, sections, r"(?m)^=== .*$", only_groups)
 
-    used_group_anchors: set[str] = set()
-    for group, insts in groups.items():
-        base_group_anchor = _anchorize(group)
-        group_anchor = base_group_anchor
-        suffix = 2
-        while group_anchor in used_group_anchors:
-            group_anchor = f"{base_group_anchor}-{suffix}"
-            suffix += 1
-        used_group_anchors.add(group_anchor)
 
-        # Group header (level 4 so it appears in the ToC; mnemonics are level 5 so they do not).
-        lines.append(f"[[insndesc-{group_anchor}]]")
-        lines.append(f"==== {group}")
+def _instruction_details_section(
+    group: str, insts: List[Dict[str, Any]], group_anchor: str, svg_dir: Optional[str]
+) -> List[str]:
+    lines: List[str] = []
+    # Group header (level 4 so it appears in the ToC; mnemonics are level 5 so they do not).
+    lines.append(f"[[insndesc-{group_anchor}]]")
+    lines.append(f"==== {group}")
+    lines.append("")
+
+    # Preserve mnemonic first-seen order within the group.
+    m2: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+    for inst in insts:
+        m = str(inst.get("mnemonic") or "").strip()
+        if not m:
+            continue
+        m2.setdefault(m, []).append(inst)
+
+    for mnemonic, forms in m2.items():
+        asm_forms: List[str] = []
+        seen_asm: set[str] = set()
+        lengths: List[int] = []
+        decodes: List[str] = []
+        for inst in forms:
+            a = str(inst.get("asm") or "").strip()
+            a = _fixup_asm_for_docs(mnemonic, a)
+            a = _normalize_asm(a) if a else ""
+            if a and a not in seen_asm:
+                seen_asm.add(a)
+                asm_forms.append(a)
+            l = int(inst.get("length_bits", 0))
+            if l and l not in lengths:
+                lengths.append(l)
+            d = _decode_tag(inst)
+            if d and d not in decodes:
+                decodes.append(d)
+
+        lengths_s = ", ".join(str(x) for x in sorted(lengths)) if lengths else "?"
+        forms_count = len(forms)
+
+        expls = _collect_part_explains(forms)
+        notes = _collect_notes(forms)
+        op_lines = _infer_operation_pseudocode(group, mnemonic, asm_forms, notes)
+
+        m_anchor = _anchorize(f"{group_anchor}-{mnemonic}")
+        lines.append(f"[[insndesc-{m_anchor}]]")
+        lines.append(f"===== {mnemonic}")
         lines.append("")
+        lines.append(f"{_describe_mnemonic(group, mnemonic, asm_forms)}")
+        lines.append("")
+        lines.append(f"Catalog forms:: {forms_count} form(s) ({lengths_s} bits).")
+        if decodes and any(d != "-" for d in decodes):
+            dec_s = ", ".join(_escape_table_cell(d) for d in decodes if d and d != "-")
+            if dec_s:
+                lines.append(f"Decode tags:: {dec_s}.")
 
-        # Preserve mnemonic first-seen order within the group.
-        m2: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
-        for inst in insts:
-            m = str(inst.get("mnemonic") or "").strip()
-            if not m:
-                continue
-            m2.setdefault(m, []).append(inst)
-
-        for mnemonic, forms in m2.items():
-            asm_forms: List[str] = []
-            seen_asm: set[str] = set()
-            lengths: List[int] = []
-            decodes: List[str] = []
-            for inst in forms:
-                a = str(inst.get("asm") or "").strip()
-                a = _fixup_asm_for_docs(mnemonic, a)
-                a = _normalize_asm(a) if a else ""
-                if a and a not in seen_asm:
-                    seen_asm.add(a)
-                    asm_forms.append(a)
-                l = int(inst.get("length_bits", 0))
-                if l and l not in lengths:
-                    lengths.append(l)
-                d = _decode_tag(inst)
-                if d and d not in decodes:
-                    decodes.append(d)
-
-            lengths_s = ", ".join(str(x) for x in sorted(lengths)) if lengths else "?"
-            forms_count = len(forms)
-
-            expls = _collect_part_explains(forms)
-            notes = _collect_notes(forms)
-            op_lines = _infer_operation_pseudocode(group, mnemonic, asm_forms, notes)
-
-            m_anchor = _anchorize(f"{group_anchor}-{mnemonic}")
-            lines.append(f"[[insndesc-{m_anchor}]]")
-            lines.append(f"===== {mnemonic}")
+        if expls:
             lines.append("")
-            lines.append(f"{_describe_mnemonic(group, mnemonic, asm_forms)}")
-            lines.append("")
-            lines.append(f"Catalog forms:: {forms_count} form(s) ({lengths_s} bits).")
-            if decodes and any(d != "-" for d in decodes):
-                dec_s = ", ".join(_escape_table_cell(d) for d in decodes if d and d != "-")
-                if dec_s:
-                    lines.append(f"Decode tags:: {dec_s}.")
+            lines.append("Notes (informative)::")
+            lines.append("+")
+            for ex in expls:
+                lines.append(f"* {_escape_table_cell(ex)}")
 
-            if expls:
-                lines.append("")
-                lines.append("Notes (informative)::")
-                lines.append("+")
-                for ex in expls:
-                    lines.append(f"* {_escape_table_cell(ex)}")
-
-            if asm_forms:
+        if asm_forms:
+            lines.append("")
+            lines.append("Assembly forms::")
+            lines.append("+")
+            for a in asm_forms:
+                lines.append(f"* `{_escape_table_cell(a)}`")
+
+        # Embed encoding SVG if available
+        if svg_dir:
+            svg_filename = f"enc_{mnemonic.lower()}.svg"
+            svg_path = os.path.join(svg_dir, svg_filename)
+            if os.path.exists(svg_path):
+                # IMPORTANT: AsciiDoc image:: paths must be POSIX-style (forward slashes)
+                # even when generating on Windows.
+                rel_path = f"encodings/{svg_filename}"
                 lines.append("")
-                lines.append("Assembly forms::")
+                lines.append("Encoding::")
                 lines.append("+")
-                for a in asm_forms:
-                    lines.append(f"* `{_escape_table_cell(a)}`")
-
-            # Embed encoding SVG if available
-            if svg_dir:
-                svg_filename = f"enc_{mnemonic.lower()}.svg"
-                svg_path = os.path.join(svg_dir, svg_filename)
-                if os.path.exists(svg_path):
-                    # IMPORTANT: AsciiDoc image:: paths must be POSIX-style (forward slashes)
-                    # even when generating on Windows.
-                    rel_path = f"encodings/{svg_filename}"
-                    lines.append("")
-                    lines.append("Encoding::")
-                    lines.append("+")
-                    lines.append(f"image::{rel_path}[{mnemonic} encoding diagram,align=\"center\"]")
-                    lines.append("")
-
-            if notes:
+                lines.append(f"image::{rel_path}[{mnemonic} encoding diagram,align=\"center\"]")
                 lines.append("")
-                lines.append("Encoding notes (informative)::")
-                lines.append("+")
-                for n in notes:
-                    lines.append(f"* {_escape_table_cell(n)}")
 
-            if op_lines:
-                lines.append("")
-                lines.append("Operation (informative)::")
-                lines.append("+")
-                lines.append("[source]")
-                lines.append("----")
-                for l in op_lines:
-                    if l.strip():
-                        lines.append(l)
-                lines.append("----")
+        if notes:
+            lines.append("")
+            lines.append("Encoding notes (informative)::")
+            lines.append("+")
+            for n in notes:
+                lines.append(f"* {_escape_table_cell(n)}")
 
+        if op_lines:
             lines.append("")
+            lines.append("Operation (informative)::")
+            lines.append("+")
+            lines.append("[source]")
+            lines.append("----")
+            for l in op_lines:
+                if l.strip():
+                    lines.append(l)
+            lines.append("----")
 
-    _mkdirp(os.path.dirname(out_path))
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+        lines.append("")
+    return lines
+
+
+def _write_instruction_details(
+    groups: "OrderedDict[str, List[Dict[str, Any]]]", out_path: str, spec_version: str,
+    svg_dir: Optional[str] = None, only_groups: Optional[set[str]] = None
+) -> None:
+    lines: List[str] = []
+    lines.append("// Generated file; do not edit by hand.")
+    lines.append("")
+    lines.append("[[insnref-details]]")
+    lines.append("=== Instruction descriptions (by mnemonic)")
+    lines.append("")
+    lines.append(
+        "This section provides per-mnemonic descriptions. The tables above remain the authoritative listing of encodable "
+        f"forms and decode layouts in the v{spec_version} catalog. Descriptions and pseudocode here are derived from mnemonic naming "
+        "conventions plus catalog assembly templates/notes and are intended to be *informative*."
+    )
+    lines.append("")
+
+    anchors = _unique_anchors(groups, _anchorize)
+    sections = [
+        (
+            group,
+            [f"[[insndesc-{anchor}]]", f"==== {group}"],
+            lambda group=group, insts=insts, anchor=anchor: _instruction_details_section(group, insts, anchor, svg_dir),
+        )
+        for (group, insts), anchor in zip(groups.items(), anchors)
+    ]
+    _write_sections(out_path, lines, sections, r"(?m)^==== .*$", only_groups)
 
 def _write_mnemonic_index(instructions: List[Dict[str, Any]], out_path: str, spec_version: str) -> None:
     """
@@ -1201,7 +1294,14 @@ def main(argv: Optional[List[str]] = None) -> int:
         help="Directory containing SVG encoding diagrams",
     )
     ap.add_argument("--check", action="store_true", help="Fail if outputs are not up-to-date")
+    ap.add_argument(
+        "--diff",
+        default=None,
+        help="Catalog diff JSON (diff_catalog.py --out); only rewrite outputs and group sections it affects",
+    )
     args = ap.parse_args(argv)
+    if args.check and args.diff:
+        ap.error("--diff cannot be combined with --check")
 
     spec_path = args.spec or "isa/v0.3/linxisa-v0.3.json"
     spec = _read_json(spec_path)
@@ -1222,13 +1322,30 @@ def main(argv: Optional[List[str]] = None) -> int:
         "instruction_details.adoc",
     ]
 
-    def _emit(out_dir: str, svg_dir: str) -> None:
+    def _emit(out_dir: str, svg_dir: str, diff: Optional[DiffSummary] = None) -> None:
         _mkdirp(out_dir)
-        _write_registers_reg5(spec, os.path.join(out_dir, "registers_reg5.adoc"), source_comment)
-        _write_instruction_group_summary(groups, os.path.join(out_dir, "instruction_group_summary.adoc"))
-        _write_instruction_reference(groups, os.path.join(out_dir, "instruction_reference.adoc"))
-        _write_mnemonic_index(instructions, os.path.join(out_dir, "mnemonic_index.adoc"), spec_version)
-        _write_instruction_details(groups, os.path.join(out_dir, "instruction_details.adoc"), spec_version, svg_dir)
+
+        def _stale(name: str, *keys: str, membership: bool = False) -> bool:
+            if diff is None or not os.path.exists(os.path.join(out_dir, name)):
+                return True
+            return bool(diff.keys_changed.intersection(keys)) or (membership and diff.membership_changed)
+
+        # Sections of groups the diff does not touch are carried over from the existing files.
+        only_groups = None if diff is None else {g or "Ungrouped" for g in diff.groups}
+
+        reg_path = os.path.join(out_dir, "registers_reg5.adoc")
+        if _stale("registers_reg5.adoc", "registers", "generated_on", "version") or source_comment not in Path(
+            reg_path
+        ).read_text(encoding="utf-8"):
+            _write_registers_reg5(spec, reg_path, source_comment)
+        if _stale("instruction_group_summary.adoc", membership=True):
+            _write_instruction_group_summary(groups, os.path.join(out_dir, "instruction_group_summary.adoc"))
+        _write_instruction_reference(groups, os.path.join(out_dir, "instruction_reference.adoc"), only_groups)
+        if _stale("mnemonic_index.adoc", "version", membership=True):
+            _write_mnemonic_index(instructions, os.path.join(out_dir, "mnemonic_index.adoc"), spec_version)
+        _write_instruction_details(
+            groups, os.path.join(out_dir, "instruction_details.adoc"), spec_version, svg_dir, only_groups
+        )
 
     if args.check:
         out_dir = args.out_dir
@@ -1246,7 +1363,12 @@ def main(argv: Optional[List[str]] = None) -> int:
         print("OK")
         return 0
 
-    _emit(args.out_dir, args.svg_dir)
+    diff: Optional[DiffSummary] = None
+    if args.diff:
+        diff = DiffSummary.load(args.diff)
+        if not diff.matches(spec_path):
+            raise SystemExit(f"error: {args.diff} was not computed against {spec_path}")
+    _emit(args.out_dir, args.svg_dir, diff)
 
     return 0
 
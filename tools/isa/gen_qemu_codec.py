@@ -22,12 +22,14 @@ from __future__ import annotations
 
 import argparse
 import dataclasses
-import json
 import os
 import re
 import tempfile
 from collections import defaultdict
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+
+from linxisa.catalog import FieldPiece, Instruction, load_catalog
+from linxisa.encoding import mask_match_to_pattern
 
 
 _IDENT_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
@@ -78,26 +80,13 @@ def _normalize_spec_label(spec_path: str) -> str:
     return os.path.normpath(spec_path)
 
 
-@dataclasses.dataclass(frozen=True)
-class Piece:
-    insn_lsb: int
-    width: int
-    value_msb: Optional[int] = None
-    value_lsb: Optional[int] = None
-    token: Optional[str] = None
-
-    @property
-    def insn_msb(self) -> int:
-        return self.insn_lsb + self.width - 1
-
-
 @dataclasses.dataclass
 class Field:
     base: str
     signed: Optional[bool]
-    pieces: List[Piece]
+    pieces: List[FieldPiece]
 
-    def sorted_pieces_msb_to_lsb(self) -> List[Piece]:
+    def sorted_pieces_msb_to_lsb(self) -> List[FieldPiece]:
         # Prefer explicit value-bit slice ordering if present.
         if all(p.value_msb is not None for p in self.pieces):
             return sorted(self.pieces, key=lambda p: int(p.value_msb), reverse=True)
@@ -123,37 +112,23 @@ class FieldSignature:
         return "__".join(parts) if parts else "empty"
 
 
-def _build_combined_encoding(inst: Dict[str, Any]) -> Tuple[int, str, Dict[str, Field]]:
+def _build_combined_encoding(inst: Instruction) -> Tuple[int, str, Dict[str, Field]]:
     """
     Return (length_bits, pattern_msb_to_lsb, fields_by_base).
 
-    For multi-part instructions (e.g. 64-bit forms as 2x32 parts), we treat the
-    instruction as a single bit-vector with:
-      - part0 at bit offset 0 (first in stream)
-      - part1 at bit offset width(part0)
-      - etc
-    This matches little-endian packing if the instruction words are loaded into
-    an integer with the first word as the low bits.
+    Multi-part instructions (e.g. 64-bit forms as 2x32 parts) are treated as a
+    single bit-vector with part0 in the low bits (first in stream), matching the
+    packed view of `linxisa.catalog`. Fields are merged by their decodetree
+    identifier, so names that differ only in punctuation share one field.
     """
 
-    enc = inst.get("encoding", {})
-    parts: List[Dict[str, Any]] = list(enc.get("parts", []))
-
-    length_bits = int(enc.get("length_bits", inst.get("length_bits", 0)))
-    if not parts:
+    length_bits = inst.length_bits
+    if not inst.parts:
         return length_bits, "." * length_bits, {}
 
-    # Stream-order offsets (part0 is first word in memory stream).
-    offsets: List[int] = []
-    off = 0
-    for p in parts:
-        offsets.append(off)
-        off += int(p.get("width_bits", 0))
-
     # Combined pattern: MSB->LSB, so reverse stream order when concatenating.
     combined_pattern = "".join(
-        str(parts[i].get("pattern", "")).replace(" ", "")
-        for i in reversed(range(len(parts)))
+        mask_match_to_pattern(p.mask, p.match, p.width_bits) for p in reversed(inst.parts)
     )
     if len(combined_pattern) != length_bits:
         # Fall back to best-effort padding.
@@ -161,31 +136,25 @@ def _build_combined_encoding(inst: Dict[str, Any]) -> Tuple[int, str, Dict[str,
 
     fields_by_base: Dict[str, Field] = {}
 
-    for part_index, part in enumerate(parts):
-        part_off = offsets[part_index]
-        for f in part.get("fields", []):
-            base = _to_ident(str(f.get("name", "")))
-            signed = f.get("signed", None)
+    for part in inst.parts:
+        for name, f in part.fields.items():
+            base = _to_ident(name)
             field = fields_by_base.get(base)
             if field is None:
-                field = Field(base=base, signed=signed, pieces=[])
+                field = Field(base=base, signed=f.signed, pieces=[])
                 fields_by_base[base] = field
             # Preserve signed hint if any part marks it as signed/unsigned.
-            if field.signed is None and signed is not None:
-                field.signed = signed
-
-            for piece in f.get("pieces", []):
-                insn_lsb = int(piece.get("insn_lsb", 0)) + part_off
-                width = int(piece.get("width", 0))
-                vp_msb = piece.get("value_msb")
-                vp_lsb = piece.get("value_lsb")
+            if field.signed is None and f.signed is not None:
+                field.signed = f.signed
+
+            for piece in f.pieces:
                 field.pieces.append(
-                    Piece(
-                        insn_lsb=insn_lsb,
-                        width=width,
-                        value_msb=int(vp_msb) if vp_msb is not None else None,
-                        value_lsb=int(vp_lsb) if vp_lsb is not None else None,
-                        token=str(piece.get("token", "")) if piece.get("token") is not None else None,
+                    FieldPiece(
+                        insn_lsb=piece.insn_lsb + part.offset,
+                        insn_msb=piece.insn_msb + part.offset,
+                        width=piece.width,
+                        value_lsb=piece.value_lsb,
+                        value_msb=piece.value_msb,
                     )
                 )
 
@@ -232,10 +201,8 @@ def _choose_field_def_names(
     return chosen
 
 
-def _generate_decode_file(
-    instructions: List[Dict[str, Any]], out_path: str, spec_label: str
-) -> None:
-    inst_encodings: List[Tuple[Dict[str, Any], int, str, Dict[str, Field]]] = []
+def _generate_decode_file(instructions: List[Instruction], out_path: str, spec_label: str) -> None:
+    inst_encodings: List[Tuple[Instruction, int, str, Dict[str, Field]]] = []
 
     for inst in instructions:
         length_bits, pattern, fields_by_base = _build_combined_encoding(inst)
@@ -276,20 +243,15 @@ def _generate_decode_file(
     # Instruction patterns.
     lines.append("# Instruction forms")
     # Stable ordering: by mnemonic, then by id.
-    inst_encodings.sort(key=lambda t: (str(t[0].get("mnemonic", "")), str(t[0].get("id", ""))))
+    inst_encodings.sort(key=lambda t: (t[0].mnemonic, t[0].id))
 
     for inst, length_bits, pattern, fields_by_base in inst_encodings:
-        inst_id = _to_ident(str(inst.get("id", "inst")))
-        mnemonic = str(inst.get("mnemonic", ""))
-        asm = str(inst.get("asm", "")) if inst.get("asm") is not None else ""
-        src = inst.get("source", {}) or {}
-        src_file = src.get("file")
-        src_line = src.get("line")
-        comment = f"# {mnemonic}"
-        if asm:
-            comment += f" | {asm}"
-        if src_file and src_line:
-            comment += f" | {src_file}:{src_line}"
+        inst_id = _to_ident(inst.id or "inst")
+        comment = f"# {inst.mnemonic}"
+        if inst.asm:
+            comment += f" | {inst.asm}"
+        if inst.source:
+            comment += f" | {inst.source}"
         lines.append(comment)
 
         grouped_pat = _group_pattern(pattern, 4)
@@ -318,7 +280,7 @@ def _generate_decode_file(
         f.write("\n".join(lines).rstrip() + "\n")
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument(
         "--profile",
@@ -341,20 +303,13 @@ def main() -> int:
         action="store_true",
         help="Verify that files in --out-dir match the generator output",
     )
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     default_spec = os.path.join("isa", "v0.3", "linxisa-v0.3.json")
     spec_path = args.spec or default_spec
 
-    with open(spec_path, "r", encoding="utf-8") as f:
-        spec = json.load(f)
-
-    spec_label = os.path.normpath(str(spec.get("_spec_path") or _normalize_spec_label(spec_path)))
-
-    by_len: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
-    for inst in spec.get("instructions", []):
-        length_bits = int(inst.get("length_bits", inst.get("encoding", {}).get("length_bits", 0)))
-        by_len[length_bits].append(inst)
+    catalog = load_catalog(spec_path)
+    spec_label = os.path.normpath(str(catalog.spec_path or _normalize_spec_label(spec_path)))
 
     targets = [
         (16, "linxisa16.decode"),
@@ -366,7 +321,7 @@ def main() -> int:
         with tempfile.TemporaryDirectory() as td:
             for length_bits, filename in targets:
                 tmp_path = os.path.join(td, filename)
-                _generate_decode_file(by_len.get(length_bits, []), tmp_path, spec_label)
+                _generate_decode_file(catalog.by_length(length_bits), tmp_path, spec_label)
 
                 out_path = os.path.join(args.out_dir, filename)
                 if not os.path.exists(out_path):
@@ -383,7 +338,7 @@ def main() -> int:
     else:
         for length_bits, filename in targets:
             out_path = os.path.join(args.out_dir, filename)
-            _generate_decode_file(by_len.get(length_bits, []), out_path, spec_label)
+            _generate_decode_file(catalog.by_length(length_bits), out_path, spec_label)
 
     return 0
 
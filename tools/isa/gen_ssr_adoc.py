@@ -234,7 +234,7 @@ def gen_trapno_encoding(spec_path: str, sysregs: Dict[str, Any]) -> str:
     return "\n".join(lines).rstrip() + "\n"
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument(
         "--profile",
@@ -257,7 +257,7 @@ def main() -> int:
         action="store_true",
         help="Verify that generated files in --out-dir are up-to-date",
     )
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     default_spec = os.path.join("isa", "v0.3", "linxisa-v0.3.json")
     spec_path = args.spec or default_spec
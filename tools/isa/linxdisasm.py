@@ -10,11 +10,23 @@ mask/match decode + field extraction.
 from __future__ import annotations
 
 import argparse
+import bisect
 import json
+import mmap
+import os
+import random
 import re
+import struct
 import sys
+import time
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from linxisa import decode16
+from linxisa.catalog import Catalog, Instruction, load_catalog
+from linxisa.constraints import FieldConstraint, compile_predicate, form_constraints
 
 
 _HEX_RE = re.compile(r"^(?:0x)?[0-9a-fA-F_]+$")
@@ -37,140 +49,26 @@ def _parse_hex_word(s: str) -> Tuple[int, int]:
     return int(s, 16), bit_width
 
 
-def _pattern_to_mask_match(pattern: str) -> Tuple[int, int]:
-    width_bits = len(pattern)
-    mask = 0
-    match = 0
-    for i, ch in enumerate(pattern):
-        bit = width_bits - 1 - i
-        if ch == ".":
-            continue
-        if ch not in ("0", "1"):
-            raise ValueError(f"invalid pattern char {ch!r}")
-        mask |= 1 << bit
-        if ch == "1":
-            match |= 1 << bit
-    return mask, match
-
-
-@dataclass(frozen=True)
-class FieldPiece:
-    insn_lsb: int
-    width: int
-    value_lsb: int
-
-
-@dataclass
-class Field:
-    name: str
-    signed: Optional[bool]
-    pieces: List[FieldPiece]
-
-    @property
-    def bit_width(self) -> int:
-        if not self.pieces:
-            return 0
-        return max(p.value_lsb + p.width for p in self.pieces)
-
-
-@dataclass(frozen=True)
-class Form:
-    id: str
-    mnemonic: str
-    asm_fmt: str
-    length_bits: int
-    mask: int
-    match: int
-    fixed_bits: int
-    fields: Dict[str, Field]
-
-
-def _load_reg5(spec: Dict[str, Any]) -> Dict[int, str]:
-    reg5 = spec.get("registers", {}).get("reg5", {})
-    entries = reg5.get("entries", [])
+def _load_reg5(catalog: Catalog) -> Dict[int, str]:
     code_to_asm: Dict[int, str] = {}
-    for e in entries:
-        try:
-            code = int(e.get("code"))
-        except Exception:
+    for e in catalog.reg5:
+        if e.code is None:
             continue
-        asm = str(e.get("asm", "")).strip()
+        asm = e.asm.strip()
         if asm:
-            code_to_asm[code] = asm
+            code_to_asm[e.code] = asm
     return code_to_asm
 
 
-def _build_combined(inst: Dict[str, Any]) -> Tuple[int, str, Dict[str, Field]]:
-    enc = inst.get("encoding", {})
-    parts: List[Dict[str, Any]] = list(enc.get("parts", []))
-    length_bits = int(enc.get("length_bits", inst.get("length_bits", 0)))
-    if not parts:
-        return length_bits, "." * length_bits, {}
-
-    offsets: List[int] = []
-    off = 0
-    for p in parts:
-        offsets.append(off)
-        off += int(p.get("width_bits", 0))
-
-    pattern = "".join(
-        str(parts[i].get("pattern", "")).replace(" ", "") for i in reversed(range(len(parts)))
-    )
-    if len(pattern) != length_bits:
-        pattern = (("." * length_bits) + pattern)[-length_bits:]
-
-    fields: Dict[str, Field] = {}
-    for part_index, part in enumerate(parts):
-        part_off = offsets[part_index]
-        for f in part.get("fields", []):
-            name = str(f.get("name", "")).strip()
-            if not name:
-                continue
-            existing = fields.get(name)
-            if existing is None:
-                existing = Field(name=name, signed=f.get("signed", None), pieces=[])
-                fields[name] = existing
-            if existing.signed is None and f.get("signed") is not None:
-                existing.signed = f.get("signed")
-
-            for p in f.get("pieces", []):
-                insn_lsb = int(p.get("insn_lsb", 0)) + part_off
-                width = int(p.get("width", 0))
-                value_lsb = int(p.get("value_lsb", 0) if p.get("value_lsb") is not None else 0)
-                existing.pieces.append(FieldPiece(insn_lsb=insn_lsb, width=width, value_lsb=value_lsb))
-
-    # Stable piece ordering for deterministic output.
-    for fld in fields.values():
-        fld.pieces.sort(key=lambda p: (p.value_lsb, p.insn_lsb))
-
-    return length_bits, pattern, fields
-
-
-def _load_forms(spec: Dict[str, Any]) -> Dict[int, List[Form]]:
-    out: Dict[int, List[Form]] = {}
-    for inst in spec.get("instructions", []):
-        length_bits, pattern, fields = _build_combined(inst)
-        mask, match = _pattern_to_mask_match(pattern)
-        fixed_bits = mask.bit_count()
-        form = Form(
-            id=str(inst.get("id", "")),
-            mnemonic=str(inst.get("mnemonic", "")),
-            asm_fmt=str(inst.get("asm", "") or ""),
-            length_bits=length_bits,
-            mask=mask,
-            match=match,
-            fixed_bits=fixed_bits,
-            fields=fields,
-        )
-        out.setdefault(length_bits, []).append(form)
-
-    # Prefer more specific encodings first.
-    for k in list(out.keys()):
-        out[k].sort(key=lambda f: (-f.fixed_bits, f.id))
+def _load_forms(catalog: Catalog) -> Dict[int, List[Instruction]]:
+    """Per-length form lists, most fixed bits first (ties broken by id)."""
+    out: Dict[int, List[Instruction]] = {}
+    for length_bits in catalog.lengths():
+        out[length_bits] = sorted(catalog.by_length(length_bits), key=lambda f: (-f.fixed_bits, f.id))
     return out
 
 
-def _extract_fields(val: int, form: Form) -> Dict[str, int]:
+def _extract_fields(val: int, form: Instruction) -> Dict[str, int]:
     out: Dict[str, int] = {}
     for name, field in form.fields.items():
         v = 0
@@ -206,9 +104,9 @@ def _format_regdst(code_to_asm: Dict[int, str], code: int) -> str:
     return _format_reg(code_to_asm, code)
 
 
-def _format_inst_pretty(form: Form, fields: Dict[str, int], reg5: Dict[int, str]) -> str:
+def _format_inst_pretty(form: Instruction, fields: Dict[str, int], reg5: Dict[int, str]) -> str:
     # Mnemonic: prefer the asm template's first token (already lowercase in the ISA catalog).
-    asm = form.asm_fmt.strip()
+    asm = form.asm.strip()
     mnem = asm.split()[0] if asm else form.mnemonic.lower()
 
     # Very small heuristic-based operand ordering.
@@ -243,48 +141,1054 @@ def _format_inst_pretty(form: Form, fields: Dict[str, int], reg5: Dict[int, str]
     return mnem
 
 
-def _decode_one(forms_by_len: Dict[int, List[Form]], val: int, length_bits: int) -> Optional[Form]:
+def _load_constraints(catalog: Catalog) -> Dict[str, Tuple[FieldConstraint, ...]]:
+    """Resolved part constraints per form id (forms without constraints are omitted)."""
+    out: Dict[str, Tuple[FieldConstraint, ...]] = {}
+    for inst in catalog.instructions:
+        cons = form_constraints(inst, catalog)
+        if cons:
+            out[inst.id] = cons
+    return out
+
+
+def _load_direct16(catalog: Catalog) -> Optional[List[Optional[Instruction]]]:
+    """Decode result of every 16-bit word, from the direct-index table (None without 16-bit forms)."""
+    if not catalog.by_length(16):
+        return None
+    order = decode16.c_form_order(catalog)
+    return [None if i == decode16.NONE else order[i] for i in decode16.load_table(catalog)]
+
+
+def _decode_one(
+    forms_by_len: Dict[int, List[Instruction]],
+    val: int,
+    length_bits: int,
+    constraints: Optional[Dict[str, Tuple[FieldConstraint, ...]]] = None,
+) -> Optional[Instruction]:
     val &= (1 << length_bits) - 1
     for form in forms_by_len.get(length_bits, []):
         if (val & form.mask) == form.match:
+            if constraints and not all(c.holds(val) for c in constraints.get(form.id, ())):
+                continue
             return form
     return None
 
 
+class _GatheredArrays(Mapping):
+    """
+    Per-field arrays kept in the distinct-word domain and expanded to rows on access.
+
+    Nothing is cached: a batch may carry dozens of field names, and holding every
+    expanded array at once would multiply memory use by the field count.
+    """
+
+    def __init__(self, by_uniq: Dict[str, Any], inverse: Any) -> None:
+        self._by_uniq = by_uniq
+        self._inverse = inverse
+
+    def __getitem__(self, name: str) -> Any:
+        return self._by_uniq[name][self._inverse]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._by_uniq)
+
+    def __len__(self) -> int:
+        return len(self._by_uniq)
+
+
+@dataclass
+class BatchDecode:
+    """
+    Result of `LinxDecoder.decode_batch`.
+
+    `form_index[i]` indexes `forms` (-1 when the word does not decode). For each
+    field name, `fields[name][i]` holds the extracted (sign-extended) value and
+    `present[name][i]` tells whether the decoded form has that field at all.
+    Field arrays are expanded to full length on access.
+    """
+
+    length_bits: int
+    forms: List[Instruction]
+    form_index: Any
+    fields: Mapping[str, Any]
+    present: Mapping[str, Any]
+
+
+def _require_numpy() -> Any:
+    try:
+        import numpy  # type: ignore
+    except Exception as exc:
+        raise RuntimeError(f"batch decode requires NumPy, which is unavailable: {exc}") from exc
+    return numpy
+
+
+class _DecodeNode:
+    """
+    One node of the compiled decode tree.
+
+    Inner nodes dispatch on `val & mask` through `children`; leaves hold the
+    remaining candidate forms in priority order and are scanned linearly.
+    `entries` is the leaf scan list: (mask, match, predicate or None, form).
+    """
+
+    __slots__ = ("mask", "children", "forms", "entries")
+
+    def __init__(
+        self,
+        mask: int = 0,
+        children: Optional[Dict[int, "_DecodeNode"]] = None,
+        forms: Optional[Tuple[Instruction, ...]] = None,
+        entries: Optional[Tuple[Tuple[int, int, Any, Instruction], ...]] = None,
+    ) -> None:
+        self.mask = mask
+        self.children = children
+        self.forms = forms
+        self.entries = entries
+
+
+class LinxDecoder:
+    """
+    Decision-tree decoder compiled from the catalog mask/match patterns.
+
+    Each length class gets its own tree. At every node we dispatch on the
+    opcode bits that all remaining candidates fix (or, failing that, on the
+    single bit fixed by the most candidates). Forms that leave a split bit
+    free are replicated into every child, so a leaf always holds every form
+    that can still match, in the same "most fixed bits wins" order used by
+    `_load_forms`; the first hit in a leaf is therefore the same form the
+    linear scan in `_decode_one` would return.
+
+    Part constraints (e.g. `ADDTPC ... ; RegDst!=RA`) are compiled into one
+    predicate per constrained form (see `linxisa.constraints`) and stored in
+    the leaf entry, so they run only after that form's mask/match already
+    hit; unconstrained forms pay a single `is None` test. A form whose
+    predicate fails falls through to the next candidate in the leaf.
+
+    Decoders built from a catalog also hold the 16-bit direct-index table
+    (`linxisa.decode16`), so 16-bit words skip the tree: one list index in
+    `decode()`, one array gather in `decode_batch()`.
+    """
+
+    # Leaves at or below this size are scanned linearly.
+    LEAF_FORMS = 2
+
+    def __init__(
+        self,
+        forms_by_len: Dict[int, List[Instruction]],
+        constraints: Optional[Dict[str, Tuple[FieldConstraint, ...]]] = None,
+        direct16: Optional[List[Optional[Instruction]]] = None,
+    ) -> None:
+        self.forms_by_len = forms_by_len
+        self.constraints = constraints or {}
+        self._direct16 = direct16
+        self._direct16_index: Any = None
+        self._predicates = {fid: compile_predicate(cons) for fid, cons in self.constraints.items()}
+        self._roots: Dict[int, _DecodeNode] = {}
+        for length_bits, forms in forms_by_len.items():
+            self._roots[length_bits] = self._compile(tuple(forms), 0)
+
+    @classmethod
+    def from_catalog(cls, catalog: Catalog) -> "LinxDecoder":
+        return cls(_load_forms(catalog), _load_constraints(catalog), _load_direct16(catalog))
+
+    @classmethod
+    def from_spec(cls, spec: Dict[str, Any]) -> "LinxDecoder":
+        return cls.from_catalog(Catalog.from_spec(spec))
+
+    @classmethod
+    def from_path(cls, spec_path: str) -> "LinxDecoder":
+        return cls.from_catalog(load_catalog(spec_path))
+
+    def _leaf(self, forms: Tuple[Instruction, ...]) -> _DecodeNode:
+        entries = tuple((f.mask, f.match, self._predicates.get(f.id), f) for f in forms)
+        return _DecodeNode(forms=forms, entries=entries)
+
+    def _compile(self, forms: Tuple[Instruction, ...], used_mask: int) -> _DecodeNode:
+        if len(forms) <= self.LEAF_FORMS:
+            return self._leaf(forms)
+
+        common = ~used_mask
+        for f in forms:
+            common &= f.mask
+        if common:
+            split_mask = common
+        else:
+            # No bit is fixed by every candidate: split on the most widely fixed
+            # bit and replicate the forms that leave it free.
+            counts: Dict[int, int] = {}
+            for f in forms:
+                free = f.mask & ~used_mask
+                while free:
+                    low = free & -free
+                    counts[low] = counts.get(low, 0) + 1
+                    free ^= low
+            if not counts:
+                return self._leaf(forms)
+            split_mask = max(counts, key=lambda b: (counts[b], -b))
+
+        buckets: Dict[int, List[Instruction]] = {}
+        wildcard: List[Instruction] = []
+        for f in forms:
+            if (f.mask & split_mask) == split_mask:
+                buckets.setdefault(f.match & split_mask, []).append(f)
+            else:
+                wildcard.append(f)
+        if wildcard:
+            # Only single-bit splits produce wildcards, so both keys are reachable.
+            for key in (0, split_mask):
+                bucket = buckets.setdefault(key, [])
+                bucket.extend(wildcard)
+                bucket.sort(key=lambda f: (-f.fixed_bits, f.id))
+            if all(len(b) == len(forms) for b in buckets.values()):
+                return self._leaf(forms)
+
+        children = {
+            key: self._compile(tuple(bucket), used_mask | split_mask) for key, bucket in buckets.items()
+        }
+        return _DecodeNode(mask=split_mask, children=children)
+
+    def decode(self, val: int, length_bits: int) -> Optional[Instruction]:
+        if length_bits == 16 and self._direct16 is not None:
+            return self._direct16[val & 0xFFFF]
+        node = self._roots.get(length_bits)
+        if node is None:
+            return None
+        val &= (1 << length_bits) - 1
+        while node.forms is None:
+            node = node.children.get(val & node.mask)
+            if node is None:
+                return None
+        for mask, match, check, form in node.entries:
+            if (val & mask) == match and (check is None or check(val)):
+                return form
+        return None
+
+    def decode_batch(
+        self,
+        words: Any,
+        length_bits: int,
+        fields: Optional[Iterable[str]] = None,
+    ) -> "BatchDecode":
+        """
+        Vectorized decode of an array of `length_bits`-wide instruction words.
+
+        Distinct words are decoded once (traces are dominated by repeats) by walking
+        the decode tree with whole-array masked compares; field values are then
+        extracted per form with shift/mask ops and gathered back to every row.
+
+        `fields` restricts which field arrays are materialized (default: every field
+        of every decoded form).
+        """
+        np = _require_numpy()
+        forms = self.forms_by_len.get(length_bits, [])
+        width_mask = (1 << length_bits) - 1
+        vals = np.asarray(words, dtype=np.uint64).reshape(-1) & np.uint64(width_mask)
+        if length_bits <= 16:
+            # The whole space is smaller than a typical batch: decode every value once.
+            uniq = np.arange(1 << length_bits, dtype=np.uint64)
+            inverse = vals.astype(np.intp)
+        else:
+            uniq, inverse = np.unique(vals, return_inverse=True)
+            inverse = inverse.reshape(-1)
+
+        uniq_index = np.full(len(uniq), -1, dtype=np.int32)
+        root = self._roots.get(length_bits)
+        if length_bits == 16 and self._direct16 is not None:
+            if self._direct16_index is None:
+                form_pos = {id(f): i for i, f in enumerate(forms)}
+                self._direct16_index = np.array(
+                    [form_pos[id(f)] if f is not None else -1 for f in self._direct16], dtype=np.int32
+                )
+            uniq_index = self._direct16_index.copy()
+        elif root is not None and len(uniq):
+            form_pos = {id(f): i for i, f in enumerate(forms)}
+            self._walk_batch(np, root, np.arange(len(uniq)), uniq, uniq_index, form_pos)
+
+        wanted = set(fields) if fields is not None else None
+        uniq_fields: Dict[str, Any] = {}
+        uniq_present: Dict[str, Any] = {}
+        order = np.argsort(uniq_index, kind="stable")
+        decoded = uniq_index[order]
+        bounds = np.searchsorted(decoded, np.arange(-1, len(forms) + 1))
+        for fi in range(len(forms)):
+            lo, hi = int(bounds[fi + 1]), int(bounds[fi + 2])
+            if lo == hi:
+                continue
+            rows = order[lo:hi]
+            sub = uniq[rows]
+            for name, field in forms[fi].fields.items():
+                if wanted is not None and name not in wanted:
+                    continue
+                out = uniq_fields.get(name)
+                if out is None:
+                    out = uniq_fields[name] = np.zeros(len(uniq), dtype=np.int64)
+                    uniq_present[name] = np.zeros(len(uniq), dtype=bool)
+                v = np.zeros(len(rows), dtype=np.uint64)
+                for p in field.pieces:
+                    v |= ((sub >> np.uint64(p.insn_lsb)) & np.uint64((1 << p.width) - 1)) << np.uint64(p.value_lsb)
+                v = v.astype(np.int64)
+                if field.signed is True and field.bit_width > 0:
+                    sign_bit = 1 << (field.bit_width - 1)
+                    v -= (v & sign_bit) << 1
+                out[rows] = v
+                uniq_present[name][rows] = True
+
+        return BatchDecode(
+            length_bits=length_bits,
+            forms=forms,
+            form_index=uniq_index[inverse],
+            fields=_GatheredArrays(uniq_fields, inverse),
+            present=_GatheredArrays(uniq_present, inverse),
+        )
+
+    def _walk_batch(self, np: Any, node: _DecodeNode, rows: Any, vals: Any, out: Any, form_pos: Dict[int, int]) -> None:
+        if node.forms is not None:
+            pending = np.ones(len(rows), dtype=bool)
+            for form in node.forms:
+                hit = pending & ((vals & np.uint64(form.mask)) == np.uint64(form.match))
+                for c in self.constraints.get(form.id, ()):
+                    hit &= c.holds_array(np, vals)
+                out[rows[hit]] = form_pos[id(form)]
+                pending &= ~hit
+            return
+
+        keys = vals & np.uint64(node.mask)
+        if len(node.children) <= 4:
+            for key, child in node.children.items():
+                sel = keys == np.uint64(key)
+                if sel.any():
+                    self._walk_batch(np, child, rows[sel], vals[sel], out, form_pos)
+            return
+
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        for key, child in node.children.items():
+            lo = int(np.searchsorted(sorted_keys, np.uint64(key), side="left"))
+            hi = int(np.searchsorted(sorted_keys, np.uint64(key), side="right"))
+            if lo == hi:
+                continue
+            sel = order[lo:hi]
+            self._walk_batch(np, child, rows[sel], vals[sel], out, form_pos)
+
+    def stats(self) -> Dict[int, Dict[str, int]]:
+        """Return per-length tree shape (inner nodes, leaves, max depth, max leaf size)."""
+        out: Dict[int, Dict[str, int]] = {}
+        for length_bits, root in self._roots.items():
+            st = {"inner": 0, "leaves": 0, "max_depth": 0, "max_leaf": 0}
+            stack = [(root, 0)]
+            while stack:
+                node, depth = stack.pop()
+                st["max_depth"] = max(st["max_depth"], depth)
+                if node.forms is not None:
+                    st["leaves"] += 1
+                    st["max_leaf"] = max(st["max_leaf"], len(node.forms))
+                    continue
+                st["inner"] += 1
+                stack.extend((child, depth + 1) for child in node.children.values())
+            out[length_bits] = st
+        return out
+
+
+def _bench_corpus(forms: List[Instruction], length_bits: int, count: int, seed: int) -> List[int]:
+    """Build `count` words that cycle over every form with randomized free bits."""
+    rng = random.Random(seed)
+    width_mask = (1 << length_bits) - 1
+    words: List[int] = []
+    for i in range(count):
+        form = forms[i % len(forms)]
+        words.append(form.match | (rng.getrandbits(length_bits) & ~form.mask & width_mask))
+    return words
+
+
+def _time_decode(decoder: LinxDecoder, words: List[int], length_bits: int) -> Tuple[List[Optional[Instruction]], float]:
+    decode = decoder.decode
+    t0 = time.perf_counter()
+    out = [decode(w, length_bits) for w in words]
+    return out, time.perf_counter() - t0
+
+
+def _run_bench(forms_by_len: Dict[int, List[Instruction]], decoder: LinxDecoder, count: int) -> int:
+    """
+    Time the linear scan against the decision tree for each length class.
+
+    Both decoders run over the same synthetic corpus; any disagreement is a hard error.
+    The tree is also timed without its constraint predicates, over the full corpus and
+    over words of constrained forms only, to show what constraint-aware decode costs.
+    When `decoder` holds the 16-bit direct-index table, it is checked and timed too.
+    """
+    shape = decoder.stats()
+    tree_only = LinxDecoder(forms_by_len, decoder.constraints)
+    plain = LinxDecoder(forms_by_len)
+    try:
+        np = _require_numpy()
+    except RuntimeError:
+        np = None
+    print(
+        "length\tforms\twords\tlinear_wps\ttree_wps\tspeedup\tnocons_wps\tcons_cost\tbatch_wps"
+        "\ttree(inner/leaves/depth/max_leaf)"
+    )
+    constrained_rows: List[str] = []
+    direct_row = ""
+    for length_bits in sorted(forms_by_len.keys()):
+        forms = forms_by_len[length_bits]
+        words = _bench_corpus(forms, length_bits, count, seed=length_bits)
+
+        t0 = time.perf_counter()
+        linear = [_decode_one(forms_by_len, w, length_bits, decoder.constraints) for w in words]
+        t_linear = time.perf_counter() - t0
+
+        tree, t_tree = _time_decode(tree_only, words, length_bits)
+        _, t_plain = _time_decode(plain, words, length_bits)
+
+        for w, a, b in zip(words, linear, tree):
+            if a is not b:
+                print(
+                    f"error: decoder mismatch for 0x{w:x} [{length_bits}]: "
+                    f"linear={a.id if a else None} tree={b.id if b else None}",
+                    file=sys.stderr,
+                )
+                return 1
+
+        batch_wps = "-"
+        if np is not None:
+            arr = np.array(words, dtype=np.uint64)
+            t0 = time.perf_counter()
+            res = tree_only.decode_batch(arr, length_bits)
+            t_batch = time.perf_counter() - t0
+            batch_wps = f"{len(words) / t_batch:.0f}"
+            pos = {id(f): i for i, f in enumerate(forms)}
+            expect = np.array([pos[id(f)] if f is not None else -1 for f in tree], dtype=np.int32)
+            if not np.array_equal(res.form_index, expect):
+                print(f"error: batch decode mismatch [{length_bits}]", file=sys.stderr)
+                return 1
+
+        st = shape.get(length_bits, {})
+        print(
+            f"{length_bits}\t{len(forms)}\t{len(words)}"
+            f"\t{len(words) / t_linear:.0f}\t{len(words) / t_tree:.0f}\t{t_linear / t_tree:.1f}x"
+            f"\t{len(words) / t_plain:.0f}\t{(t_tree / t_plain - 1) * 100:+.1f}%\t{batch_wps}"
+            f"\t{st.get('inner', 0)}/{st.get('leaves', 0)}/{st.get('max_depth', 0)}/{st.get('max_leaf', 0)}"
+        )
+
+        cforms = [f for f in forms if f.id in decoder.constraints]
+        if cforms:
+            cwords = _bench_corpus(cforms, length_bits, count, seed=length_bits)
+            ctree, t_ctree = _time_decode(tree_only, cwords, length_bits)
+            _, t_cplain = _time_decode(plain, cwords, length_bits)
+            for w, b in zip(cwords, ctree):
+                if _decode_one(forms_by_len, w, length_bits, decoder.constraints) is not b:
+                    print(f"error: constrained decode mismatch for 0x{w:x} [{length_bits}]", file=sys.stderr)
+                    return 1
+            rejected = sum(1 for f, w in zip(ctree, cwords) if f is None or f.id not in decoder.constraints)
+            constrained_rows.append(
+                f"{length_bits}\t{len(cforms)}\t{len(cwords)}\t{rejected}"
+                f"\t{len(cwords) / t_ctree:.0f}\t{len(cwords) / t_cplain:.0f}\t{(t_ctree / t_cplain - 1) * 100:+.1f}%"
+            )
+
+        if length_bits == 16 and decoder._direct16 is not None:
+            direct, t_direct = _time_decode(decoder, words, length_bits)
+            if any(a is not b for a, b in zip(linear, direct)):
+                print("error: 16-bit direct table disagrees with the linear scan", file=sys.stderr)
+                return 1
+            direct_row = f"16-bit direct table: {len(words) / t_direct:.0f} wps ({t_tree / t_direct:.1f}x the tree)"
+
+    if direct_row:
+        print()
+        print(direct_row)
+    if constrained_rows:
+        print()
+        print("constrained forms only:")
+        print("length\tforms\twords\tredirected\ttree_wps\tnocons_wps\tcons_cost")
+        for row in constrained_rows:
+            print(row)
+    return 0
+
+
+def _format_inst_fields(form: Instruction, fields: Dict[str, int], reg5: Dict[int, str]) -> str:
+    items = []
+    for k in sorted(fields.keys()):
+        v = fields[k]
+        if k in {"SrcL", "SrcR", "SrcD", "SrcP", "SrcA", "RegDst"}:
+            items.append(f"{k}={_format_reg(reg5, int(v) & 0x1F)}")
+        else:
+            items.append(f"{k}={v}")
+    return f"{form.mnemonic}\t" + " ".join(items)
+
+
+def _format_inst(form: Instruction, val: int, reg5: Dict[int, str], fmt: str) -> str:
+    extracted = _extract_fields(val, form)
+    if fmt == "fields":
+        return _format_inst_fields(form, extracted, reg5)
+    return _format_inst_pretty(form, extracted, reg5)
+
+
+class DecodeCache:
+    """
+    Bounded CLOCK cache of decode results keyed on (word, length_bits).
+
+    Traces and hot loops repeat the same instruction words over and over; each
+    entry keeps the decoded form and its formatted text, so a repeat costs one
+    dict lookup instead of a tree walk, field extraction and formatting. On a
+    hit the entry's reference bit is set; when the cache is full the clock
+    hand sweeps past referenced entries (clearing their bit) and evicts the
+    first unreferenced one, which approximates LRU without reordering on hits.
+    `size` <= 0 disables caching (every lookup decodes).
+    """
+
+    DEFAULT_SIZE = 1 << 16
+
+    def __init__(self, decoder: LinxDecoder, reg5: Dict[int, str], fmt: str, size: int = DEFAULT_SIZE) -> None:
+        self.decoder = decoder
+        self.reg5 = reg5
+        self.fmt = fmt
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # key -> [form, text, referenced]; key packs (word, length_bits) as word << 7 | length_bits.
+        self._map: Dict[int, List[Any]] = {}
+        self._keys: List[int] = []
+        self._hand = 0
+
+    def _fill(self, key: int, val: int, length_bits: int) -> List[Any]:
+        self.misses += 1
+        form = self.decoder.decode(val, length_bits)
+        text = "<invalid>" if form is None else _format_inst(form, val, self.reg5, self.fmt)
+        entry = [form, text, False]
+        size = self.size
+        if size <= 0:
+            return entry
+        keys = self._keys
+        if len(keys) < size:
+            keys.append(key)
+            self._map[key] = entry
+            return entry
+        m = self._map
+        hand = self._hand
+        while True:
+            victim = m[keys[hand]]
+            if not victim[2]:
+                break
+            victim[2] = False
+            hand = hand + 1 if hand + 1 < size else 0
+        del m[keys[hand]]
+        self.evictions += 1
+        keys[hand] = key
+        m[key] = entry
+        self._hand = hand + 1 if hand + 1 < size else 0
+        return entry
+
+    def lookup(self, val: int, length_bits: int) -> Tuple[Optional[Instruction], str]:
+        """Return (form or None, formatted text) for one instruction word."""
+        key = val << 7 | length_bits
+        entry = self._map.get(key)
+        if entry is None:
+            entry = self._fill(key, val, length_bits)
+        else:
+            self.hits += 1
+            entry[2] = True
+        return entry[0], entry[1]
+
+    def text(self, val: int, length_bits: int) -> str:
+        """Formatted text only (the stream/trace hot path)."""
+        key = val << 7 | length_bits
+        entry = self._map.get(key)
+        if entry is None:
+            entry = self._fill(key, val, length_bits)
+        else:
+            self.hits += 1
+            entry[2] = True
+        return entry[1]
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": self.size,
+            "entries": len(self._map),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def _insn_length_bits(halfword: int) -> int:
+    """
+    Length-decode an instruction from its first 16-bit parcel.
+
+    The low bits of the first parcel select the length class:
+      - `...1110` 16-bit HL prefix => 48-bit form
+      - `...1111` 32-bit V prefix  => 64-bit form (2x32 parts)
+      - `.......1`                 => 32-bit form
+      - `.......0`                 => 16-bit compressed form
+    """
+    if (halfword & 0xF) == 0xE:
+        return 48
+    if (halfword & 0xF) == 0xF:
+        return 64
+    if halfword & 1:
+        return 32
+    return 16
+
+
+@dataclass(frozen=True)
+class TextSection:
+    name: str
+    addr: int
+    offset: int
+    size: int
+    index: int = -1
+
+
+_SHT_PROGBITS = 1
+_SHT_SYMTAB = 2
+_SHT_DYNSYM = 11
+_SHF_EXECINSTR = 0x4
+_STT_FUNC = 2
+
+
+def _elf_section_headers(buf: Any) -> Tuple[str, int, List[Tuple[int, ...]], int]:
+    """Return (struct byte order, ELF class, section headers, e_shstrndx) of an ELF image."""
+    if len(buf) < 16 or bytes(buf[:4]) != b"\x7fELF":
+        raise ValueError("not an ELF image")
+    ei_class = buf[4]
+    ei_data = buf[5]
+    if ei_class not in (1, 2):
+        raise ValueError(f"unsupported ELF class {ei_class}")
+    if ei_data not in (1, 2):
+        raise ValueError(f"unsupported ELF data encoding {ei_data}")
+    end = "<" if ei_data == 1 else ">"
+    if ei_class == 2:
+        e_shoff, = struct.unpack_from(end + "Q", buf, 0x28)
+        e_shentsize, e_shnum, e_shstrndx = struct.unpack_from(end + "HHH", buf, 0x3A)
+        sh_fmt = end + "IIQQQQIIQQ"
+    else:
+        e_shoff, = struct.unpack_from(end + "I", buf, 0x20)
+        e_shentsize, e_shnum, e_shstrndx = struct.unpack_from(end + "HHH", buf, 0x2E)
+        sh_fmt = end + "IIIIIIIIII"
+    if e_shoff == 0 or e_shnum == 0:
+        return end, ei_class, [], e_shstrndx
+    # (name, type, flags, addr, offset, size, link, info, addralign, entsize)
+    headers = [struct.unpack_from(sh_fmt, buf, e_shoff + i * e_shentsize) for i in range(e_shnum)]
+    return end, ei_class, headers, e_shstrndx
+
+
+def _elf_text_sections(buf: Any) -> List[TextSection]:
+    """
+    Return executable PROGBITS sections of an ELF image (ELF32/ELF64, either endianness).
+
+    `buf` is any buffer (typically an mmap); headers are read in place with struct.
+    """
+    _, _, headers, e_shstrndx = _elf_section_headers(buf)
+    strtab = headers[e_shstrndx] if e_shstrndx < len(headers) else None
+
+    def _name(off: int) -> str:
+        if strtab is None:
+            return ""
+        start = strtab[4] + off
+        stop = bytes(buf[start : start + 256]).find(b"\0")
+        return bytes(buf[start : start + (stop if stop >= 0 else 0)]).decode("utf-8", "replace")
+
+    out: List[TextSection] = []
+    for index, sh in enumerate(headers):
+        if sh[1] != _SHT_PROGBITS or not (sh[2] & _SHF_EXECINSTR) or sh[5] == 0:
+            continue
+        out.append(TextSection(name=_name(sh[0]), addr=sh[3], offset=sh[4], size=sh[5], index=index))
+    out.sort(key=lambda t: (t.addr, t.offset))
+    return out
+
+
+def _elf_function_starts(buf: Any) -> Dict[int, List[int]]:
+    """Return sorted STT_FUNC addresses per section index, from .symtab and .dynsym."""
+    end, ei_class, headers, _ = _elf_section_headers(buf)
+    if ei_class == 2:
+        sym_fmt = end + "IBBHQQ"  # name, info, other, shndx, value, size
+    else:
+        sym_fmt = end + "IIIBBH"  # name, value, size, info, other, shndx
+    sym_size = struct.calcsize(sym_fmt)
+    out: Dict[int, set] = {}
+    for sh in headers:
+        if sh[1] not in (_SHT_SYMTAB, _SHT_DYNSYM) or sh[5] < sym_size:
+            continue
+        data = memoryview(buf)[sh[4] : sh[4] + sh[5] - sh[5] % sym_size]
+        for sym in struct.iter_unpack(sym_fmt, data):
+            if ei_class == 2:
+                info, shndx, value = sym[1], sym[3], sym[4]
+            else:
+                info, shndx, value = sym[3], sym[5], sym[1]
+            if (info & 0xF) == _STT_FUNC and value:
+                out.setdefault(shndx, set()).add(value)
+        data.release()
+    return {k: sorted(v) for k, v in out.items()}
+
+
+def _decode_span(
+    mv: Any,
+    pos: int,
+    end: int,
+    stop: int,
+    delta: int,
+    cache: DecodeCache,
+    lines: List[str],
+    *,
+    starts: Optional[List[int]] = None,
+    out: Any = None,
+    flush_lines: int = 4096,
+) -> int:
+    """
+    Decode every instruction starting in [pos, end) (reads may run up to `stop`,
+    the section end) and append one line each to `lines`. Returns the offset
+    just past the last instruction. With `out`, lines are flushed in batches;
+    with `starts`, the offset of each emitted line is recorded.
+    """
+    text_of = cache.text
+    from_bytes = int.from_bytes
+    while pos < end and pos + 2 <= stop:
+        if starts is not None:
+            starts.append(pos)
+        length_bits = _insn_length_bits(mv[pos] | (mv[pos + 1] << 8))
+        nbytes = length_bits // 8
+        addr = pos + delta
+        if pos + nbytes > stop:
+            tail = from_bytes(mv[pos:stop], "little")
+            lines.append(f"{addr:8x}:\t{tail:0{(stop - pos) * 2}x}\t<truncated>")
+            return stop
+        val = from_bytes(mv[pos : pos + nbytes], "little")
+        lines.append(f"{addr:8x}:\t{val:0{nbytes * 2}x}\t{text_of(val, length_bits)}")
+        pos += nbytes
+        if out is not None and len(lines) >= flush_lines:
+            lines.append("")
+            out.write("\n".join(lines))
+            lines.clear()
+    if pos < end and pos < stop:
+        # Odd trailing byte: not a complete parcel.
+        if starts is not None:
+            starts.append(pos)
+        lines.append(f"{pos + delta:8x}:\t{mv[pos]:02x}\t<truncated>")
+        pos = stop
+    return pos
+
+
+def _disasm_stream(
+    buf: Any,
+    section: TextSection,
+    cache: DecodeCache,
+    out: Any,
+    *,
+    flush_lines: int = 4096,
+) -> None:
+    """
+    Length-decode and disassemble one section of `buf`, writing one line per instruction.
+
+    Instruction bytes are sliced from a memoryview (no copies of the image), and output
+    lines are batched into large writes.
+    """
+    mv = memoryview(buf)
+    stop = section.offset + section.size
+    lines: List[str] = []
+    _decode_span(
+        mv,
+        section.offset,
+        stop,
+        stop,
+        section.addr - section.offset,
+        cache,
+        lines,
+        out=out,
+        flush_lines=flush_lines,
+    )
+    if lines:
+        lines.append("")
+        out.write("\n".join(lines))
+    mv.release()
+
+
+# Sections smaller than this are not worth a process pool.
+_SHARD_MIN_BYTES = 1 << 20
+# Shards per worker, so uneven shards still balance.
+_SHARDS_PER_JOB = 4
+# How far past a nominal cut to look for a BSTART when no symbol is close.
+_RESYNC_SCAN_BYTES = 4096
+
+_BLOCK_START_RE = re.compile(r"^(?:C\.|HL\.)?BSTART\b")
+
+
+def _plan_shards(
+    buf: Any,
+    section: TextSection,
+    decoder: LinxDecoder,
+    nshards: int,
+    func_addrs: List[int],
+) -> List[Tuple[int, int]]:
+    """
+    Split a section into roughly equal [start, end) byte ranges cut at likely
+    instruction boundaries: the first function symbol past each nominal cut or,
+    failing that, the first halfword that decodes as a BSTART block start. A
+    wrong guess only costs a re-sync in `_disasm_sharded`, never wrong output.
+    """
+    begin = section.offset
+    stop = section.offset + section.size
+    delta = section.addr - section.offset
+    func_offsets = [a - delta for a in func_addrs if begin < a - delta < stop]
+    step = section.size / nshards
+    cuts: List[int] = []
+    for k in range(1, nshards):
+        nominal = (begin + int(k * step)) & ~1
+        limit = min(begin + int((k + 1) * step), stop)
+        i = bisect.bisect_left(func_offsets, nominal)
+        if i < len(func_offsets) and func_offsets[i] < limit:
+            cut = func_offsets[i]
+        else:
+            cut = nominal
+            p = nominal
+            while p + 2 <= min(nominal + _RESYNC_SCAN_BYTES, limit):
+                length_bits = _insn_length_bits(buf[p] | (buf[p + 1] << 8))
+                nbytes = length_bits // 8
+                if p + nbytes <= stop:
+                    form = decoder.decode(int.from_bytes(buf[p : p + nbytes], "little"), length_bits)
+                    if form is not None and _BLOCK_START_RE.match(form.mnemonic):
+                        cut = p
+                        break
+                p += 2
+        if cut > (cuts[-1] if cuts else begin):
+            cuts.append(cut)
+    bounds = [begin] + cuts + [stop]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+_WORKER: Dict[str, Any] = {}
+
+
+def _shard_worker_init(spec_path: str, image_path: str, fmt: str, cache_size: int) -> None:
+    catalog = load_catalog(spec_path)
+    _WORKER["cache"] = DecodeCache(LinxDecoder.from_catalog(catalog), _load_reg5(catalog), fmt, cache_size)
+    f = open(image_path, "rb")
+    _WORKER["file"] = f
+    _WORKER["buf"] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _shard_worker(task: Tuple[int, int, int, int]) -> Tuple[List[str], List[int], int, Tuple[int, int, int]]:
+    start, end, stop, delta = task
+    lines: List[str] = []
+    starts: List[int] = []
+    cache = _WORKER["cache"]
+    before = (cache.hits, cache.misses, cache.evictions)
+    mv = memoryview(_WORKER["buf"])
+    pos = _decode_span(mv, start, end, stop, delta, cache, lines, starts=starts)
+    mv.release()
+    counters = (cache.hits - before[0], cache.misses - before[1], cache.evictions - before[2])
+    return lines, starts, pos, counters
+
+
+def _disasm_sharded(
+    buf: Any,
+    section: TextSection,
+    shards: List[Tuple[int, int]],
+    pool: Any,
+    cache: DecodeCache,
+    out: Any,
+) -> None:
+    """
+    Decode `shards` of one section in `pool` and write them in address order.
+
+    Each shard is decoded as if an instruction starts at its first byte. When
+    the previous shard actually ended elsewhere (the cut was not a real
+    boundary), the gap is re-decoded serially from the true position until it
+    meets an offset the worker also decoded from; from there both decodes agree,
+    so the rest of the worker's lines are reused and the output matches a
+    serial run byte for byte. Worker cache counters are added to `cache`.
+    """
+    stop = section.offset + section.size
+    delta = section.addr - section.offset
+    mv = memoryview(buf)
+    tasks = [(start, end, stop, delta) for start, end in shards]
+    pos = section.offset
+    for (start, end), (lines, starts, shard_pos, counters) in zip(shards, pool.map(_shard_worker, tasks)):
+        cache.hits += counters[0]
+        cache.misses += counters[1]
+        cache.evictions += counters[2]
+        if pos != start:
+            fixed: List[str] = []
+            while True:
+                i = bisect.bisect_left(starts, pos)
+                if i < len(starts) and starts[i] == pos:
+                    lines = fixed + lines[i:]
+                    break
+                if pos >= end:
+                    lines, shard_pos = fixed, pos
+                    break
+                pos = _decode_span(mv, pos, pos + 1, stop, delta, cache, fixed)
+        pos = shard_pos
+        if lines:
+            lines.append("")
+            out.write("\n".join(lines))
+    mv.release()
+
+
+def _disasm_file(
+    path: str,
+    *,
+    raw: bool,
+    base_addr: int,
+    cache: DecodeCache,
+    out: Any,
+    jobs: int = 1,
+    spec_path: str = "",
+) -> int:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            func_starts: Dict[int, List[int]] = {}
+            if raw:
+                sections = [TextSection(name=os.path.basename(path), addr=base_addr, offset=0, size=len(buf))]
+            else:
+                sections = _elf_text_sections(buf)
+                if jobs > 1:
+                    func_starts = _elf_function_starts(buf)
+            pool = None
+            try:
+                for sec in sections:
+                    out.write(f"\nDisassembly of section {sec.name}:\n\n")
+                    if jobs <= 1 or sec.size < _SHARD_MIN_BYTES:
+                        _disasm_stream(buf, sec, cache, out)
+                        continue
+                    if pool is None:
+                        pool = ProcessPoolExecutor(
+                            max_workers=jobs,
+                            initializer=_shard_worker_init,
+                            initargs=(spec_path, path, cache.fmt, cache.size),
+                        )
+                    shards = _plan_shards(
+                        buf, sec, cache.decoder, jobs * _SHARDS_PER_JOB, func_starts.get(sec.index, [])
+                    )
+                    _disasm_sharded(buf, sec, shards, pool, cache, out)
+            finally:
+                if pool is not None:
+                    pool.shutdown()
+    return 0
+
+
+def _disasm_trace(path: str, cache: DecodeCache, out: Any, *, flush_lines: int = 4096) -> int:
+    """
+    Disassemble the `insn` column of a JSONL commit trace (one line per row).
+
+    The instruction length comes from the row's `len` (bytes) when present, else
+    from the first parcel. Repeated words are served from `cache`.
+    """
+    text_of = cache.text
+    loads = json.loads
+    lines: List[str] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for raw in f:
+            if not raw.strip():
+                continue
+            row = loads(raw)
+            insn = int(row["insn"])
+            nbytes = row.get("len")
+            length_bits = int(nbytes) * 8 if nbytes else _insn_length_bits(insn & 0xFFFF)
+            val = insn & ((1 << length_bits) - 1)
+            lines.append(f"{int(row.get('pc', 0)):8x}:\t{val:0{length_bits // 4}x}\t{text_of(val, length_bits)}")
+            if len(lines) >= flush_lines:
+                lines.append("")
+                out.write("\n".join(lines))
+                lines.clear()
+    if lines:
+        lines.append("")
+        out.write("\n".join(lines))
+    return 0
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--spec", default="isa/v0.3/linxisa-v0.3.json")
     ap.add_argument("--hex", nargs="*", default=[], help="Hex instruction words (e.g. 5316 000fcf87)")
+    ap.add_argument("--elf", default=None, help="Disassemble the executable sections of an ELF image")
+    ap.add_argument("--raw", default=None, help="Disassemble a raw little-endian instruction blob")
+    ap.add_argument("--trace", default=None, help="Disassemble the insn column of a JSONL commit trace")
+    ap.add_argument(
+        "--base-addr",
+        type=lambda s: int(s, 0),
+        default=0,
+        help="Load address of the first byte for --raw (default: 0)",
+    )
+    ap.add_argument("--out", default=None, help="Output file for --elf/--raw/--trace (default: stdout)")
     ap.add_argument("--format", choices=("pretty", "fields"), default="pretty")
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for --elf/--raw sections of 1 MiB or more (0: one per CPU)",
+    )
+    ap.add_argument(
+        "--cache-size",
+        type=int,
+        default=DecodeCache.DEFAULT_SIZE,
+        help="Entries in the hot-word decode cache (0 disables it)",
+    )
+    ap.add_argument("--cache-stats", action="store_true", help="Print decode cache hit-rate counters to stderr")
+    ap.add_argument(
+        "--bench",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Benchmark linear vs decision-tree decode over N synthetic words per length class",
+    )
     args = ap.parse_args()
 
-    with open(args.spec, "r", encoding="utf-8") as f:
-        spec = json.load(f)
+    catalog = load_catalog(args.spec)
+    reg5 = _load_reg5(catalog)
+    forms_by_len = _load_forms(catalog)
+    decoder = LinxDecoder.from_catalog(catalog)
+
+    if args.bench:
+        return _run_bench(forms_by_len, decoder, args.bench)
+
+    cache = DecodeCache(decoder, reg5, args.format, args.cache_size)
 
-    reg5 = _load_reg5(spec)
-    forms_by_len = _load_forms(spec)
+    if args.elf or args.raw or args.trace:
+        if args.hex:
+            ap.error("--hex cannot be combined with --elf/--raw/--trace")
+        if sum(1 for x in (args.elf, args.raw, args.trace) if x) > 1:
+            ap.error("--elf, --raw and --trace are mutually exclusive")
+        if args.out:
+            out = open(args.out, "w", encoding="utf-8", buffering=1 << 20)
+        else:
+            out = open(sys.stdout.fileno(), "w", encoding="utf-8", buffering=1 << 20, closefd=False)
+        try:
+            if args.trace:
+                rc = _disasm_trace(args.trace, cache, out)
+            else:
+                rc = _disasm_file(
+                    args.elf or args.raw,
+                    raw=bool(args.raw),
+                    base_addr=args.base_addr,
+                    cache=cache,
+                    out=out,
+                    jobs=args.jobs if args.jobs > 0 else (os.cpu_count() or 1),
+                    spec_path=args.spec,
+                )
+        finally:
+            out.close()
+        if args.cache_stats:
+            st = cache.stats()
+            print(
+                f"decode cache: size={st['size']} entries={st['entries']} hits={st['hits']} "
+                f"misses={st['misses']} evictions={st['evictions']} hit_rate={st['hit_rate'] * 100:.1f}%",
+                file=sys.stderr,
+            )
+        return rc
 
     if not args.hex:
-        ap.error("provide --hex words (binary stream mode not implemented yet)")
+        ap.error("provide --hex words, --elf, --raw or --trace")
 
     for token in args.hex:
         val, bits = _parse_hex_word(token)
-        form = _decode_one(forms_by_len, val, bits)
+        form = decoder.decode(val, bits)
         if form is None:
             print(f"{token}\t<invalid>")
             continue
-        extracted = _extract_fields(val, form)
-        if args.format == "fields":
-            items = []
-            for k in sorted(extracted.keys()):
-                v = extracted[k]
-                if k in {"SrcL", "SrcR", "SrcD", "SrcP", "SrcA", "RegDst"}:
-                    items.append(f"{k}={_format_reg(reg5, int(v) & 0x1F)}")
-                else:
-                    items.append(f"{k}={v}")
-            print(f"{token}\t{form.mnemonic}\t" + " ".join(items))
-        else:
-            print(f"{token}\t" + _format_inst_pretty(form, extracted, reg5))
+        print(f"{token}\t" + _format_inst(form, val, reg5, args.format))
 
     return 0
 
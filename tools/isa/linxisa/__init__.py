@@ -0,0 +1,45 @@
+"""
+Shared helpers for the LinxISA catalog tooling under tools/isa/.
+
+The tools in this directory are run as scripts (`python3 tools/isa/<tool>.py`),
+so this package is importable from them directly. Scripts elsewhere in the repo
+add `tools/isa` to `sys.path` before importing it.
+
+  - `linxisa.catalog`: indexed `Catalog` model (`load_catalog()`)
+  - `linxisa.constraints`: compiled per-form constraint predicates
+  - `linxisa.encoder`: catalog-driven instruction encoder (`Encoder`)
+  - `linxisa.cache`: content-hash keyed compiled catalog cache
+  - `linxisa.lxcat`: memory-mappable binary catalog (`BinaryCatalog`)
+  - `linxisa.jsonindex`: offset-indexed lazy JSON catalog reader (`CatalogJSON`)
+  - `linxisa.diff`: id-keyed structural diff between two catalogs
+  - `linxisa.alloc`: free encoding space index and allocator queries
+  - `linxisa.decode16`: 16-bit direct-index decode table
+  - `linxisa.encoding`: pattern/mask/hex helpers
+"""
+
+from linxisa.catalog import (
+    Catalog,
+    Constraint,
+    Field,
+    FieldPiece,
+    Instruction,
+    Part,
+    RegEntry,
+    load_catalog,
+)
+from linxisa.encoder import EncodeError, Encoder
+from linxisa.lxcat import BinaryCatalog
+
+__all__ = [
+    "BinaryCatalog",
+    "Catalog",
+    "Constraint",
+    "EncodeError",
+    "Encoder",
+    "Field",
+    "FieldPiece",
+    "Instruction",
+    "Part",
+    "RegEntry",
+    "load_catalog",
+]
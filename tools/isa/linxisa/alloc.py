@@ -0,0 +1,283 @@
+"""
+Free encoding space index and allocator queries for new opcodes.
+
+For each instruction length the index holds the unused part of that length's
+encoding space as a list of disjoint cubes, i.e. (mask, match) pairs whose
+free bits may take any value. It is built from the packed (mask, match) of
+every existing form (part0 in the low bits):
+
+  - the space starts as the length class cube of the first parcel (the low
+    bits `_insn_length_bits()` in linxdisasm.py decodes), minus the classes
+    that take priority over it (a 16-bit word ending in `1110` is a 48-bit
+    prefix, a 32-bit word ending in `1111` a 64-bit prefix);
+  - a cube with no compatible pattern is free; a cube inside some pattern is
+    used; otherwise it is split on the free bit that the most compatible
+    patterns fix (in practice the major-opcode bits first);
+  - sibling free cubes are merged back together afterwards.
+
+Constrained forms are treated as occupying their whole mask/match cube: the
+words their constraints reject are left alone rather than handed out.
+
+`allocate()` places the requested field widths into contiguous runs of a free
+cube's free bits (never across a part boundary) and fixes every other free bit
+to 0. A placement of F field bits in a free cube of dimension D leaves D-F
+smaller free cubes behind, so candidates are ranked by that `waste` first: an
+exact fit leaves no fragments, and the large free cubes are kept for later.
+
+The index is cached next to the compiled catalog, keyed by the SHA-256 of the
+catalog JSON, so queries only hash the catalog and unpickle a few thousand
+cubes. Writing a new index deletes the ones for older digests of the catalog.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import pickle
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from linxisa.cache import cache_dir, cache_disabled, catalog_prefix, prune_stale, write_atomic
+from linxisa.encoding import hex_width
+
+
+# Bump when the index layout or the decomposition changes.
+ALLOC_FORMAT = 1
+
+Cube = Tuple[int, int]
+
+# Length class of the first parcel per instruction length: the cube it lives in
+# and the cubes inside it that decode as a different length.
+LENGTH_CLASSES: Dict[int, Tuple[Cube, Tuple[Cube, ...]]] = {
+    16: ((0x1, 0x0), ((0xF, 0xE),)),
+    32: ((0x1, 0x1), ((0xF, 0xF),)),
+    48: ((0xF, 0xE), ()),
+    64: ((0xF, 0xF), ()),
+}
+
+
+def free_cubes(keys: Sequence[Cube], width_bits: int, root: Cube, reserved: Sequence[Cube] = ()) -> List[Cube]:
+    """Disjoint cubes covering the words in `root` that match none of `keys` or `reserved`."""
+    full = (1 << width_bits) - 1
+    rmask, rmatch = root
+    pats = [(m & full, v & m & full) for m, v in list(keys) + list(reserved)]
+    live0 = [(m, v) for m, v in pats if (v ^ rmatch) & m & rmask == 0]
+    out: List[Cube] = []
+    stack: List[Tuple[int, int, List[Cube]]] = [(rmask, rmatch & rmask, live0)]
+    while stack:
+        mask, match, live = stack.pop()
+        if not live:
+            out.append((mask, match))
+            continue
+        if any(m & ~mask == 0 for m, _ in live):
+            continue
+        free = full & ~mask
+        best_bit = -1
+        best_count = 0
+        for bit in range(width_bits):
+            b = 1 << bit
+            if not free & b:
+                continue
+            n = sum(1 for m, _ in live if m & b)
+            if n > best_count:
+                best_bit, best_count = bit, n
+        b = 1 << best_bit
+        for val in (0, b):
+            sub = [(m, v) for m, v in live if not m & b or (v & b) == val]
+            stack.append((mask | b, match | val, sub))
+    return merge_cubes(out, rmask)
+
+
+def merge_cubes(cubes: List[Cube], keep_mask: int = 0) -> List[Cube]:
+    """Merge pairs of cubes that differ in one fixed bit (outside `keep_mask`) until none are left."""
+    cur = set(cubes)
+    changed = True
+    while changed:
+        changed = False
+        by_mask: Dict[int, set] = {}
+        for m, v in cur:
+            by_mask.setdefault(m, set()).add(v)
+        nxt: set = set()
+        for m, vals in by_mask.items():
+            bits = m & ~keep_mask
+            for v in sorted(vals):
+                if v not in vals:
+                    continue
+                merged = False
+                b = bits
+                while b:
+                    low = b & -b
+                    b ^= low
+                    if not v & low and (v | low) in vals:
+                        vals.discard(v)
+                        vals.discard(v | low)
+                        nxt.add((m & ~low, v))
+                        merged = changed = True
+                        break
+                if not merged:
+                    vals.discard(v)
+                    nxt.add((m, v))
+        cur = nxt
+    return sorted(cur, key=lambda c: (c[0].bit_count(), c[0], c[1]))
+
+
+class Candidate:
+    """One proposed encoding: fixed bits plus the bit range of each requested field."""
+
+    __slots__ = ("length_bits", "mask", "match", "fields", "waste", "cube")
+
+    def __init__(
+        self,
+        length_bits: int,
+        mask: int,
+        match: int,
+        fields: List[Tuple[int, int]],
+        waste: int,
+        cube: Cube,
+    ) -> None:
+        self.length_bits = length_bits
+        self.mask = mask
+        self.match = match
+        self.fields = fields
+        self.waste = waste
+        self.cube = cube
+
+    def pattern(self, part_widths: Sequence[int]) -> str:
+        """MSB->LSB pattern per part, part0 first (`0`/`1` fixed, `a`, `b`, ... field bits)."""
+        owner: Dict[int, str] = {}
+        for k, (msb, lsb) in enumerate(self.fields):
+            for bit in range(lsb, msb + 1):
+                owner[bit] = chr(ord("a") + k % 26)
+        parts: List[str] = []
+        off = 0
+        for w in part_widths:
+            bits = []
+            for bit in range(off + w - 1, off - 1, -1):
+                bits.append(owner.get(bit) or str((self.match >> bit) & 1))
+            parts.append("".join(bits))
+            off += w
+        return " ".join(parts)
+
+    def to_json(self, part_widths: Sequence[int]) -> Dict[str, Any]:
+        w = self.length_bits
+        return {
+            "length_bits": w,
+            "mask": hex_width(self.mask, w),
+            "match": hex_width(self.match, w),
+            "pattern": self.pattern(part_widths),
+            "fields": [{"msb": msb, "lsb": lsb} for msb, lsb in self.fields],
+            "waste": self.waste,
+            "free_cube": {"mask": hex_width(self.cube[0], w), "match": hex_width(self.cube[1], w)},
+        }
+
+
+def _free_runs(free: int, part_widths: Sequence[int]) -> List[List[int]]:
+    """Contiguous runs of free bits as [msb, lsb], split at part boundaries."""
+    runs: List[List[int]] = []
+    off = 0
+    for w in part_widths:
+        bit = off + w - 1
+        while bit >= off:
+            if (free >> bit) & 1:
+                msb = bit
+                while bit >= off and (free >> bit) & 1:
+                    bit -= 1
+                runs.append([msb, bit + 1])
+            else:
+                bit -= 1
+        off += w
+    return runs
+
+
+def _place(free: int, widths: Sequence[int], part_widths: Sequence[int]) -> Optional[List[Tuple[int, int]]]:
+    """Best-fit each field (widest first) into the shortest run that holds it, at the run's top."""
+    runs = _free_runs(free, part_widths)
+    placed: List[Optional[Tuple[int, int]]] = [None] * len(widths)
+    for k in sorted(range(len(widths)), key=lambda k: -widths[k]):
+        w = widths[k]
+        fits = [r for r in runs if r[0] - r[1] + 1 >= w]
+        if not fits:
+            return None
+        run = min(fits, key=lambda r: (r[0] - r[1], -r[0]))
+        placed[k] = (run[0], run[0] - w + 1)
+        run[0] -= w
+    return [p for p in placed if p is not None]
+
+
+class FreeSpaceIndex:
+    """Free cubes per instruction length, plus the part widths of that length."""
+
+    def __init__(self, sha256: str, lengths: Dict[int, Dict[str, Any]]) -> None:
+        self.sha256 = sha256
+        self.lengths = lengths
+
+    @classmethod
+    def build(cls, sha256: str, keys_by_length: Dict[int, Tuple[Tuple[int, ...], List[Cube]]]) -> "FreeSpaceIndex":
+        """`keys_by_length`: length -> (part widths, packed (mask, match) of every form of that length)."""
+        lengths: Dict[int, Dict[str, Any]] = {}
+        for length, (part_widths, keys) in sorted(keys_by_length.items()):
+            root, reserved = LENGTH_CLASSES.get(length, ((0, 0), ()))
+            cubes = free_cubes(keys, length, root, reserved)
+            lengths[length] = {
+                "part_widths": tuple(part_widths),
+                "cubes": cubes,
+                "free_words": sum(1 << (length - m.bit_count()) for m, _ in cubes),
+            }
+        return cls(sha256, lengths)
+
+    def allocate(self, length_bits: int, widths: Sequence[int], top: int = 10) -> List[Candidate]:
+        entry = self.lengths.get(length_bits)
+        if entry is None:
+            raise KeyError(length_bits)
+        full = (1 << length_bits) - 1
+        need = sum(widths)
+        out: List[Candidate] = []
+        for mask, match in entry["cubes"]:
+            free = full & ~mask
+            dim = free.bit_count()
+            if dim < need:
+                continue
+            fields = _place(free, widths, entry["part_widths"])
+            if fields is None:
+                continue
+            field_bits = 0
+            for msb, lsb in fields:
+                field_bits |= ((1 << (msb - lsb + 1)) - 1) << lsb
+            out.append(Candidate(length_bits, full & ~field_bits, match, fields, dim - need, (mask, match)))
+        out.sort(key=lambda c: (c.waste, -c.cube[0].bit_count(), c.match))
+        return out[:top] if top > 0 else out
+
+    def to_blob(self) -> bytes:
+        data = {"format": ALLOC_FORMAT, "sha256": self.sha256, "lengths": self.lengths}
+        return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _index_prefix(spec_path: Path) -> str:
+    return f"{catalog_prefix(spec_path)}alloc-"
+
+
+def _index_path(spec_path: Path, digest: str) -> Path:
+    return cache_dir() / f"{_index_prefix(spec_path)}{digest[:20]}.pickle"
+
+
+def open_index(
+    spec_path: Path,
+    build_keys: Callable[[], Dict[int, Tuple[Tuple[int, ...], List[Cube]]]],
+) -> Tuple[FreeSpaceIndex, bool]:
+    """
+    Return (index, cache_hit) for the catalog at `spec_path`. On a miss
+    `build_keys()` supplies the per-length patterns and the index is cached.
+    """
+    digest = hashlib.sha256(spec_path.read_bytes()).hexdigest()
+    path = None if cache_disabled() else _index_path(spec_path, digest)
+    if path is not None:
+        try:
+            with path.open("rb") as f:
+                data = pickle.load(f)
+        except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+            data = None
+        if isinstance(data, dict) and data.get("format") == ALLOC_FORMAT and data.get("sha256") == digest:
+            return FreeSpaceIndex(digest, data["lengths"]), True
+    index = FreeSpaceIndex.build(digest, build_keys())
+    if path is not None and write_atomic(path, index.to_blob()):
+        prune_stale(path, _index_prefix(spec_path))
+    return index, False
@@ -0,0 +1,289 @@
+"""
+Precompiled, content-hash keyed cache of the compiled ISA catalog.
+
+Every catalog consumer used to `json.load` the multi-megabyte
+`isa/v0.3/linxisa-v0.3.json` and re-derive masks, field pieces and register
+tables on each invocation. `load_compiled()` does that derivation once, stores
+the result as a pickle blob keyed by the SHA-256 of the catalog bytes, and
+serves later invocations from the blob. Editing the JSON changes its hash, so
+the next load transparently rebuilds the entry.
+
+The compiled view is plain dicts/lists/ints/strings:
+
+  {
+    "format": CACHE_FORMAT,
+    "sha256": "<catalog digest>",
+    "schema"/"isa"/"version": catalog header strings,
+    "spec_path": optional `_spec_path` override from the catalog,
+    "instructions": [
+      {
+        "id", "uid", "mnemonic", "group", "asm" (or None), "length_bits",
+        "mask", "match",           # packed over all parts (part0 in the low bits)
+        "fields": [...],           # combined fields, pieces offset into the packed word
+        "parts": [
+          {"width_bits", "mask", "match", "fields": [...], "constraints": [...]}
+        ],
+      }
+    ],
+    "reg5": [{"code", "name", "asm", "aliases"}],
+  }
+
+Fields are `{"name", "signed", "pieces": [{"insn_lsb", "insn_msb", "width",
+"value_lsb", "value_msb"}]}`; `value_lsb`/`value_msb` are None when the
+catalog does not slice the field value. Combined field pieces are ordered by
+(value_lsb or 0, insn_lsb); per-part pieces keep catalog order.
+
+Environment:
+  LINXISA_CACHE_DIR  cache directory (default: $XDG_CACHE_HOME/linxisa or ~/.cache/linxisa)
+  LINXISA_NO_CACHE=1 always derive from JSON and never touch the cache directory
+"""
+
+from __future__ import annotations
+
+import gc
+import hashlib
+import json
+import os
+import pickle
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from linxisa.encoding import parse_hex
+
+
+# Bump when the compiled layout changes so stale blobs are never reused.
+CACHE_FORMAT = 2
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+def cache_dir() -> Path:
+    env = os.environ.get("LINXISA_CACHE_DIR")
+    if env:
+        return Path(env)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    if xdg:
+        return Path(xdg) / "linxisa"
+    return Path.home() / ".cache" / "linxisa"
+
+
+def cache_disabled() -> bool:
+    return os.environ.get("LINXISA_NO_CACHE", "") not in ("", "0")
+
+
+def _compile_fields(raw_fields: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    out: List[Dict[str, Any]] = []
+    for f in raw_fields:
+        pieces: List[Dict[str, Any]] = []
+        for p in f.get("pieces", []):
+            value_lsb = p.get("value_lsb")
+            value_msb = p.get("value_msb")
+            pieces.append(
+                {
+                    "insn_lsb": int(p.get("insn_lsb", 0)),
+                    "insn_msb": int(p.get("insn_msb", 0)),
+                    "width": int(p.get("width", 0)),
+                    "value_lsb": int(value_lsb) if value_lsb is not None else None,
+                    "value_msb": int(value_msb) if value_msb is not None else None,
+                }
+            )
+        out.append({"name": str(f.get("name", "")), "signed": f.get("signed", None), "pieces": pieces})
+    return out
+
+
+def _combine_fields(parts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Merge per-part fields by name into the packed instruction word (first part at bit 0)."""
+    by_name: Dict[str, Dict[str, Any]] = {}
+    offset = 0
+    for part in parts:
+        for f in part["fields"]:
+            name = f["name"]
+            if not name:
+                continue
+            existing = by_name.get(name)
+            if existing is None:
+                existing = {"name": name, "signed": f["signed"], "pieces": []}
+                by_name[name] = existing
+            if existing["signed"] is None and f["signed"] is not None:
+                existing["signed"] = f["signed"]
+            for p in f["pieces"]:
+                q = dict(p)
+                q["insn_lsb"] += offset
+                q["insn_msb"] += offset
+                existing["pieces"].append(q)
+        offset += part["width_bits"]
+    for f in by_name.values():
+        f["pieces"].sort(key=lambda p: (p["value_lsb"] or 0, p["insn_lsb"]))
+    return list(by_name.values())
+
+
+def compile_spec(spec: Dict[str, Any], sha256: str = "") -> Dict[str, Any]:
+    """Derive the compiled (cacheable) view from a parsed catalog."""
+    instructions: List[Dict[str, Any]] = []
+    for inst in spec.get("instructions", []):
+        enc = inst.get("encoding", {}) or {}
+        length_bits = int(enc.get("length_bits", inst.get("length_bits", 0)))
+        parts: List[Dict[str, Any]] = []
+        mask = 0
+        match = 0
+        offset = 0
+        for p in enc.get("parts", []):
+            width_bits = int(p.get("width_bits", 0))
+            part_mask = parse_hex(p.get("mask", "0x0"))
+            part_match = parse_hex(p.get("match", "0x0"))
+            parts.append(
+                {
+                    "width_bits": width_bits,
+                    "mask": part_mask,
+                    "match": part_match,
+                    "fields": _compile_fields(p.get("fields", [])),
+                    "constraints": [
+                        {"field": str(c.get("field")), "op": str(c.get("op")), "value": str(c.get("value"))}
+                        for c in p.get("constraints", []) or []
+                    ],
+                }
+            )
+            mask |= part_mask << offset
+            match |= part_match << offset
+            offset += width_bits
+
+        asm = inst.get("asm")
+        src = inst.get("source", {}) or {}
+        instructions.append(
+            {
+                "id": str(inst.get("id", "")),
+                "uid": str(inst.get("uid", "")),
+                "mnemonic": str(inst.get("mnemonic", "")),
+                "group": str(inst.get("group", "") or ""),
+                "asm": str(asm) if asm is not None else None,
+                "length_bits": length_bits,
+                "mask": mask,
+                "match": match,
+                "fields": _combine_fields(parts),
+                "parts": parts,
+                "source": f"{src['file']}:{src['line']}" if src.get("file") and src.get("line") else "",
+            }
+        )
+
+    reg5: List[Dict[str, Any]] = []
+    for e in (spec.get("registers") or {}).get("reg5", {}).get("entries", []) or []:
+        code = e.get("code")
+        reg5.append(
+            {
+                "code": int(code) if code is not None else None,
+                "name": str(e.get("name", "") or ""),
+                "asm": str(e.get("asm", "") or ""),
+                "aliases": [str(a) for a in (e.get("aliases") or [])],
+            }
+        )
+
+    spec_path = spec.get("_spec_path")
+    return {
+        "format": CACHE_FORMAT,
+        "sha256": sha256,
+        "schema": str(spec.get("schema", "")),
+        "isa": str(spec.get("isa", "")),
+        "version": str(spec.get("version", "")),
+        "spec_path": str(spec_path) if spec_path else None,
+        "instructions": instructions,
+        "reg5": reg5,
+    }
+
+
+def catalog_prefix(spec_path: Path) -> str:
+    """`<stem>-<dir tag>-`: catalogs with the same name in different directories get their own entries."""
+    tag = hashlib.sha256(str(spec_path.resolve().parent).encode("utf-8")).hexdigest()[:8]
+    return f"{spec_path.stem}-{tag}-"
+
+
+def _cache_path(spec_path: Path, digest: str) -> Path:
+    return cache_dir() / f"{catalog_prefix(spec_path)}{digest[:20]}.pickle"
+
+
+def _read_blob(path: Path, digest: str) -> Optional[Dict[str, Any]]:
+    # The blob is tens of thousands of small containers; cyclic GC passes
+    # triggered mid-load only cost time, as nothing in it can form a cycle.
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with path.open("rb") as f:
+            data = pickle.load(f)
+    except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+        return None
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    if not isinstance(data, dict) or data.get("format") != CACHE_FORMAT or data.get("sha256") != digest:
+        return None
+    return data
+
+
+def write_atomic(path: Path, data: bytes) -> bool:
+    """
+    Publish `data` at `path` via a temporary file and rename, so readers never
+    see a partial file. Returns False (instead of raising) when the directory
+    is not writable: cache entries are an optimization, not a requirement.
+    """
+    import tempfile
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=path.name + ".", dir=str(path.parent))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+    except OSError:
+        return False
+    return True
+
+
+def prune_stale(path: Path, prefix: str) -> None:
+    """
+    Delete the entries next to `path` named `<prefix><20 hex digits>.pickle`,
+    i.e. older digests of the same entry. Names are matched exactly, so other
+    caches sharing the directory are left alone.
+    """
+    stale = re.compile(re.escape(prefix) + r"[0-9a-f]{20}\.pickle")
+    try:
+        names = list(path.parent.iterdir())
+    except OSError:
+        return
+    for old in names:
+        if old != path and stale.fullmatch(old.name):
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+
+def _write_blob(path: Path, prefix: str, data: Dict[str, Any]) -> None:
+    """Atomically publish a cache entry and drop stale entries for the same catalog."""
+    if write_atomic(path, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)):
+        prune_stale(path, prefix)
+
+
+def load_compiled(spec_path: PathLike) -> Dict[str, Any]:
+    """
+    Return the compiled view of the catalog at `spec_path`, using the cache when possible.
+    """
+    path = Path(spec_path)
+    raw = path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    if cache_disabled():
+        return compile_spec(json.loads(raw), digest)
+
+    blob = _cache_path(path, digest)
+    data = _read_blob(blob, digest)
+    if data is not None:
+        return data
+    data = compile_spec(json.loads(raw), digest)
+    _write_blob(blob, catalog_prefix(path), data)
+    return data
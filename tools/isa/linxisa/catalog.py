@@ -0,0 +1,310 @@
+"""
+Indexed, lazily built object model over the compiled ISA catalog.
+
+`load_catalog(path)` returns a `Catalog` backed by the compiled view from
+`linxisa.cache` (so repeat loads skip JSON parsing). Records are slotted
+dataclasses; they are materialized on first access, and each lookup index
+(by id, mnemonic, group, length) is built the first time it is queried, so a
+tool that only needs `reg5` never pays for the instruction records.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from linxisa.cache import PathLike, compile_spec, load_compiled
+
+
+class _Record:
+    """Base for the slotted catalog records: attribute access only, identity equality."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        args = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({args})"
+
+
+class FieldPiece(_Record):
+    __slots__ = ("insn_lsb", "insn_msb", "width", "value_lsb", "value_msb")
+
+    def __init__(self, insn_lsb: int, insn_msb: int, width: int, value_lsb: int, value_msb: Optional[int]) -> None:
+        self.insn_lsb = insn_lsb
+        self.insn_msb = insn_msb
+        self.width = width
+        self.value_lsb = value_lsb
+        self.value_msb = value_msb
+
+
+class Field(_Record):
+    __slots__ = ("name", "signed", "pieces", "bit_width")
+
+    def __init__(self, name: str, signed: Optional[bool], pieces: Tuple[FieldPiece, ...], bit_width: int) -> None:
+        self.name = name
+        self.signed = signed
+        self.pieces = pieces
+        self.bit_width = bit_width
+
+
+class Constraint(_Record):
+    __slots__ = ("field", "op", "value")
+
+    def __init__(self, field: str, op: str, value: str) -> None:
+        self.field = field
+        self.op = op
+        self.value = value
+
+
+class Part(_Record):
+    __slots__ = ("index", "width_bits", "offset", "mask", "match", "fields", "constraints")
+
+    def __init__(
+        self,
+        index: int,
+        width_bits: int,
+        offset: int,
+        mask: int,
+        match: int,
+        fields: Dict[str, Field],
+        constraints: Tuple[Constraint, ...],
+    ) -> None:
+        self.index = index
+        self.width_bits = width_bits
+        self.offset = offset
+        self.mask = mask
+        self.match = match
+        self.fields = fields
+        self.constraints = constraints
+
+
+class Instruction(_Record):
+    """
+    One instruction form. `mask`/`match`/`fields` describe the packed word
+    (part0 in the low bits); `parts` keeps the per-part view. `source` is
+    the originating `file:line` in the opcode database ("" if unknown).
+    """
+
+    __slots__ = (
+        "id",
+        "uid",
+        "mnemonic",
+        "group",
+        "asm",
+        "length_bits",
+        "mask",
+        "match",
+        "fixed_bits",
+        "fields",
+        "parts",
+        "source",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        uid: str,
+        mnemonic: str,
+        group: str,
+        asm: str,
+        length_bits: int,
+        mask: int,
+        match: int,
+        fixed_bits: int,
+        fields: Dict[str, Field],
+        parts: Tuple[Part, ...],
+        source: str,
+    ) -> None:
+        self.id = id
+        self.uid = uid
+        self.mnemonic = mnemonic
+        self.group = group
+        self.asm = asm
+        self.length_bits = length_bits
+        self.mask = mask
+        self.match = match
+        self.fixed_bits = fixed_bits
+        self.fields = fields
+        self.parts = parts
+        self.source = source
+
+
+class RegEntry(_Record):
+    __slots__ = ("code", "name", "asm", "aliases")
+
+    def __init__(self, code: Optional[int], name: str, asm: str, aliases: Tuple[str, ...]) -> None:
+        self.code = code
+        self.name = name
+        self.asm = asm
+        self.aliases = aliases
+
+
+def _make_field(raw: Dict[str, Any]) -> Field:
+    pieces = tuple(
+        FieldPiece(
+            insn_lsb=p["insn_lsb"],
+            insn_msb=p["insn_msb"],
+            width=p["width"],
+            value_lsb=p["value_lsb"] or 0,
+            value_msb=p["value_msb"],
+        )
+        for p in raw["pieces"]
+    )
+    bit_width = max((p.value_lsb + p.width for p in pieces), default=0)
+    return Field(name=raw["name"], signed=raw["signed"], pieces=pieces, bit_width=bit_width)
+
+
+def _make_instruction(raw: Dict[str, Any]) -> Instruction:
+    parts: List[Part] = []
+    offset = 0
+    for index, p in enumerate(raw["parts"]):
+        parts.append(
+            Part(
+                index=index,
+                width_bits=p["width_bits"],
+                offset=offset,
+                mask=p["mask"],
+                match=p["match"],
+                fields={f["name"]: _make_field(f) for f in p["fields"]},
+                constraints=tuple(Constraint(c["field"], c["op"], c["value"]) for c in p["constraints"]),
+            )
+        )
+        offset += p["width_bits"]
+    return Instruction(
+        id=raw["id"],
+        uid=raw["uid"],
+        mnemonic=raw["mnemonic"],
+        group=raw["group"],
+        asm=raw["asm"] or "",
+        length_bits=raw["length_bits"],
+        mask=raw["mask"],
+        match=raw["match"],
+        fixed_bits=raw["mask"].bit_count(),
+        fields={f["name"]: _make_field(f) for f in raw["fields"]},
+        parts=tuple(parts),
+        source=raw["source"],
+    )
+
+
+class Catalog:
+    """Catalog records plus O(1) lookup indexes, each built on first use."""
+
+    __slots__ = (
+        "compiled",
+        "_instructions",
+        "_by_id",
+        "_by_mnemonic",
+        "_by_group",
+        "_by_length",
+        "_reg5",
+        "_reg_codes",
+    )
+
+    def __init__(self, compiled: Dict[str, Any]) -> None:
+        self.compiled = compiled
+        self._instructions: Optional[List[Instruction]] = None
+        self._by_id: Optional[Dict[str, Instruction]] = None
+        self._by_mnemonic: Optional[Dict[str, List[Instruction]]] = None
+        self._by_group: Optional[Dict[str, List[Instruction]]] = None
+        self._by_length: Optional[Dict[int, List[Instruction]]] = None
+        self._reg5: Optional[List[RegEntry]] = None
+        self._reg_codes: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def from_spec(cls, spec: Dict[str, Any]) -> "Catalog":
+        return cls(compile_spec(spec))
+
+    @property
+    def sha256(self) -> str:
+        return self.compiled["sha256"]
+
+    @property
+    def version(self) -> str:
+        return self.compiled["version"]
+
+    @property
+    def spec_path(self) -> Optional[str]:
+        """The catalog's `_spec_path` override, if any."""
+        return self.compiled["spec_path"]
+
+    @property
+    def instructions(self) -> List[Instruction]:
+        """All instruction forms, in catalog order."""
+        if self._instructions is None:
+            self._instructions = [_make_instruction(raw) for raw in self.compiled["instructions"]]
+        return self._instructions
+
+    def __len__(self) -> int:
+        return len(self.compiled["instructions"])
+
+    def by_id(self, inst_id: str) -> Optional[Instruction]:
+        if self._by_id is None:
+            self._by_id = {inst.id: inst for inst in self.instructions}
+        return self._by_id.get(inst_id)
+
+    def by_mnemonic(self, mnemonic: str) -> List[Instruction]:
+        if self._by_mnemonic is None:
+            idx: Dict[str, List[Instruction]] = {}
+            for inst in self.instructions:
+                idx.setdefault(inst.mnemonic, []).append(inst)
+            self._by_mnemonic = idx
+        return self._by_mnemonic.get(mnemonic, [])
+
+    def by_group(self, group: str) -> List[Instruction]:
+        if self._by_group is None:
+            idx: Dict[str, List[Instruction]] = {}
+            for inst in self.instructions:
+                idx.setdefault(inst.group, []).append(inst)
+            self._by_group = idx
+        return self._by_group.get(group, [])
+
+    def _length_index(self) -> Dict[int, List[Instruction]]:
+        if self._by_length is None:
+            idx: Dict[int, List[Instruction]] = {}
+            for inst in self.instructions:
+                idx.setdefault(inst.length_bits, []).append(inst)
+            self._by_length = idx
+        return self._by_length
+
+    def by_length(self, length_bits: int) -> List[Instruction]:
+        return self._length_index().get(length_bits, [])
+
+    def lengths(self) -> List[int]:
+        return sorted(self._length_index())
+
+    @property
+    def reg5(self) -> List[RegEntry]:
+        if self._reg5 is None:
+            self._reg5 = [
+                RegEntry(code=e["code"], name=e["name"], asm=e["asm"], aliases=tuple(e["aliases"]))
+                for e in self.compiled["reg5"]
+            ]
+        return self._reg5
+
+    def reg_code(self, name: str) -> Optional[int]:
+        """Resolve a reg5 name, asm spelling or alias (case-insensitive) to its code."""
+        if self._reg_codes is None:
+            codes: Dict[str, int] = {}
+            for e in self.reg5:
+                if e.code is None:
+                    continue
+                for a in e.aliases:
+                    codes[a.upper()] = e.code
+                codes[e.asm.upper()] = e.code
+                codes[e.name.upper()] = e.code
+            self._reg_codes = codes
+        return self._reg_codes.get(name.upper())
+
+
+_LOADED: Dict[Tuple[str, str], Catalog] = {}
+
+
+def load_catalog(spec_path: PathLike) -> Catalog:
+    """Load (and memoize per catalog content) the catalog at `spec_path`."""
+    compiled = load_compiled(spec_path)
+    key = (str(Path(spec_path).resolve()), compiled["sha256"])
+    cat = _LOADED.get(key)
+    if cat is None:
+        cat = Catalog(compiled)
+        _LOADED[key] = cat
+    return cat
@@ -0,0 +1,141 @@
+"""
+Compiled per-form field constraints (e.g. `RegDst!=RA`, `Function>=3`).
+
+`build_golden.py` records these on encoding parts to disambiguate forms whose
+fixed bits overlap. `form_constraints()` resolves them against the packed
+instruction word (symbolic values such as `RA` via the catalog's reg5 table)
+and `compile_predicate()` folds a form's constraints into one `word -> bool`
+closure. Fields up to `BITSET_MAX_WIDTH` bits wide are checked through a
+precomputed allowed-value bitset, so each constraint costs a shift, a mask and
+a bit test however many `!=` values it excludes.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from linxisa.catalog import Catalog, Field, Instruction
+from linxisa.encoding import parse_int
+
+
+OPS = {
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+}
+
+BITSET_MAX_WIDTH = 16
+
+
+class FieldConstraint:
+    """One `field op value` constraint, located in the packed instruction word."""
+
+    __slots__ = ("field", "op", "value", "gather", "width", "signed_width")
+
+    def __init__(self, field: Field, offset: int, op: str, value: int) -> None:
+        self.field = field.name
+        self.op = op
+        self.value = value
+        # Pieces of the per-part field, relocated into the packed word.
+        self.gather: Tuple[Tuple[int, int, int], ...] = tuple(
+            (p.insn_lsb + offset, (1 << p.width) - 1, p.value_lsb) for p in field.pieces
+        )
+        self.width = field.bit_width
+        self.signed_width = field.bit_width if field.signed is True else 0
+
+    def __repr__(self) -> str:
+        return f"FieldConstraint({self.field}{self.op}{self.value})"
+
+    def extract(self, word: int) -> int:
+        v = 0
+        for insn_lsb, width_mask, value_lsb in self.gather:
+            v |= ((word >> insn_lsb) & width_mask) << value_lsb
+        if self.signed_width and v >> (self.signed_width - 1):
+            v -= 1 << self.signed_width
+        return v
+
+    def holds(self, word: int) -> bool:
+        return OPS[self.op](self.extract(word), self.value)
+
+    def allowed_bitset(self) -> int:
+        """Bit `u` is set iff raw (unsigned) field bits `u` satisfy the constraint."""
+        test = OPS[self.op]
+        bits = 0
+        for u in range(1 << self.width):
+            v = u - (1 << self.width) if self.signed_width and u >> (self.width - 1) else u
+            if test(v, self.value):
+                bits |= 1 << u
+        return bits
+
+    def holds_array(self, np: Any, words: Any) -> Any:
+        """Vectorized `holds` over a uint64 array (NumPy module passed in)."""
+        v = np.zeros(len(words), dtype=np.int64)
+        for insn_lsb, width_mask, value_lsb in self.gather:
+            v |= ((words >> np.uint64(insn_lsb)) & np.uint64(width_mask)).astype(np.int64) << value_lsb
+        if self.signed_width:
+            v = np.where(v >> (self.signed_width - 1), v - (1 << self.signed_width), v)
+        return OPS[self.op](v, self.value)
+
+
+def form_constraints(inst: Instruction, catalog: Catalog) -> Tuple[FieldConstraint, ...]:
+    """
+    Resolve the part constraints of `inst`. Constraints naming a field the part
+    does not have, using an unknown operator, or comparing against a symbol the
+    catalog cannot resolve are skipped (there is nothing to check against).
+    """
+    out: List[FieldConstraint] = []
+    for part in inst.parts:
+        for c in part.constraints:
+            field = part.fields.get(c.field)
+            if field is None or c.op not in OPS:
+                continue
+            try:
+                value: Optional[int] = parse_int(c.value)
+            except ValueError:
+                value = catalog.reg_code(c.value)
+            if value is None:
+                continue
+            out.append(FieldConstraint(field, part.offset, c.op, value))
+    return tuple(out)
+
+
+def _bitset_test(gather: Tuple[Tuple[int, int, int], ...], allowed: int) -> Callable[[int], Any]:
+    if len(gather) == 1:
+        (insn_lsb, width_mask, value_lsb), = gather
+        if value_lsb == 0:
+            return lambda w: (allowed >> ((w >> insn_lsb) & width_mask)) & 1
+
+    def test(w: int) -> int:
+        u = 0
+        for insn_lsb, width_mask, value_lsb in gather:
+            u |= ((w >> insn_lsb) & width_mask) << value_lsb
+        return (allowed >> u) & 1
+
+    return test
+
+
+def compile_predicate(constraints: Tuple[FieldConstraint, ...]) -> Optional[Callable[[int], Any]]:
+    """
+    Fold constraints into one `word -> truthy` predicate (None when there is
+    nothing to check). Constraints on the same narrow field share one bitset,
+    so e.g. `Function!=0`, `Function!=2`, `Function!=8` is a single bit test.
+    """
+    bitsets: Dict[Tuple[Tuple[int, int, int], ...], int] = {}
+    tests: List[Callable[[int], Any]] = []
+    for c in constraints:
+        if c.width <= BITSET_MAX_WIDTH:
+            bitsets[c.gather] = bitsets.get(c.gather, -1) & c.allowed_bitset()
+        else:
+            tests.append(c.holds)
+    tests[:0] = [_bitset_test(gather, allowed) for gather, allowed in bitsets.items()]
+    if not tests:
+        return None
+    if len(tests) == 1:
+        return tests[0]
+    if len(tests) == 2:
+        a, b = tests
+        return lambda w: a(w) and b(w)
+    return lambda w: all(t(w) for t in tests)
@@ -0,0 +1,95 @@
+"""
+Direct-index decode table for the 16-bit compressed space.
+
+The compressed forms (`lx_c.opc`) live in a 65,536-word space, so decoding one
+is a single load from a table holding, for every 16-bit word, the index of the
+form it decodes to. Each word gets the form a constraint-aware linear scan
+would return: the first form, most fixed bits first and ties broken by id (the
+`linxdisasm.py` order), whose mask/match hits and whose constraints hold. Words
+no form accepts hold `NONE`.
+
+Indexes are positions in `c_form_order(catalog)`, the order of
+`linxisa_inst_forms[]` in the generated C codec, so the C table emitted by
+`gen_c_codec.py` (`linxisa_decode16_table[]`) and the Python one are the same
+array. `load_table()` returns it as an `array('H')`, cached by catalog hash as
+a little-endian blob; `table_numpy()` is a zero-copy `uint16` view of it.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, List
+
+from linxisa.cache import cache_dir, cache_disabled, write_atomic
+from linxisa.catalog import Catalog, Instruction
+from linxisa.constraints import compile_predicate, form_constraints
+
+
+# Bump when the table layout or its priority rule changes.
+TABLE_FORMAT = 1
+
+NONE = 0xFFFF
+SIZE = 1 << 16
+
+
+def c_form_order(catalog: Catalog) -> List[Instruction]:
+    """Forms in `linxisa_inst_forms[]` order (by mnemonic, then id)."""
+    return sorted(catalog.instructions, key=lambda i: (i.mnemonic, i.id))
+
+
+def build_table(catalog: Catalog) -> array:
+    """Compute the table. Each form fills only the free words of its own mask/match cube."""
+    index = {inst.id: i for i, inst in enumerate(c_form_order(catalog))}
+    if len(index) >= NONE:
+        raise ValueError(f"{len(index)} forms do not fit a uint16 form index")
+    table = array("H", [NONE]) * SIZE
+    forms = sorted(catalog.by_length(16), key=lambda f: (-f.fixed_bits, f.id))
+    for form in forms:
+        pred = compile_predicate(form_constraints(form, catalog))
+        idx = index[form.id]
+        free = (SIZE - 1) & ~form.mask
+        sub = free
+        while True:
+            w = form.match | sub
+            if table[w] == NONE and (pred is None or pred(w)):
+                table[w] = idx
+            if not sub:
+                break
+            sub = (sub - 1) & free
+    return table
+
+
+def _blob_path(digest: str) -> Path:
+    return cache_dir() / f"decode16-v{TABLE_FORMAT}-{digest[:20]}.bin"
+
+
+def load_table(catalog: Catalog) -> array:
+    """The table for `catalog`, from the cache when its hash matches."""
+    path = None if cache_disabled() or not catalog.sha256 else _blob_path(catalog.sha256)
+    if path is not None:
+        try:
+            blob = path.read_bytes()
+        except OSError:
+            blob = b""
+        if len(blob) == 2 * SIZE:
+            table = array("H")
+            table.frombytes(blob)
+            if sys.byteorder == "big":
+                table.byteswap()
+            return table
+    table = build_table(catalog)
+    if path is not None:
+        out = array("H", table)
+        if sys.byteorder == "big":
+            out.byteswap()
+        write_atomic(path, out.tobytes())
+    return table
+
+
+def table_numpy(table: array) -> Any:
+    """Zero-copy NumPy `uint16` view of a table from `load_table()`."""
+    import numpy as np  # type: ignore
+
+    return np.frombuffer(table, dtype=np.uint16)
@@ -0,0 +1,238 @@
+"""
+Structural diff between two compiled catalogs, keyed on the stable form `id`.
+
+`build_golden.py` derives each form's `uid` (and so its `id`) from the
+mnemonic, length and encoding segments, so:
+
+  - an `id` present on both sides with different records is a *changed* form
+    (asm, group, notes, constraints, field signedness, ...);
+  - an edited encoding shows up as one id removed and another added. Those
+    pairs are reported as *re-encoded* when they share a mnemonic and length
+    and can be matched one-to-one (same source line first, then the only
+    remaining candidate);
+  - everything else is *added* or *removed*.
+
+`source` is ignored when comparing records, so inserting a line in an `.opc`
+file does not mark every form below it as changed.
+
+`CatalogDiff.to_json()` is the interchange format written by
+`diff_catalog.py --out` and consumed by the generators' `--diff` option:
+
+  {"format": 1, "old_sha256", "new_sha256",
+   "added": [id, ...], "removed": [id, ...], "reencoded": [[old, new], ...],
+   "changed": {id: [key, ...]}, "keys_changed": [top-level key, ...],
+   "affected": {"mnemonics": [...], "groups": [...]}, "membership_changed": bool}
+
+`affected` covers both sides, so a form that moved group or was renamed marks
+the old and the new group/mnemonic. `membership_changed` is set when the set
+of forms, or any form's mnemonic, group or length, differs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from linxisa.cache import PathLike
+
+
+DIFF_FORMAT = 1
+
+# Record keys whose change moves a form between index rows or groups.
+MEMBERSHIP_KEYS = ("mnemonic", "group", "length_bits")
+
+_IGNORED_KEYS = ("source",)
+
+
+def _strip(inst: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in inst.items() if k not in _IGNORED_KEYS}
+
+
+def _source_key(inst: Dict[str, Any]) -> Optional[Tuple[str, int]]:
+    src = inst.get("source")
+    if not isinstance(src, dict) or "file" not in src:
+        return None
+    return str(src["file"]), int(src.get("line", 0))
+
+
+def _shape_key(inst: Dict[str, Any]) -> Tuple[str, int]:
+    return str(inst.get("mnemonic", "")), int(inst.get("length_bits", 0))
+
+
+class CatalogDiff:
+    """Forms added, removed, re-encoded and changed between two catalogs."""
+
+    def __init__(
+        self,
+        old: Dict[str, Dict[str, Any]],
+        new: Dict[str, Dict[str, Any]],
+        added: List[str],
+        removed: List[str],
+        reencoded: List[Tuple[str, str]],
+        changed: Dict[str, List[str]],
+        keys_changed: List[str],
+        old_sha256: str = "",
+        new_sha256: str = "",
+    ) -> None:
+        self.old = old
+        self.new = new
+        self.added = added
+        self.removed = removed
+        self.reencoded = reencoded
+        self.changed = changed
+        self.keys_changed = keys_changed
+        self.old_sha256 = old_sha256
+        self.new_sha256 = new_sha256
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.reencoded or self.changed or self.keys_changed)
+
+    def _touched(self) -> Iterable[Dict[str, Any]]:
+        for i in self.added:
+            yield self.new[i]
+        for i in self.removed:
+            yield self.old[i]
+        for o, n in self.reencoded:
+            yield self.old[o]
+            yield self.new[n]
+        for i in self.changed:
+            yield self.old[i]
+            yield self.new[i]
+
+    @property
+    def affected_mnemonics(self) -> Set[str]:
+        return {str(inst.get("mnemonic", "")) for inst in self._touched()}
+
+    @property
+    def affected_groups(self) -> Set[str]:
+        return {str(inst.get("group") or "").strip() for inst in self._touched()}
+
+    @property
+    def membership_changed(self) -> bool:
+        if self.added or self.removed or self.reencoded:
+            return True
+        return any(k in MEMBERSHIP_KEYS for keys in self.changed.values() for k in keys)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "format": DIFF_FORMAT,
+            "old_sha256": self.old_sha256,
+            "new_sha256": self.new_sha256,
+            "added": self.added,
+            "removed": self.removed,
+            "reencoded": [list(p) for p in self.reencoded],
+            "changed": self.changed,
+            "keys_changed": self.keys_changed,
+            "affected": {
+                "mnemonics": sorted(self.affected_mnemonics),
+                "groups": sorted(self.affected_groups),
+            },
+            "membership_changed": self.membership_changed,
+        }
+
+
+def _pair_reencoded(
+    old: Dict[str, Dict[str, Any]], new: Dict[str, Dict[str, Any]], removed: List[str], added: List[str]
+) -> List[Tuple[str, str]]:
+    pairs: List[Tuple[str, str]] = []
+    left = set(removed)
+    right = set(added)
+
+    # Same source line and shape: the line was edited in place.
+    by_source: Dict[Tuple[Any, ...], List[str]] = {}
+    for i in added:
+        by_source.setdefault((_source_key(new[i]), _shape_key(new[i])), []).append(i)
+    for o in removed:
+        sk = _source_key(old[o])
+        cands = [n for n in by_source.get((sk, _shape_key(old[o])), []) if n in right] if sk else []
+        if len(cands) == 1:
+            pairs.append((o, cands[0]))
+            left.discard(o)
+            right.discard(cands[0])
+
+    # Otherwise only an unambiguous one-to-one shape match.
+    olds: Dict[Tuple[str, int], List[str]] = {}
+    news: Dict[Tuple[str, int], List[str]] = {}
+    for o in removed:
+        if o in left:
+            olds.setdefault(_shape_key(old[o]), []).append(o)
+    for n in added:
+        if n in right:
+            news.setdefault(_shape_key(new[n]), []).append(n)
+    for key, os_ in olds.items():
+        ns = news.get(key, [])
+        if len(os_) == 1 and len(ns) == 1:
+            pairs.append((os_[0], ns[0]))
+
+    pairs.sort()
+    return pairs
+
+
+def diff_specs(old_spec: Dict[str, Any], new_spec: Dict[str, Any], old_sha256: str = "", new_sha256: str = "") -> CatalogDiff:
+    """Diff two catalogs as loaded from their JSON."""
+    old = {str(i.get("id")): i for i in old_spec.get("instructions", [])}
+    new = {str(i.get("id")): i for i in new_spec.get("instructions", [])}
+
+    added = sorted(set(new) - set(old))
+    removed = sorted(set(old) - set(new))
+    reencoded = _pair_reencoded(old, new, removed, added)
+    paired_old = {o for o, _ in reencoded}
+    paired_new = {n for _, n in reencoded}
+    added = [i for i in added if i not in paired_new]
+    removed = [i for i in removed if i not in paired_old]
+
+    changed: Dict[str, List[str]] = {}
+    for i in sorted(set(old) & set(new)):
+        a, b = _strip(old[i]), _strip(new[i])
+        if a != b:
+            changed[i] = sorted(k for k in set(a) | set(b) if a.get(k) != b.get(k))
+
+    keys_changed = sorted(
+        k
+        for k in set(old_spec) | set(new_spec)
+        if k not in ("instructions", "instruction_count") and old_spec.get(k) != new_spec.get(k)
+    )
+    return CatalogDiff(old, new, added, removed, reencoded, changed, keys_changed, old_sha256, new_sha256)
+
+
+def diff_bytes(old_data: bytes, new_data: bytes) -> CatalogDiff:
+    return diff_specs(
+        json.loads(old_data),
+        json.loads(new_data),
+        hashlib.sha256(old_data).hexdigest(),
+        hashlib.sha256(new_data).hexdigest(),
+    )
+
+
+def diff_paths(old_path: PathLike, new_path: PathLike) -> CatalogDiff:
+    with open(old_path, "rb") as f:
+        old_data = f.read()
+    with open(new_path, "rb") as f:
+        new_data = f.read()
+    return diff_bytes(old_data, new_data)
+
+
+class DiffSummary:
+    """The parts of a diff JSON (`CatalogDiff.to_json()`) that generators consume."""
+
+    def __init__(self, doc: Dict[str, Any]) -> None:
+        if doc.get("format") != DIFF_FORMAT:
+            raise ValueError(f"unsupported catalog diff format: {doc.get('format')!r}")
+        self.new_sha256 = str(doc.get("new_sha256") or "")
+        self.mnemonics: Set[str] = set(doc["affected"]["mnemonics"])
+        self.groups: Set[str] = set(doc["affected"]["groups"])
+        self.keys_changed: Set[str] = set(doc.get("keys_changed", []))
+        self.membership_changed = bool(doc.get("membership_changed"))
+
+    @classmethod
+    def load(cls, path: PathLike) -> "DiffSummary":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def matches(self, spec_path: PathLike) -> bool:
+        """True when the diff's new side is the catalog at `spec_path`."""
+        if not self.new_sha256:
+            return True
+        with open(spec_path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest() == self.new_sha256
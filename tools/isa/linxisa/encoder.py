@@ -0,0 +1,165 @@
+"""
+Catalog-driven instruction encoder (the inverse of field extraction).
+
+`Encoder.encode(form_id, **fields)` returns the packed instruction word (part0
+in the low bits, as in `linxisa.catalog`). Each form is compiled on first use
+into a scatter plan: the form's `match` as the base word plus, per field, a
+tuple of (value_lsb, width_mask, insn_lsb) pieces, so split immediates such as
+`uimm17[11:0]`/`[16:12]` and fields spanning both halves of a 64-bit form are
+a handful of shift/mask/or steps.
+
+Values are range checked against the field's declared signedness and width
+(signed fields take two's-complement values, unknown signedness is treated as
+unsigned), value bits not covered by any piece must be zero (scaled
+immediates), and per-part constraints such as `RegDst!=RA` are enforced so an
+encoding never silently decodes as a different form. Fields that are not
+given are encoded as zero.
+
+`Encoder.encode_batch()` is the NumPy bulk mode for corpus generation and
+fuzzing: every field value is an array (or scalar, broadcast) and the result is
+a `uint64` array of words.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from linxisa.catalog import Catalog, Field, Instruction
+from linxisa.constraints import form_constraints
+
+
+class EncodeError(ValueError):
+    pass
+
+
+class _FieldPlan:
+    __slots__ = ("name", "lo", "hi", "value_mask", "gap_mask", "scatter")
+
+    def __init__(self, field: Field) -> None:
+        width = field.bit_width
+        covered = 0
+        for p in field.pieces:
+            covered |= ((1 << p.width) - 1) << p.value_lsb
+        self.name = field.name
+        if field.signed is True and width > 0:
+            self.lo = -(1 << (width - 1))
+            self.hi = (1 << (width - 1)) - 1
+        else:
+            self.lo = 0
+            self.hi = (1 << width) - 1
+        self.value_mask = (1 << width) - 1
+        self.gap_mask = self.value_mask & ~covered
+        self.scatter: Tuple[Tuple[int, int, int], ...] = tuple(
+            (p.value_lsb, (1 << p.width) - 1, p.insn_lsb) for p in field.pieces
+        )
+
+
+class _FormPlan:
+    __slots__ = ("inst", "base", "fields", "constraints")
+
+    def __init__(self, inst: Instruction, catalog: Catalog) -> None:
+        self.inst = inst
+        self.base = inst.match
+        self.fields: Dict[str, _FieldPlan] = {name: _FieldPlan(f) for name, f in inst.fields.items()}
+        self.constraints = form_constraints(inst, catalog)
+
+
+class Encoder:
+    """Encode instruction forms of a `Catalog` by id; plans are compiled per form on first use."""
+
+    def __init__(self, catalog: Catalog) -> None:
+        self.catalog = catalog
+        self._plans: Dict[str, _FormPlan] = {}
+
+    def _plan(self, form_id: str) -> _FormPlan:
+        plan = self._plans.get(form_id)
+        if plan is None:
+            inst = self.catalog.by_id(form_id)
+            if inst is None:
+                raise EncodeError(f"unknown instruction form: {form_id!r}")
+            plan = _FormPlan(inst, self.catalog)
+            self._plans[form_id] = plan
+        return plan
+
+    def form(self, form_id: str) -> Instruction:
+        return self._plan(form_id).inst
+
+    def field_range(self, form_id: str, field: str) -> Tuple[int, int]:
+        """Inclusive (lo, hi) accepted for `field` of `form_id`."""
+        fp = self._plan(form_id).fields.get(field)
+        if fp is None:
+            raise EncodeError(f"{form_id}: unknown field {field!r}")
+        return fp.lo, fp.hi
+
+    def encode(self, form_id: str, values: Optional[Mapping[str, int]] = None, **fields: int) -> int:
+        """
+        Encode one instruction. Field names that are not Python identifiers
+        (e.g. `RegSrc0=BasePtr`) can be passed through `values`.
+        """
+        plan = self._plan(form_id)
+        if values:
+            fields = {**values, **fields}
+        word = plan.base
+        for name, v in fields.items():
+            fp = plan.fields.get(name)
+            if fp is None:
+                raise EncodeError(f"{form_id}: unknown field {name!r}")
+            if not fp.lo <= v <= fp.hi:
+                raise EncodeError(f"{form_id}: {name}={v} out of range [{fp.lo}, {fp.hi}]")
+            u = v & fp.value_mask
+            if u & fp.gap_mask:
+                raise EncodeError(f"{form_id}: {name}={v} has bits outside the encoded slices (mask {fp.gap_mask:#x})")
+            for value_lsb, width_mask, insn_lsb in fp.scatter:
+                word |= ((u >> value_lsb) & width_mask) << insn_lsb
+        for c in plan.constraints:
+            if not c.holds(word):
+                raise EncodeError(f"{form_id}: constraint {c.field}{c.op}{c.value} violated")
+        return word
+
+    def encode_batch(self, form_id: str, fields: Mapping[str, Any], count: Optional[int] = None) -> Any:
+        """
+        Encode `count` instructions of one form from per-field value arrays
+        (NumPy required). Scalars broadcast; `count` defaults to the common
+        array length. Raises `EncodeError` naming the first offending index.
+        """
+        np = _require_numpy()
+        plan = self._plan(form_id)
+        arrays: Dict[str, Any] = {}
+        for name, v in fields.items():
+            if name not in plan.fields:
+                raise EncodeError(f"{form_id}: unknown field {name!r}")
+            arrays[name] = np.asarray(v, dtype=np.int64)
+        if count is None:
+            count = max((a.size for a in arrays.values() if a.ndim), default=1)
+
+        words = np.full(count, plan.base, dtype=np.uint64)
+        for name, a in arrays.items():
+            fp = plan.fields[name]
+            a = np.broadcast_to(a, (count,))
+            bad = (a < fp.lo) | (a > fp.hi)
+            if bad.any():
+                i = int(np.argmax(bad))
+                raise EncodeError(f"{form_id}: {name}[{i}]={int(a[i])} out of range [{fp.lo}, {fp.hi}]")
+            u = a.astype(np.uint64) & np.uint64(fp.value_mask)
+            if fp.gap_mask:
+                bad = (u & np.uint64(fp.gap_mask)) != 0
+                if bad.any():
+                    i = int(np.argmax(bad))
+                    raise EncodeError(f"{form_id}: {name}[{i}]={int(a[i])} has bits outside the encoded slices")
+            for value_lsb, width_mask, insn_lsb in fp.scatter:
+                words |= ((u >> np.uint64(value_lsb)) & np.uint64(width_mask)) << np.uint64(insn_lsb)
+
+        for c in plan.constraints:
+            bad = ~c.holds_array(np, words)
+            if bad.any():
+                i = int(np.argmax(bad))
+                raise EncodeError(f"{form_id}: [{i}] constraint {c.field}{c.op}{c.value} violated")
+        return words
+
+
+def _require_numpy() -> Any:
+    try:
+        import numpy  # type: ignore
+    except Exception as exc:
+        raise RuntimeError(f"batch encode requires NumPy, which is unavailable: {exc}") from exc
+    return numpy
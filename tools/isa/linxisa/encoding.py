@@ -0,0 +1,69 @@
+"""
+Small encoding helpers shared by the catalog builder, generators and checkers.
+"""
+
+from __future__ import annotations
+
+from typing import FrozenSet, Tuple
+
+
+# Block-header mnemonics whose encodings deliberately coincide (legacy spellings
+# kept beside their canonical form, e.g. BSTART.PAR / BSTART.TEPL). Checkers
+# accept overlaps between two of these.
+ALIAS_OVERLAP_MNEMONICS: FrozenSet[str] = frozenset(
+    {
+        "BSTART.PAR",
+        "BSTART.TEPL",
+        "BSTART.MPAR",
+        "BSTART.MSEQ",
+        "BSTART.VPAR",
+        "BSTART.VSEQ",
+    }
+)
+
+
+def parse_hex(s: str) -> int:
+    """Parse a `0x`-prefixed hex string (the catalog's mask/match spelling)."""
+    s = str(s).strip().lower()
+    if not s.startswith("0x"):
+        raise ValueError(f"expected hex string, got {s!r}")
+    return int(s, 16)
+
+
+def parse_int(s: str) -> int:
+    """Parse a decimal, `0x` hex or `0b` binary integer literal."""
+    s = str(s).strip()
+    if s.lower().startswith("0x"):
+        return int(s, 16)
+    if s.lower().startswith("0b"):
+        return int(s, 2)
+    return int(s, 10)
+
+
+def hex_width(val: int, width_bits: int) -> str:
+    """Format `val` as `0x` hex zero-padded to `width_bits`."""
+    hex_digits = (width_bits + 3) // 4
+    return f"0x{val:0{hex_digits}x}"
+
+
+def pattern_to_mask_match(pattern: str) -> Tuple[int, int]:
+    """Convert an MSB->LSB pattern of '0'/'1'/'.' into (mask, match)."""
+    for ch in pattern:
+        if ch not in "01.":
+            raise ValueError(f"invalid pattern char {ch!r}")
+    if not pattern:
+        return 0, 0
+    mask = int(pattern.replace("0", "1").replace(".", "0"), 2)
+    match = int(pattern.replace(".", "0"), 2)
+    return mask, match
+
+
+def mask_match_to_pattern(mask: int, match: int, width_bits: int) -> str:
+    """Inverse of `pattern_to_mask_match` for a `width_bits`-wide pattern."""
+    out = []
+    for bit in range(width_bits - 1, -1, -1):
+        if (mask >> bit) & 1:
+            out.append("1" if (match >> bit) & 1 else "0")
+        else:
+            out.append(".")
+    return "".join(out)
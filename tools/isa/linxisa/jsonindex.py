@@ -0,0 +1,223 @@
+"""
+Byte-offset sidecar index and lazy reader for the JSON catalog.
+
+`build_golden.py` writes `<catalog>.json.idx` next to the catalog. It records
+the byte span of every top-level key, of each `registers` entry and of each
+instruction (by id):
+
+  {"format": 1, "size": <catalog bytes>, "sha256": "<catalog digest>",
+   "keys": {"<key>": [start, end], ...},
+   "registers": {"<name>": [start, end], ...},
+   "instructions": {"<id>": [start, end], ...}}
+
+`CatalogJSON.open(path)` maps the catalog read-only and `json.loads` only the
+requested span, so fetching `registers.reg5` or one instruction does not parse
+(or hold) the rest of the multi-megabyte document. A missing index, or one
+whose recorded size or SHA-256 no longer matches the file, is rebuilt in
+memory with one scan (a same-size edit would otherwise reuse stale spans); a
+record whose id does not match its span triggers the same rescan.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from linxisa.cache import PathLike
+
+
+INDEX_FORMAT = 1
+
+_WS = re.compile(r"[ \t\n\r]*")
+
+Span = Tuple[int, int]
+
+
+def index_path_for(json_path: PathLike) -> Path:
+    p = Path(json_path)
+    return p.with_name(p.name + ".idx")
+
+
+def _skip_ws(text: str, pos: int) -> int:
+    return _WS.match(text, pos).end()  # type: ignore[union-attr]
+
+
+def _scan_object(
+    text: str, pos: int, decoder: json.JSONDecoder, on_value: Any = None
+) -> Tuple[Dict[str, Span], int]:
+    """
+    Spans (character offsets) of the members of the object at `pos`. Values are
+    skipped with `raw_decode` unless `on_value(key, text, pos)` returns the end
+    of a value it scanned itself.
+    """
+    pos = _skip_ws(text, pos)
+    if text[pos] != "{":
+        raise ValueError(f"expected object at offset {pos}")
+    pos = _skip_ws(text, pos + 1)
+    spans: Dict[str, Span] = {}
+    if text[pos] == "}":
+        return spans, pos + 1
+    while True:
+        key, pos = decoder.raw_decode(text, pos)
+        pos = _skip_ws(text, pos)
+        if text[pos] != ":":
+            raise ValueError(f"expected ':' at offset {pos}")
+        start = _skip_ws(text, pos + 1)
+        end = on_value(key, text, start) if on_value is not None else None
+        if end is None:
+            _, end = decoder.raw_decode(text, start)
+        spans[key] = (start, end)
+        pos = _skip_ws(text, end)
+        if text[pos] == "}":
+            return spans, pos + 1
+        if text[pos] != ",":
+            raise ValueError(f"expected ',' or '}}' at offset {pos}")
+        pos = _skip_ws(text, pos + 1)
+
+
+def _scan_instructions(text: str, pos: int, decoder: json.JSONDecoder, out: Dict[str, Span]) -> int:
+    if text[pos] != "[":
+        raise ValueError(f"expected array at offset {pos}")
+    pos = _skip_ws(text, pos + 1)
+    if text[pos] == "]":
+        return pos + 1
+    while True:
+        inst, end = decoder.raw_decode(text, pos)
+        out[str(inst.get("id", ""))] = (pos, end)
+        pos = _skip_ws(text, end)
+        if text[pos] == "]":
+            return pos + 1
+        if text[pos] != ",":
+            raise ValueError(f"expected ',' or ']' at offset {pos}")
+        pos = _skip_ws(text, pos + 1)
+
+
+def build_index(data: bytes) -> Dict[str, Any]:
+    """Index the catalog serialized in `data` (one full scan)."""
+    text = data.decode("utf-8")
+    decoder = json.JSONDecoder()
+    registers: Dict[str, Span] = {}
+    instructions: Dict[str, Span] = {}
+
+    def on_value(key: str, text: str, pos: int) -> Optional[int]:
+        if key == "instructions":
+            return _scan_instructions(text, pos, decoder, instructions)
+        if key == "registers":
+            spans, end = _scan_object(text, pos, decoder)
+            registers.update(spans)
+            return end
+        return None
+
+    keys, _ = _scan_object(text, 0, decoder, on_value)
+
+    groups = (keys, registers, instructions)
+    if not text.isascii():
+        # Character offsets -> byte offsets, walking the boundaries in order.
+        bounds = sorted({b for g in groups for span in g.values() for b in span})
+        byte_of: Dict[int, int] = {}
+        last_c = last_b = 0
+        for c in bounds:
+            last_b += len(text[last_c:c].encode("utf-8"))
+            last_c = c
+            byte_of[c] = last_b
+        groups = tuple({k: (byte_of[s], byte_of[e]) for k, (s, e) in g.items()} for g in groups)
+
+    return {
+        "format": INDEX_FORMAT,
+        "size": len(data),
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "keys": {k: list(v) for k, v in groups[0].items()},
+        "registers": {k: list(v) for k, v in groups[1].items()},
+        "instructions": {k: list(v) for k, v in groups[2].items()},
+    }
+
+
+def render_index(index: Dict[str, Any]) -> str:
+    return json.dumps(index, sort_keys=True, separators=(",", ":")) + "\n"
+
+
+class CatalogJSON:
+    """Single-record access to the JSON catalog through its byte-offset index."""
+
+    def __init__(self, buf: Any, index: Optional[Dict[str, Any]]) -> None:
+        self.buf = buf
+        if (
+            index is None
+            or index.get("format") != INDEX_FORMAT
+            or index.get("size") != len(buf)
+            or index.get("sha256") != hashlib.sha256(buf).hexdigest()
+        ):
+            index = build_index(bytes(buf))
+        self.index = index
+        self._rescanned = False
+
+    @classmethod
+    def open(cls, path: PathLike, index_path: Optional[PathLike] = None) -> "CatalogJSON":
+        with open(path, "rb") as f:
+            buf: Any = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if f.seek(0, 2) else b""
+        try:
+            index = json.loads(Path(index_path or index_path_for(path)).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            index = None
+        return cls(buf, index)
+
+    def _load(self, span: List[int]) -> Any:
+        start, end = span
+        return json.loads(self.buf[start:end])
+
+    def _rescan(self) -> bool:
+        """Rebuild a stale index in memory; False when it was already rebuilt."""
+        if self._rescanned:
+            return False
+        self.index = build_index(bytes(self.buf))
+        self._rescanned = True
+        return True
+
+    def keys(self) -> List[str]:
+        return list(self.index["keys"])
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """One top-level value (e.g. `version`, `state`)."""
+        span = self.index["keys"].get(key)
+        if span is None:
+            return default
+        try:
+            return self._load(span)
+        except ValueError:
+            if self._rescan():
+                return self.get(key, default)
+            raise
+
+    def register(self, name: str) -> Optional[Any]:
+        """One `registers` entry (e.g. `reg5`)."""
+        span = self.index["registers"].get(name)
+        if span is None:
+            return None
+        try:
+            return self._load(span)
+        except ValueError:
+            if self._rescan():
+                return self.register(name)
+            raise
+
+    def instruction_ids(self) -> List[str]:
+        return list(self.index["instructions"])
+
+    def instruction(self, inst_id: str) -> Optional[Dict[str, Any]]:
+        """One instruction record by id (None if the catalog has no such id)."""
+        span = self.index["instructions"].get(inst_id)
+        if span is None:
+            return None
+        try:
+            inst = self._load(span)
+        except ValueError:
+            inst = None
+        if not isinstance(inst, dict) or inst.get("id") != inst_id:
+            if self._rescan():
+                return self.instruction(inst_id)
+            raise ValueError(f"catalog index is inconsistent for {inst_id!r}")
+        return inst
@@ -0,0 +1,366 @@
+"""
+Versioned, memory-mappable binary catalog (`.lxcat`).
+
+`build_golden.py` writes `linxisa-v0.3.lxcat` next to the JSON catalog. It
+carries only what decoders and encoders consume: per-form mask/match and
+string ids, combined field pieces, resolved constraints and the reg5 table,
+as fixed-width little-endian columns plus one string table:
+
+  header      magic "LXCAT\\0\\0\\0", format version, column count, row counts,
+              SHA-256 of the source JSON, then one u64 byte offset per column
+              (in `COLUMNS` order; every column is 8-byte aligned)
+  forms       mask, match, id, uid, mnemonic, group, asm, source, length_bits,
+              fixed_bits, field_start/field_count, constraint_start/constraint_count
+  fields      name, signed_hint (-1 unspecified, 0 unsigned, 1 signed),
+              bit_width, piece_start/piece_count
+  pieces      insn_lsb (in the packed word), width, value_lsb
+  constraints op (index into `OPS`), signed_hint, bit_width, value,
+              piece_start/piece_count (the constrained field, relocated into
+              the packed word; unresolvable constraints are dropped, as in
+              `form_constraints()`)
+  regs        code (-1 when none), name, asm
+  strtab      NUL-terminated UTF-8; string columns hold byte offsets into it
+              (offset 0 is the empty string)
+
+`BinaryCatalog.open(path)` maps the file read-only and exposes each column as a
+zero-copy `numpy.frombuffer` view (a `memoryview` cast without NumPy), so
+opening it costs a header parse and every process mapping the same file
+shares its pages. `gen_c_codec.py` renders the matching C header
+(`linxisa_catalog.h`, see `render_c_header()`), so C reads the same bytes
+as-is on little-endian hosts.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from linxisa.catalog import Catalog
+from linxisa.constraints import OPS, form_constraints
+
+
+MAGIC = b"LXCAT\0\0\0"
+# Bump when the layout or column set changes.
+FORMAT_VERSION = 1
+
+# (column, table, struct code). The order is part of the format.
+COLUMNS: Tuple[Tuple[str, str, str], ...] = (
+    ("form_mask", "forms", "Q"),
+    ("form_match", "forms", "Q"),
+    ("form_id", "forms", "I"),
+    ("form_uid", "forms", "I"),
+    ("form_mnemonic", "forms", "I"),
+    ("form_group", "forms", "I"),
+    ("form_asm", "forms", "I"),
+    ("form_source", "forms", "I"),
+    ("form_length_bits", "forms", "H"),
+    ("form_fixed_bits", "forms", "H"),
+    ("form_field_start", "forms", "I"),
+    ("form_field_count", "forms", "H"),
+    ("form_constraint_start", "forms", "I"),
+    ("form_constraint_count", "forms", "H"),
+    ("field_name", "fields", "I"),
+    ("field_signed_hint", "fields", "b"),
+    ("field_bit_width", "fields", "H"),
+    ("field_piece_start", "fields", "I"),
+    ("field_piece_count", "fields", "H"),
+    ("piece_insn_lsb", "pieces", "B"),
+    ("piece_width", "pieces", "B"),
+    ("piece_value_lsb", "pieces", "B"),
+    ("constraint_op", "constraints", "B"),
+    ("constraint_signed_hint", "constraints", "b"),
+    ("constraint_bit_width", "constraints", "H"),
+    ("constraint_value", "constraints", "q"),
+    ("constraint_piece_start", "constraints", "I"),
+    ("constraint_piece_count", "constraints", "H"),
+    ("reg_code", "regs", "h"),
+    ("reg_name", "regs", "I"),
+    ("reg_asm", "regs", "I"),
+    ("strtab", "strtab", "B"),
+)
+
+TABLES = ("forms", "fields", "pieces", "constraints", "regs", "strtab")
+
+OP_NAMES = tuple(OPS)
+
+# magic, version, column count, one row count per table, source SHA-256.
+_HEADER = struct.Struct("<8sII" + "I" * len(TABLES) + "32s")
+
+_C_TYPES = {"Q": "uint64_t", "q": "int64_t", "I": "uint32_t", "H": "uint16_t", "h": "int16_t", "B": "uint8_t", "b": "int8_t"}
+
+
+def _signed_hint(signed: Optional[bool]) -> int:
+    return -1 if signed is None else int(bool(signed))
+
+
+class _StringTable:
+    def __init__(self) -> None:
+        self.data = bytearray(b"\0")
+        self.offsets: Dict[str, int] = {"": 0}
+
+    def add(self, s: str) -> int:
+        off = self.offsets.get(s)
+        if off is None:
+            off = len(self.data)
+            self.data += s.encode("utf-8") + b"\0"
+            self.offsets[s] = off
+        return off
+
+
+def encode_catalog(catalog: Catalog) -> bytes:
+    """Serialize `catalog` (forms in catalog order) into the `.lxcat` layout."""
+    strings = _StringTable()
+    cols: Dict[str, List[int]] = {name: [] for name, _, _ in COLUMNS if name != "strtab"}
+
+    def add_piece(insn_lsb: int, width: int, value_lsb: int) -> None:
+        cols["piece_insn_lsb"].append(insn_lsb)
+        cols["piece_width"].append(width)
+        cols["piece_value_lsb"].append(value_lsb)
+
+    for inst in catalog.instructions:
+        cols["form_mask"].append(inst.mask)
+        cols["form_match"].append(inst.match)
+        for col, s in (
+            ("form_id", inst.id),
+            ("form_uid", inst.uid),
+            ("form_mnemonic", inst.mnemonic),
+            ("form_group", inst.group),
+            ("form_asm", inst.asm),
+            ("form_source", inst.source),
+        ):
+            cols[col].append(strings.add(s))
+        cols["form_length_bits"].append(inst.length_bits)
+        cols["form_fixed_bits"].append(inst.fixed_bits)
+
+        cols["form_field_start"].append(len(cols["field_name"]))
+        cols["form_field_count"].append(len(inst.fields))
+        for name in sorted(inst.fields):
+            f = inst.fields[name]
+            cols["field_name"].append(strings.add(name))
+            cols["field_signed_hint"].append(_signed_hint(f.signed))
+            cols["field_bit_width"].append(f.bit_width)
+            cols["field_piece_start"].append(len(cols["piece_insn_lsb"]))
+            cols["field_piece_count"].append(len(f.pieces))
+            for p in f.pieces:
+                add_piece(p.insn_lsb, p.width, p.value_lsb)
+
+        cons = form_constraints(inst, catalog)
+        cols["form_constraint_start"].append(len(cols["constraint_op"]))
+        cols["form_constraint_count"].append(len(cons))
+        for c in cons:
+            cols["constraint_op"].append(OP_NAMES.index(c.op))
+            cols["constraint_signed_hint"].append(1 if c.signed_width else 0)
+            cols["constraint_bit_width"].append(c.width)
+            cols["constraint_value"].append(c.value)
+            cols["constraint_piece_start"].append(len(cols["piece_insn_lsb"]))
+            cols["constraint_piece_count"].append(len(c.gather))
+            for insn_lsb, width_mask, value_lsb in c.gather:
+                add_piece(insn_lsb, width_mask.bit_length(), value_lsb)
+
+    for e in catalog.reg5:
+        cols["reg_code"].append(-1 if e.code is None else e.code)
+        cols["reg_name"].append(strings.add(e.name))
+        cols["reg_asm"].append(strings.add(e.asm))
+
+    counts = {
+        "forms": len(cols["form_mask"]),
+        "fields": len(cols["field_name"]),
+        "pieces": len(cols["piece_insn_lsb"]),
+        "constraints": len(cols["constraint_op"]),
+        "regs": len(cols["reg_code"]),
+        "strtab": len(strings.data),
+    }
+
+    blobs: List[bytes] = []
+    for name, table, code in COLUMNS:
+        if name == "strtab":
+            blobs.append(bytes(strings.data))
+        else:
+            blobs.append(struct.pack(f"<{counts[table]}{code}", *cols[name]))
+
+    offsets: List[int] = []
+    pos = _HEADER.size + 8 * len(COLUMNS)
+    for blob in blobs:
+        pos = (pos + 7) & ~7
+        offsets.append(pos)
+        pos += len(blob)
+
+    sha = bytes.fromhex(catalog.sha256) if catalog.sha256 else bytes(32)
+    out = bytearray(_HEADER.pack(MAGIC, FORMAT_VERSION, len(COLUMNS), *(counts[t] for t in TABLES), sha))
+    out += struct.pack(f"<{len(COLUMNS)}Q", *offsets)
+    for off, blob in zip(offsets, blobs):
+        out += bytes(off - len(out))
+        out += blob
+    out += bytes(-len(out) & 7)
+    return bytes(out)
+
+
+class BinaryCatalog:
+    """Read-only view over an `.lxcat` buffer (typically an mmap); columns are zero-copy."""
+
+    def __init__(self, buf: Any) -> None:
+        self.buf = buf
+        if len(buf) < _HEADER.size:
+            raise ValueError("not an lxcat catalog (truncated header)")
+        magic, version, ncols, *rest = _HEADER.unpack_from(buf, 0)
+        if magic != MAGIC:
+            raise ValueError("not an lxcat catalog (bad magic)")
+        if version != FORMAT_VERSION or ncols != len(COLUMNS):
+            raise ValueError(f"unsupported lxcat format version {version} ({ncols} columns)")
+        self.counts: Dict[str, int] = dict(zip(TABLES, rest[: len(TABLES)]))
+        self.source_sha256: str = rest[len(TABLES)].hex()
+        self.offsets: Dict[str, int] = dict(
+            zip((name for name, _, _ in COLUMNS), struct.unpack_from(f"<{len(COLUMNS)}Q", buf, _HEADER.size))
+        )
+        end = self.offsets["strtab"] + self.counts["strtab"]
+        if end > len(buf):
+            raise ValueError("lxcat catalog is truncated")
+        self._np: Any = False  # resolved on first column access
+        self._columns: Dict[str, Any] = {}
+        self._by_id: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def open(cls, path: "str | Path") -> "BinaryCatalog":
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mm)
+
+    def __len__(self) -> int:
+        return self.counts["forms"]
+
+    def column(self, name: str) -> Any:
+        """A column as a NumPy array view (or a typed `memoryview` without NumPy)."""
+        col = self._columns.get(name)
+        if col is None:
+            table, code = next((t, c) for n, t, c in COLUMNS if n == name)
+            count = self.counts[table]
+            off = self.offsets[name]
+            if self._np is False:
+                self._np = _optional_numpy()
+            if self._np is not None:
+                col = self._np.frombuffer(self.buf, dtype="<" + code, count=count, offset=off)
+            else:
+                if sys.byteorder != "little":
+                    raise RuntimeError("reading lxcat without NumPy requires a little-endian host")
+                col = memoryview(self.buf)[off : off + count * struct.calcsize(code)].cast(code)
+            self._columns[name] = col
+        return col
+
+    def string(self, off: int) -> str:
+        base = self.offsets["strtab"]
+        start = base + int(off)
+        end = self.buf.find(b"\0", start)
+        return bytes(self.buf[start:end]).decode("utf-8")
+
+    def form_index(self, form_id: str) -> Optional[int]:
+        if self._by_id is None:
+            ids = self.column("form_id")
+            self._by_id = {self.string(ids[i]): i for i in range(len(self))}
+        return self._by_id.get(form_id)
+
+    def form_fields(self, index: int) -> List[Tuple[str, Optional[bool], int, Tuple[Tuple[int, int, int], ...]]]:
+        """(name, signed, bit_width, ((insn_lsb, width, value_lsb), ...)) per field of form `index`."""
+        start = int(self.column("form_field_start")[index])
+        count = int(self.column("form_field_count")[index])
+        names = self.column("field_name")
+        signed = self.column("field_signed_hint")
+        widths = self.column("field_bit_width")
+        pstart = self.column("field_piece_start")
+        pcount = self.column("field_piece_count")
+        out = []
+        for i in range(start, start + count):
+            hint = int(signed[i])
+            out.append(
+                (
+                    self.string(names[i]),
+                    None if hint < 0 else bool(hint),
+                    int(widths[i]),
+                    self._pieces(int(pstart[i]), int(pcount[i])),
+                )
+            )
+        return out
+
+    def _pieces(self, start: int, count: int) -> Tuple[Tuple[int, int, int], ...]:
+        lsb = self.column("piece_insn_lsb")
+        width = self.column("piece_width")
+        vlsb = self.column("piece_value_lsb")
+        return tuple((int(lsb[i]), int(width[i]), int(vlsb[i])) for i in range(start, start + count))
+
+
+def _optional_numpy() -> Any:
+    try:
+        import numpy  # type: ignore
+    except Exception:
+        return None
+    return numpy
+
+
+def render_c_header() -> str:
+    """The C view of the `.lxcat` layout (column enum, header struct, typed accessors)."""
+    lines = [
+        "/* Auto-generated from tools/isa/linxisa/lxcat.py. */",
+        "/* DO NOT EDIT: run `python3 tools/isa/gen_c_codec.py` to regenerate. */",
+        "",
+        "#pragma once",
+        "",
+        "#include <stddef.h>",
+        "#include <stdint.h>",
+        "#include <string.h>",
+        "",
+        "/*",
+        " * Memory-mappable LinxISA binary catalog (`isa/v0.3/linxisa-v0.3.lxcat`).",
+        " * Little-endian; every column is 8-byte aligned, so on little-endian hosts",
+        " * a mapped file can be read in place through the accessors below.",
+        " */",
+        "",
+        '#define LXCAT_MAGIC "LXCAT\\0\\0\\0"',
+        f"#define LXCAT_FORMAT_VERSION {FORMAT_VERSION}u",
+        "",
+        "enum lxcat_column {",
+    ]
+    for name, _, _ in COLUMNS:
+        lines.append(f"  LXCAT_{name.upper()},")
+    lines += [
+        "  LXCAT_NUM_COLUMNS",
+        "};",
+        "",
+        "enum lxcat_op { LXCAT_OP_EQ, LXCAT_OP_NE, LXCAT_OP_LT, LXCAT_OP_LE, LXCAT_OP_GT, LXCAT_OP_GE };",
+        "",
+        "typedef struct {",
+        "  char magic[8];",
+        "  uint32_t version;",
+        "  uint32_t num_columns;",
+    ]
+    for table in TABLES:
+        lines.append(f"  uint32_t num_{table};")
+    lines += [
+        "  uint8_t source_sha256[32];",
+        "  uint64_t column_offset[LXCAT_NUM_COLUMNS];",
+        "} lxcat_header;",
+        "",
+        "/* Returns 0 when `buf` (of `size` bytes) holds a catalog this header can read. */",
+        "static inline int lxcat_check(const void *buf, size_t size) {",
+        "  const lxcat_header *h = (const lxcat_header *)buf;",
+        "  if (size < sizeof(lxcat_header)) return -1;",
+        "  if (memcmp(h->magic, LXCAT_MAGIC, 8) != 0) return -1;",
+        "  if (h->version != LXCAT_FORMAT_VERSION || h->num_columns != LXCAT_NUM_COLUMNS) return -1;",
+        "  if (h->column_offset[LXCAT_STRTAB] + h->num_strtab > size) return -1;",
+        "  return 0;",
+        "}",
+        "",
+    ]
+    for name, _, code in COLUMNS:
+        ctype = "char" if name == "strtab" else _C_TYPES[code]
+        lines.append(
+            f"static inline const {ctype} *lxcat_{name}(const lxcat_header *h) "
+            f"{{ return (const {ctype} *)((const uint8_t *)h + h->column_offset[LXCAT_{name.upper()}]); }}"
+        )
+    lines += [
+        "",
+        "static inline const char *lxcat_string(const lxcat_header *h, uint32_t off) { return lxcat_strtab(h) + off; }",
+        "",
+    ]
+    return "\n".join(lines)
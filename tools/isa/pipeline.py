@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Regenerate every artifact derived from the LinxISA catalog in one driver.
+
+The stages form a declared DAG (see `STAGES`): `build_golden` produces the
+catalog, `validate_spec` gates it, and the generators fan out from there.
+Each stage runs its tool's `main(argv)` in-process (or in a worker process
+with `--jobs`), so no stage pays for a fresh interpreter.
+
+A stage is skipped when its stamp is current: the stamp records a SHA-256 of
+the stage's argv, its tool sources (plus the `linxisa` package), its input
+files, and the output files it left behind. Editing an input, a tool, or
+hand-editing an output re-runs the stage; a stage whose upstream rewrote its
+inputs byte-identically stays skipped. Stamps live in the catalog cache
+directory (`LINXISA_CACHE_DIR`); `LINXISA_NO_CACHE=1` or `--force` runs
+everything.
+
+  python3 tools/isa/pipeline.py                  # bring all artifacts up to date
+  python3 tools/isa/pipeline.py --jobs 0         # independent stages in parallel
+  python3 tools/isa/pipeline.py --dry-run        # show which stages are stale
+  python3 tools/isa/pipeline.py gen_c_codec      # one stage (and its upstream)
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import hashlib
+import importlib
+import io
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from linxisa.cache import cache_dir, cache_disabled, write_atomic
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Bump when the stamp layout or digest inputs change.
+STAMP_FORMAT = 1
+
+_SPEC = "isa/v0.3/linxisa-v0.3.json"
+_MANUAL = "docs/architecture/isa-manual/src/generated"
+_CODECS = "isa/generated/codecs"
+_SVG = f"{_MANUAL}/encodings"
+
+# Sources every tool imports from; a change re-runs all stages.
+_SHARED_SOURCES = ("tools/isa/linxisa/*.py",)
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    tool: str  # module in tools/isa/ providing main(argv)
+    args: Tuple[str, ...]
+    inputs: Tuple[str, ...]  # paths or glob patterns relative to the repo root
+    outputs: Tuple[str, ...]  # files, or directories (hashed recursively)
+    deps: Tuple[str, ...] = ()
+
+
+STAGES: Tuple[Stage, ...] = (
+    Stage(
+        "build_golden",
+        "build_golden",
+        ("--profile", "v0.3", "--pretty"),
+        (
+            "isa/v0.3/meta.json",
+            "isa/v0.3/encoding/*.json",
+            "isa/v0.3/registers/*.json",
+            "isa/v0.3/state/*.json",
+            "isa/v0.3/opcodes/**/*.opc",
+        ),
+        (_SPEC, "isa/v0.3/linxisa-v0.3.lxcat", "isa/v0.3/linxisa-v0.3.json.idx"),
+    ),
+    Stage("validate_spec", "validate_spec", ("--spec", _SPEC), (_SPEC,), (), ("build_golden",)),
+    Stage(
+        "gen_c_codec",
+        "gen_c_codec",
+        ("--spec", _SPEC, "--out-dir", _CODECS),
+        (_SPEC,),
+        (f"{_CODECS}/linxisa_opcodes.h", f"{_CODECS}/linxisa_opcodes.c", f"{_CODECS}/linxisa_catalog.h"),
+        ("validate_spec",),
+    ),
+    Stage(
+        "gen_qemu_codec",
+        "gen_qemu_codec",
+        ("--spec", _SPEC, "--out-dir", _CODECS),
+        (_SPEC,),
+        tuple(f"{_CODECS}/linxisa{n}.decode" for n in (16, 32, 48, 64)),
+        ("validate_spec",),
+    ),
+    Stage(
+        "gen_llvm_tablegen",
+        "gen_llvm_tablegen",
+        ("--spec", _SPEC, "--out", "avs/compiler/linx-llvm/LinxISAInstrInfo.td"),
+        (_SPEC,),
+        ("avs/compiler/linx-llvm/LinxISAInstrInfo.td",),
+        ("validate_spec",),
+    ),
+    Stage(
+        "gen_encoding_svg",
+        "gen_encoding_svg",
+        ("--spec", _SPEC, "--out-dir", _SVG),
+        (_SPEC,),
+        (_SVG,),
+        ("validate_spec",),
+    ),
+    # The details fragment embeds the diagrams that exist, so it runs after the SVGs.
+    Stage(
+        "gen_manual_adoc",
+        "gen_manual_adoc",
+        ("--spec", _SPEC, "--out-dir", _MANUAL, "--svg-dir", _SVG),
+        (_SPEC, f"{_SVG}/*.svg"),
+        tuple(
+            f"{_MANUAL}/{n}.adoc"
+            for n in (
+                "registers_reg5",
+                "instruction_group_summary",
+                "instruction_reference",
+                "mnemonic_index",
+                "instruction_details",
+            )
+        ),
+        ("validate_spec", "gen_encoding_svg"),
+    ),
+    Stage(
+        "gen_ssr_adoc",
+        "gen_ssr_adoc",
+        ("--spec", _SPEC, "--out-dir", _MANUAL),
+        (_SPEC,),
+        (f"{_MANUAL}/system_registers_ssr.adoc", f"{_MANUAL}/trapno_encoding.adoc"),
+        ("validate_spec",),
+    ),
+    Stage(
+        "report_encoding_space",
+        "report_encoding_space",
+        ("--spec", _SPEC, "--out", "docs/reference/encoding_space_report.md", "--check"),
+        (_SPEC,),
+        ("docs/reference/encoding_space_report.md",),
+        ("validate_spec",),
+    ),
+    Stage(
+        "sail_coverage",
+        "sail_coverage",
+        ("--spec", _SPEC, "--implemented", "isa/sail/implemented_mnemonics.txt", "--out", "isa/sail/coverage.json"),
+        (_SPEC, "isa/sail/implemented_mnemonics.txt"),
+        ("isa/sail/coverage.json",),
+        ("validate_spec",),
+    ),
+)
+
+
+def _expand(patterns: Tuple[str, ...]) -> List[Path]:
+    out: List[Path] = []
+    for pat in patterns:
+        if any(ch in pat for ch in "*?["):
+            out.extend(p for p in sorted(ROOT.glob(pat)) if p.is_file())
+            continue
+        p = ROOT / pat
+        if p.is_dir():
+            out.extend(sorted(q for q in p.rglob("*") if q.is_file()))
+        else:
+            out.append(p)
+    return out
+
+
+def _files_digest(patterns: Tuple[str, ...]) -> str:
+    """Length-prefixed SHA-256 of (path, contents) for every file; missing files hash as absent."""
+    h = hashlib.sha256()
+    for p in _expand(patterns):
+        rel = p.relative_to(ROOT).as_posix().encode("utf-8")
+        try:
+            data = p.read_bytes()
+        except OSError:
+            h.update(b"-%d:%s" % (len(rel), rel))
+            continue
+        h.update(b"+%d:%s%d:" % (len(rel), rel, len(data)))
+        h.update(data)
+    return h.hexdigest()
+
+
+def _input_digest(stage: Stage) -> str:
+    h = hashlib.sha256()
+    h.update(json.dumps([STAMP_FORMAT, stage.tool, list(stage.args)]).encode("utf-8"))
+    h.update(_files_digest((f"tools/isa/{stage.tool}.py", *_SHARED_SOURCES, *stage.inputs)).encode("ascii"))
+    return h.hexdigest()
+
+
+class _Stamps:
+    """Per-stage {inputs, outputs} digests of the last successful run."""
+
+    def __init__(self, path: Optional[Path]) -> None:
+        self.path = path
+        self.entries: Dict[str, Dict[str, str]] = {}
+        if path is None:
+            return
+        try:
+            doc = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(doc, dict) and doc.get("format") == STAMP_FORMAT:
+            self.entries = dict(doc.get("stages") or {})
+
+    @classmethod
+    def open(cls) -> "_Stamps":
+        if cache_disabled():
+            return cls(None)
+        key = hashlib.sha256(str(ROOT).encode("utf-8")).hexdigest()[:16]
+        return cls(cache_dir() / f"pipeline-{key}.json")
+
+    def fresh(self, stage: Stage, inputs: str) -> bool:
+        e = self.entries.get(stage.name)
+        return bool(e) and e.get("inputs") == inputs and e.get("outputs") == _files_digest(stage.outputs)
+
+    def record(self, stage: Stage, inputs: str) -> None:
+        self.entries[stage.name] = {"inputs": inputs, "outputs": _files_digest(stage.outputs)}
+
+    def forget(self, stage: Stage) -> None:
+        self.entries.pop(stage.name, None)
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        doc = {"format": STAMP_FORMAT, "stages": self.entries}
+        write_atomic(self.path, (json.dumps(doc, indent=2, sort_keys=True) + "\n").encode("utf-8"))
+
+
+def _run_stage(tool: str, args: Tuple[str, ...]) -> Tuple[int, str, float]:
+    """
+    Run `tool.main(args)` from the repo root (the tools' default paths are
+    repo-relative), capturing its output. The caller's working directory is
+    restored afterwards. Returns (rc, output, seconds).
+    """
+    cwd = os.getcwd()
+    buf = io.StringIO()
+    t0 = time.perf_counter()
+    os.chdir(ROOT)
+    try:
+        with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+            try:
+                rc = importlib.import_module(tool).main(list(args))
+            except SystemExit as exc:
+                code = exc.code
+                if code is not None and not isinstance(code, int):
+                    print(code)
+                    code = 1
+                rc = code or 0
+            except Exception as exc:  # report and keep the other stages going
+                print(f"error: {type(exc).__name__}: {exc}")
+                rc = 1
+    finally:
+        os.chdir(cwd)
+    return int(rc or 0), buf.getvalue(), time.perf_counter() - t0
+
+
+def _select(names: List[str]) -> List[Stage]:
+    """The named stages plus everything upstream of them, in declaration order."""
+    by_name = {s.name: s for s in STAGES}
+    want: Set[str] = set()
+    todo = list(names) or list(by_name)
+    while todo:
+        n = todo.pop()
+        if n not in by_name:
+            raise SystemExit(f"error: unknown stage {n!r} (known: {', '.join(by_name)})")
+        if n not in want:
+            want.add(n)
+            todo.extend(by_name[n].deps)
+    return [s for s in STAGES if s.name in want]
+
+
+class _Result:
+    __slots__ = ("status", "seconds", "output")
+
+    def __init__(self, status: str, seconds: float = 0.0, output: str = "") -> None:
+        self.status = status
+        self.seconds = seconds
+        self.output = output
+
+
+def run(stages: List[Stage], jobs: int = 1, force: bool = False, dry_run: bool = False) -> Dict[str, _Result]:
+    """
+    Run `stages` in dependency order; a stage starts once all of its deps
+    succeeded or were skipped as up to date. Returns a result per stage:
+    `ran`, `fresh` (skipped), `stale` (dry run), `failed` or `blocked`.
+    """
+    stamps = _Stamps.open()
+    results: Dict[str, _Result] = {}
+    names = {s.name for s in stages}
+    pending = list(stages)
+    running: Dict[Future, Tuple[Stage, str]] = {}
+    pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 and not dry_run else None
+
+    def finish(stage: Stage, inputs: str, rc: int, output: str, seconds: float) -> None:
+        if rc == 0:
+            stamps.record(stage, inputs)
+            results[stage.name] = _Result("ran", seconds, output)
+        else:
+            stamps.forget(stage)
+            results[stage.name] = _Result("failed", seconds, output)
+        stamps.save()
+
+    try:
+        while pending or running:
+            progressed = False
+            for stage in list(pending):
+                deps = [d for d in stage.deps if d in names]
+                states = [results[d].status if d in results else None for d in deps]
+                if any(st in ("failed", "blocked") for st in states):
+                    results[stage.name] = _Result("blocked")
+                elif all(st in ("ran", "fresh", "stale") for st in states):
+                    if dry_run and "stale" in states:
+                        results[stage.name] = _Result("stale")
+                    else:
+                        inputs = _input_digest(stage)
+                        if not force and stamps.fresh(stage, inputs):
+                            results[stage.name] = _Result("fresh")
+                        elif dry_run:
+                            results[stage.name] = _Result("stale")
+                        elif pool is None:
+                            finish(stage, inputs, *_run_stage(stage.tool, stage.args))
+                        elif len(running) < jobs:
+                            running[pool.submit(_run_stage, stage.tool, stage.args)] = (stage, inputs)
+                        else:
+                            continue
+                else:
+                    continue
+                pending.remove(stage)
+                progressed = True
+            if running and not progressed:
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for fut in done:
+                    stage, inputs = running.pop(fut)
+                    finish(stage, inputs, *fut.result())
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Regenerate catalog-derived artifacts (skipping up-to-date stages).")
+    ap.add_argument("stages", nargs="*", help="Stages to bring up to date, with their upstream (default: all)")
+    ap.add_argument("--jobs", type=int, default=1, help="Stages to run concurrently (0: one per CPU)")
+    ap.add_argument("--force", action="store_true", help="Ignore stamps and run every selected stage")
+    ap.add_argument("--dry-run", action="store_true", help="Report stale stages without running them")
+    ap.add_argument("--list", action="store_true", help="List the stage DAG and exit")
+    ap.add_argument("-v", "--verbose", action="store_true", help="Print each stage's output, not only on failure")
+    args = ap.parse_args(argv)
+
+    if args.list:
+        for s in STAGES:
+            deps = f" <- {', '.join(s.deps)}" if s.deps else ""
+            print(f"{s.name}{deps}")
+            for o in s.outputs:
+                print(f"    {o}")
+        return 0
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    stages = _select(args.stages)
+    t0 = time.perf_counter()
+    results = run(stages, jobs=jobs, force=args.force, dry_run=args.dry_run)
+    wall = time.perf_counter() - t0
+
+    failed = False
+    width = max(len(s.name) for s in stages)
+    for name, r in ((s.name, results[s.name]) for s in stages):
+        timing = f"{r.seconds:8.3f}s" if r.status in ("ran", "failed") else " " * 9
+        print(f"{name:<{width}}  {r.status:<7} {timing}")
+        if r.output and (args.verbose or r.status == "failed"):
+            for line in r.output.rstrip("\n").splitlines():
+                print(f"    {line}")
+        failed |= r.status in ("failed", "blocked")
+    ran = sum(r.seconds for r in results.values())
+    print(f"{'total':<{width}}  {'':<7} {wall:8.3f}s wall, {ran:.3f}s in stages")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
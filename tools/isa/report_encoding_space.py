@@ -2,35 +2,21 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import pickle
+import re
+import sys
+import time
 from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
-
-def _parse_hex(s: str) -> int:
-    s = s.strip().lower()
-    if not s.startswith("0x"):
-        raise ValueError(f"expected hex string, got {s!r}")
-    return int(s, 16)
-
-
-def _parse_int(s: str) -> int:
-    s = str(s).strip()
-    if s.lower().startswith("0x"):
-        return int(s, 16)
-    if s.lower().startswith("0b"):
-        return int(s, 2)
-    return int(s, 10)
-
-
-@dataclass(frozen=True)
-class FieldPiece:
-    insn_lsb: int
-    insn_msb: int
-    value_lsb: int
-    width: int
+from linxisa.alloc import open_index
+from linxisa.cache import cache_dir, cache_disabled, write_atomic
+from linxisa.catalog import FieldPiece, load_catalog
+from linxisa.encoding import ALIAS_OVERLAP_MNEMONICS, hex_width, parse_int
 
 
 @dataclass(frozen=True)
@@ -53,6 +39,7 @@ class PartPat:
     field_pieces: Dict[str, List[FieldPiece]]
     field_width: Dict[str, int]
     constraints: List[Constraint]
+    uid: str = ""
 
 
 @dataclass(frozen=True)
@@ -61,6 +48,7 @@ class InstPat:
     mnemonic: str
     length_bits: int
     parts: Tuple[PartPat, ...]
+    uid: str = ""
 
 
 def _overlap(a: PartPat, b: PartPat) -> bool:
@@ -113,28 +101,73 @@ def _eval_constraints(p: PartPat, insn: int) -> bool:
     return True
 
 
-def _eval_constraint_op(op: str, lhs: int, rhs: int) -> bool:
-    if op == "==":
-        return lhs == rhs
-    if op == "!=":
-        return lhs != rhs
-    if op == "<":
-        return lhs < rhs
-    if op == "<=":
-        return lhs <= rhs
-    if op == ">":
-        return lhs > rhs
-    if op == ">=":
-        return lhs >= rhs
-    raise ValueError(f"unsupported constraint operator: {op!r}")
-
-
 def _match_with_constraints(p: PartPat, insn: int) -> bool:
     if (insn & p.mask) != p.match:
         return False
     return _eval_constraints(p, insn)
 
 
+def _optional_numpy() -> Any:
+    try:
+        import numpy  # type: ignore
+    except Exception:
+        return None
+    return numpy
+
+
+def _match16_array(np: Any, p: PartPat) -> Any:
+    """
+    Vectorized `_match_with_constraints` over the whole 16-bit space: the
+    mask/match test and every constraint are boolean arrays over all 65,536
+    values.
+    """
+    vals = np.arange(0x10000, dtype=np.uint32)
+    hit = (vals & np.uint32(p.mask)) == np.uint32(p.match)
+    for c in p.constraints:
+        pieces = p.field_pieces.get(c.field)
+        if not pieces:
+            hit[:] = False
+            break
+        fv = np.zeros(0x10000, dtype=np.int64)
+        for pc in pieces:
+            width = pc.insn_msb - pc.insn_lsb + 1
+            fv |= ((vals >> np.uint32(pc.insn_lsb)) & np.uint32((1 << width) - 1)).astype(np.int64) << pc.value_lsb
+        if c.op == "==":
+            hit &= fv == c.value
+        elif c.op == "!=":
+            hit &= fv != c.value
+        elif c.op == "<":
+            hit &= fv < c.value
+        elif c.op == "<=":
+            hit &= fv <= c.value
+        elif c.op == ">":
+            hit &= fv > c.value
+        elif c.op == ">=":
+            hit &= fv >= c.value
+        else:
+            hit[:] = False
+            break
+    return hit
+
+
+def _bitmap16(p: PartPat) -> bytes:
+    """The 16-bit words `p` matches (constraints applied) as a 65,536-bit little-endian bitmap."""
+    np = _optional_numpy()
+    if np is not None:
+        return np.packbits(_match16_array(np, p), bitorder="little").tobytes()
+    bits = bytearray(0x2000)
+    free = 0xFFFF & ~p.mask
+    sub = free
+    while True:
+        val = p.match | sub
+        if _eval_constraints(p, val):
+            bits[val >> 3] |= 1 << (val & 7)
+        if not sub:
+            break
+        sub = (sub - 1) & free
+    return bytes(bits)
+
+
 def _mask_for_bits(bits: Iterable[int]) -> int:
     out = 0
     for bit in bits:
@@ -147,65 +180,35 @@ def _bits_msb_to_lsb(msb: int, lsb: int) -> List[int]:
 
 
 def _extract_patterns(spec_path: Path) -> List[PartPat]:
-    spec = json.loads(spec_path.read_text())
-    # Resolve register aliases (used by a small number of constraints).
-    reg_alias_to_code: Dict[str, int] = {}
-    try:
-        entries = (spec.get("registers") or {}).get("reg5", {}).get("entries", [])
-        for e in entries:
-            code = int(e.get("code"))
-            for a in (e.get("aliases") or []):
-                reg_alias_to_code[str(a).upper()] = code
-            reg_alias_to_code[str(e.get("asm")).upper()] = code
-            reg_alias_to_code[str(e.get("name")).upper()] = code
-    except Exception:
-        reg_alias_to_code = {}
-
+    catalog = load_catalog(spec_path)
     out: List[PartPat] = []
-    for inst in spec.get("instructions", []):
-        inst_id = str(inst.get("id") or inst.get("mnemonic") or "<missing-id>")
-        mnemonic = str(inst.get("mnemonic") or "<missing-mnemonic>")
-        length_bits = int(inst.get("length_bits", 0))
-        enc_parts = (inst.get("encoding") or {}).get("parts") or []
-        for i, p in enumerate(enc_parts):
+    for inst in catalog.instructions:
+        inst_id = inst.id or inst.mnemonic or "<missing-id>"
+        mnemonic = inst.mnemonic or "<missing-mnemonic>"
+        length_bits = inst.length_bits
+        for p in inst.parts:
             field_pieces: Dict[str, List[FieldPiece]] = {}
             field_width: Dict[str, int] = {}
-            for f in p.get("fields") or []:
-                name = str(f.get("name"))
-                pieces: List[FieldPiece] = []
-                w = 0
-                for pc in f.get("pieces") or []:
-                    width = int(pc.get("width"))
-                    pieces.append(
-                        FieldPiece(
-                            insn_lsb=int(pc.get("insn_lsb")),
-                            insn_msb=int(pc.get("insn_msb")),
-                            value_lsb=int(pc.get("value_lsb", 0)),
-                            width=width,
-                        )
-                    )
-                    w += width
-                field_pieces[name] = pieces
-                field_width[name] = w
+            for name, f in p.fields.items():
+                field_pieces[name] = list(f.pieces)
+                field_width[name] = sum(pc.width for pc in f.pieces)
 
             constraints: List[Constraint] = []
-            for c in p.get("constraints") or []:
-                field = str(c.get("field"))
-                op = str(c.get("op"))
-                value_raw = str(c.get("value"))
+            for c in p.constraints:
                 value_int: Optional[int] = None
                 try:
-                    value_int = _parse_int(value_raw)
+                    value_int = parse_int(c.value)
                 except Exception:
-                    value_int = reg_alias_to_code.get(value_raw.upper())
+                    # Register aliases are used by a small number of constraints.
+                    value_int = catalog.reg_code(c.value)
                 if value_int is None:
                     # Unknown symbolic value; keep raw and conservatively treat as 0.
                     value_int = 0
                 constraints.append(
                     Constraint(
-                        field=field,
-                        op=op,
-                        value_raw=value_raw,
+                        field=c.field,
+                        op=c.op,
+                        value_raw=c.value,
                         value=value_int,
                     )
                 )
@@ -215,13 +218,14 @@ def _extract_patterns(spec_path: Path) -> List[PartPat]:
                     inst_id=inst_id,
                     mnemonic=mnemonic,
                     length_bits=length_bits,
-                    part_index=i,
-                    width_bits=int(p.get("width_bits", 0)),
-                    mask=_parse_hex(p.get("mask", "0x0")),
-                    match=_parse_hex(p.get("match", "0x0")),
+                    part_index=p.index,
+                    width_bits=p.width_bits,
+                    mask=p.mask,
+                    match=p.match,
                     field_pieces=field_pieces,
                     field_width=field_width,
                     constraints=constraints,
+                    uid=inst.uid,
                 )
             )
     return out
@@ -242,146 +246,634 @@ def _build_instructions(parts: List[PartPat]) -> List[InstPat]:
                 mnemonic=ps_sorted[0].mnemonic,
                 length_bits=ps_sorted[0].length_bits,
                 parts=tuple(ps_sorted),
+                uid=ps_sorted[0].uid,
             )
         )
     return out
 
 
-def _constraints_disjoint(a: PartPat, b: PartPat) -> bool:
-    """
-    Best-effort disjointness check for constraint sets on part0.
+# Allowed field values: sorted, disjoint, inclusive (lo, hi) intervals.
+Intervals = List[Tuple[int, int]]
 
-    Returns True if we can prove there is no assignment satisfying both.
-    Returns False if unknown / could overlap.
-    """
-    combined_mask = a.mask | b.mask
-    combined_match = (a.match & a.mask) | (b.match & b.mask)
 
-    fields = {c.field for c in a.constraints} | {c.field for c in b.constraints}
-    if not fields:
-        return False
-    for field in fields:
-        pieces = a.field_pieces.get(field) or b.field_pieces.get(field)
-        if not pieces:
-            return False
+def _op_intervals(op: str, value: int, width: int) -> Optional[Intervals]:
+    """Values of a `width`-bit unsigned field satisfying `field op value` (None: unknown op)."""
+    top = (1 << width) - 1
+    if op == "==":
+        iv = [(value, value)]
+    elif op == "!=":
+        iv = [(0, value - 1), (value + 1, top)]
+    elif op == "<":
+        iv = [(0, value - 1)]
+    elif op == "<=":
+        iv = [(0, value)]
+    elif op == ">":
+        iv = [(value + 1, top)]
+    elif op == ">=":
+        iv = [(value, top)]
+    else:
+        return None
+    out: Intervals = []
+    for lo, hi in iv:
+        lo, hi = max(lo, 0), min(hi, top)
+        if lo <= hi:
+            out.append((lo, hi))
+    return out
 
-        width = a.field_width.get(field) or b.field_width.get(field) or 0
-        if width <= 0 or width > 20:
-            # Avoid big enumerations; treat as unknown.
-            return False
 
-        allowed = []
-        for val in range(0, 1 << width):
-            # Check compatibility with combined fixed bits for the bits that this field covers.
-            ok = True
-            for pc in pieces:
-                field_slice = (val >> pc.value_lsb) & ((1 << pc.width) - 1)
-                # The field slice maps to insn bits [insn_msb:insn_lsb].
-                for k in range(pc.width):
-                    insn_bit = pc.insn_lsb + k
-                    bit_val = (field_slice >> k) & 1
-                    if (combined_mask >> insn_bit) & 1:
-                        if ((combined_match >> insn_bit) & 1) != bit_val:
-                            ok = False
-                            break
-                if not ok:
-                    break
-            if not ok:
-                continue
+def _intersect_intervals(a: Intervals, b: Intervals) -> Intervals:
+    out: Intervals = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        lo = max(a[i][0], b[j][0])
+        hi = min(a[i][1], b[j][1])
+        if lo <= hi:
+            out.append((lo, hi))
+        if a[i][1] < b[j][1]:
+            i += 1
+        else:
+            j += 1
+    return out
 
-            # Apply constraints from both patterns on this field only.
-            for c in a.constraints:
-                if c.field != field:
-                    continue
-                try:
-                    if not _eval_constraint_op(c.op, val, c.value):
-                        ok = False
-                        break
-                except ValueError:
-                    # Unknown operator: cannot prove disjointness.
-                    return False
-            if not ok:
-                continue
-            for c in b.constraints:
-                if c.field != field:
-                    continue
-                try:
-                    if not _eval_constraint_op(c.op, val, c.value):
-                        ok = False
-                        break
-                except ValueError:
-                    # Unknown operator: cannot prove disjointness.
-                    return False
-            if not ok:
+
+def _complement_intervals(iv: Intervals, width: int) -> Intervals:
+    out: Intervals = []
+    nxt = 0
+    for lo, hi in iv:
+        if lo > nxt:
+            out.append((nxt, lo - 1))
+        nxt = hi + 1
+    if nxt <= (1 << width) - 1:
+        out.append((nxt, (1 << width) - 1))
+    return out
+
+
+def _next_in_cube(lo: int, fm: int, fv: int, width: int) -> Optional[int]:
+    """Smallest x >= lo of `width` bits with (x & fm) == fv, or None."""
+    if lo >= 1 << width:
+        return None
+    # Walk MSB->LSB keeping x == lo on the prefix; remember the lowest free bit
+    # where lo has a 0 (x can take a 1 there and be minimal below it).
+    bump = -1
+    for bit in range(width - 1, -1, -1):
+        b = 1 << bit
+        want = lo & b
+        if fm & b:
+            got = fv & b
+            if got == want:
                 continue
+            if got > want:
+                # x already exceeds lo: keep the prefix, then the cube's minimum below.
+                high = lo & ~((b << 1) - 1)
+                return high | b | (fv & (b - 1))
+            if bump < 0:
+                return None
+            break
+        if not want:
+            bump = bit
+    else:
+        return lo
+    b = 1 << bump
+    high = lo & ~((b << 1) - 1)
+    return high | b | (fv & (b - 1))
 
-            allowed.append(val)
-            # Early exit: if we found at least one satisfying value for this field, we cannot
-            # prove disjointness from this field alone.
-            if len(allowed) >= 1:
-                break
 
-        if not allowed:
+def _cube_hits(iv: Intervals, fm: int, fv: int, width: int) -> bool:
+    """Whether some x with (x & fm) == fv lies in `iv`."""
+    for lo, hi in iv:
+        x = _next_in_cube(lo, fm, fv, width)
+        if x is not None and x <= hi:
             return True
-
     return False
 
 
-def _parts_overlap(a: PartPat, b: PartPat) -> bool:
+class _FieldTerm:
+    """A part field (pieces in instruction bits) restricted to an interval set of values."""
+
+    __slots__ = ("pieces", "width", "insn_bits", "allowed", "denied")
+
+    def __init__(self, pieces: Tuple[Tuple[int, int, int], ...], width: int, allowed: Intervals) -> None:
+        self.pieces = pieces  # (insn_lsb, width, value_lsb)
+        self.width = width
+        self.insn_bits = 0
+        for insn_lsb, w, _ in pieces:
+            self.insn_bits |= ((1 << w) - 1) << insn_lsb
+        self.allowed = allowed
+        self.denied = _complement_intervals(allowed, width)
+
+    def project(self, mask: int, match: int) -> Tuple[int, int]:
+        """The cube's fixed bits in field-value space; value bits no piece covers are fixed 0."""
+        fm = (1 << self.width) - 1
+        fv = 0
+        for insn_lsb, w, value_lsb in self.pieces:
+            wm = (1 << w) - 1
+            fm &= ~(wm << value_lsb)
+            fm |= ((mask >> insn_lsb) & wm) << value_lsb
+            fv |= ((match >> insn_lsb) & wm) << value_lsb
+        return fm, fv & fm
+
+
+def _part_terms(p: PartPat) -> Optional[List[_FieldTerm]]:
+    """
+    The part's constraints as one `_FieldTerm` per constrained field (same
+    pieces -> intervals intersected). None when the part can never match: a
+    constraint on a missing field, an unknown operator, or no allowed value.
+    """
+    merged: Dict[Tuple[Tuple[int, int, int], ...], Intervals] = {}
+    widths: Dict[Tuple[Tuple[int, int, int], ...], int] = {}
+    for c in p.constraints:
+        pieces = p.field_pieces.get(c.field)
+        if not pieces:
+            return None
+        key = tuple((pc.insn_lsb, pc.insn_msb - pc.insn_lsb + 1, pc.value_lsb) for pc in pieces)
+        width = max(value_lsb + w for _, w, value_lsb in key)
+        iv = _op_intervals(c.op, c.value, width)
+        if iv is None:
+            return None
+        merged[key] = _intersect_intervals(merged[key], iv) if key in merged else iv
+        widths[key] = width
+        if not merged[key]:
+            return None
+    return [_FieldTerm(key, widths[key], iv) for key, iv in merged.items()]
+
+
+def _cube_witness(mask: int, match: int, terms: List[_FieldTerm]) -> Optional[int]:
+    """
+    A word in the cube (mask, match) satisfying every term, or None if there is
+    none. Each step either prunes the cube (some term has no allowed value in
+    it), accepts it (every value of every term is allowed: its free bits are
+    don't-cares) or splits it on the highest free bit of an undecided term.
+    """
+    stack = [(mask, match)]
+    while stack:
+        m, t = stack.pop()
+        undecided: Optional[_FieldTerm] = None
+        feasible = True
+        for term in terms:
+            fm, fv = term.project(m, t)
+            if not _cube_hits(term.allowed, fm, fv, term.width):
+                feasible = False
+                break
+            if undecided is None and _cube_hits(term.denied, fm, fv, term.width):
+                undecided = term
+        if not feasible:
+            continue
+        if undecided is None:
+            return t
+        b = 1 << ((undecided.insn_bits & ~m).bit_length() - 1)
+        stack.append((m | b, t | b))
+        stack.append((m | b, t))
+    return None
+
+
+def _parts_witness(a: PartPat, b: PartPat) -> Optional[int]:
+    """A part-width word matched by both parts (fixed bits and constraints), or None. Exact."""
     if a.width_bits != b.width_bits:
-        return False
+        return None
     if not _overlap(a, b):
-        return False
-    if a.width_bits == 16:
-        for val in range(0x0000, 0x10000):
-            if _match_with_constraints(a, val) and _match_with_constraints(b, val):
-                return True
-        return False
-    return not _constraints_disjoint(a, b)
+        return None
+    ta = _part_terms(a)
+    tb = _part_terms(b)
+    if ta is None or tb is None:
+        return None
+    terms: Dict[Tuple[Tuple[int, int, int], ...], _FieldTerm] = {}
+    for term in ta + tb:
+        prev = terms.get(term.pieces)
+        if prev is not None:
+            iv = _intersect_intervals(prev.allowed, term.allowed)
+            if not iv:
+                return None
+            term = _FieldTerm(term.pieces, term.width, iv)
+        terms[term.pieces] = term
+    return _cube_witness(a.mask | b.mask, (a.match & a.mask) | (b.match & b.mask), list(terms.values()))
 
 
-def _inst_overlap(a: InstPat, b: InstPat) -> bool:
+def _parts_overlap(a: PartPat, b: PartPat) -> bool:
+    return _parts_witness(a, b) is not None
+
+
+def _inst_witness(a: InstPat, b: InstPat) -> Optional[int]:
+    """A full-length encoding (part0 in the low bits) matched by both instructions, or None."""
     if len(a.parts) != len(b.parts):
-        return False
+        return None
     if tuple(p.width_bits for p in a.parts) != tuple(p.width_bits for p in b.parts):
-        return False
-    return all(_parts_overlap(pa, pb) for pa, pb in zip(a.parts, b.parts))
+        return None
+    word = off = 0
+    for pa, pb in zip(a.parts, b.parts):
+        w = _parts_witness(pa, pb)
+        if w is None:
+            return None
+        word |= w << off
+        off += pa.width_bits
+    return word
 
 
-_ALLOWED_ALIAS_OVERLAP_MNEMONICS = {
-    "BSTART.PAR",
-    "BSTART.TEPL",
-    "BSTART.MPAR",
-    "BSTART.MSEQ",
-    "BSTART.VPAR",
-    "BSTART.VSEQ",
-}
+def _inst_overlap(a: InstPat, b: InstPat) -> bool:
+    return _inst_witness(a, b) is not None
 
 
 def _is_allowed_overlap(a: InstPat, b: InstPat) -> bool:
     mnems = {a.mnemonic, b.mnemonic}
-    return mnems.issubset(_ALLOWED_ALIAS_OVERLAP_MNEMONICS)
+    return mnems.issubset(ALIAS_OVERLAP_MNEMONICS)
+
+
+def _packed_key(it: InstPat) -> Tuple[int, int]:
+    """(mask, match) over all parts, part0 in the low bits."""
+    mask = match = off = 0
+    for p in it.parts:
+        mask |= p.mask << off
+        match |= p.match << off
+        off += p.width_bits
+    return mask, match
+
+
+class _BitTrie:
+    """
+    Index of (mask, match) patterns split on their fixed bits.
+
+    Each inner node splits on the bit that the most patterns fix to both 0 and
+    1 (a major-opcode bit, in practice); patterns that leave it free go down
+    both sides. Two patterns can only overlap if they share a leaf, so
+    `pairs()` yields far fewer candidates than all n^2 pairs. A node stays a
+    leaf when it is small or no bit splits it to at most 3/4 of its size.
+    """
+
+    LEAF_SIZE = 8
+
+    def __init__(self, keys: List[Tuple[int, int]], width_bits: int) -> None:
+        self.keys = keys
+        self.width_bits = width_bits
+        self.root: Any = self._build(list(range(len(keys))))
+
+    def _build(self, idxs: List[int]) -> Any:
+        if len(idxs) <= self.LEAF_SIZE:
+            return idxs
+        best_bit = -1
+        best_score = 0
+        for bit in range(self.width_bits):
+            ones = zeros = 0
+            for i in idxs:
+                mask, match = self.keys[i]
+                if (mask >> bit) & 1:
+                    if (match >> bit) & 1:
+                        ones += 1
+                    else:
+                        zeros += 1
+            score = min(ones, zeros)
+            if score > best_score:
+                best_bit, best_score = bit, score
+        if best_bit < 0:
+            return idxs
+        lo: List[int] = []
+        hi: List[int] = []
+        for i in idxs:
+            mask, match = self.keys[i]
+            if not (mask >> best_bit) & 1:
+                lo.append(i)
+                hi.append(i)
+            elif (match >> best_bit) & 1:
+                hi.append(i)
+            else:
+                lo.append(i)
+        limit = len(idxs) * 3 // 4
+        if len(lo) > limit or len(hi) > limit:
+            return idxs
+        return (best_bit, self._build(lo), self._build(hi))
+
+    def _leaves(self, node: Any, mask: Optional[int] = None, match: int = 0) -> Iterable[List[int]]:
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            if isinstance(n, list):
+                yield n
+                continue
+            bit, lo, hi = n
+            if mask is not None and (mask >> bit) & 1:
+                stack.append(hi if (match >> bit) & 1 else lo)
+            else:
+                stack.extend((lo, hi))
+
+    def pairs(self) -> List[Tuple[int, int]]:
+        """Sorted (i, j), i < j, of patterns that share a leaf and agree on their common fixed bits."""
+        out: set[Tuple[int, int]] = set()
+        keys = self.keys
+        for leaf in self._leaves(self.root):
+            for x in range(len(leaf)):
+                i = leaf[x]
+                mi, ti = keys[i]
+                for j in leaf[x + 1 :]:
+                    mj, tj = keys[j]
+                    if (ti ^ tj) & mi & mj == 0:
+                        out.add((i, j) if i < j else (j, i))
+        return sorted(out)
+
+    def query(self, mask: int, match: int) -> List[int]:
+        """Sorted indices of patterns whose fixed bits agree with (mask, match)."""
+        out: set[int] = set()
+        for leaf in self._leaves(self.root, mask, match):
+            for i in leaf:
+                mi, ti = self.keys[i]
+                if (ti ^ match) & mi & mask == 0:
+                    out.add(i)
+        return sorted(out)
+
+
+# Conflict buckets: the major-opcode bits of each part signature (packed, part0 in
+# the low bits). The same bits key the occupancy tables below.
+_MAJOR16 = _mask_for_bits(_bits_msb_to_lsb(5, 0))
+_MAJOR32 = _mask_for_bits(_bits_msb_to_lsb(6, 0))
+_MAJOR48 = _mask_for_bits(_bits_msb_to_lsb(19, 17) + [16] + _bits_msb_to_lsb(3, 0))
+_BUCKET_MAJOR: Dict[Tuple[int, ...], int] = {
+    (16,): _MAJOR16,
+    (32,): _MAJOR32,
+    (48,): _MAJOR48,
+    (32, 32): _MAJOR32,
+}
+
+# Bump when cached bitmaps or bucket results change meaning.
+_REPORT_CACHE_FORMAT = 3
+# Code the cached results depend on: this tool and the whole `linxisa` package
+# (catalog.py parses the field pieces and constraints the results are built on).
+_CACHE_SOURCES = (
+    Path(__file__).resolve(),
+    *sorted((Path(__file__).resolve().parent / "linxisa").glob("*.py")),
+)
+
+
+def _form_key(it: InstPat) -> str:
+    """
+    Key of a form: its id, which tells forms apart even when two of them are
+    exact duplicates, plus its `uid` (mnemonic, length, encoding segments) and
+    constraints, so that an edited form no longer hits its old cache entries.
+    """
+    key = f"{it.inst_id}/{it.uid}"
+    cons = [(p.part_index, c.field, c.op, c.value) for p in it.parts for c in p.constraints]
+    if not cons:
+        return key
+    return f"{key}/{hashlib.sha1(repr(cons).encode('utf-8')).hexdigest()[:8]}"
+
+
+def _bucket_values(key: Tuple[int, int], major: int) -> List[int]:
+    """Major values (`key` bits under `major`) a pattern can take: one, unless it leaves major bits free."""
+    mask, match = key
+    base = match & mask & major
+    free = major & ~mask
+    out = [base]
+    sub = free
+    while sub:
+        out.append(base | sub)
+        sub = (sub - 1) & free
+    return sorted(out)
+
+
+def _pair_bucket(a: Tuple[int, int], b: Tuple[int, int], major: int) -> int:
+    """The one bucket that owns a pair: its common major bits, free ones taken as 0."""
+    return ((a[1] & a[0]) | (b[1] & b[0])) & major
+
+
+class _ReportCache:
+    """
+    Persistent per-form and per-bucket results of the report, keyed by form.
+
+    A form is keyed by its catalog id, its `uid` (a hash of its mnemonic,
+    length and encoding segments) and its constraints (`_form_key`). The cache
+    holds:
+
+      - `forms`: the extracted part and instruction patterns, keyed by the
+        SHA-256 of the catalog JSON, so an unchanged catalog is not re-loaded;
+      - `bitmaps`: form key -> the 16-bit words it matches, as a 65,536-bit
+        bitmap; the exhaustive 16-bit coverage is an OR/AND over these;
+      - `buckets`: (kind, signature, major value) -> (sorted member keys,
+        results). A bucket's conflicts are only recomputed when its members
+        change, so an `.opc` edit re-checks the buckets the edited forms left
+        or joined and reuses the rest.
+
+    Results are stored with member keys, not catalog positions, and witnesses
+    are computed with the pair in key order, so a cached run reproduces an
+    uncached one exactly. Entries no run touched are dropped on save, and the
+    whole cache is dropped when this tool or any `linxisa` module changes.
+    """
+
+    def __init__(self, path: Optional[Path]) -> None:
+        self.path = path
+        self.env = ""
+        self.sha256 = ""
+        self.forms: Optional[List[Tuple[Any, ...]]] = None
+        self.bitmaps: Dict[str, bytes] = {}
+        self.buckets: Dict[Tuple[Any, ...], Tuple[Tuple[str, ...], List[Tuple[str, str, int]]]] = {}
+        self.used_bitmaps: set[str] = set()
+        self.used_buckets: set[Tuple[Any, ...]] = set()
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+
+    @classmethod
+    def open(cls, spec_path: Path, enabled: bool = True) -> "_ReportCache":
+        if not enabled or cache_disabled():
+            cache = cls(None)
+        else:
+            tag = hashlib.sha256(str(spec_path.resolve()).encode("utf-8")).hexdigest()[:16]
+            cache = cls(cache_dir() / f"encspace-{tag}.pickle")
+        h = hashlib.sha256()
+        for src in _CACHE_SOURCES:
+            h.update(src.read_bytes())
+        env = h.hexdigest()
+        if cache.path is not None:
+            try:
+                with cache.path.open("rb") as f:
+                    data = pickle.load(f)
+            except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+                data = None
+            if isinstance(data, dict) and data.get("format") == _REPORT_CACHE_FORMAT and data.get("env") == env:
+                cache.bitmaps = data["bitmaps"]
+                cache.buckets = data["buckets"]
+                cache.sha256 = data["sha256"]
+                cache.forms = data["forms"]
+        cache.env = env
+        return cache
+
+    def patterns(self, spec_path: Path) -> Tuple[List[PartPat], List[InstPat]]:
+        """
+        (part patterns, instruction patterns) of the catalog, extracted on a
+        miss. Stored as plain tuples: this module may be `__main__` or
+        `report_encoding_space`, so its classes are not pickled.
+        """
+        digest = hashlib.sha256(spec_path.read_bytes()).hexdigest()
+        if self.forms is not None and self.sha256 == digest:
+            self.hits += 1
+            pats = [PartPat(*t[:9], constraints=[Constraint(*c) for c in t[9]], uid=t[10]) for t in self.forms]
+        else:
+            self.misses += 1
+            pats = _extract_patterns(spec_path)
+            self.forms = [
+                (
+                    p.inst_id,
+                    p.mnemonic,
+                    p.length_bits,
+                    p.part_index,
+                    p.width_bits,
+                    p.mask,
+                    p.match,
+                    p.field_pieces,
+                    p.field_width,
+                    [(c.field, c.op, c.value_raw, c.value) for c in p.constraints],
+                    p.uid,
+                )
+                for p in pats
+            ]
+            self.sha256 = digest
+            self.dirty = True
+        return pats, _build_instructions(pats)
+
+    def bitmap(self, key: str, p: PartPat) -> bytes:
+        self.used_bitmaps.add(key)
+        blob = self.bitmaps.get(key)
+        if blob is None:
+            self.misses += 1
+            blob = _bitmap16(p)
+            self.bitmaps[key] = blob
+            self.dirty = True
+        else:
+            self.hits += 1
+        return blob
+
+    def bucket(
+        self,
+        bid: Tuple[Any, ...],
+        members: Tuple[str, ...],
+        compute: Callable[[], List[Tuple[str, str, int]]],
+    ) -> List[Tuple[str, str, int]]:
+        self.used_buckets.add(bid)
+        hit = self.buckets.get(bid)
+        if hit is not None and hit[0] == members:
+            self.hits += 1
+            return hit[1]
+        self.misses += 1
+        results = compute()
+        self.buckets[bid] = (members, results)
+        self.dirty = True
+        return results
+
+    def save(self) -> None:
+        stale = set(self.bitmaps) - self.used_bitmaps or set(self.buckets) - self.used_buckets
+        if self.path is None or not (self.dirty or stale):
+            return
+        data = {
+            "format": _REPORT_CACHE_FORMAT,
+            "env": self.env,
+            "sha256": self.sha256,
+            "forms": self.forms,
+            "bitmaps": {k: v for k, v in self.bitmaps.items() if k in self.used_bitmaps},
+            "buckets": {k: v for k, v in self.buckets.items() if k in self.used_buckets},
+        }
+        write_atomic(self.path, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _bucket_conflicts(members: List[InstPat], width_bits: int, value: int, major: int) -> List[Tuple[str, str, int]]:
+    """Overlapping pairs owned by bucket `value`, as (key, key, witness) in key order."""
+    keys = [_packed_key(it) for it in members]
+    out: List[Tuple[str, str, int]] = []
+    # Only pairs whose fixed bits are compatible can overlap; the trie finds them
+    # without comparing every pair.
+    for i, j in _BitTrie(keys, width_bits).pairs():
+        if _pair_bucket(keys[i], keys[j], major) != value:
+            continue
+        a, b = members[i], members[j]
+        if _is_allowed_overlap(a, b):
+            continue
+        witness = _inst_witness(a, b)
+        if witness is not None:
+            out.append((_form_key(a), _form_key(b), witness))
+    return out
 
 
-def _conflicts_by_signature(insts: List[InstPat]) -> Dict[Tuple[int, ...], List[Tuple[InstPat, InstPat]]]:
+def _conflicts_by_signature(
+    insts: List[InstPat], cache: _ReportCache
+) -> Dict[Tuple[int, ...], List[Tuple[InstPat, InstPat, int]]]:
     groups: Dict[Tuple[int, ...], List[InstPat]] = defaultdict(list)
     for it in insts:
         sig = tuple(p.width_bits for p in it.parts)
         groups[sig].append(it)
 
-    out: Dict[Tuple[int, ...], List[Tuple[InstPat, InstPat]]] = {}
+    out: Dict[Tuple[int, ...], List[Tuple[InstPat, InstPat, int]]] = {}
     for sig, xs in groups.items():
-        conf: List[Tuple[InstPat, InstPat]] = []
-        for i in range(len(xs)):
-            for j in range(i + 1, len(xs)):
-                if _inst_overlap(xs[i], xs[j]):
-                    if _is_allowed_overlap(xs[i], xs[j]):
-                        continue
-                    conf.append((xs[i], xs[j]))
+        major = _BUCKET_MAJOR.get(sig, 0)
+        by_key = {_form_key(it): it for it in xs}
+        pos = {k: i for i, k in enumerate(by_key)}
+        buckets: Dict[int, List[str]] = defaultdict(list)
+        for k, it in by_key.items():
+            for v in _bucket_values(_packed_key(it), major):
+                buckets[v].append(k)
+
+        conf: List[Tuple[InstPat, InstPat, int]] = []
+        for v in sorted(buckets):
+            members = tuple(sorted(buckets[v]))
+            found = cache.bucket(
+                ("conflicts", sig, v),
+                members,
+                lambda: _bucket_conflicts([by_key[k] for k in members], sum(sig), v, major),
+            )
+            for ka, kb, witness in found:
+                if pos[ka] > pos[kb]:
+                    ka, kb = kb, ka
+                conf.append((by_key[ka], by_key[kb], witness))
+        # Same order as a full i<j scan over the catalog.
+        conf.sort(key=lambda t: (pos[_form_key(t[0])], pos[_form_key(t[1])]))
         out[sig] = conf
     return out
 
 
+def _bucket_prefix_conflicts(multi: List[InstPat], single: List[InstPat], value: int) -> List[Tuple[str, str, int]]:
+    """(prefix form key, 32-bit form key, witness) for 32-bit forms overlapping a multi-part prefix part."""
+    keys = [(it.parts[0].mask, it.parts[0].match) for it in single]
+    trie = _BitTrie(keys, 32)
+    out: List[Tuple[str, str, int]] = []
+    for mp in multi:
+        mk = (mp.parts[0].mask, mp.parts[0].match)
+        for k in trie.query(*mk):
+            if _pair_bucket(mk, keys[k], _MAJOR32) != value:
+                continue
+            witness = _parts_witness(mp.parts[0], single[k].parts[0])
+            if witness is not None:
+                out.append((_form_key(mp), _form_key(single[k]), witness))
+    return out
+
+
+def _prefix_conflicts(insts: List[InstPat], cache: _ReportCache) -> List[Tuple[InstPat, InstPat, int]]:
+    """
+    Prefix ambiguity: if a multi-part instruction begins with a 32-bit prefix
+    part, no 32-bit single-part instruction may overlap that prefix encoding.
+    """
+    single = {_form_key(it): it for it in insts if len(it.parts) == 1 and it.parts[0].width_bits == 32}
+    multi = {_form_key(it): it for it in insts if len(it.parts) > 1 and it.parts[0].width_bits == 32}
+    spos = {k: i for i, k in enumerate(single)}
+    mpos = {k: i for i, k in enumerate(multi)}
+    buckets: Dict[int, Tuple[List[str], List[str]]] = defaultdict(lambda: ([], []))
+    for k, it in multi.items():
+        for v in _bucket_values((it.parts[0].mask, it.parts[0].match), _MAJOR32):
+            buckets[v][0].append(k)
+    for k, it in single.items():
+        for v in _bucket_values((it.parts[0].mask, it.parts[0].match), _MAJOR32):
+            buckets[v][1].append(k)
+
+    out: List[Tuple[InstPat, InstPat, int]] = []
+    for v in sorted(buckets):
+        ms, ss = buckets[v]
+        if not ms or not ss:
+            continue
+        ms, ss = sorted(ms), sorted(ss)
+        members = tuple(ms) + ("|",) + tuple(ss)
+        found = cache.bucket(
+            ("prefix", (32,), v),
+            members,
+            lambda: _bucket_prefix_conflicts([multi[k] for k in ms], [single[k] for k in ss], v),
+        )
+        for km, ks, witness in found:
+            out.append((multi[km], single[ks], witness))
+    out.sort(key=lambda t: (mpos[_form_key(t[0])], spos[_form_key(t[1])]))
+    return out
+
+
 def _major_occupancy(
     pats: List[PartPat],
     *,
@@ -405,35 +897,36 @@ def _major_occupancy(
     return dict(buckets), partial
 
 
-def _bruteforce_16bit(
-    pats: List[PartPat],
+def _coverage_16bit(
+    pats: List[PartPat], cache: _ReportCache
 ) -> Tuple[int, int, List[Tuple[int, List[str]]], List[Tuple[int, int]]]:
+    """Exhaustive 16-bit coverage, merged from the per-form occupancy bitmaps."""
     xs = [p for p in pats if p.part_index == 0 and p.width_bits == 16]
-    holes = 0
-    multi = 0
+    keys: Dict[str, str] = {}
+    for it in _build_instructions(xs):
+        keys[it.inst_id] = _form_key(it)
+    blobs = [cache.bitmap(keys[p.inst_id], p) for p in xs]
+    maps = [int.from_bytes(b, "little") for b in blobs]
+
+    seen = multi = 0
+    for m in maps:
+        multi |= seen & m
+        seen |= m
+    empty = ~seen & ((1 << 0x10000) - 1)
+
     examples: List[Tuple[int, List[str]]] = []
-    hole_ranges: List[Tuple[int, int]] = []
-    hole_start: Optional[int] = None
-    for val in range(0x0000, 0x10000):
-        hits = []
-        for p in xs:
-            if _match_with_constraints(p, val):
-                hits.append(p.mnemonic)
-        if not hits:
-            holes += 1
-            if hole_start is None:
-                hole_start = val
-            continue
-        if hole_start is not None:
-            hole_ranges.append((hole_start, val - 1))
-            hole_start = None
-        if len(hits) > 1:
-            multi += 1
-            if len(examples) < 50:
-                examples.append((val, hits[:10]))
-    if hole_start is not None:
-        hole_ranges.append((hole_start, 0xFFFF))
-    return holes, multi, examples, hole_ranges
+    rest = multi
+    while rest and len(examples) < 50:
+        low = rest & -rest
+        val = low.bit_length() - 1
+        byte, bit = val >> 3, 1 << (val & 7)
+        examples.append((val, [p.mnemonic for p, b in zip(xs, blobs) if b[byte] & bit][:10]))
+        rest ^= low
+
+    # Hole runs: runs of 1s in `empty`, written out LSB first.
+    bits = format(empty, "065536b")[::-1]
+    hole_ranges = [(m.start(), m.end() - 1) for m in re.finditer("1+", bits)]
+    return bits.count("1"), bin(multi).count("1"), examples, hole_ranges
 
 
 def _masked_to_index(masked_value: int, bit_positions_lsb_to_msb: List[int]) -> int:
@@ -468,13 +961,13 @@ def _write_report(
     out_path: Path,
     *,
     spec_path: Path,
-    conflicts_by_sig: Dict[Tuple[int, ...], List[Tuple[InstPat, InstPat]]],
+    conflicts_by_sig: Dict[Tuple[int, ...], List[Tuple[InstPat, InstPat, int]]],
     major_tables: Dict[str, Dict],
     holes16: int,
     multi16: int,
     multi16_examples: List[Tuple[int, List[str]]],
     hole16_ranges: List[Tuple[int, int]],
-    prefix_conflicts: List[Tuple[InstPat, InstPat]],
+    prefix_conflicts: List[Tuple[InstPat, InstPat, int]],
 ) -> None:
     def fmt_ranges(indices: List[int], *, width_bits: int) -> str:
         """
@@ -516,9 +1009,10 @@ def _write_report(
             continue
         any_conf = True
         lines.append(f"- count: {len(conf)}\n")
-        for a, b in conf[:50]:
+        for a, b, witness in conf[:50]:
             lines.append(
-                f"- overlap: `{a.mnemonic}` ({a.inst_id}) vs `{b.mnemonic}` ({b.inst_id})\n"
+                f"- overlap: `{a.mnemonic}` ({a.inst_id}) vs `{b.mnemonic}` ({b.inst_id}), "
+                f"e.g. `{hex_width(witness, a.length_bits)}`\n"
             )
         if len(conf) > 50:
             lines.append(f"- ... and {len(conf) - 50} more\n")
@@ -529,8 +1023,11 @@ def _write_report(
     else:
         any_conf = True
         lines.append(f"- count: {len(prefix_conflicts)}\n")
-        for a, b in prefix_conflicts[:50]:
-            lines.append(f"- overlap: `{a.mnemonic}` ({a.inst_id}) vs `{b.mnemonic}` ({b.inst_id})\n")
+        for a, b, witness in prefix_conflicts[:50]:
+            lines.append(
+                f"- overlap: `{a.mnemonic}` ({a.inst_id}) vs `{b.mnemonic}` ({b.inst_id}), "
+                f"e.g. prefix `{hex_width(witness, 32)}`\n"
+            )
 
     lines.append("\n## Major Opcode Occupancy (summary)\n")
     for name, tbl in major_tables.items():
@@ -581,6 +1078,95 @@ def _write_report(
     out_path.write_text("".join(lines), encoding="utf-8")
 
 
+def _report_json(
+    *,
+    spec_path: Path,
+    conflicts_by_sig: Dict[Tuple[int, ...], List[Tuple[InstPat, InstPat, int]]],
+    major_tables: Dict[str, Dict],
+    holes16: int,
+    multi16: int,
+    multi16_examples: List[Tuple[int, List[str]]],
+    hole16_ranges: List[Tuple[int, int]],
+    prefix_conflicts: List[Tuple[InstPat, InstPat, int]],
+) -> Dict[str, Any]:
+    """The `_write_report` content as JSON (complete lists, no truncation)."""
+
+    def pair(a: InstPat, b: InstPat, witness: int, width_bits: int) -> Dict[str, Any]:
+        return {
+            "a": {"id": a.inst_id, "mnemonic": a.mnemonic},
+            "b": {"id": b.inst_id, "mnemonic": b.mnemonic},
+            "witness": hex_width(witness, width_bits),
+        }
+
+    conflicts = {
+        "+".join(str(x) for x in sig): [pair(a, b, w, a.length_bits) for a, b, w in conflicts_by_sig[sig]]
+        for sig in sorted(conflicts_by_sig, key=lambda t: (len(t), t))
+    }
+    has_conf = any(conflicts_by_sig.values()) or bool(prefix_conflicts) or multi16 != 0
+    return {
+        "spec": _display_path(spec_path),
+        "conflicts": conflicts,
+        "prefix_conflicts": [pair(a, b, w, 32) for a, b, w in prefix_conflicts],
+        "major_tables": major_tables,
+        "coverage16": {
+            "holes": holes16,
+            "multi": multi16,
+            "hole_ranges": [[f"0x{lo:04x}", f"0x{hi:04x}"] for lo, hi in hole16_ranges],
+            "multi_examples": [{"word": f"0x{v:04x}", "matches": hits} for v, hits in multi16_examples],
+        },
+        "status": "FAIL" if has_conf else "OK",
+    }
+
+
+def _alloc_keys(spec_path: Path) -> Dict[int, Tuple[Tuple[int, ...], List[Tuple[int, int]]]]:
+    """Per length: (part widths, packed (mask, match) of every form) for the allocator index."""
+    out: Dict[int, Tuple[Tuple[int, ...], List[Tuple[int, int]]]] = {}
+    for it in _build_instructions(_extract_patterns(spec_path)):
+        sig = tuple(p.width_bits for p in it.parts)
+        entry = out.setdefault(it.length_bits, (sig, []))
+        if entry[0] != sig:
+            raise SystemExit(f"error: {it.length_bits}-bit forms mix part layouts {entry[0]} and {sig}")
+        entry[1].append(_packed_key(it))
+    return out
+
+
+def _alloc_query(spec_path: Path, length_bits: int, widths: List[int], top: int, as_json: bool) -> int:
+    t0 = time.perf_counter()
+    index, cached = open_index(spec_path, lambda: _alloc_keys(spec_path))
+    try:
+        cands = index.allocate(length_bits, widths, top)
+    except KeyError:
+        known = ", ".join(str(n) for n in sorted(index.lengths))
+        raise SystemExit(f"error: no {length_bits}-bit forms in the catalog (lengths: {known})")
+    ms = (time.perf_counter() - t0) * 1e3
+    part_widths = index.lengths[length_bits]["part_widths"]
+
+    if as_json:
+        doc = {
+            "length_bits": length_bits,
+            "fields": widths,
+            "free_words": index.lengths[length_bits]["free_words"],
+            "free_cubes": len(index.lengths[length_bits]["cubes"]),
+            "candidates": [c.to_json(part_widths) for c in cands],
+        }
+        sys.stdout.write(json.dumps(doc, indent=2) + "\n")
+        return 0 if cands else 1
+
+    for c in cands:
+        fields = ", ".join(f"{chr(ord('a') + k % 26)}=[{msb}:{lsb}]" for k, (msb, lsb) in enumerate(c.fields))
+        print(
+            f"{c.pattern(part_widths)}  mask={hex_width(c.mask, length_bits)} "
+            f"match={hex_width(c.match, length_bits)}  {fields}  waste={c.waste}"
+        )
+    entry = index.lengths[length_bits]
+    print(
+        f"{len(cands)} candidate(s) for fields {','.join(str(w) for w in widths)} in {entry['free_words']} free "
+        f"{length_bits}-bit words ({len(entry['cubes'])} free cubes; index {'cached' if cached else 'built'}, {ms:.1f} ms)",
+        file=sys.stderr,
+    )
+    return 0 if cands else 1
+
+
 def main(argv: List[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Report encoding space usage and detect conflicts.")
     ap.add_argument("--spec", type=Path, default=Path("isa/v0.3/linxisa-v0.3.json"))
@@ -590,28 +1176,38 @@ def main(argv: List[str] | None = None) -> int:
         action="store_true",
         help="Exit non-zero if any encoding conflicts are found.",
     )
+    ap.add_argument(
+        "--alloc-fields",
+        default=None,
+        help="Allocator query: comma-separated field widths (e.g. 5,5,12); print free encodings instead of the report.",
+    )
+    ap.add_argument("--alloc-length", type=int, default=32, help="Instruction length for --alloc-fields (default: 32)")
+    ap.add_argument("--alloc-top", type=int, default=10, help="Number of candidates to print (0: all)")
+    ap.add_argument("--json", action="store_true", help="Print allocator candidates as JSON")
+    ap.add_argument("--out-json", type=Path, default=None, help="Also write the report as JSON")
+    ap.add_argument("--no-cache", action="store_true", help="Recompute every bucket and bitmap")
+    ap.add_argument("--cache-stats", action="store_true", help="Print cache hit/miss counts to stderr")
     args = ap.parse_args(argv)
 
-    pats = _extract_patterns(args.spec)
-    insts = _build_instructions(pats)
-    conflicts_by_sig = _conflicts_by_signature(insts)
+    if args.alloc_fields is not None:
+        try:
+            widths = [int(x) for x in args.alloc_fields.split(",") if x.strip()]
+        except ValueError:
+            ap.error(f"--alloc-fields: expected comma-separated widths, got {args.alloc_fields!r}")
+        if any(w <= 0 for w in widths):
+            ap.error("--alloc-fields: widths must be positive")
+        return _alloc_query(args.spec, args.alloc_length, widths, args.alloc_top, args.json)
 
-    # Prefix ambiguity: if a multi-part instruction begins with a 32-bit prefix part,
-    # ensure no 32-bit single-part instruction overlaps that prefix encoding.
-    prefix_conflicts: List[Tuple[InstPat, InstPat]] = []
-    single32 = [it for it in insts if len(it.parts) == 1 and it.parts[0].width_bits == 32]
-    multiprefix = [it for it in insts if len(it.parts) > 1 and it.parts[0].width_bits == 32]
-    for mp in multiprefix:
-        for sp in single32:
-            if _parts_overlap(mp.parts[0], sp.parts[0]):
-                prefix_conflicts.append((mp, sp))
+    cache = _ReportCache.open(args.spec, enabled=not args.no_cache)
+    pats, insts = cache.patterns(args.spec)
+    conflicts_by_sig = _conflicts_by_signature(insts, cache)
+    prefix_conflicts = _prefix_conflicts(insts, cache)
 
     # Major-bit occupancy summaries (these are descriptive, not a proof of coverage).
     major_tables: Dict[str, Dict] = {}
 
     # 16-bit compressed: low bits [5:0] are used heavily as a major decode key.
-    mask16 = _mask_for_bits(_bits_msb_to_lsb(5, 0))
-    occ16, partial16 = _major_occupancy(pats, width_bits=16, major_mask=mask16)
+    occ16, partial16 = _major_occupancy(pats, width_bits=16, major_mask=_MAJOR16)
     major_tables["C16-major[5:0]"] = {
         "width_bits": 16,
         "bits_desc": "[5:0] (6b)",
@@ -621,8 +1217,7 @@ def main(argv: List[str] | None = None) -> int:
     }
 
     # 32-bit scalar: low bits [6:0] act as a major opcode key in the current catalog.
-    mask32 = _mask_for_bits(_bits_msb_to_lsb(6, 0))
-    occ32, partial32 = _major_occupancy(pats, width_bits=32, major_mask=mask32)
+    occ32, partial32 = _major_occupancy(pats, width_bits=32, major_mask=_MAJOR32)
     major_tables["LX32-major[6:0]"] = {
         "width_bits": 32,
         "bits_desc": "[6:0] (7b)",
@@ -632,8 +1227,7 @@ def main(argv: List[str] | None = None) -> int:
     }
 
     # 48-bit HL: use bits [19:17] + [16] + [3:0] as a stable "major" signature for the current opcode database.
-    mask48 = _mask_for_bits(_bits_msb_to_lsb(19, 17) + [16] + _bits_msb_to_lsb(3, 0))
-    occ48, partial48 = _major_occupancy(pats, width_bits=48, major_mask=mask48)
+    occ48, partial48 = _major_occupancy(pats, width_bits=48, major_mask=_MAJOR48)
     major_tables["HL48-major[19:17,16,3:0]"] = {
         "width_bits": 48,
         "bits_desc": "[19:17],[16],[3:0] (8b)",
@@ -642,7 +1236,10 @@ def main(argv: List[str] | None = None) -> int:
         "partial": len(partial48),
     }
 
-    holes16, multi16, multi16_examples, hole16_ranges = _bruteforce_16bit(pats)
+    holes16, multi16, multi16_examples, hole16_ranges = _coverage_16bit(pats, cache)
+    cache.save()
+    if args.cache_stats:
+        print(f"encoding-space cache: {cache.hits} hit(s), {cache.misses} miss(es)", file=sys.stderr)
 
     # Augment major tables with concrete used/unused slot indices.
     def add_slot_lists(name: str, occ: Dict[int, List[PartPat]], bit_positions: List[int], total: int) -> None:
@@ -668,6 +1265,19 @@ def main(argv: List[str] | None = None) -> int:
         hole16_ranges=hole16_ranges,
         prefix_conflicts=prefix_conflicts,
     )
+    if args.out_json is not None:
+        doc = _report_json(
+            spec_path=args.spec,
+            conflicts_by_sig=conflicts_by_sig,
+            major_tables=major_tables,
+            holes16=holes16,
+            multi16=multi16,
+            multi16_examples=multi16_examples,
+            hole16_ranges=hole16_ranges,
+            prefix_conflicts=prefix_conflicts,
+        )
+        args.out_json.parent.mkdir(parents=True, exist_ok=True)
+        args.out_json.write_text(json.dumps(doc, indent=2) + "\n", encoding="utf-8")
 
     has_conf = any(conflicts_by_sig[s] for s in conflicts_by_sig) or (multi16 != 0) or bool(prefix_conflicts)
     if args.check and has_conf:
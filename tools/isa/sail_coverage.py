@@ -14,7 +14,7 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set
 
 
 def _read_json(path: Path) -> Dict[str, Any]:
@@ -54,7 +54,7 @@ def _relpath_in_repo(p: Path, repo_root: Path) -> str:
         return str(p)
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--spec", default="isa/v0.3/linxisa-v0.3.json", help="Compiled ISA catalog JSON")
     ap.add_argument(
@@ -65,7 +65,7 @@ def main() -> int:
     ap.add_argument("--out", default="isa/sail/coverage.json", help="Output JSON path")
     ap.add_argument("--pretty", action="store_true", help="Pretty-print JSON")
     ap.add_argument("--check", action="store_true", help="Verify --out is up-to-date without writing")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     repo_root = Path(__file__).resolve().parents[2]
     spec = _read_json(Path(args.spec))
@@ -4,7 +4,10 @@ Validate basic invariants of the compiled ISA JSON spec.
 
 This is intentionally lightweight and does not attempt to validate semantics.
 It checks that the derived `encoding` view is internally consistent with the
-raw `parts[].segments` view.
+raw `parts[].segments` view, that field pieces do not overlap each other or
+the fixed bits, and that no two forms share an id or an exact encoding.
+It makes a single pass over the catalog so it is cheap enough for every
+commit; `--timings` reports the time spent per rule.
 """
 
 from __future__ import annotations
@@ -12,40 +15,73 @@ from __future__ import annotations
 import argparse
 import json
 import sys
-from typing import Any, Dict, List, Tuple
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-
-def _parse_hex(s: str) -> int:
-    s = s.strip().lower()
-    if not s.startswith("0x"):
-        raise ValueError(f"expected hex string, got {s!r}")
-    return int(s, 16)
+from linxisa.encoding import ALIAS_OVERLAP_MNEMONICS, parse_hex, pattern_to_mask_match
 
 
 def _mask_for_width(width_bits: int) -> int:
     return (1 << width_bits) - 1 if width_bits > 0 else 0
 
 
-def _pattern_to_mask_match(pattern: str) -> Tuple[int, int]:
-    # pattern is MSB->LSB with '0','1','.'
-    width_bits = len(pattern)
-    mask = 0
-    match = 0
-    for i, ch in enumerate(pattern):
-        bit = width_bits - 1 - i  # convert to bit index
-        if ch == ".":
-            continue
-        if ch not in ("0", "1"):
-            raise ValueError(f"invalid pattern char {ch!r}")
-        mask |= 1 << bit
-        if ch == "1":
-            match |= 1 << bit
-    return mask, match
+# Rules in report order; `validate(..., timings=)` accumulates seconds per rule.
+RULES = ("load", "profile", "mnemonics", "parts", "fields", "ids", "encodings")
+
+
+class _RuleClock:
+    """Per-rule wall time accumulated over the single pass over the catalog."""
+
+    def __init__(self, timings: Optional[Dict[str, float]]) -> None:
+        self.timings = timings
+        if timings is not None:
+            for rule in RULES:
+                timings.setdefault(rule, 0.0)
+
+    def lap(self, rule: str, t0: float) -> float:
+        """Charge the time since `t0` to `rule`; returns the new start time."""
+        if self.timings is None:
+            return t0
+        now = time.perf_counter()
+        self.timings[rule] += now - t0
+        return now
+
+
+def _walk_names(obj: Any) -> Set[str]:
+    """Every `name`/`name_fmt` string in a nested dict/list tree."""
+    out: Set[str] = set()
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if isinstance(o, dict):
+            for key in ("name", "name_fmt"):
+                v = o.get(key)
+                if isinstance(v, str):
+                    out.add(v)
+            stack.extend(o.values())
+        elif isinstance(o, list):
+            stack.extend(o)
+    return out
+
+
+def _constraints_key(enc_part: Dict[str, Any]) -> Tuple[Tuple[str, str, str], ...]:
+    return tuple(
+        sorted((str(c.get("field")), str(c.get("op")), str(c.get("value"))) for c in enc_part.get("constraints") or [])
+    )
 
 
-def validate(path: str) -> List[str]:
+def validate(path: str, timings: Optional[Dict[str, float]] = None) -> List[str]:
+    """
+    Check the catalog in one pass over its instructions. Per-form rules run
+    inline; cross-form rules (duplicate ids, duplicate encodings) probe hash
+    indexes built along the way. With `timings`, seconds per rule (`RULES`)
+    are accumulated into it.
+    """
+    clock = _RuleClock(timings)
+    t = time.perf_counter()
     with open(path, "r", encoding="utf-8") as f:
         spec = json.load(f)
+    t = clock.lap("load", t)
 
     errors: List[str] = []
 
@@ -60,24 +96,7 @@ def validate(path: str) -> List[str]:
             errors.append("v0.2: missing state.system_registers (expected dict)")
         else:
             legacy = {"EBPC_ACRn", "ETPC_ACRn", "EBPCN_ACRn"}
-
-            def _walk_names(obj: Any) -> List[str]:
-                out: List[str] = []
-                if isinstance(obj, dict):
-                    n = obj.get("name")
-                    if isinstance(n, str):
-                        out.append(n)
-                    fmt = obj.get("name_fmt")
-                    if isinstance(fmt, str):
-                        out.append(fmt)
-                    for v in obj.values():
-                        out.extend(_walk_names(v))
-                elif isinstance(obj, list):
-                    for it in obj:
-                        out.extend(_walk_names(it))
-                return out
-
-            names = set(_walk_names(sysregs))
+            names = _walk_names(sysregs)
             for bad in sorted(legacy):
                 if bad in names:
                     errors.append(f"v0.2: forbidden legacy SSR name present in system_registers: {bad}")
@@ -85,6 +104,11 @@ def validate(path: str) -> List[str]:
             ebarg = sysregs.get("ebarg_group") or {}
             if not isinstance(ebarg, dict):
                 errors.append("v0.2: system_registers.ebarg_group missing/invalid")
+    t = clock.lap("profile", t)
+
+    seen_ids: Set[str] = set()
+    # (length_bits, per-part (width, mask, match, constraints)) -> (id, mnemonic) of the first form.
+    first_by_encoding: Dict[Tuple[Any, ...], Tuple[str, str]] = {}
 
     for inst in spec.get("instructions", []):
         inst_id = inst.get("id", inst.get("mnemonic", "<missing-id>"))
@@ -95,6 +119,13 @@ def validate(path: str) -> List[str]:
         # treat it as a hard error so it cannot silently regress.
         if mnemonic == "BSTART.VEC":
             errors.append(f"{inst_id}: forbidden mnemonic present in spec: BSTART.VEC (use BSTART.VPAR/VSEQ)")
+        t = clock.lap("mnemonics", t)
+
+        if "id" in inst:
+            if inst["id"] in seen_ids:
+                errors.append(f"{inst_id}: duplicate id")
+            seen_ids.add(inst["id"])
+        t = clock.lap("ids", t)
 
         parts = inst.get("parts", [])
         enc = inst.get("encoding", {})
@@ -102,14 +133,19 @@ def validate(path: str) -> List[str]:
 
         if len(parts) != len(enc_parts):
             errors.append(f"{inst_id}: parts count {len(parts)} != encoding.parts count {len(enc_parts)}")
+            t = clock.lap("parts", t)
             continue
 
+        # None once a part is malformed: that form takes no part in the duplicate check.
+        enc_key: Optional[List[Tuple[Any, ...]]] = []
         for i, (part, enc_part) in enumerate(zip(parts, enc_parts)):
             width_bits = int(part.get("width_bits", 0))
             if int(enc_part.get("width_bits", -1)) != width_bits:
                 errors.append(
                     f"{inst_id}: part[{i}] width_bits {width_bits} != encoding.width_bits {enc_part.get('width_bits')}"
                 )
+                enc_key = None
+                t = clock.lap("parts", t)
                 continue
 
             # Segments should cover full width.
@@ -119,8 +155,8 @@ def validate(path: str) -> List[str]:
                 errors.append(f"{inst_id}: part[{i}] segments cover {seg_sum} bits, expected {width_bits}")
 
             # Derived mask/match should be within width.
-            mask = _parse_hex(enc_part.get("mask", "0x0"))
-            match = _parse_hex(enc_part.get("match", "0x0"))
+            mask = parse_hex(enc_part.get("mask", "0x0"))
+            match = parse_hex(enc_part.get("match", "0x0"))
             width_mask = _mask_for_width(width_bits)
             if (mask & ~width_mask) != 0:
                 errors.append(f"{inst_id}: part[{i}] mask has bits outside width")
@@ -133,17 +169,45 @@ def validate(path: str) -> List[str]:
             if len(pattern) != width_bits:
                 errors.append(f"{inst_id}: part[{i}] pattern length {len(pattern)} != width {width_bits}")
             else:
-                pmask, pmatch = _pattern_to_mask_match(pattern)
+                pmask, pmatch = pattern_to_mask_match(pattern)
                 if pmask != mask or pmatch != match:
                     errors.append(
                         f"{inst_id}: part[{i}] pattern-derived mask/match disagree "
                         f"(mask {pmask:#x} vs {mask:#x}, match {pmatch:#x} vs {match:#x})"
                     )
+            t = clock.lap("parts", t)
+
+            # Field pieces: one occupancy bitset per part. A piece must stay inside
+            # the part, off the fixed (mask) bits, and off every other piece.
+            used = 0
+            for fld in enc_part.get("fields", []):
+                name = fld.get("name")
+                for piece in fld.get("pieces", []):
+                    lsb = int(piece.get("insn_lsb", 0))
+                    bits = _mask_for_width(int(piece.get("width", 0))) << lsb
+                    if bits & ~width_mask:
+                        errors.append(f"{inst_id}: part[{i}] field {name} piece at bit {lsb} exceeds width {width_bits}")
+                    if bits & mask:
+                        errors.append(f"{inst_id}: part[{i}] field {name} overlaps fixed bits {bits & mask:#x}")
+                    if bits & used:
+                        errors.append(f"{inst_id}: part[{i}] field {name} overlaps another field at {bits & used:#x}")
+                    used |= bits
+            t = clock.lap("fields", t)
+
+            if enc_key is not None:
+                enc_key.append((width_bits, mask, match, _constraints_key(enc_part)))
+
+        if enc_key:
+            key = (int(inst.get("length_bits", 0)), tuple(enc_key))
+            other_id, other_mnemonic = first_by_encoding.setdefault(key, (str(inst_id), mnemonic))
+            if other_id != str(inst_id) and not {mnemonic, other_mnemonic} <= ALIAS_OVERLAP_MNEMONICS:
+                errors.append(f"{inst_id}: same length/mask/match/constraints as {other_id}")
+            t = clock.lap("encodings", t)
 
     return errors
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument(
         "--profile",
@@ -156,10 +220,16 @@ def main() -> int:
         default=None,
         help="Path to the generated ISA spec JSON",
     )
-    args = ap.parse_args()
+    ap.add_argument("--timings", action="store_true", help="Print the time spent per rule to stderr")
+    args = ap.parse_args(argv)
 
     default_spec = "isa/v0.3/linxisa-v0.3.json"
-    errors = validate(args.spec or default_spec)
+    timings: Optional[Dict[str, float]] = {} if args.timings else None
+    errors = validate(args.spec or default_spec, timings)
+    if timings is not None:
+        for rule, secs in timings.items():
+            print(f"{rule:<10} {secs * 1e3:8.2f} ms", file=sys.stderr)
+        print(f"{'total':<10} {sum(timings.values()) * 1e3:8.2f} ms", file=sys.stderr)
     if errors:
         for e in errors[:200]:
             print(e, file=sys.stderr)
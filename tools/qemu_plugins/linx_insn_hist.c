@@ -71,23 +71,10 @@ static const char *decode_mnemonic_from_bytes(const void *buf, size_t size_bytes
         val |= ((uint64_t)b[i]) << (8u * (unsigned)i);
     }
 
-    const unsigned bits = (unsigned)(size_bytes * 8u);
-    const linxisa_inst_form *best = NULL;
-    unsigned best_fixed = 0;
-    for (size_t i = 0; i < linxisa_inst_forms_count; i++) {
-        const linxisa_inst_form *f = &linxisa_inst_forms[i];
-        if ((unsigned)f->length_bits != bits) {
-            continue;
-        }
-        if ((val & f->mask) != f->match) {
-            continue;
-        }
-        unsigned fixed = (unsigned)__builtin_popcountll((unsigned long long)f->mask);
-        if (!best || fixed > best_fixed) {
-            best = f;
-            best_fixed = fixed;
-        }
-    }
+    /* Compressed words are one table load (constraints applied). */
+    const int idx = size_bytes == 2 ? linxisa_decode16_direct((uint16_t)val)
+                                    : linxisa_decode(val, (unsigned)(size_bytes * 8u));
+    const linxisa_inst_form *best = idx >= 0 ? &linxisa_inst_forms[idx] : NULL;
     if (!best || !best->mnemonic || best->mnemonic[0] == '\0') {
         return g_intern_string("ILLEGAL");
     }